@@ -0,0 +1,76 @@
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+DOCUMENTATION = '''
+---
+name: pg_num
+short_description: Compute the pg_num of a single pool
+version_added: "1.2.0"
+description:
+    - Compute the pg_num of a pool from the number of OSDs, rounded to a power of two.
+options:
+    _input:
+        description:
+            - The number of OSDs the pool is spread on.
+        type: int
+        required: true
+    size:
+        description:
+            - The replica size of the pool, or k+m for an erasure coded pool.
+        type: int
+        default: 3
+    target_ratio:
+        description:
+            - The share of the cluster data stored in the pool.
+        type: float
+        default: 1.0
+    target_pgs_per_osd:
+        description:
+            - The number of PGs targeted per OSD.
+        type: int
+        default: 100
+    min_pg_num:
+        description:
+            - The minimum pg_num of the pool.
+        type: int
+        default: 1
+author: Teoman ONAY (@asM0deuz)
+'''
+
+EXAMPLES = '''
+- name: Create a pool holding a fifth of the data
+  ceph.automation.ceph_pool:
+    name: images
+    pg_autoscale_mode: "off"
+    pg_num: "{{ 48 | ceph.automation.pg_num(size=3, target_ratio=0.2) }}"
+'''
+
+RETURN = '''
+_value:
+    description: The pg_num of the pool.
+    type: int
+'''
+
+from ansible.errors import AnsibleFilterError
+try:
+    from ansible_collections.ceph.automation.plugins.plugin_utils.pg_calc import pg_num as _pg_num
+except ImportError:
+    from plugin_utils.pg_calc import pg_num as _pg_num
+
+
+def pg_num(osd_count, size=3, target_ratio=1.0, target_pgs_per_osd=100, min_pg_num=1):
+    try:
+        return _pg_num(int(osd_count),
+                       size=int(size),
+                       target_ratio=float(target_ratio),
+                       target_pgs_per_osd=int(target_pgs_per_osd),
+                       min_pg_num=int(min_pg_num))
+    except (TypeError, ValueError) as e:
+        raise AnsibleFilterError('pg_num: {}'.format(e))
+
+
+class FilterModule(object):
+    def filters(self):
+        return {
+            'pg_num': pg_num,
+        }
@@ -0,0 +1,107 @@
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+DOCUMENTATION = '''
+---
+name: pool_pg_layout
+short_description: Compute the placement groups of a whole pool layout
+version_added: "1.2.0"
+description:
+    - Compute pg_num, pgp_num and target_size_ratio for a list of pools in a single pass.
+    - Pools without target_size_ratio evenly share the ratio left by the other pools.
+    - The returned pool definitions can be passed as is to ceph_pool, the k, m, target_pgs_per_osd
+      and min_pg_num keys only used for the computation are removed from them.
+positional: osd_count
+options:
+    _input:
+        description:
+            - The pool definitions. Each pool is a dictionary with a name and either a replica size
+              or the k and m values of its erasure code profile.
+            - Optional keys are target_size_ratio, target_pgs_per_osd and min_pg_num.
+        type: list
+        elements: dict
+        required: true
+    osd_count:
+        description:
+            - The number of OSDs the pools are spread on.
+        type: int
+        required: true
+    target_pgs_per_osd:
+        description:
+            - The number of PGs targeted per OSD, unless overridden by a pool.
+        type: int
+        default: 100
+    min_pg_num:
+        description:
+            - The minimum pg_num of a pool, unless overridden by a pool.
+        type: int
+        default: 1
+    normalize:
+        description:
+            - Scale the target ratios down when their sum is greater than 1.
+        type: bool
+        default: true
+author: Teoman ONAY (@asM0deuz)
+'''
+
+EXAMPLES = '''
+- name: Create the pools of the layout
+  ceph.automation.ceph_pool:
+    name: "{{ item.name }}"
+    size: "{{ item.size | default(omit) }}"
+    pool_type: "{{ item.pool_type }}"
+    erasure_profile: "{{ item.erasure_profile | default(omit) }}"
+    pg_num: "{{ item.pg_num }}"
+    pgp_num: "{{ item.pgp_num }}"
+    pg_autoscale_mode: "{{ item.pg_autoscale_mode }}"
+    target_size_ratio: "{{ item.target_size_ratio }}"
+  loop: "{{ pools | ceph.automation.pool_pg_layout(groups['osds'] | length * 12) }}"
+  vars:
+    pools:
+      - name: rbd
+        size: 3
+        target_size_ratio: 0.4
+      - name: cephfs_data
+        k: 4
+        m: 2
+        erasure_profile: ec42
+        target_size_ratio: 0.5
+      - name: cephfs_metadata
+        size: 3
+'''
+
+RETURN = '''
+_value:
+    description:
+        - The pool definitions completed with pg_num, pgp_num, target_size_ratio,
+          pg_autoscale_mode (off unless set), pool_type and size (replicated pools only).
+        - The k, m, target_pgs_per_osd and min_pg_num keys are removed.
+    type: list
+    elements: dict
+'''
+
+from ansible.errors import AnsibleFilterError
+try:
+    from ansible_collections.ceph.automation.plugins.plugin_utils.pg_calc import pool_pg_layout as _pool_pg_layout
+except ImportError:
+    from plugin_utils.pg_calc import pool_pg_layout as _pool_pg_layout
+
+
+def pool_pg_layout(pools, osd_count, target_pgs_per_osd=100, min_pg_num=1, normalize=True):
+    if not isinstance(pools, list) or not all(isinstance(pool, dict) for pool in pools):
+        raise AnsibleFilterError('pool_pg_layout requires a list of dictionaries as input')
+
+    try:
+        return _pool_pg_layout(pools, int(osd_count),
+                               target_pgs_per_osd=int(target_pgs_per_osd),
+                               min_pg_num=int(min_pg_num),
+                               normalize=bool(normalize))
+    except (TypeError, ValueError) as e:
+        raise AnsibleFilterError('pool_pg_layout: {}'.format(e))
+
+
+class FilterModule(object):
+    def filters(self):
+        return {
+            'pool_pg_layout': pool_pg_layout,
+        }
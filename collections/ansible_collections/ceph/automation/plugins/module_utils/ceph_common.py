@@ -3,6 +3,7 @@ __metaclass__ = type
 
 import datetime
 import os
+import shlex
 import time
 from typing import TYPE_CHECKING, Any, List, Dict, Callable, Type, TypeVar, Optional
 
@@ -104,6 +105,21 @@ def exec_command(module, cmd, stdin=None, check_rc=False):
     return rc, cmd, out, err
 
 
+def exec_batch(module, commands, cluster='ceph', container_image=None):
+    '''
+    Execute several ceph commands in a single ceph session (and a single
+    container), the commands are fed to the ceph CLI on stdin
+    '''
+
+    cmd = generate_cmd(cluster=cluster,
+                       container_image=container_image,
+                       interactive=True)
+    stdin = ''.join(' '.join(shlex.quote(str(arg)) for arg in command) + '\n'
+                    for command in commands)
+
+    return exec_command(module, cmd, stdin=stdin)
+
+
 def retry(exceptions: Type[ExceptionType], module: "AnsibleModule", retries: int = 20, delay: int = 1) -> Callable:
     def decorator(f: Callable) -> Callable:
         def _retry(*args: Any, **kwargs: Any) -> Callable:
@@ -159,7 +175,8 @@ def exit_module(module: "AnsibleModule",
                 out: str = '',
                 err: str = '',
                 changed: bool = False,
-                diff: Optional[Dict[str, str]] = None) -> None:
+                diff: Optional[Dict[str, str]] = None,
+                extra: Optional[Dict[str, Any]] = None) -> None:
     endd = datetime.datetime.now()
     delta = endd - startd
 
@@ -174,6 +191,8 @@ def exit_module(module: "AnsibleModule",
         changed=changed,
         diff=diff
     )
+    if extra:
+        result.update(extra)
     module.exit_json(**result)
 
 
@@ -0,0 +1,165 @@
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+import datetime
+import glob
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    from ansible.module_utils.basic import AnsibleModule  # type: ignore
+
+
+def container_cmd(container_binary: str, container_image: str, entrypoint: str = 'ceph-volume') -> List[str]:
+    '''
+    Build the privileged container CLI used by ceph-volume simple
+    '''
+
+    return [container_binary,
+            'run', '--rm', '--privileged',
+            '--ipc=host', '--net=host',
+            '-v', '/etc/ceph:/etc/ceph:z',
+            '-v', '/var/lib/ceph/:/var/lib/ceph/:z',
+            '-v', '/var/log/ceph/:/var/log/ceph/:z',
+            '-v', '/run/lvm/:/run/lvm/',
+            '-v', '/run/lock/lvm/:/run/lock/lvm/',
+            '--entrypoint=' + entrypoint, container_image]
+
+
+def discover_osd_dirs(cluster: str, osd_data_dir: str) -> List[Tuple[str, str]]:
+    '''
+    List the legacy OSD data directories which can be scanned
+    as (osd_id, path) tuples
+    '''
+
+    osds = []
+    for path in sorted(glob.glob(os.path.join(osd_data_dir, '{}-*'.format(cluster)))):
+        whoami = os.path.join(path, 'whoami')
+        if not os.path.isfile(whoami):
+            continue
+        with open(whoami) as f:
+            osd_id = f.read().strip()
+        osds.append((osd_id, path))
+
+    return osds
+
+
+def discover_osd_files(osd_json_dir: str) -> List[Tuple[str, str]]:
+    '''
+    List the scanned OSD JSON files ({OSD_ID}-{OSD_FSID}.json)
+    which can be activated as (osd_id, path) tuples
+    '''
+
+    osds = []
+    for path in sorted(glob.glob(os.path.join(osd_json_dir, '*.json'))):
+        osd_id = os.path.basename(path).split('-', 1)[0]
+        osds.append((osd_id, path))
+
+    return osds
+
+
+class SimpleRunner(object):
+    '''
+    Run several ceph-volume simple commands concurrently, reusing a
+    single long running container when the deployment is containerized
+    '''
+
+    def __init__(self, module: "AnsibleModule", cluster: str,
+                 container_binary: Optional[str] = None,
+                 container_image: Optional[str] = None,
+                 max_workers: int = 4) -> None:
+        self.module = module
+        self.cluster = cluster
+        self.container_binary = container_binary
+        self.container_image = container_image
+        self.max_workers = max(1, max_workers)
+        self.container_name = 'ceph-volume-simple-{}'.format(os.getpid())
+        self.started = False
+
+    @property
+    def containerized(self) -> bool:
+        return bool(self.container_binary and self.container_image)
+
+    def start_cmd(self) -> List[str]:
+        cmd = container_cmd(self.container_binary, self.container_image, entrypoint='sleep')
+        cmd[2:2] = ['--detach', '--name', self.container_name]
+        cmd.append('infinity')
+        return cmd
+
+    def build_cmd(self, args: List[str]) -> List[str]:
+        if self.containerized:
+            cmd = [self.container_binary, 'exec', self.container_name, 'ceph-volume']
+        else:
+            cmd = ['ceph-volume']
+
+        cmd.extend(['--cluster', self.cluster, 'simple'])
+        cmd.extend(args)
+        return cmd
+
+    def __enter__(self) -> "SimpleRunner":
+        if self.containerized:
+            cmd = self.start_cmd()
+            rc, out, err = self.module.run_command(cmd)
+            if rc != 0:
+                self.module.fail_json(msg='Failed to start the ceph-volume container',
+                                      cmd=cmd, rc=rc, stdout=out, stderr=err)
+            self.started = True
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        if self.started:
+            self.module.run_command([self.container_binary, 'rm', '--force', self.container_name])
+            self.started = False
+
+    def _run(self, item: Tuple[str, str, List[str]]) -> Dict[str, Any]:
+        osd_id, path, cmd = item
+        startd = datetime.datetime.now()
+        rc, out, err = self.module.run_command(cmd)
+        endd = datetime.datetime.now()
+        return dict(
+            osd_id=osd_id,
+            path=path,
+            cmd=cmd,
+            start=str(startd),
+            end=str(endd),
+            delta=str(endd - startd),
+            rc=rc,
+            stdout=out.rstrip("\r\n"),
+            stderr=err.rstrip("\r\n"),
+            changed=rc == 0,
+        )
+
+    def run(self, items: List[Tuple[str, str, List[str]]]) -> List[Dict[str, Any]]:
+        '''
+        Run the (osd_id, path, cmd) items, the results keep the input order
+        '''
+
+        if not items:
+            return []
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(items))) as executor:
+            return list(executor.map(self._run, items))
+
+
+def exit_batch(module: "AnsibleModule",
+               osds: List[Dict[str, Any]],
+               startd: datetime.datetime) -> None:
+    '''
+    Exit with the per OSD summary of a host-wide run, which changed
+    when at least one of the OSDs changed
+    '''
+
+    endd = datetime.datetime.now()
+    failed = [osd for osd in osds if osd['rc'] != 0]
+
+    module.exit_json(
+        cmd=[osd['cmd'] for osd in osds],
+        start=str(startd),
+        end=str(endd),
+        delta=str(endd - startd),
+        rc=failed[0]['rc'] if failed else 0,
+        stdout='',
+        stderr='\n'.join(osd['stderr'] for osd in failed),
+        changed=any(osd['changed'] for osd in osds),
+        osds=osds,
+    )
@@ -0,0 +1,237 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Copyright 2020, Red Hat, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+ANSIBLE_METADATA = {
+    'metadata_version': '1.1',
+    'status': ['preview'],
+    'supported_by': 'community'
+}
+
+DOCUMENTATION = '''
+---
+module: ceph_crush_rules
+short_description: Manage several Ceph Crush Replicated/Erasure Rules at once
+version_added: "1.2.0"
+description:
+    - Manage a list of Ceph Crush rules.
+    - All the existing rules are dumped once, compared in memory and only the
+      missing rules are created and the unwanted rules removed, in a single ceph session.
+options:
+    cluster:
+        description:
+            - The ceph cluster name.
+        type: str
+        required: false
+        default: ceph
+    rules:
+        description:
+            - The crush rules.
+            - Each rule accepts the same keys as the options of ceph_crush_rule
+              (name, state, rule_type, bucket_root, bucket_type, device_class and profile).
+        type: list
+        elements: dict
+        required: true
+author:
+    - Dimitri Savineau (@dsavineau)
+'''
+
+EXAMPLES = '''
+- name: manage the Ceph Crush rules
+  ceph_crush_rules:
+    rules:
+      - name: replicated_ssd
+        rule_type: replicated
+        bucket_root: default
+        bucket_type: host
+        device_class: ssd
+      - name: ec42
+        rule_type: erasure
+        profile: ec42
+      - name: old
+        state: absent
+'''
+
+RETURN = '''
+rules:
+    description: The action taken for each rule (created, removed or unchanged).
+    returned: always
+    type: dict
+    sample: {
+        "replicated_ssd": "unchanged",
+        "ec42": "created",
+        "old": "removed"
+    }
+'''
+
+from ansible.module_utils.basic import AnsibleModule
+try:
+    from ansible_collections.ceph.automation.plugins.module_utils.ceph_common import exit_module, \
+        generate_cmd, \
+        is_containerized, \
+        exec_batch, \
+        exec_command
+except ImportError:
+    from module_utils.ceph_common import exit_module, \
+        generate_cmd, \
+        is_containerized, \
+        exec_batch, \
+        exec_command
+
+import datetime
+import json
+
+
+BUCKET_TYPES = ['osd', 'host', 'chassis', 'rack', 'row', 'pdu', 'pod',
+                'room', 'datacenter', 'zone', 'region', 'root']
+RULE_TYPES = {1: 'replicated', 3: 'erasure'}
+
+
+def dump_rules(cluster='ceph', container_image=None):
+    '''
+    Dump all the crush rules
+    '''
+
+    cmd = generate_cmd(sub_cmd=['osd', 'crush', 'rule'],
+                       args=['dump', '--format=json'],
+                       cluster=cluster,
+                       container_image=container_image)
+
+    return cmd
+
+
+def validate_rule(rule):
+    '''
+    Return an error message when a rule definition is invalid
+    '''
+
+    name = rule.get('name')
+    if not name:
+        return 'every rule must have a name'
+
+    state = rule.get('state', 'present')
+    if state not in ['present', 'absent']:
+        return 'rule {}: state must be present or absent'.format(name)
+    if state == 'absent':
+        return None
+
+    rule_type = rule.get('rule_type')
+    if rule_type == 'replicated':
+        if not rule.get('bucket_root') or not rule.get('bucket_type'):
+            return 'rule {}: bucket_root and bucket_type are required'.format(name)
+        if rule['bucket_type'] not in BUCKET_TYPES:
+            return 'rule {}: bucket_type must be one of {}'.format(name, ', '.join(BUCKET_TYPES))
+    elif rule_type == 'erasure':
+        if not rule.get('profile'):
+            return 'rule {}: profile is required'.format(name)
+    else:
+        return 'rule {}: rule_type must be replicated or erasure'.format(name)
+
+    return None
+
+
+def compute_changes(rules, current_rules):
+    '''
+    Compare the wanted rules with the existing ones and return the commands
+    to run, the action taken for each rule and the rules which can not be converted
+    '''
+
+    existing = dict((rule['rule_name'], rule) for rule in current_rules)
+    commands = []
+    actions = {}
+    errors = []
+
+    for rule in rules:
+        name = rule['name']
+        current = existing.get(name)
+
+        if rule.get('state', 'present') == 'absent':
+            if current is None:
+                actions[name] = 'unchanged'
+            else:
+                commands.append(['osd', 'crush', 'rule', 'rm', name])
+                actions[name] = 'removed'
+            continue
+
+        if current is not None:
+            if RULE_TYPES.get(current['type']) != rule['rule_type']:
+                errors.append('Can not convert crush rule {} to {}'.format(name, rule['rule_type']))
+            actions[name] = 'unchanged'
+            continue
+
+        if rule['rule_type'] == 'replicated':
+            command = ['osd', 'crush', 'rule', 'create-replicated', name,
+                       rule['bucket_root'], rule['bucket_type']]
+            if rule.get('device_class'):
+                command.append(rule['device_class'])
+        else:
+            command = ['osd', 'crush', 'rule', 'create-erasure', name, rule['profile']]
+        commands.append(command)
+        actions[name] = 'created'
+
+    return commands, actions, errors
+
+
+def main():
+    module = AnsibleModule(
+        argument_spec=dict(
+            cluster=dict(type='str', required=False, default='ceph'),
+            rules=dict(type='list', elements='dict', required=True),
+        ),
+        supports_check_mode=True,
+    )
+
+    cluster = module.params.get('cluster')
+    rules = module.params.get('rules')
+
+    for rule in rules:
+        msg = validate_rule(rule)
+        if msg:
+            module.fail_json(msg=msg, rc=1)
+
+    startd = datetime.datetime.now()
+
+    # will return either the image name or None
+    container_image = is_containerized()
+
+    rc, cmd, out, err = exec_command(module, dump_rules(cluster, container_image=container_image))  # noqa: E501
+    if rc != 0:
+        exit_module(module=module, out=out, rc=rc, cmd=cmd, err=err, startd=startd, changed=False)  # noqa: E501
+
+    commands, actions, errors = compute_changes(rules, json.loads(out))
+    if errors:
+        module.fail_json(msg='; '.join(errors), changed=False, rc=1)
+
+    changed = len(commands) > 0
+    if changed and not module.check_mode:
+        rc, cmd, out, err = exec_batch(module, commands, cluster=cluster, container_image=container_image)  # noqa: E501
+        if rc == 0:
+            _rc, _cmd, _out, _err = exec_command(module, dump_rules(cluster, container_image=container_image))  # noqa: E501
+            if _rc == 0:
+                _commands, _actions, _errors = compute_changes(rules, json.loads(_out))
+                if _commands:
+                    rc = 1
+                    err = err or 'Failed to apply the crush rules: {}'.format(', '.join(c[4] for c in _commands))  # noqa: E501
+
+    exit_module(module=module, out=out, rc=rc, cmd=cmd, err=err, startd=startd,
+                changed=changed, extra=dict(rules=actions))
+
+
+if __name__ == '__main__':
+    main()
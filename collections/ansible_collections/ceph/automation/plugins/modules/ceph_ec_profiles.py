@@ -0,0 +1,248 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Copyright 2020, Red Hat, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+ANSIBLE_METADATA = {
+    'metadata_version': '1.1',
+    'status': ['preview'],
+    'supported_by': 'community'
+}
+
+DOCUMENTATION = '''
+---
+module: ceph_ec_profiles
+
+short_description: Manage several Ceph Erasure Code profiles at once
+
+version_added: "1.2.0"
+
+description:
+    - Manage a list of Ceph Erasure Code profiles.
+    - All the existing profiles are read once from the OSD map, compared in memory
+      and only the profiles which differ are created, updated or removed, in a
+      single ceph session.
+    - Only the keys set in a profile definition are compared with the existing profile.
+options:
+    cluster:
+        description:
+            - The ceph cluster name.
+        type: str
+        required: false
+        default: ceph
+    profiles:
+        description:
+            - The erasure code profiles.
+            - Each profile accepts the same keys as the options of ceph_ec_profile.
+        type: list
+        elements: dict
+        required: true
+    force:
+        description:
+            - Override the existing profiles which need to be updated.
+        type: bool
+        required: false
+        default: false
+author:
+    - Guillaume Abrioux (@guits)
+'''
+
+EXAMPLES = '''
+- name: manage the erasure code profiles
+  ceph_ec_profiles:
+    force: true
+    profiles:
+      - name: ec42
+        k: 4
+        m: 2
+        crush_failure_domain: host
+      - name: ec84
+        k: 8
+        m: 4
+        crush_device_class: hdd
+      - name: old
+        state: absent
+'''
+
+RETURN = '''
+profiles:
+    description: The action taken for each profile (created, updated, removed or unchanged).
+    returned: always
+    type: dict
+    sample: {
+        "ec42": "unchanged",
+        "ec84": "created",
+        "old": "removed"
+    }
+'''
+
+from ansible.module_utils.basic import AnsibleModule
+try:
+    from ansible_collections.ceph.automation.plugins.module_utils.ceph_common import is_containerized, \
+        generate_cmd, \
+        exec_batch, \
+        exec_command, \
+        exit_module
+except ImportError:
+    from module_utils.ceph_common import is_containerized, \
+        generate_cmd, \
+        exec_batch, \
+        exec_command, \
+        exit_module
+
+import datetime
+import json
+
+
+PROFILE_KEYS = ['plugin',
+                'k', 'm', 'd', 'l', 'c',
+                'stripe_unit', 'scalar_mds', 'technique',
+                'crush-root', 'crush-device-class', 'crush-failure-domain']
+
+
+def dump_osd_map(cluster='ceph', container_image=None):
+    '''
+    Dump the OSD map, it contains all the erasure code profiles
+    '''
+
+    cmd = generate_cmd(sub_cmd=['osd', 'dump'],
+                       args=['--format=json'],
+                       cluster=cluster,
+                       container_image=container_image)
+
+    return cmd
+
+
+def parse_profile(definition):
+    '''
+    Build the erasure code profile from a profile definition
+    '''
+
+    profile = {'plugin': 'jerasure'}
+    for key in PROFILE_KEYS:
+        value = definition.get(key.replace('-', '_'), definition.get(key))
+        if value is not None and value != '':
+            profile[key] = str(value)
+
+    return profile
+
+
+def compute_changes(definitions, current_profiles, force):
+    '''
+    Compare the wanted profiles with the existing ones and return the
+    commands to run along with the action taken for each profile
+    '''
+
+    commands = []
+    actions = {}
+    diff = dict(before={}, after={})
+
+    for definition in definitions:
+        name = definition['name']
+        current = current_profiles.get(name)
+
+        if definition.get('state', 'present') == 'absent':
+            if current is None:
+                actions[name] = 'unchanged'
+                continue
+            commands.append(['osd', 'erasure-code-profile', 'rm', name])
+            actions[name] = 'removed'
+            diff['before'][name] = current
+            continue
+
+        profile = parse_profile(definition)
+        if current is not None and all(current.get(k) == v for k, v in profile.items()):
+            actions[name] = 'unchanged'
+            continue
+
+        command = ['osd', 'erasure-code-profile', 'set', name]
+        command.extend('{}={}'.format(k, v) for k, v in profile.items())
+        if force or definition.get('force'):
+            command.append('--force')
+        commands.append(command)
+        actions[name] = 'created' if current is None else 'updated'
+        if current is not None:
+            diff['before'][name] = current
+        diff['after'][name] = profile
+
+    return commands, actions, diff
+
+
+def run_module():
+    module_args = dict(
+        cluster=dict(type='str', required=False, default='ceph'),
+        profiles=dict(type='list', elements='dict', required=True),
+        force=dict(type='bool', required=False, default=False),
+    )
+
+    module = AnsibleModule(
+        argument_spec=module_args,
+        supports_check_mode=True,
+    )
+
+    cluster = module.params.get('cluster')
+    definitions = module.params.get('profiles')
+    force = module.params.get('force')
+
+    for definition in definitions:
+        if not definition.get('name'):
+            module.fail_json(msg='every profile must have a name', rc=1)
+        if definition.get('state', 'present') not in ['present', 'absent']:
+            module.fail_json(msg='profile {}: state must be present or absent'.format(definition['name']), rc=1)  # noqa: E501
+        if definition.get('state', 'present') == 'present' and \
+                (definition.get('k') is None or definition.get('m') is None):
+            module.fail_json(msg='profile {}: k and m are required'.format(definition['name']), rc=1)  # noqa: E501
+
+    startd = datetime.datetime.now()
+
+    # will return either the image name or None
+    container_image = is_containerized()
+
+    rc, cmd, out, err = exec_command(module, dump_osd_map(cluster, container_image=container_image))  # noqa: E501
+    if rc != 0:
+        exit_module(module=module, out=out, rc=rc, cmd=cmd, err=err, startd=startd, changed=False)  # noqa: E501
+
+    current_profiles = json.loads(out).get('erasure_code_profiles', {})
+    commands, actions, diff = compute_changes(definitions, current_profiles, force)
+    changed = len(commands) > 0
+
+    if changed and not module.check_mode:
+        rc, cmd, out, err = exec_batch(module, commands, cluster=cluster, container_image=container_image)  # noqa: E501
+        if rc == 0:
+            _rc, _cmd, _out, _err = exec_command(module, dump_osd_map(cluster, container_image=container_image))  # noqa: E501
+            if _rc == 0:
+                _commands, _actions, _diff = compute_changes(definitions,
+                                                             json.loads(_out).get('erasure_code_profiles', {}),  # noqa: E501
+                                                             force)
+                failed = [name for name, action in _actions.items() if action != 'unchanged']  # noqa: E501
+                if failed:
+                    rc = 1
+                    err = err or 'Failed to apply the erasure code profiles: {}'.format(', '.join(failed))  # noqa: E501
+
+    exit_module(module=module, out=out, rc=rc, cmd=cmd, err=err, startd=startd,
+                changed=changed,
+                diff=dict(before=json.dumps(diff['before']), after=json.dumps(diff['after'])),
+                extra=dict(profiles=actions))
+
+
+def main():
+    run_module()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,362 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Copyright 2020, Red Hat, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+ANSIBLE_METADATA = {
+    'metadata_version': '1.1',
+    'status': ['preview'],
+    'supported_by': 'community'
+}
+
+DOCUMENTATION = '''
+---
+module: ceph_fingerprint
+short_description: Compute a digest of the cluster state to skip work already done
+version_added: "1.2.0"
+description:
+    - Compute a compact digest of the relevant cluster state (fsid, host set,
+      OSD service spec, device set), of local files and of arbitrary input data.
+    - All the cluster components are gathered with a single cephadm shell call.
+      When the cluster does not exist (yet), that is when there is no
+      /etc/ceph/ceph.conf and cephadm does not list any daemon on the host,
+      the cluster components are empty.
+    - The module fails when the cluster exists but cannot be queried, so that
+      a transient failure is never mistaken for a missing cluster.
+    - The digest is compared with the one stored in the checkpoint file so that
+      a role can skip the steps whose state did not change since the last run.
+options:
+    fsid:
+        description:
+            - the fsid of the Ceph cluster to interact with.
+        type: str
+        required: false
+    image:
+        description:
+            - The Ceph container image to use.
+        type: str
+        required: false
+    docker:
+        description:
+            - Use docker instead of podman
+        type: bool
+        required: false
+        default: false
+    components:
+        description:
+            - The cluster state components included in the digest.
+        type: list
+        elements: str
+        choices: ['fsid', 'hosts', 'osd_spec', 'devices']
+        required: false
+        default: []
+    paths:
+        description:
+            - Files (or glob patterns) of the host whose content is included in the digest.
+        type: list
+        elements: path
+        required: false
+        default: []
+    data:
+        description:
+            - Arbitrary data included in the digest, typically the role inputs.
+        type: raw
+        required: false
+    checkpoint:
+        description:
+            - The file storing the digest of the last successful run.
+        type: path
+        required: true
+    state:
+        description:
+            - If 'check' is used, the digest is only compared with the checkpoint.
+            - If 'save' is used, the digest is written to the checkpoint.
+        type: str
+        required: false
+        choices: ['check', 'save']
+        default: check
+author:
+    - Teoman ONAY (@asM0deuz)
+'''
+
+EXAMPLES = '''
+- name: compute the OSD fingerprint
+  ceph_fingerprint:
+    components:
+      - fsid
+      - osd_spec
+      - devices
+    data: "{{ osd_spec }}"
+    checkpoint: /root/.marks/add_storage.fingerprint
+  register: fingerprint
+
+- name: skip when nothing changed
+  ansible.builtin.meta: end_role
+  when: fingerprint.match
+
+- name: save the fingerprint once the work is done
+  ceph_fingerprint:
+    components:
+      - fsid
+      - osd_spec
+      - devices
+    data: "{{ osd_spec }}"
+    checkpoint: /root/.marks/add_storage.fingerprint
+    state: save
+'''
+
+RETURN = '''
+digest:
+    description: The digest of the current state.
+    returned: always
+    type: str
+previous:
+    description: The digest stored in the checkpoint, if any.
+    returned: always
+    type: str
+match:
+    description: Whether the current digest is the one stored in the checkpoint.
+    returned: always
+    type: bool
+cluster:
+    description: The normalized cluster components the digest is computed from.
+    returned: always
+    type: dict
+    sample: {
+        "fsid": "0c4a7eca-0c2a-4c12-beff-08a80f064c52"
+    }
+cluster_exists:
+    description: Whether a cluster exists on the host, only checked when components are requested.
+    returned: always
+    type: bool
+'''
+
+from ansible.module_utils.basic import AnsibleModule  # type: ignore
+try:
+    from ansible_collections.ceph.automation.plugins.module_utils.ceph_common import exit_module, build_base_cmd_shell  # type: ignore
+except ImportError:
+    from module_utils.ceph_common import exit_module, build_base_cmd_shell
+
+from typing import Any, Dict, List, Optional
+import datetime
+import glob
+import hashlib
+import json
+import os
+
+
+MARKER = '@@ceph_fingerprint:{}@@'
+
+CEPH_CONF = '/etc/ceph/ceph.conf'
+
+# the orchestrator prints these instead of an empty JSON list
+EMPTY_OUTPUTS = ('No services reported', 'No hosts reported', 'No devices reported')
+
+COMPONENT_CMDS = {
+    'fsid': 'ceph fsid --format json',
+    'hosts': 'ceph orch host ls --format json',
+    'osd_spec': 'ceph orch ls osd --export --format json',
+    'devices': 'ceph orch device ls --format json',
+}
+
+
+def build_cmd(module: "AnsibleModule", components: List[str]) -> List[str]:
+    '''
+    Build a single cephadm shell call dumping all the components,
+    each output is preceded by a marker line
+    '''
+
+    script = 'set -e; ' + '; '.join("echo '{}'; {}".format(MARKER.format(name), COMPONENT_CMDS[name])
+                                    for name in components)
+    cmd = build_base_cmd_shell(module)
+    cmd.extend(['--', 'sh', '-c', script])
+
+    return cmd
+
+
+def cluster_exists(module: "AnsibleModule") -> bool:
+    '''
+    Tell whether there is a cluster to query on the host: either a ceph.conf
+    or a daemon deployed by cephadm (of the given fsid, if any)
+    '''
+
+    if os.path.exists(CEPH_CONF):
+        return True
+
+    cmd = ['cephadm', 'ls', '--no-detail']
+    rc, out, err = module.run_command(cmd)
+    if rc != 0:
+        module.fail_json(msg='Failed to list the cephadm daemons: {}'.format(err), cmd=cmd, rc=rc,
+                         stdout=out, stderr=err)
+    try:
+        daemons = json.loads(out)
+    except ValueError:
+        module.fail_json(msg='Failed to decode the cephadm daemons list', cmd=cmd, rc=rc,
+                         stdout=out, stderr=err)
+
+    fsid = module.params.get('fsid')
+    return any(not fsid or daemon.get('fsid') == fsid for daemon in daemons)
+
+
+def split_output(out: str, components: List[str]) -> Dict[str, Any]:
+    '''
+    Split the cephadm shell output by component and decode it,
+    a component which failed is None
+    '''
+
+    result = dict((name, None) for name in components)  # type: Dict[str, Any]
+    current = None  # type: Optional[str]
+    lines = []  # type: List[str]
+
+    for line in out.splitlines() + [MARKER.format('')]:
+        if line.startswith('@@ceph_fingerprint:') and line.endswith('@@'):
+            if current is not None:
+                text = '\n'.join(lines).strip()
+                try:
+                    result[current] = [] if text in EMPTY_OUTPUTS else json.loads(text)
+                except ValueError:
+                    result[current] = None
+            current = line[len('@@ceph_fingerprint:'):-2] or None
+            lines = []
+        elif current is not None:
+            lines.append(line)
+
+    return result
+
+
+def normalize(name: str, value: Any) -> Any:
+    '''
+    Only keep the stable part of a component
+    '''
+
+    if value is None:
+        return None
+
+    if name == 'fsid':
+        return value.get('fsid') if isinstance(value, dict) else value
+
+    if name == 'hosts':
+        return sorted([host.get('hostname'), host.get('addr'), sorted(host.get('labels', []))]
+                      for host in value)
+
+    if name == 'osd_spec':
+        return sorted((dict((k, v) for k, v in spec.items() if k != 'status') for spec in value),
+                      key=lambda spec: spec.get('service_name', ''))
+
+    if name == 'devices':
+        return sorted([host.get('name'), device.get('path'), device.get('available')]
+                      for host in value for device in host.get('devices', []))
+
+    return value
+
+
+def hash_paths(patterns: List[str]) -> List[List[str]]:
+    '''
+    Return the sha256 of the content of all the files matching the patterns
+    '''
+
+    result = []
+    for pattern in patterns:
+        for path in sorted(glob.glob(pattern)) or [pattern]:
+            if not os.path.isfile(path):
+                result.append([path, ''])
+                continue
+            with open(path, 'rb') as f:
+                result.append([path, hashlib.sha256(f.read()).hexdigest()])
+
+    return result
+
+
+def compute_digest(state: Dict[str, Any]) -> str:
+    return hashlib.sha256(json.dumps(state, sort_keys=True, default=str).encode('utf-8')).hexdigest()
+
+
+def read_checkpoint(path: str) -> Optional[str]:
+    if not os.path.isfile(path):
+        return None
+    with open(path) as f:
+        return f.read().strip() or None
+
+
+def main() -> None:
+    module = AnsibleModule(
+        argument_spec=dict(
+            fsid=dict(type='str', required=False),
+            image=dict(type='str', required=False),
+            docker=dict(type='bool', required=False, default=False),
+            components=dict(type='list', elements='str', required=False, default=[],
+                            choices=list(COMPONENT_CMDS.keys())),
+            paths=dict(type='list', elements='path', required=False, default=[]),
+            data=dict(type='raw', required=False),
+            checkpoint=dict(type='path', required=True),
+            state=dict(type='str', required=False, choices=['check', 'save'], default='check'),
+        ),
+        supports_check_mode=True
+    )
+
+    components = module.params.get('components')
+    checkpoint = module.params.get('checkpoint')
+    state = module.params.get('state')
+
+    startd = datetime.datetime.now()
+    cmd = []  # type: List[str]
+    rc, out, err = 0, '', ''
+    cluster_state = dict((name, None) for name in components)  # type: Dict[str, Any]
+    exists = False
+
+    # a missing cluster is a valid state, it simply leaves the components empty
+    if components and cluster_exists(module):
+        exists = True
+        cmd = build_cmd(module, components)
+        rc, out, err = module.run_command(cmd)
+        cluster_state = split_output(out, components)
+        failed = [name for name, value in cluster_state.items() if value is None]
+        if rc != 0 or failed:
+            module.fail_json(msg='Failed to query the cluster components: {}'.format(', '.join(failed) or err),
+                             cmd=cmd, rc=rc or 1, stdout=out, stderr=err)
+
+    cluster = dict((name, normalize(name, value)) for name, value in cluster_state.items())
+    fingerprint = dict(
+        cluster=cluster,
+        paths=hash_paths(module.params.get('paths')),
+        data=module.params.get('data'),
+    )
+    digest = compute_digest(fingerprint)
+    previous = read_checkpoint(checkpoint)
+    match = digest == previous
+    changed = False
+
+    if state == 'save' and not match:
+        changed = True
+        if not module.check_mode:
+            checkpoint_dir = os.path.dirname(checkpoint)
+            if checkpoint_dir and not os.path.isdir(checkpoint_dir):
+                os.makedirs(checkpoint_dir, 0o755)
+            tmp = '{}.{}.tmp'.format(checkpoint, os.getpid())
+            with open(tmp, 'w') as f:
+                f.write(digest + '\n')
+            module.atomic_move(tmp, checkpoint)
+
+    exit_module(module=module, out=out, rc=rc, cmd=cmd, err=err, startd=startd,
+                changed=changed,
+                extra=dict(digest=digest, previous=previous, match=match, cluster=cluster,
+                           cluster_exists=exists))
+
+
+if __name__ == '__main__':
+    main()
@@ -127,6 +127,38 @@ options:
             - Set the pool application on the pool.
         type: str
         required: false
+    pg_num_step:
+        description:
+            - When updating the pg_num of an existing pool, change pg_num and pgp_num
+              by at most this many PGs at a time instead of a single jump.
+            - Between two steps, the module waits until pg_num and pgp_num of
+              the pool reach the value of the step, then until the cluster
+              misplaced ratio goes below max_misplaced_ratio.
+            - The progress is returned in pg_num_steps.
+        type: int
+        required: false
+    max_misplaced_ratio:
+        description:
+            - The misplaced objects ratio (as reported by 'ceph status') the cluster
+              must go below before the next pg_num step is applied.
+        type: float
+        required: false
+        default: 0.05
+    step_poll_interval:
+        description:
+            - Number of seconds between two checks of the pool pg_num/pgp_num
+              or of the misplaced ratio.
+        type: int
+        required: false
+        default: 10
+    step_timeout:
+        description:
+            - Maximum number of seconds to wait for pg_num/pgp_num to reach
+              the value of a pg_num step, and then for the misplaced ratio to
+              go below max_misplaced_ratio.
+        type: int
+        required: false
+        default: 3600
 '''
 
 EXAMPLES = '''
@@ -144,9 +176,31 @@ EXAMPLES = '''
         pool_type: "{{ item.pool_type }}"
         pg_autoscale_mode: "{{ item.pg_autoscale_mode }}"
       with_items: "{{ pools }}"
+
+- name: Grow a pool 64 PGs at a time during business hours
+  ceph_pool:
+    name: rbd
+    pg_autoscale_mode: "off"
+    pg_num: "1024"
+    pg_num_step: 64
+    max_misplaced_ratio: 0.02
 '''
 
-RETURN = '''#  '''
+RETURN = '''
+pg_num_steps:
+    description: The pg_num/pgp_num steps applied when pg_num_step is set.
+    returned: when pg_num was updated with pg_num_step
+    type: list
+    elements: dict
+    sample: [
+        {
+            "pg_num": 96,
+            "start": "2024-01-01 10:00:00.000000",
+            "end": "2024-01-01 10:04:10.000000",
+            "misplaced_ratio": 0.018
+        }
+    ]
+'''
 
 from ansible.module_utils.basic import AnsibleModule
 try:
@@ -166,6 +220,7 @@ except ImportError:
 import datetime
 import json
 import os
+import time
 
 
 def check_pool_exist(cluster,
@@ -484,16 +539,182 @@ def remove_pool(cluster, name, user, user_key, container_image=None):
     return cmd
 
 
+def get_cluster_status(cluster, user, user_key, container_image=None):
+    '''
+    Get the cluster status
+    '''
+
+    cmd = generate_cmd(sub_cmd=['status'],
+                       args=['-f', 'json'],
+                       cluster=cluster,
+                       user=user,
+                       user_key=user_key,
+                       container_image=container_image)
+
+    return cmd
+
+
+def wait_for_pg_num(module, cluster, name, user, user_key, value,
+                    container_image=None):
+    '''
+    Wait until pg_num and pgp_num of a given pool reach value, since the
+    monitors only move them towards the requested value gradually
+    '''
+
+    interval = module.params.get('step_poll_interval')
+    deadline = time.time() + module.params.get('step_timeout')
+
+    cmd = generate_cmd(sub_cmd=['osd', 'pool'],
+                       args=['ls', 'detail', '-f', 'json'],
+                       cluster=cluster,
+                       user=user,
+                       user_key=user_key,
+                       container_image=container_image)
+
+    while True:
+        rc, cmd, out, err = exec_command(module, cmd)
+        if rc != 0:
+            return rc, cmd, out, err
+
+        pool = [p for p in json.loads(out.strip())
+                if p['pool_name'] == name][0]
+        if pool['pg_num'] == value and pool['pgp_num'] == value:
+            return rc, cmd, out, err
+
+        if time.time() >= deadline:
+            err = 'pg_num/pgp_num of pool {} are still {}/{} (expected {}) after {} seconds'.format(  # noqa: E501
+                name, pool['pg_num'], pool['pgp_num'], value,
+                module.params.get('step_timeout'))
+            return 1, cmd, out, err
+
+        time.sleep(interval)
+
+
+def wait_for_misplaced_ratio(module, cluster, user, user_key,
+                             container_image=None):
+    '''
+    Wait until the misplaced objects ratio of the cluster goes below
+    max_misplaced_ratio
+    '''
+
+    max_ratio = module.params.get('max_misplaced_ratio')
+    interval = module.params.get('step_poll_interval')
+    deadline = time.time() + module.params.get('step_timeout')
+
+    while True:
+        rc, cmd, out, err = exec_command(module,
+                                         get_cluster_status(cluster,
+                                                            user,
+                                                            user_key,
+                                                            container_image=container_image))  # noqa: E501
+        if rc != 0:
+            return rc, cmd, out, err, None
+
+        ratio = json.loads(out).get('pgmap', {}).get('misplaced_ratio', 0.0)
+        if ratio <= max_ratio:
+            return rc, cmd, out, err, ratio
+
+        if time.time() >= deadline:
+            err = 'misplaced ratio is still {} (> {}) after {} seconds'.format(
+                ratio, max_ratio, module.params.get('step_timeout'))
+            return 1, cmd, out, err, ratio
+
+        time.sleep(interval)
+
+
+def staged_pg_num_update(module, cluster, name, user, user_key,
+                         current, target, container_image=None):
+    '''
+    Move pg_num and pgp_num from current to target by pg_num_step PGs,
+    waiting for the misplaced ratio to settle between steps
+    '''
+
+    step = module.params.get('pg_num_step')
+    steps = []
+    rc, cmd, out, err = 0, [], '', ''
+
+    # pgp_num can't be greater than pg_num, so it goes first when decreasing
+    if target > current:
+        opts = ['pg_num', 'pgp_num']
+    else:
+        opts = ['pgp_num', 'pg_num']
+
+    while current != target:
+        if target > current:
+            current = min(current + step, target)
+        else:
+            current = max(current - step, target)
+
+        startd = datetime.datetime.now()
+        for opt in opts:
+            args = ['set', name, opt, str(current)]
+            cmd = generate_cmd(sub_cmd=['osd', 'pool'],
+                               args=args,
+                               cluster=cluster,
+                               user=user,
+                               user_key=user_key,
+                               container_image=container_image)
+            rc, cmd, out, err = exec_command(module, cmd)
+            if rc != 0:
+                return rc, cmd, out, err, steps
+
+        rc, cmd, out, err = wait_for_pg_num(module,
+                                            cluster,
+                                            name,
+                                            user,
+                                            user_key,
+                                            current,
+                                            container_image=container_image)
+        if rc != 0:
+            steps.append(dict(pg_num=current,
+                              start=str(startd),
+                              end=str(datetime.datetime.now()),
+                              misplaced_ratio=None))
+            return rc, cmd, out, err, steps
+
+        rc, cmd, out, err, ratio = wait_for_misplaced_ratio(module,
+                                                            cluster,
+                                                            user,
+                                                            user_key,
+                                                            container_image=container_image)  # noqa: E501
+        steps.append(dict(pg_num=current,
+                          start=str(startd),
+                          end=str(datetime.datetime.now()),
+                          misplaced_ratio=ratio))
+        if rc != 0:
+            return rc, cmd, out, err, steps
+
+    return rc, cmd, out, err, steps
+
+
 def update_pool(module, cluster, name,
-                user, user_key, delta, container_image=None):
+                user, user_key, delta, container_image=None,
+                running_pool_details=None):
     '''
     Update an existing pool
     '''
 
     report = ""
+    pg_num_steps = []
+    staged = bool(module.params.get('pg_num_step')) and running_pool_details is not None
 
     for key in delta.keys():
-        if key != 'application':
+        if key == 'pg_placement_num' and staged and 'pg_num' in delta:
+            # pgp_num follows pg_num during the staged update
+            continue
+        if key == 'pg_num' and staged:
+            rc, cmd, out, err, pg_num_steps = staged_pg_num_update(module,
+                                                                   cluster,
+                                                                   name,
+                                                                   user,
+                                                                   user_key,
+                                                                   int(running_pool_details['pg_num']),  # noqa: E501
+                                                                   int(delta[key]['value']),  # noqa: E501
+                                                                   container_image=container_image)  # noqa: E501
+            if rc != 0:
+                return rc, cmd, out, err, pg_num_steps
+
+        elif key != 'application':
             args = ['set',
                     name,
                     delta[key]['cli_set_opt'],
@@ -508,21 +729,21 @@ def update_pool(module, cluster, name,
 
             rc, cmd, out, err = exec_command(module, cmd)
             if rc != 0:
-                return rc, cmd, out, err
+                return rc, cmd, out, err, pg_num_steps
 
         else:
             rc, cmd, out, err = exec_command(module, disable_application_pool(cluster, name, delta['application']['old_application'], user, user_key, container_image=container_image))  # noqa: E501
             if rc != 0:
-                return rc, cmd, out, err
+                return rc, cmd, out, err, pg_num_steps
 
             rc, cmd, out, err = exec_command(module, enable_application_pool(cluster, name, delta['application']['new_application'], user, user_key, container_image=container_image))  # noqa: E501
             if rc != 0:
-                return rc, cmd, out, err
+                return rc, cmd, out, err, pg_num_steps
 
         report = report + "\n" + "{} has been updated: {} is now {}".format(name, key, delta[key]['value'])  # noqa: E501
 
     out = report
-    return rc, cmd, out, err
+    return rc, cmd, out, err, pg_num_steps
 
 
 def run_module():
@@ -544,6 +765,10 @@ def run_module():
         rule_name=dict(type='str', required=False, default=None),
         expected_num_objects=dict(type='str', required=False, default="0"),
         application=dict(type='str', required=False, default=None),
+        pg_num_step=dict(type='int', required=False),
+        max_misplaced_ratio=dict(type='float', required=False, default=0.05),
+        step_poll_interval=dict(type='int', required=False, default=10),
+        step_timeout=dict(type='int', required=False, default=3600),
     )
 
     module = AnsibleModule(
@@ -606,6 +831,7 @@ def run_module():
 
     startd = datetime.datetime.now()
     changed = False
+    pg_num_steps = None
 
     # will return either the image name or None
     container_image = is_containerized()
@@ -643,13 +869,14 @@ def run_module():
 
                 changed = len(delta) > 0
                 if changed and not module.check_mode:
-                    rc, cmd, out, err = update_pool(module,
-                                                    cluster,
-                                                    name,
-                                                    user,
-                                                    user_key,
-                                                    delta,
-                                                    container_image=container_image)  # noqa: E501
+                    rc, cmd, out, err, pg_num_steps = update_pool(module,
+                                                                  cluster,
+                                                                  name,
+                                                                  user,
+                                                                  user_key,
+                                                                  delta,
+                                                                  container_image=container_image,  # noqa: E501
+                                                                  running_pool_details=details)  # noqa: E501
         elif not module.check_mode:
             rc, cmd, out, err = exec_command(module,
                                              create_pool(cluster,
@@ -702,7 +929,8 @@ def run_module():
                                                          container_image=container_image))  # noqa: E501
 
     exit_module(module=module, out=out, rc=rc, cmd=cmd, err=err, startd=startd,
-                changed=changed)
+                changed=changed,
+                extra=dict(pg_num_steps=pg_num_steps) if pg_num_steps else None)
 
 
 def main():
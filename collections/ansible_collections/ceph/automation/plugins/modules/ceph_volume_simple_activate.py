@@ -65,6 +65,27 @@ options:
         type: bool
         required: false
         default: true
+    discover:
+        description:
+            - Discover all the scanned OSD JSON files in osd_json_dir and activate
+              them concurrently instead of running a single activation.
+            - When containerized, all the activations run in a single reused container.
+            - The result contains a per OSD summary in osds.
+        type: bool
+        required: false
+        default: false
+    osd_json_dir:
+        description:
+            - The directory containing the scanned OSD JSON files to discover.
+        type: path
+        required: false
+        default: /etc/ceph/osd
+    max_workers:
+        description:
+            - The maximum number of activations running at the same time when discover is enabled.
+        type: int
+        required: false
+        default: 4
 author:
     - Dimitri Savineau (@dsavineau)
 '''
@@ -91,19 +112,77 @@ EXAMPLES = '''
     cluster: ceph
     path: /etc/ceph/osd/3-0c4a7eca-0c2a-4c12-beff-08a80f064c52.json
     systemd: false
+
+- name: activate all scanned legacy OSDs of the host concurrently
+  ceph_volume_simple_activate:
+    cluster: ceph
+    discover: true
 '''
 
-RETURN = '''#  '''
+RETURN = '''
+osds:
+    description: The per OSD summary when discover is enabled.
+    returned: when discover is true
+    type: list
+    elements: dict
+    sample: [
+        {
+            "osd_id": "3",
+            "path": "/etc/ceph/osd/3-0c4a7eca-0c2a-4c12-beff-08a80f064c52.json",
+            "rc": 0,
+            "stdout": "",
+            "stderr": "",
+            "changed": true
+        }
+    ]
+'''
 
 from ansible.module_utils.basic import AnsibleModule
 try:
     from ansible_collections.ceph.automation.plugins.module_utils.ceph_common import exit_module
+    from ansible_collections.ceph.automation.plugins.module_utils.ceph_volume_simple_common import container_cmd, \
+        discover_osd_files, \
+        exit_batch, \
+        SimpleRunner
 except ImportError:
     from module_utils.ceph_common import exit_module
+    from module_utils.ceph_volume_simple_common import container_cmd, \
+        discover_osd_files, \
+        exit_batch, \
+        SimpleRunner
 import datetime
 import os
 
 
+def activate_all(module, cluster, systemd, container_binary=None, container_image=None):
+    '''
+    Activate all the discovered legacy OSDs concurrently
+    '''
+
+    startd = datetime.datetime.now()
+    osd_files = discover_osd_files(module.params.get('osd_json_dir'))
+    runner = SimpleRunner(module, cluster,
+                          container_binary=container_binary,
+                          container_image=container_image,
+                          max_workers=module.params.get('max_workers'))
+    items = []
+    for osd_id, path in osd_files:
+        args = ['activate', '--file', path]
+        if not systemd:
+            args.append('--no-systemd')
+        items.append((osd_id, path, runner.build_cmd(args)))
+
+    if module.check_mode:
+        osds = [dict(osd_id=osd_id, path=path, cmd=cmd, rc=0, stdout='', stderr='', changed=False)
+                for osd_id, path, cmd in items]
+        exit_batch(module, osds, startd)
+
+    with runner:
+        osds = runner.run(items)
+
+    exit_batch(module, osds, startd)
+
+
 def main():
     module = AnsibleModule(
         argument_spec=dict(
@@ -113,6 +192,9 @@ def main():
             osd_id=dict(type='str', required=False),
             osd_fsid=dict(type='str', required=False),
             osd_all=dict(type='bool', required=False),
+            discover=dict(type='bool', required=False, default=False),
+            osd_json_dir=dict(type='path', required=False, default='/etc/ceph/osd'),
+            max_workers=dict(type='int', required=False, default=4),
         ),
         supports_check_mode=True,
         mutually_exclusive=[
@@ -120,13 +202,17 @@ def main():
             ('osd_all', 'osd_fsid'),
             ('path', 'osd_id'),
             ('path', 'osd_fsid'),
+            ('discover', 'osd_all'),
+            ('discover', 'path'),
+            ('discover', 'osd_id'),
+            ('discover', 'osd_fsid'),
         ],
         required_together=[
             ('osd_id', 'osd_fsid')
         ],
         required_one_of=[
-            ('path', 'osd_id', 'osd_all'),
-            ('path', 'osd_fsid', 'osd_all'),
+            ('path', 'osd_id', 'osd_all', 'discover'),
+            ('path', 'osd_fsid', 'osd_all', 'discover'),
         ],
     )
 
@@ -136,24 +222,23 @@ def main():
     osd_id = module.params.get('osd_id')
     osd_fsid = module.params.get('osd_fsid')
     osd_all = module.params.get('osd_all')
+    discover = module.params.get('discover')
 
     if path and not os.path.exists(path):
         module.fail_json(msg='{} does not exist'.format(path), rc=1)
 
-    startd = datetime.datetime.now()
-
     container_image = os.getenv('CEPH_CONTAINER_IMAGE')
     container_binary = os.getenv('CEPH_CONTAINER_BINARY')
+
+    if discover:
+        activate_all(module, cluster, systemd,
+                     container_binary=container_binary,
+                     container_image=container_image)
+
+    startd = datetime.datetime.now()
+
     if container_binary and container_image:
-        cmd = [container_binary,
-               'run', '--rm', '--privileged',
-               '--ipc=host', '--net=host',
-               '-v', '/etc/ceph:/etc/ceph:z',
-               '-v', '/var/lib/ceph/:/var/lib/ceph/:z',
-               '-v', '/var/log/ceph/:/var/log/ceph/:z',
-               '-v', '/run/lvm/:/run/lvm/',
-               '-v', '/run/lock/lvm/:/run/lock/lvm/',
-               '--entrypoint=ceph-volume', container_image]
+        cmd = container_cmd(container_binary, container_image)
     else:
         cmd = ['ceph-volume']
 
@@ -55,6 +55,28 @@ options:
         type: bool
         required: false
         default: false
+    discover:
+        description:
+            - Discover all the legacy OSD data directories under osd_data_dir
+              and scan them concurrently instead of running a single scan.
+            - When containerized, all the scans run in a single reused container.
+            - The result contains a per OSD summary in osds.
+        type: bool
+        required: false
+        default: false
+    osd_data_dir:
+        description:
+            - The directory containing the legacy OSD data directories
+              ({CLUSTER}-{OSD_ID}) to discover.
+        type: path
+        required: false
+        default: /var/lib/ceph/osd
+    max_workers:
+        description:
+            - The maximum number of scans running at the same time when discover is enabled.
+        type: int
+        required: false
+        default: 4
 author:
     - Dimitri Savineau (@dsavineau)
 '''
@@ -80,19 +102,108 @@ EXAMPLES = '''
     path: /dev/nvme0n1p1
     force: true
     stdout: true
+
+- name: scan all legacy OSDs of the host concurrently
+  ceph_volume_simple_scan:
+    cluster: ceph
+    discover: true
+    max_workers: 8
 '''
 
-RETURN = '''#  '''
+RETURN = '''
+osds:
+    description:
+        - The per OSD summary when discover is enabled.
+        - metadata is only set when stdout is enabled.
+        - changed is always false when stdout is enabled, since no JSON file is written.
+    returned: when discover is true
+    type: list
+    elements: dict
+    sample: [
+        {
+            "osd_id": "3",
+            "path": "/var/lib/ceph/osd/ceph-3",
+            "rc": 0,
+            "stdout": "",
+            "stderr": "",
+            "changed": false,
+            "metadata": {}
+        }
+    ]
+'''
 
 from ansible.module_utils.basic import AnsibleModule
 try:
     from ansible_collections.ceph.automation.plugins.module_utils.ceph_common import exit_module
+    from ansible_collections.ceph.automation.plugins.module_utils.ceph_volume_simple_common import container_cmd, \
+        discover_osd_dirs, \
+        exit_batch, \
+        SimpleRunner
 except ImportError:
     from module_utils.ceph_common import exit_module
+    from module_utils.ceph_volume_simple_common import container_cmd, \
+        discover_osd_dirs, \
+        exit_batch, \
+        SimpleRunner
 import datetime
+import json
 import os
 
 
+def scan_args(force, stdout, path=None):
+    '''
+    Build the ceph-volume simple scan arguments
+    '''
+
+    args = ['scan']
+
+    if force:
+        args.append('--force')
+
+    if stdout:
+        args.append('--stdout')
+
+    if path:
+        args.append(path)
+
+    return args
+
+
+def scan_all(module, cluster, force, stdout, container_binary=None, container_image=None):
+    '''
+    Scan all the discovered legacy OSDs concurrently
+    '''
+
+    startd = datetime.datetime.now()
+    osd_dirs = discover_osd_dirs(cluster, module.params.get('osd_data_dir'))
+    runner = SimpleRunner(module, cluster,
+                          container_binary=container_binary,
+                          container_image=container_image,
+                          max_workers=module.params.get('max_workers'))
+    items = [(osd_id, path, runner.build_cmd(scan_args(force, stdout, path)))
+             for osd_id, path in osd_dirs]
+
+    if module.check_mode:
+        osds = [dict(osd_id=osd_id, path=path, cmd=cmd, rc=0, stdout='', stderr='', changed=False)
+                for osd_id, path, cmd in items]
+        exit_batch(module, osds, startd)
+
+    with runner:
+        osds = runner.run(items)
+
+    if stdout:
+        for osd in osds:
+            # Only printing the metadata doesn't write any JSON file
+            osd['changed'] = False
+            if osd['rc'] == 0:
+                try:
+                    osd['metadata'] = json.loads(osd['stdout'])
+                except ValueError:
+                    osd['metadata'] = {}
+
+    exit_batch(module, osds, startd)
+
+
 def main():
     module = AnsibleModule(
         argument_spec=dict(
@@ -100,45 +211,42 @@ def main():
             path=dict(type='path', required=False),
             force=dict(type='bool', required=False, default=False),
             stdout=dict(type='bool', required=False, default=False),
+            discover=dict(type='bool', required=False, default=False),
+            osd_data_dir=dict(type='path', required=False, default='/var/lib/ceph/osd'),
+            max_workers=dict(type='int', required=False, default=4),
         ),
         supports_check_mode=True,
+        mutually_exclusive=[
+            ('discover', 'path'),
+        ],
     )
 
     path = module.params.get('path')
     cluster = module.params.get('cluster')
     force = module.params.get('force')
     stdout = module.params.get('stdout')
+    discover = module.params.get('discover')
 
     if path and not os.path.exists(path):
         module.fail_json(msg='{} does not exist'.format(path), rc=1)
 
-    startd = datetime.datetime.now()
-
     container_image = os.getenv('CEPH_CONTAINER_IMAGE')
     container_binary = os.getenv('CEPH_CONTAINER_BINARY')
-    if container_binary and container_image:
-        cmd = [container_binary,
-               'run', '--rm', '--privileged',
-               '--ipc=host', '--net=host',
-               '-v', '/etc/ceph:/etc/ceph:z',
-               '-v', '/var/lib/ceph/:/var/lib/ceph/:z',
-               '-v', '/var/log/ceph/:/var/log/ceph/:z',
-               '-v', '/run/lvm/:/run/lvm/',
-               '-v', '/run/lock/lvm/:/run/lock/lvm/',
-               '--entrypoint=ceph-volume', container_image]
-    else:
-        cmd = ['ceph-volume']
 
-    cmd.extend(['--cluster', cluster, 'simple', 'scan'])
+    if discover:
+        scan_all(module, cluster, force, stdout,
+                 container_binary=container_binary,
+                 container_image=container_image)
 
-    if force:
-        cmd.append('--force')
+    startd = datetime.datetime.now()
 
-    if stdout:
-        cmd.append('--stdout')
+    if container_binary and container_image:
+        cmd = container_cmd(container_binary, container_image)
+    else:
+        cmd = ['ceph-volume']
 
-    if path:
-        cmd.append(path)
+    cmd.extend(['--cluster', cluster, 'simple'])
+    cmd.extend(scan_args(force, stdout, path))
 
     if module.check_mode:
         exit_module(
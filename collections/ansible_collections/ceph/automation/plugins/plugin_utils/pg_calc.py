@@ -0,0 +1,138 @@
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+from typing import Any, Dict, List, Optional
+
+
+DEFAULT_PGS_PER_OSD = 100
+DEFAULT_POOL_SIZE = 3
+
+# Keys of the pool definitions only used to compute the layout, ceph_pool
+# doesn't know them
+LAYOUT_KEYS = ('k', 'm', 'target_pgs_per_osd', 'min_pg_num')
+
+
+def nearest_power_of_two(value: float) -> int:
+    '''
+    Round a PG count to a power of two the same way the Ceph PG calculator
+    does: the next higher power of two is used when the nearest lower one is
+    more than 25% below the value
+    '''
+
+    if value <= 1:
+        return 1
+
+    lower = 1 << (int(value).bit_length() - 1)
+    if lower < value * 0.75:
+        return lower << 1
+    return lower
+
+
+def pool_size(pool: Dict[str, Any]) -> int:
+    '''
+    Return the number of copies (replicated) or chunks (erasure, k+m) of a pool
+    '''
+
+    if pool.get('k') is not None or pool.get('m') is not None:
+        try:
+            k = int(pool['k'])
+            m = int(pool['m'])
+        except (KeyError, TypeError, ValueError):
+            raise ValueError('pool {!r}: both k and m must be integers'.format(pool.get('name')))
+        size = k + m
+    else:
+        try:
+            size = int(pool.get('size') or DEFAULT_POOL_SIZE)
+        except (TypeError, ValueError):
+            raise ValueError('pool {!r}: size must be an integer'.format(pool.get('name')))
+
+    if size < 1:
+        raise ValueError('pool {!r}: size must be greater than 0'.format(pool.get('name')))
+    return size
+
+
+def pg_num(osd_count: int,
+           size: int = DEFAULT_POOL_SIZE,
+           target_ratio: float = 1.0,
+           target_pgs_per_osd: int = DEFAULT_PGS_PER_OSD,
+           min_pg_num: int = 1) -> int:
+    '''
+    Compute the pg_num of a single pool
+    '''
+
+    if osd_count < 1:
+        raise ValueError('osd_count must be greater than 0')
+    if size < 1:
+        raise ValueError('size must be greater than 0')
+
+    raw = float(target_pgs_per_osd) * osd_count * target_ratio / size
+    return nearest_power_of_two(max(raw, float(osd_count) / size, min_pg_num))
+
+
+def _ratios(pools: List[Dict[str, Any]], normalize: bool) -> List[float]:
+    '''
+    Return the target ratio of every pool, pools without any ratio share
+    what is left evenly
+    '''
+
+    ratios = []  # type: List[Optional[float]]
+    for pool in pools:
+        ratio = pool.get('target_size_ratio')
+        if ratio is None or ratio == '':
+            ratios.append(None)
+            continue
+        try:
+            ratio = float(ratio)
+        except (TypeError, ValueError):
+            raise ValueError('pool {!r}: target_size_ratio must be a number'.format(pool.get('name')))
+        if ratio < 0:
+            raise ValueError('pool {!r}: target_size_ratio must not be negative'.format(pool.get('name')))
+        ratios.append(ratio)
+
+    given = sum(r for r in ratios if r is not None)
+    missing = ratios.count(None)
+    share = max(0.0, 1.0 - given) / missing if missing else 0.0
+    result = [share if r is None else r for r in ratios]
+
+    total = given + share * missing
+    if normalize and total > 1.0:
+        result = [r / total for r in result]
+
+    return result
+
+
+def pool_pg_layout(pools: List[Dict[str, Any]],
+                   osd_count: int,
+                   target_pgs_per_osd: int = DEFAULT_PGS_PER_OSD,
+                   min_pg_num: int = 1,
+                   normalize: bool = True) -> List[Dict[str, Any]]:
+    '''
+    Compute pg_num/pgp_num/target_size_ratio for a whole pool layout in a
+    single pass and return pool definitions usable with ceph_pool
+    '''
+
+    if osd_count < 1:
+        raise ValueError('osd_count must be greater than 0')
+
+    ratios = _ratios(pools, normalize)
+    result = []
+    for pool, ratio in zip(pools, ratios):
+        size = pool_size(pool)
+        erasure = pool.get('k') is not None
+        pgs = pg_num(osd_count,
+                     size=size,
+                     target_ratio=ratio,
+                     target_pgs_per_osd=int(pool.get('target_pgs_per_osd') or target_pgs_per_osd),
+                     min_pg_num=int(pool.get('min_pg_num') or min_pg_num))
+
+        definition = dict((key, value) for key, value in pool.items() if key not in LAYOUT_KEYS)
+        definition.update(pg_num=pgs,
+                          pgp_num=pgs,
+                          target_size_ratio=round(ratio, 4))
+        definition.setdefault('pg_autoscale_mode', 'off')
+        definition.setdefault('pool_type', 'erasure' if erasure else 'replicated')
+        if not erasure:
+            definition['size'] = size
+        result.append(definition)
+
+    return result
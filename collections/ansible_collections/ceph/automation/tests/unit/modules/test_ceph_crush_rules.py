@@ -0,0 +1,108 @@
+from mock.mock import patch
+from ansible_collections.ceph.automation.tests.unit.modules import ca_test_common
+from ansible_collections.ceph.automation.plugins.modules import ceph_crush_rules
+import json
+import pytest
+
+fake_rules = [
+    {'rule_id': 0, 'rule_name': 'replicated_rule', 'type': 1, 'steps': []},
+    {'rule_id': 1, 'rule_name': 'ec42', 'type': 3, 'steps': []},
+    {'rule_id': 2, 'rule_name': 'old', 'type': 1, 'steps': []},
+]
+
+
+class TestCephCrushRulesModule(object):
+
+    def test_dump_rules(self):
+        expected_cmd = [
+            'ceph',
+            '-n', 'client.admin',
+            '-k', '/etc/ceph/ceph.client.admin.keyring',
+            '--cluster', 'ceph',
+            'osd', 'crush', 'rule',
+            'dump', '--format=json'
+        ]
+
+        assert ceph_crush_rules.dump_rules() == expected_cmd
+
+    def test_compute_changes(self):
+        rules = [
+            {'name': 'replicated_rule', 'rule_type': 'replicated', 'bucket_root': 'default', 'bucket_type': 'host'},
+            {'name': 'ssd', 'rule_type': 'replicated', 'bucket_root': 'default', 'bucket_type': 'host',
+             'device_class': 'ssd'},
+            {'name': 'ec84', 'rule_type': 'erasure', 'profile': 'ec84'},
+            {'name': 'old', 'state': 'absent'},
+        ]
+
+        commands, actions, errors = ceph_crush_rules.compute_changes(rules, fake_rules)
+
+        assert commands == [
+            ['osd', 'crush', 'rule', 'create-replicated', 'ssd', 'default', 'host', 'ssd'],
+            ['osd', 'crush', 'rule', 'create-erasure', 'ec84', 'ec84'],
+            ['osd', 'crush', 'rule', 'rm', 'old'],
+        ]
+        assert actions == {'replicated_rule': 'unchanged', 'ssd': 'created', 'ec84': 'created', 'old': 'removed'}
+        assert not errors
+
+    def test_compute_changes_convert(self):
+        rules = [{'name': 'ec42', 'rule_type': 'replicated', 'bucket_root': 'default', 'bucket_type': 'host'}]
+
+        commands, actions, errors = ceph_crush_rules.compute_changes(rules, fake_rules)
+
+        assert errors == ['Can not convert crush rule ec42 to replicated']
+
+    @pytest.mark.parametrize('rule,msg', [
+        ({'rule_type': 'erasure'}, 'every rule must have a name'),
+        ({'name': 'foo', 'rule_type': 'erasure'}, 'rule foo: profile is required'),
+        ({'name': 'foo', 'rule_type': 'replicated', 'bucket_root': 'default'},
+         'rule foo: bucket_root and bucket_type are required'),
+        ({'name': 'foo'}, 'rule foo: rule_type must be replicated or erasure'),
+        ({'name': 'foo', 'state': 'absent'}, None),
+    ])
+    def test_validate_rule(self, rule, msg):
+        assert ceph_crush_rules.validate_rule(rule) == msg
+
+    @patch('ansible.module_utils.basic.AnsibleModule.exit_json')
+    @patch('ansible.module_utils.basic.AnsibleModule.run_command')
+    def test_apply_in_one_session(self, m_run_command, m_exit_json):
+        ca_test_common.set_module_args({
+            'rules': [
+                {'name': 'ec84', 'rule_type': 'erasure', 'profile': 'ec84'},
+                {'name': 'old', 'state': 'absent'},
+            ]
+        })
+        m_exit_json.side_effect = ca_test_common.exit_json
+        converged = fake_rules[:2] + [{'rule_id': 3, 'rule_name': 'ec84', 'type': 3, 'steps': []}]
+        m_run_command.side_effect = [
+            (0, json.dumps(fake_rules), ''),
+            (0, '', ''),
+            (0, json.dumps(converged), ''),
+        ]
+
+        with pytest.raises(ca_test_common.AnsibleExitJson) as result:
+            ceph_crush_rules.main()
+
+        result = result.value.args[0]
+        assert result['changed']
+        assert result['rc'] == 0
+        assert result['rules'] == {'ec84': 'created', 'old': 'removed'}
+        assert m_run_command.call_args_list[1].kwargs['data'] == ('osd crush rule create-erasure ec84 ec84\n'
+                                                                  'osd crush rule rm old\n')
+
+    @patch('ansible.module_utils.basic.AnsibleModule.exit_json')
+    @patch('ansible.module_utils.basic.AnsibleModule.run_command')
+    def test_with_check_mode(self, m_run_command, m_exit_json):
+        ca_test_common.set_module_args({
+            'rules': [{'name': 'old', 'state': 'absent'}],
+            '_ansible_check_mode': True
+        })
+        m_exit_json.side_effect = ca_test_common.exit_json
+        m_run_command.return_value = 0, json.dumps(fake_rules), ''
+
+        with pytest.raises(ca_test_common.AnsibleExitJson) as result:
+            ceph_crush_rules.main()
+
+        result = result.value.args[0]
+        assert result['changed']
+        assert result['rules'] == {'old': 'removed'}
+        assert m_run_command.call_count == 1
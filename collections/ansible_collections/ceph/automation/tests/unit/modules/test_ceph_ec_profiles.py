@@ -0,0 +1,136 @@
+from mock.mock import patch
+import ca_test_common
+from ansible_collections.ceph.automation.plugins.modules import ceph_ec_profiles
+import json
+import pytest
+
+fake_osd_dump = json.dumps({
+    'epoch': 42,
+    'erasure_code_profiles': {
+        'default': {'k': '2', 'm': '2', 'plugin': 'jerasure', 'technique': 'reed_sol_van'},
+        'ec42': {'crush-failure-domain': 'host', 'k': '4', 'm': '2', 'plugin': 'jerasure',
+                 'technique': 'reed_sol_van', 'w': '8'},
+        'ec84': {'k': '8', 'm': '4', 'plugin': 'jerasure'},
+        'old': {'k': '2', 'm': '1', 'plugin': 'jerasure'},
+    }
+})
+
+
+class TestCephEcProfiles(object):
+
+    def test_dump_osd_map(self):
+        expected_cmd = [
+            'ceph',
+            '-n', 'client.admin',
+            '-k', '/etc/ceph/ceph.client.admin.keyring',
+            '--cluster', 'ceph',
+            'osd', 'dump',
+            '--format=json'
+        ]
+
+        assert ceph_ec_profiles.dump_osd_map() == expected_cmd
+
+    def test_compute_changes(self):
+        definitions = [
+            {'name': 'ec42', 'k': 4, 'm': 2, 'crush_failure_domain': 'host'},
+            {'name': 'ec84', 'k': 8, 'm': 3},
+            {'name': 'ec63', 'k': 6, 'm': 3, 'crush_device_class': 'hdd'},
+            {'name': 'old', 'state': 'absent'},
+            {'name': 'gone', 'state': 'absent'},
+        ]
+
+        commands, actions, diff = ceph_ec_profiles.compute_changes(
+            definitions, json.loads(fake_osd_dump)['erasure_code_profiles'], True)
+
+        assert commands == [
+            ['osd', 'erasure-code-profile', 'set', 'ec84', 'plugin=jerasure', 'k=8', 'm=3', '--force'],
+            ['osd', 'erasure-code-profile', 'set', 'ec63', 'plugin=jerasure', 'k=6', 'm=3',
+             'crush-device-class=hdd', '--force'],
+            ['osd', 'erasure-code-profile', 'rm', 'old'],
+        ]
+        assert actions == {'ec42': 'unchanged', 'ec84': 'updated', 'ec63': 'created',
+                           'old': 'removed', 'gone': 'unchanged'}
+        assert sorted(diff['before'].keys()) == ['ec84', 'old']
+        assert sorted(diff['after'].keys()) == ['ec63', 'ec84']
+
+    @patch('ansible.module_utils.basic.AnsibleModule.exit_json')
+    @patch('ansible.module_utils.basic.AnsibleModule.run_command')
+    def test_nothing_to_update(self, m_run_command, m_exit_json):
+        ca_test_common.set_module_args({
+            'profiles': [{'name': 'ec42', 'k': 4, 'm': 2}]
+        })
+        m_exit_json.side_effect = ca_test_common.exit_json
+        m_run_command.return_value = 0, fake_osd_dump, ''
+
+        with pytest.raises(ca_test_common.AnsibleExitJson) as r:
+            ceph_ec_profiles.run_module()
+
+        result = r.value.args[0]
+        assert not result['changed']
+        assert result['profiles'] == {'ec42': 'unchanged'}
+        assert m_run_command.call_count == 1
+
+    @patch('ansible.module_utils.basic.AnsibleModule.exit_json')
+    @patch('ansible.module_utils.basic.AnsibleModule.run_command')
+    def test_apply_in_one_session(self, m_run_command, m_exit_json):
+        ca_test_common.set_module_args({
+            'profiles': [
+                {'name': 'ec63', 'k': 6, 'm': 3},
+                {'name': 'old', 'state': 'absent'},
+            ]
+        })
+        m_exit_json.side_effect = ca_test_common.exit_json
+        profiles = json.loads(fake_osd_dump)
+        del profiles['erasure_code_profiles']['old']
+        profiles['erasure_code_profiles']['ec63'] = {'k': '6', 'm': '3', 'plugin': 'jerasure'}
+        m_run_command.side_effect = [
+            (0, fake_osd_dump, ''),
+            (0, '', ''),
+            (0, json.dumps(profiles), ''),
+        ]
+
+        with pytest.raises(ca_test_common.AnsibleExitJson) as r:
+            ceph_ec_profiles.run_module()
+
+        result = r.value.args[0]
+        assert result['changed']
+        assert result['rc'] == 0
+        assert result['profiles'] == {'ec63': 'created', 'old': 'removed'}
+        batch_call = m_run_command.call_args_list[1]
+        assert batch_call.args[0] == ['ceph', '-n', 'client.admin', '-k', '/etc/ceph/ceph.client.admin.keyring',
+                                      '--cluster', 'ceph']
+        assert batch_call.kwargs['data'] == ('osd erasure-code-profile set ec63 plugin=jerasure k=6 m=3\n'
+                                             'osd erasure-code-profile rm old\n')
+
+    @patch('ansible.module_utils.basic.AnsibleModule.exit_json')
+    @patch('ansible.module_utils.basic.AnsibleModule.run_command')
+    def test_apply_not_converged(self, m_run_command, m_exit_json):
+        ca_test_common.set_module_args({
+            'profiles': [{'name': 'ec63', 'k': 6, 'm': 3}]
+        })
+        m_exit_json.side_effect = ca_test_common.exit_json
+        m_run_command.side_effect = [
+            (0, fake_osd_dump, ''),
+            (0, '', ''),
+            (0, fake_osd_dump, ''),
+        ]
+
+        with pytest.raises(ca_test_common.AnsibleExitJson) as r:
+            ceph_ec_profiles.run_module()
+
+        result = r.value.args[0]
+        assert result['changed']
+        assert result['rc'] == 1
+        assert result['stderr'] == 'Failed to apply the erasure code profiles: ec63'
+
+    @patch('ansible.module_utils.basic.AnsibleModule.fail_json')
+    def test_missing_k_m(self, m_fail_json):
+        ca_test_common.set_module_args({
+            'profiles': [{'name': 'ec63', 'k': 6}]
+        })
+        m_fail_json.side_effect = ca_test_common.fail_json
+
+        with pytest.raises(ca_test_common.AnsibleFailJson) as r:
+            ceph_ec_profiles.run_module()
+
+        assert r.value.args[0]['msg'] == 'profile ec63: k and m are required'
@@ -0,0 +1,148 @@
+from mock.mock import MagicMock, patch
+from ansible_collections.ceph.automation.tests.unit.modules import ca_test_common
+from ansible_collections.ceph.automation.plugins.modules import ceph_fingerprint
+import json
+import pytest
+
+fake_fsid = '0c4a7eca-0c2a-4c12-beff-08a80f064c52'
+fake_hosts = [
+    {'hostname': 'ceph-node2', 'addr': '10.10.10.102', 'labels': ['osds', '_admin'], 'status': ''},
+    {'hostname': 'ceph-node1', 'addr': '10.10.10.101', 'labels': ['_admin'], 'status': 'offline'},
+]
+fake_out = '\n'.join([
+    '@@ceph_fingerprint:fsid@@',
+    json.dumps({'fsid': fake_fsid}),
+    '@@ceph_fingerprint:hosts@@',
+    json.dumps(fake_hosts, indent=2),
+])
+
+
+class TestCephFingerprintModule(object):
+
+    def test_build_cmd(self):
+        fake_module = MagicMock()
+        fake_module.params = {'fsid': fake_fsid}
+        cmd = ceph_fingerprint.build_cmd(fake_module, ['fsid', 'hosts'])
+
+        assert cmd == ['cephadm', 'shell', '--fsid', fake_fsid, '--', 'sh', '-c',
+                       "set -e; echo '@@ceph_fingerprint:fsid@@'; ceph fsid --format json; "
+                       "echo '@@ceph_fingerprint:hosts@@'; ceph orch host ls --format json"]
+
+    def test_split_output(self):
+        result = ceph_fingerprint.split_output(fake_out, ['fsid', 'hosts', 'devices'])
+
+        assert result['fsid'] == {'fsid': fake_fsid}
+        assert result['hosts'] == fake_hosts
+        assert result['devices'] is None
+
+    def test_split_output_no_cluster(self):
+        result = ceph_fingerprint.split_output('', ['fsid'])
+
+        assert result == {'fsid': None}
+
+    def test_split_output_no_services(self):
+        out = '@@ceph_fingerprint:osd_spec@@\nNo services reported\n'
+        result = ceph_fingerprint.split_output(out, ['osd_spec'])
+
+        assert result == {'osd_spec': []}
+
+    def test_normalize_hosts(self):
+        assert ceph_fingerprint.normalize('hosts', fake_hosts) == [
+            ['ceph-node1', '10.10.10.101', ['_admin']],
+            ['ceph-node2', '10.10.10.102', ['_admin', 'osds']],
+        ]
+
+    @patch('ansible.module_utils.basic.AnsibleModule.exit_json')
+    @patch('ansible.module_utils.basic.AnsibleModule.run_command')
+    def test_save_and_check(self, m_run_command, m_exit_json, tmp_path, monkeypatch):
+        ceph_conf = tmp_path / 'ceph.conf'
+        ceph_conf.write_text('[global]\n')
+        monkeypatch.setattr(ceph_fingerprint, 'CEPH_CONF', str(ceph_conf))
+        checkpoint = str(tmp_path / 'marks' / 'add_host.fingerprint')
+        m_exit_json.side_effect = ca_test_common.exit_json
+        m_run_command.return_value = 0, fake_out, ''
+        args = {'components': ['fsid', 'hosts'], 'data': {'hosts': ['ceph-node1']}, 'checkpoint': checkpoint}
+
+        ca_test_common.set_module_args(dict(args, state='save'))
+        with pytest.raises(ca_test_common.AnsibleExitJson) as result:
+            ceph_fingerprint.main()
+        saved = result.value.args[0]
+        assert saved['changed']
+        assert not saved['match']
+        assert saved['previous'] is None
+        assert saved['cluster']['fsid'] == fake_fsid
+        assert saved['cluster_exists']
+        assert saved['rc'] == 0
+
+        ca_test_common.set_module_args(dict(args))
+        with pytest.raises(ca_test_common.AnsibleExitJson) as result:
+            ceph_fingerprint.main()
+        checked = result.value.args[0]
+        assert not checked['changed']
+        assert checked['match']
+        assert checked['previous'] == saved['digest']
+
+        ca_test_common.set_module_args(dict(args, data={'hosts': ['ceph-node1', 'ceph-node3']}))
+        with pytest.raises(ca_test_common.AnsibleExitJson) as result:
+            ceph_fingerprint.main()
+        assert not result.value.args[0]['match']
+        assert m_run_command.call_count == 3
+
+    @patch('ansible.module_utils.basic.AnsibleModule.exit_json')
+    @patch('ansible.module_utils.basic.AnsibleModule.run_command')
+    def test_paths_only(self, m_run_command, m_exit_json, tmp_path):
+        repo = tmp_path / 'base.repo'
+        repo.write_text('[base]\n')
+        checkpoint = tmp_path / 'repo.fingerprint'
+        m_exit_json.side_effect = ca_test_common.exit_json
+        args = {'paths': [str(tmp_path / '*.repo')], 'checkpoint': str(checkpoint), 'state': 'save'}
+
+        ca_test_common.set_module_args(dict(args))
+        with pytest.raises(ca_test_common.AnsibleExitJson) as result:
+            ceph_fingerprint.main()
+        digest = result.value.args[0]['digest']
+        assert checkpoint.read_text() == digest + '\n'
+
+        repo.write_text('[base]\nenabled=0\n')
+        ca_test_common.set_module_args(dict(args, state='check'))
+        with pytest.raises(ca_test_common.AnsibleExitJson) as result:
+            ceph_fingerprint.main()
+        assert not result.value.args[0]['match']
+        assert not m_run_command.called
+
+
+    @patch('ansible.module_utils.basic.AnsibleModule.exit_json')
+    @patch('ansible.module_utils.basic.AnsibleModule.run_command')
+    def test_no_cluster(self, m_run_command, m_exit_json, tmp_path, monkeypatch):
+        monkeypatch.setattr(ceph_fingerprint, 'CEPH_CONF', str(tmp_path / 'ceph.conf'))
+        m_exit_json.side_effect = ca_test_common.exit_json
+        m_run_command.return_value = 0, json.dumps([{'name': 'osd.0', 'fsid': 'other'}]), ''
+
+        ca_test_common.set_module_args({'fsid': fake_fsid, 'components': ['fsid'],
+                                        'checkpoint': str(tmp_path / 'bootstrap.fingerprint')})
+        with pytest.raises(ca_test_common.AnsibleExitJson) as result:
+            ceph_fingerprint.main()
+
+        assert not result.value.args[0]['cluster_exists']
+        assert result.value.args[0]['cluster'] == {'fsid': None}
+        # only the daemons were listed, the cluster was not queried
+        m_run_command.assert_called_once_with(['cephadm', 'ls', '--no-detail'])
+
+    @patch('ansible.module_utils.basic.AnsibleModule.fail_json')
+    @patch('ansible.module_utils.basic.AnsibleModule.run_command')
+    def test_query_failure(self, m_run_command, m_fail_json, tmp_path, monkeypatch):
+        monkeypatch.setattr(ceph_fingerprint, 'CEPH_CONF', str(tmp_path / 'ceph.conf'))
+        m_fail_json.side_effect = ca_test_common.fail_json
+        m_run_command.side_effect = [
+            (0, json.dumps([{'name': 'mon.ceph-node1', 'fsid': fake_fsid}]), ''),
+            (1, '@@ceph_fingerprint:fsid@@\n', 'monclient(hunting): authenticate timed out'),
+        ]
+
+        ca_test_common.set_module_args({'components': ['fsid'], 'image': 'quay.io/ceph/ceph:v18',
+                                        'checkpoint': str(tmp_path / 'bootstrap.fingerprint')})
+        with pytest.raises(ca_test_common.AnsibleFailJson) as result:
+            ceph_fingerprint.main()
+
+        assert result.value.args[0]['rc'] == 1
+        assert 'fsid' in result.value.args[0]['msg']
+        assert m_run_command.call_args[0][0][:3] == ['cephadm', '--image', 'quay.io/ceph/ceph:v18']
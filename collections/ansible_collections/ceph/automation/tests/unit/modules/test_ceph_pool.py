@@ -1,7 +1,8 @@
+import json
 import os
 import sys
 from ansible_collections.ceph.automation.plugins.modules import ceph_pool
-from mock.mock import patch
+from mock.mock import MagicMock, patch
 import pytest
 
 sys.path.append('./library')
@@ -673,3 +674,120 @@ class TestCephPoolModule(object):
                                     fake_user, fake_user_key, container_image=fake_container_image_name)
 
         assert cmd == expected_command
+
+    def test_get_cluster_status(self):
+        expected_command = [
+            'ceph',
+            '-n',
+            'client.admin',
+            '-k',
+            '/etc/ceph/ceph.client.admin.keyring',
+            '--cluster',
+            'ceph',
+            'status',
+            '-f',
+            'json'
+        ]
+
+        cmd = ceph_pool.get_cluster_status(fake_cluster_name, fake_user, fake_user_key)
+
+        assert cmd == expected_command
+
+    @patch('time.sleep')
+    @patch.object(ceph_pool, 'exec_command')
+    def test_update_pool_staged_pg_num(self, m_exec_command, m_sleep):
+        module = MagicMock()
+        module.params = {
+            'pg_num_step': 16,
+            'max_misplaced_ratio': 0.05,
+            'step_poll_interval': 10,
+            'step_timeout': 3600,
+        }
+        healthy = json.dumps({'pgmap': {'misplaced_ratio': 0.01}})
+        busy = json.dumps({'pgmap': {'misplaced_ratio': 0.2}})
+        statuses = iter([busy, healthy, healthy])
+        pools = iter([(40, 32), (48, 48), (64, 64)])
+
+        def exec_command(module, cmd):
+            if 'status' in cmd:
+                return 0, cmd, next(statuses), ''
+            if 'ls' in cmd:
+                pg_num, pgp_num = next(pools)
+                return 0, cmd, json.dumps([{'pool_name': fake_pool_name,
+                                            'pg_num': pg_num,
+                                            'pgp_num': pgp_num}]), ''
+            return 0, cmd, '', ''
+        m_exec_command.side_effect = exec_command
+
+        delta = {
+            'pg_num': {'value': '64', 'cli_set_opt': 'pg_num'},
+            'pg_placement_num': {'value': '64', 'cli_set_opt': 'pgp_num'},
+        }
+        rc, cmd, out, err, steps = ceph_pool.update_pool(module, fake_cluster_name, fake_pool_name,
+                                                         fake_user, fake_user_key, delta,
+                                                         running_pool_details=self.fake_running_pool_details)
+
+        set_cmds = [c.args[1][-3:] for c in m_exec_command.call_args_list if 'set' in c.args[1]]
+        assert rc == 0
+        assert set_cmds == [['foo', 'pg_num', '48'], ['foo', 'pgp_num', '48'],
+                            ['foo', 'pg_num', '64'], ['foo', 'pgp_num', '64']]
+        assert [step['pg_num'] for step in steps] == [48, 64]
+        assert [step['misplaced_ratio'] for step in steps] == [0.01, 0.01]
+        assert m_sleep.call_count == 2
+        # pg_num/pgp_num reached the step value before the misplaced ratio was checked
+        checks = ['status' if 'status' in c.args[1] else 'ls'
+                  for c in m_exec_command.call_args_list if 'set' not in c.args[1]]
+        assert checks == ['ls', 'ls', 'status', 'status', 'ls', 'status']
+
+    @patch('time.time')
+    @patch('time.sleep')
+    @patch.object(ceph_pool, 'exec_command')
+    def test_update_pool_staged_pg_num_timeout(self, m_exec_command, m_sleep, m_time):
+        module = MagicMock()
+        module.params = {
+            'pg_num_step': 64,
+            'max_misplaced_ratio': 0.05,
+            'step_poll_interval': 10,
+            'step_timeout': 30,
+        }
+        m_time.side_effect = [0, 0, 10, 20, 30]
+        busy = json.dumps({'pgmap': {'misplaced_ratio': 0.2}})
+        pool = json.dumps([{'pool_name': fake_pool_name, 'pg_num': 16, 'pgp_num': 16}])
+        m_exec_command.side_effect = lambda module, cmd: (0, cmd, busy if 'status' in cmd else pool, '')
+
+        delta = {'pg_num': {'value': '16', 'cli_set_opt': 'pg_num'}}
+        rc, cmd, out, err, steps = ceph_pool.update_pool(module, fake_cluster_name, fake_pool_name,
+                                                         fake_user, fake_user_key, delta,
+                                                         running_pool_details=self.fake_running_pool_details)
+
+        assert rc == 1
+        assert err == 'misplaced ratio is still 0.2 (> 0.05) after 30 seconds'
+        assert steps[0]['pg_num'] == 16
+        assert m_sleep.call_count == 2
+        set_cmds = [c.args[1][-3:] for c in m_exec_command.call_args_list if 'set' in c.args[1]]
+        assert set_cmds == [['foo', 'pgp_num', '16'], ['foo', 'pg_num', '16']]
+
+    @patch('time.time')
+    @patch('time.sleep')
+    @patch.object(ceph_pool, 'exec_command')
+    def test_update_pool_staged_pg_num_pg_timeout(self, m_exec_command, m_sleep, m_time):
+        module = MagicMock()
+        module.params = {
+            'pg_num_step': 64,
+            'max_misplaced_ratio': 0.05,
+            'step_poll_interval': 10,
+            'step_timeout': 30,
+        }
+        m_time.side_effect = [0, 10, 20, 30]
+        pool = json.dumps([{'pool_name': fake_pool_name, 'pg_num': 24, 'pgp_num': 16}])
+        m_exec_command.side_effect = lambda module, cmd: (0, cmd, pool, '')
+
+        delta = {'pg_num': {'value': '16', 'cli_set_opt': 'pg_num'}}
+        rc, cmd, out, err, steps = ceph_pool.update_pool(module, fake_cluster_name, fake_pool_name,
+                                                         fake_user, fake_user_key, delta,
+                                                         running_pool_details=self.fake_running_pool_details)
+
+        assert rc == 1
+        assert err == 'pg_num/pgp_num of pool foo are still 24/16 (expected 16) after 30 seconds'
+        assert steps[0]['misplaced_ratio'] is None
+        assert not [c for c in m_exec_command.call_args_list if 'status' in c.args[1]]
@@ -172,3 +172,62 @@ class TestCephVolumeSimpleActivateModule(object):
         assert result['rc'] == rc
         assert result['stderr'] == stderr
         assert result['stdout'] == stdout
+
+    @patch('ansible.module_utils.basic.AnsibleModule.exit_json')
+    @patch('ansible.module_utils.basic.AnsibleModule.run_command')
+    def test_activate_discover(self, m_run_command, m_exit_json, tmp_path):
+        osd_files = [tmp_path / '{}-{}.json'.format(osd_id, fake_uuid) for osd_id in ['1', '7']]
+        for osd_file in osd_files:
+            osd_file.write_text('{}')
+        ca_test_common.set_module_args({
+            'discover': True,
+            'systemd': False,
+            'osd_json_dir': str(tmp_path)
+        })
+        m_exit_json.side_effect = ca_test_common.exit_json
+        m_run_command.return_value = 0, '', ''
+
+        with pytest.raises(ca_test_common.AnsibleExitJson) as result:
+            ceph_volume_simple_activate.main()
+
+        result = result.value.args[0]
+        assert result['changed']
+        assert result['rc'] == 0
+        assert [osd['osd_id'] for osd in result['osds']] == ['1', '7']
+        assert result['osds'][1]['cmd'] == ['ceph-volume', '--cluster', fake_cluster, 'simple', 'activate',
+                                            '--file', str(osd_files[1]), '--no-systemd']
+        assert m_run_command.call_count == 2
+
+    @patch('ansible.module_utils.basic.AnsibleModule.exit_json')
+    @patch('ansible.module_utils.basic.AnsibleModule.run_command')
+    def test_activate_discover_all_failed(self, m_run_command, m_exit_json, tmp_path):
+        (tmp_path / '{}-{}.json'.format(fake_id, fake_uuid)).write_text('{}')
+        ca_test_common.set_module_args({
+            'discover': True,
+            'osd_json_dir': str(tmp_path)
+        })
+        m_exit_json.side_effect = ca_test_common.exit_json
+        m_run_command.return_value = 1, '', 'error'
+
+        with pytest.raises(ca_test_common.AnsibleExitJson) as result:
+            ceph_volume_simple_activate.main()
+
+        result = result.value.args[0]
+        assert not result['changed']
+        assert result['rc'] == 1
+        assert result['stderr'] == 'error'
+        assert [osd['changed'] for osd in result['osds']] == [False]
+
+    @patch('ansible.module_utils.basic.AnsibleModule.fail_json')
+    def test_activate_discover_with_osd_all(self, m_fail_json):
+        ca_test_common.set_module_args({
+            'discover': True,
+            'osd_all': True
+        })
+        m_fail_json.side_effect = ca_test_common.fail_json
+
+        with pytest.raises(ca_test_common.AnsibleFailJson) as result:
+            ceph_volume_simple_activate.main()
+
+        result = result.value.args[0]
+        assert result['msg'] == 'parameters are mutually exclusive: discover|osd_all'
@@ -164,3 +164,92 @@ class TestCephVolumeSimpleScanModule(object):
         assert result['rc'] == rc
         assert result['stderr'] == stderr
         assert result['stdout'] == stdout
+
+    @patch('ansible.module_utils.basic.AnsibleModule.exit_json')
+    @patch('ansible.module_utils.basic.AnsibleModule.run_command')
+    def test_scan_discover(self, m_run_command, m_exit_json, tmp_path):
+        for osd_id in ['0', '1']:
+            osd_dir = tmp_path / '{}-{}'.format(fake_cluster, osd_id)
+            osd_dir.mkdir()
+            (osd_dir / 'whoami').write_text(osd_id + '\n')
+        (tmp_path / '{}-2'.format(fake_cluster)).mkdir()
+        ca_test_common.set_module_args({
+            'discover': True,
+            'stdout': True,
+            'osd_data_dir': str(tmp_path)
+        })
+        m_exit_json.side_effect = ca_test_common.exit_json
+        m_run_command.return_value = 0, '{"whoami": "0"}', ''
+
+        with pytest.raises(ca_test_common.AnsibleExitJson) as result:
+            ceph_volume_simple_scan.main()
+
+        result = result.value.args[0]
+        assert not result['changed']
+        assert result['rc'] == 0
+        assert [osd['osd_id'] for osd in result['osds']] == ['0', '1']
+        assert [osd['changed'] for osd in result['osds']] == [False, False]
+        assert result['osds'][1]['cmd'] == ['ceph-volume', '--cluster', fake_cluster, 'simple', 'scan', '--stdout',
+                                            str(tmp_path / '{}-1'.format(fake_cluster))]
+        assert result['osds'][0]['metadata'] == {'whoami': '0'}
+        assert m_run_command.call_count == 2
+
+    @patch.dict(os.environ, {'CEPH_CONTAINER_BINARY': fake_container_binary})
+    @patch.dict(os.environ, {'CEPH_CONTAINER_IMAGE': fake_container_image})
+    @patch('ansible.module_utils.basic.AnsibleModule.exit_json')
+    @patch('ansible.module_utils.basic.AnsibleModule.run_command')
+    def test_scan_discover_with_container(self, m_run_command, m_exit_json, tmp_path):
+        for osd_id in ['0', '1']:
+            osd_dir = tmp_path / '{}-{}'.format(fake_cluster, osd_id)
+            osd_dir.mkdir()
+            (osd_dir / 'whoami').write_text(osd_id)
+        ca_test_common.set_module_args({
+            'discover': True,
+            'osd_data_dir': str(tmp_path)
+        })
+        m_exit_json.side_effect = ca_test_common.exit_json
+        m_run_command.side_effect = [
+            (0, 'container-id', ''),
+            (0, '', ''),
+            (1, '', 'error'),
+            (0, '', ''),
+        ]
+        container_name = 'ceph-volume-simple-{}'.format(os.getpid())
+
+        with patch('concurrent.futures.ThreadPoolExecutor.map', lambda self, fn, items: map(fn, items)):
+            with pytest.raises(ca_test_common.AnsibleExitJson) as result:
+                ceph_volume_simple_scan.main()
+
+        result = result.value.args[0]
+        calls = [c.args[0] for c in m_run_command.call_args_list]
+        assert calls[0][:6] == [fake_container_binary, 'run', '--detach', '--name', container_name, '--rm']
+        assert calls[0][-3:] == ['--entrypoint=sleep', fake_container_image, 'infinity']
+        assert calls[1] == [fake_container_binary, 'exec', container_name, 'ceph-volume',
+                            '--cluster', fake_cluster, 'simple', 'scan', str(tmp_path / '{}-0'.format(fake_cluster))]
+        assert calls[3] == [fake_container_binary, 'rm', '--force', container_name]
+        assert result['changed']
+        assert result['rc'] == 1
+        assert result['stderr'] == 'error'
+        assert [osd['rc'] for osd in result['osds']] == [0, 1]
+        assert [osd['changed'] for osd in result['osds']] == [True, False]
+
+    @patch('ansible.module_utils.basic.AnsibleModule.exit_json')
+    @patch('ansible.module_utils.basic.AnsibleModule.run_command')
+    def test_scan_discover_with_check_mode(self, m_run_command, m_exit_json, tmp_path):
+        osd_dir = tmp_path / '{}-0'.format(fake_cluster)
+        osd_dir.mkdir()
+        (osd_dir / 'whoami').write_text('0')
+        ca_test_common.set_module_args({
+            'discover': True,
+            'osd_data_dir': str(tmp_path),
+            '_ansible_check_mode': True
+        })
+        m_exit_json.side_effect = ca_test_common.exit_json
+
+        with pytest.raises(ca_test_common.AnsibleExitJson) as result:
+            ceph_volume_simple_scan.main()
+
+        result = result.value.args[0]
+        assert not result['changed']
+        assert result['cmd'] == [['ceph-volume', '--cluster', fake_cluster, 'simple', 'scan', str(osd_dir)]]
+        assert not m_run_command.called
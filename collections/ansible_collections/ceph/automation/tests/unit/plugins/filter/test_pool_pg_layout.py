@@ -0,0 +1,74 @@
+from ansible.errors import AnsibleFilterError
+import pytest
+from ansible_collections.ceph.automation.plugins.filter.pg_num import pg_num
+from ansible_collections.ceph.automation.plugins.filter.pool_pg_layout import pool_pg_layout
+from ansible_collections.ceph.automation.plugins.plugin_utils.pg_calc import nearest_power_of_two
+
+
+class TestPgCalc(object):
+
+    @pytest.mark.parametrize('value,expected', [
+        (0, 1),
+        (1, 1),
+        (64, 64),
+        (85, 64),
+        (90, 128),
+        (100, 128),
+        (1600, 2048),
+    ])
+    def test_nearest_power_of_two(self, value, expected):
+        assert nearest_power_of_two(value) == expected
+
+    def test_pg_num(self):
+        assert pg_num(48) == 2048
+        assert pg_num(48, size=3, target_ratio=0.2) == 256
+        assert pg_num('12', size='6', target_ratio='0.01') == 2
+
+    def test_pg_num_min(self):
+        assert pg_num(3, target_ratio=0, min_pg_num=32) == 32
+
+    def test_pg_num_invalid(self):
+        with pytest.raises(AnsibleFilterError, match='osd_count must be greater than 0'):
+            pg_num(0)
+
+    def test_pool_pg_layout(self):
+        pools = [
+            {'name': 'rbd', 'size': 3, 'target_size_ratio': 0.4},
+            {'name': 'cephfs_data', 'k': 4, 'm': 2, 'erasure_profile': 'ec42', 'target_size_ratio': 0.5},
+            {'name': 'cephfs_metadata', 'min_pg_num': 128},
+        ]
+
+        result = pool_pg_layout(pools, 48)
+
+        assert [p['pg_num'] for p in result] == [512, 512, 128]
+        assert [p['pgp_num'] for p in result] == [512, 512, 128]
+        assert [p['target_size_ratio'] for p in result] == [0.4, 0.5, 0.1]
+        assert [p['pool_type'] for p in result] == ['replicated', 'erasure', 'replicated']
+        assert result[0]['size'] == 3
+        assert 'size' not in result[1]
+        assert result[2]['size'] == 3
+        assert all(p['pg_autoscale_mode'] == 'off' for p in result)
+        assert 'pg_num' not in pools[0]
+        assert result[1]['erasure_profile'] == 'ec42'
+        for key in ['k', 'm', 'target_pgs_per_osd', 'min_pg_num']:
+            assert all(key not in p for p in result)
+
+    def test_pool_pg_layout_normalize(self):
+        pools = [
+            {'name': 'a', 'target_size_ratio': 1},
+            {'name': 'b', 'target_size_ratio': 3, 'pg_autoscale_mode': 'warn'},
+        ]
+
+        result = pool_pg_layout(pools, 12)
+        assert [p['target_size_ratio'] for p in result] == [0.25, 0.75]
+        assert result[1]['pg_autoscale_mode'] == 'warn'
+
+        result = pool_pg_layout(pools, 12, normalize=False)
+        assert [p['target_size_ratio'] for p in result] == [1, 3]
+
+    def test_pool_pg_layout_invalid(self):
+        with pytest.raises(AnsibleFilterError, match="pool 'a': both k and m must be integers"):
+            pool_pg_layout([{'name': 'a', 'k': 4}], 12)
+
+        with pytest.raises(AnsibleFilterError, match='requires a list of dictionaries'):
+            pool_pg_layout('a', 12)
@@ -69,6 +69,14 @@ options:
     type: int
     default: 10
     version_added: 2.3.0
+  max_concurrent_requests:
+    description:
+      - The maximum number of requests that are sent to the ACME API at the same time.
+      - This is used when loading, validating, and waiting for the authorizations of an order with multiple identifiers.
+      - Set to V(1) to send all requests one after another.
+    type: int
+    default: 4
+    version_added: 3.2.0
 """
 
     # Account data documentation fragment
@@ -10,14 +10,20 @@ from __future__ import annotations
 
 import copy
 import datetime
+import http.client
 import json
 import locale
+import threading
 import time
 import typing as t
+import urllib.parse
+import urllib.request
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 
 from ansible.module_utils.basic import missing_required_lib
 from ansible.module_utils.common.text.converters import to_bytes
-from ansible.module_utils.urls import fetch_url
+from ansible.module_utils.urls import fetch_url, make_context
 
 from ansible_collections.community.crypto.plugins.module_utils._acme.backend_cryptography import (
     CRYPTOGRAPHY_ERROR,
@@ -49,9 +55,9 @@ from ansible_collections.community.crypto.plugins.module_utils._time import (
 )
 
 if t.TYPE_CHECKING:
-    import http.client  # pragma: no cover
     import os  # pragma: no cover
     import urllib.error  # pragma: no cover
+    from collections.abc import Callable, Iterable  # pragma: no cover
 
     from ansible.module_utils.basic import AnsibleModule  # pragma: no cover
 
@@ -66,6 +72,12 @@ RETRY_STATUS_CODES = (-1, 408, 429, 502, 503, 504)
 
 RETRY_COUNT = 20
 
+# fetch_url() follows redirects for GET and HEAD requests, so these are sent again with it
+REDIRECT_STATUS_CODES = (301, 302, 303, 307, 308)
+
+_T = t.TypeVar("_T")
+_R = t.TypeVar("_R")
+
 
 def _decode_retry(
     *,
@@ -134,6 +146,133 @@ def _is_failed(
     )
 
 
+class _ConnectionPool:
+    """
+    Keeps HTTP(S) connections to the ACME server open between requests, so that
+    not every request needs a new TCP connection and TLS handshake. Requests that
+    need to go through a proxy are sent with fetch_url() instead.
+
+    The return values are compatible to fetch_url(). The response is always ``None``,
+    the content can be found in ``info["body"]``.
+    """
+
+    def __init__(self, *, module: AnsibleModule, timeout: int) -> None:
+        self.module = module
+        self.timeout = timeout
+        self._ssl_context = None
+        self._idle: dict[tuple[str, str], list[http.client.HTTPConnection]] = {}
+        self._lock = threading.Lock()
+
+    def _needs_proxy(self, parts: urllib.parse.SplitResult) -> bool:
+        proxies = urllib.request.getproxies()
+        return parts.scheme in proxies and not urllib.request.proxy_bypass(
+            parts.hostname or ""
+        )
+
+    def _acquire(self, key: tuple[str, str]) -> tuple[http.client.HTTPConnection, bool]:
+        with self._lock:
+            idle = self._idle.get(key)
+            if idle:
+                return idle.pop(), True
+        scheme, netloc = key
+        if scheme == "https":
+            if self._ssl_context is None:
+                self._ssl_context = make_context(
+                    validate_certs=self.module.params["validate_certs"]
+                )
+            return (
+                http.client.HTTPSConnection(
+                    netloc, timeout=self.timeout, context=self._ssl_context
+                ),
+                False,
+            )
+        return http.client.HTTPConnection(netloc, timeout=self.timeout), False
+
+    def _release(
+        self, key: tuple[str, str], connection: http.client.HTTPConnection
+    ) -> None:
+        with self._lock:
+            self._idle.setdefault(key, []).append(connection)
+
+    def close(self) -> None:
+        with self._lock:
+            for connections in self._idle.values():
+                for connection in connections:
+                    connection.close()
+            self._idle = {}
+
+    def fetch(
+        self,
+        url: str,
+        *,
+        method: str,
+        data: str | bytes | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> tuple[
+        urllib.error.HTTPError | http.client.HTTPResponse | None, dict[str, t.Any]
+    ]:
+        parts = urllib.parse.urlsplit(url)
+        if parts.scheme not in ("http", "https") or self._needs_proxy(parts):
+            return fetch_url(
+                self.module,
+                url,
+                data=data,
+                headers=headers,
+                method=method,
+                timeout=self.timeout,
+            )
+        key = (parts.scheme, parts.netloc)
+        path = urllib.parse.urlunsplit(("", "", parts.path or "/", parts.query, ""))
+        # Same User-Agent as fetch_url() uses
+        request_headers = {"User-Agent": "ansible-httpget"}
+        request_headers.update(headers or {})
+        body = to_bytes(data) if data is not None else None
+        while True:
+            connection, reused = self._acquire(key)
+            try:
+                connection.request(method, path, body=body, headers=request_headers)
+                response = connection.getresponse()
+                content = response.read()
+            except (http.client.HTTPException, OSError) as exc:
+                connection.close()
+                if reused:
+                    # The server can close idle connections at any time, retry with a new one
+                    continue
+                return None, {
+                    "url": url,
+                    "status": -1,
+                    "msg": f"Request failed: {exc}",
+                }
+            break
+        if response.will_close:
+            connection.close()
+        else:
+            self._release(key, connection)
+
+        if response.status in REDIRECT_STATUS_CODES and method in ("GET", "HEAD"):
+            return fetch_url(
+                self.module,
+                url,
+                data=data,
+                headers=headers,
+                method=method,
+                timeout=self.timeout,
+            )
+
+        info: dict[str, t.Any] = {}
+        for name, value in response.getheaders():
+            # Lower-case names and join duplicate headers, as fetch_url() does
+            name = name.lower()
+            info[name] = f"{info[name]}, {value}" if name in info else value
+        if response.status >= 400:
+            msg = f"HTTP Error {response.status}: {response.reason}"
+        else:
+            msg = f"OK ({response.getheader('Content-Length', 'unknown')} bytes)"
+        info.update({"url": url, "status": response.status, "msg": msg})
+        info["body"] = content
+        return None, info
+
+
 class ACMEDirectory:
     """
     The ACME server directory. Gives access to the available resources,
@@ -147,6 +286,10 @@ class ACMEDirectory:
         self.module = module
         self.directory_root = module.params["acme_directory"]
         self.version = module.params["acme_version"]
+        self.connections = client.connections
+        # Nonces returned by the server in Replay-Nonce headers, which have not been used yet.
+        # Appending and popping from a deque is thread-safe.
+        self.nonces: deque[str] = deque()
 
         directory, info = client.get_request(self.directory_root, get_only=True)
         if not isinstance(directory, dict):
@@ -180,15 +323,26 @@ class ACMEDirectory:
     def get(self, key: str, default_value: t.Any = None) -> t.Any:
         return self.directory.get(key, default_value)
 
+    def add_nonce(self, info: dict[str, t.Any]) -> None:
+        """
+        Remember the Replay-Nonce of a response, so that the next request does not
+        need to obtain a new one.
+        """
+        if "replay-nonce" in info:
+            self.nonces.append(info["replay-nonce"])
+
     def get_nonce(self, resource: str | None = None) -> str:
         url = self.directory["newNonce"]
         if resource is not None:
             url = resource
+        else:
+            try:
+                return self.nonces.popleft()
+            except IndexError:
+                pass
         retry_count = 0
         while True:
-            response, info = fetch_url(
-                self.module, url, method="HEAD", timeout=self.request_timeout
-            )
+            response, info = self.connections.fetch(url, method="HEAD")
             if _decode_retry(
                 module=self.module,
                 response=response,
@@ -242,6 +396,10 @@ class ACMEClient:
         self.account_uri = module.params.get("account_uri") or None
 
         self.request_timeout = module.params["request_timeout"]
+        self.max_concurrent_requests: int = module.params.get(
+            "max_concurrent_requests", 1
+        )
+        self.connections = _ConnectionPool(module=module, timeout=self.request_timeout)
 
         self.account_key_data = None
         self.account_jwk = None
@@ -481,14 +639,12 @@ class ACMEClient:
             headers = {
                 "Content-Type": "application/jose+json",
             }
-            resp, info = fetch_url(
-                self.module,
-                url,
-                data=data_str,
-                headers=headers,
-                method="POST",
-                timeout=self.request_timeout,
+            resp, info = self.connections.fetch(
+                url, data=data_str, headers=headers, method="POST"
             )
+            # Every response to a POST request should contain a fresh nonce, also error responses
+            # (https://tools.ietf.org/html/rfc8555#section-6.5)
+            self.directory.add_nonce(info)
             if _decode_retry(
                 module=self.module, response=resp, info=info, retry_count=failed_tries
             ):
@@ -605,13 +761,7 @@ class ACMEClient:
             # Perform unauthenticated GET
             retry_count = 0
             while True:
-                resp, info = fetch_url(
-                    self.module,
-                    uri,
-                    method="GET",
-                    headers=headers,
-                    timeout=self.request_timeout,
-                )
+                resp, info = self.connections.fetch(uri, method="GET", headers=headers)
                 if not _decode_retry(
                     module=self.module,
                     response=resp,
@@ -665,6 +815,24 @@ class ACMEClient:
             )
         return result, info
 
+    def run_concurrently(
+        self, function: Callable[[_T], _R], items: Iterable[_T]
+    ) -> list[_R]:
+        """
+        Call function for every item, with at most max_concurrent_requests calls
+        running at the same time. Return the results in the order of the items.
+        If calls raise exceptions, the exception of the first such item is raised
+        once all calls finished.
+        """
+        items = list(items)
+        if self.max_concurrent_requests <= 1 or len(items) <= 1:
+            return [function(item) for item in items]
+        with ThreadPoolExecutor(
+            max_workers=min(self.max_concurrent_requests, len(items))
+        ) as executor:
+            futures = [executor.submit(function, item) for item in items]
+        return [future.result() for future in futures]
+
     def get_renewal_info(
         self,
         *,
@@ -732,6 +900,7 @@ def create_default_argspec(
                 "choices": ["auto", "openssl", "cryptography"],
             },
             "request_timeout": {"type": "int", "default": 10},
+            "max_concurrent_requests": {"type": "int", "default": 4},
         },
     )
     if with_account:
@@ -216,12 +216,18 @@ class ACMECertificateClient:
         get_challenge: Callable[[Authorization], str],
         wait: bool = True,
     ) -> list[tuple[Authorization, str, Challenge | None]]:
-        authzs_with_challenges_to_wait_for = []
-        for authz in pending_authzs:
-            challenge_type = get_challenge(authz)
-            authz.call_validate(
+        def validate(authz_and_challenge_type: tuple[Authorization, str]) -> bool:
+            authz, challenge_type = authz_and_challenge_type
+            return authz.call_validate(
                 client=self.client, challenge_type=challenge_type, wait=wait
             )
+
+        authzs_and_challenge_types = [
+            (authz, get_challenge(authz)) for authz in pending_authzs
+        ]
+        self.client.run_concurrently(validate, authzs_and_challenge_types)
+        authzs_with_challenges_to_wait_for = []
+        for authz, challenge_type in authzs_and_challenge_types:
             authzs_with_challenges_to_wait_for.append(
                 (
                     authz,
@@ -411,10 +411,11 @@ def wait_for_validation(
     """
     Wait until a list of authz is valid. Fail if at least one of them is invalid or revoked.
     """
+    authzs = list(authzs)
     while authzs:
         authzs_next = []
+        client.run_concurrently(lambda authz: authz.refresh(client=client), authzs)
         for authz in authzs:
-            authz.refresh(client=client)
             if authz.status in ["valid", "invalid", "revoked"]:
                 if authz.status != "valid":
                     authz.raise_error(
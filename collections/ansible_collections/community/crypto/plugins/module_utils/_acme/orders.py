@@ -186,8 +186,11 @@ class Order:
         return changed
 
     def load_authorizations(self, *, client: ACMEClient) -> None:
-        for auth_uri in self.authorization_uris:
-            authz = Authorization.from_url(client=client, url=auth_uri)
+        authzs = client.run_concurrently(
+            lambda auth_uri: Authorization.from_url(client=client, url=auth_uri),
+            self.authorization_uris,
+        )
+        for authz in authzs:
             self.authorizations[
                 normalize_combined_identifier(authz.combined_identifier)
             ] = authz
@@ -817,9 +817,6 @@ class ACMECertificateClient:
         for authz in self.authorizations.values():
             if authz.status == "pending":
                 if self.challenge is not None:
-                    authz.call_validate(
-                        client=self.client, challenge_type=self.challenge, wait=False
-                    )
                     authzs_to_wait_for.append(authz)
                 # If there is no challenge, we must check whether the authz is valid
                 elif authz.status != "valid":
@@ -828,6 +825,14 @@ class ACMECertificateClient:
                         module=self.client.module,
                     )
                 self.changed = True
+        challenge_type = self.challenge
+        if challenge_type is not None:
+            self.client.run_concurrently(
+                lambda authz: authz.call_validate(
+                    client=self.client, challenge_type=challenge_type, wait=False
+                ),
+                authzs_to_wait_for,
+            )
 
         # Step 3: wait for authzs to validate
         wait_for_validation(authzs=authzs_to_wait_for, client=self.client)
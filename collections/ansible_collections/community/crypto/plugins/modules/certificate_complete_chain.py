@@ -58,6 +58,22 @@ options:
     type: list
     elements: path
     default: []
+  index_path:
+    description:
+      - Path of a file in which an index of the certificates found in O(root_certificates) and O(intermediate_certificates)
+        is stored.
+      - The index contains the subject, issuer, and key identifiers of every certificate, and where the certificate is located
+        in its file. On later runs, only files whose modification time or size changed are parsed again. Other certificates
+        are only loaded when they are considered as the issuer of a certificate in the chain.
+      - This considerably speeds up the module when large directories like C(/etc/pki/ca-trust/) are used.
+      - The file is created if it does not exist, and updated when files changed. This also happens in check mode, since the
+        index does not influence the result of the module.
+      - If not specified, all files are parsed on every run.
+    type: path
+    version_added: 3.2.0
+notes:
+  - If a certificate has an authority key identifier, potential issuers whose subject key identifier matches it are tried
+    first.
 """
 
 
@@ -94,6 +110,16 @@ EXAMPLES = r"""
   ansible.builtin.copy:
     dest: /etc/ssl/csr/www.ansible.com-rootchain.pem
     content: "{{ ''.join(www_ansible_com.chain) }}"
+
+# Keeps an index of the system trust store, so that it does not have to be
+# parsed completely on every run.
+- name: Find root certificate in the system trust store
+  community.crypto.certificate_complete_chain:
+    input_chain: "{{ lookup('ansible.builtin.file', '/etc/ssl/csr/www.ansible.com-fullchain.pem') }}"
+    root_certificates:
+      - /etc/pki/ca-trust/extracted/pem/
+    index_path: /var/cache/ansible/ca-trust-index.json
+  register: www_ansible_com
 """
 
 
@@ -119,7 +145,10 @@ complete_chain:
   elements: str
 """
 
+import base64
+import json
 import os
+import tempfile
 import typing as t
 
 from ansible.module_utils.basic import AnsibleModule
@@ -148,6 +177,54 @@ except ImportError:
     pass
 
 
+def get_name_key(name: cryptography.x509.Name) -> str:
+    """
+    Return a string identifying a name. Two names have the same key if and only if they are equal.
+    """
+    rdns = []
+    for rdn in name.rdns:
+        attributes = []
+        for attribute in rdn:
+            value = attribute.value
+            if isinstance(value, bytes):
+                attributes.append(
+                    [
+                        attribute.oid.dotted_string,
+                        to_text(base64.b64encode(value)),
+                        True,
+                    ]
+                )
+            else:
+                attributes.append([attribute.oid.dotted_string, value, False])
+        rdns.append(sorted(attributes))
+    return json.dumps(rdns)
+
+
+def get_key_identifiers(
+    cert: cryptography.x509.Certificate,
+) -> tuple[str | None, str | None]:
+    """
+    Return the subject key identifier and the authority key identifier of a certificate as hex strings.
+    """
+    ski = None
+    aki = None
+    try:
+        ski = cert.extensions.get_extension_for_class(
+            cryptography.x509.SubjectKeyIdentifier
+        ).value.digest.hex()
+    except Exception:
+        pass
+    try:
+        key_identifier = cert.extensions.get_extension_for_class(
+            cryptography.x509.AuthorityKeyIdentifier
+        ).value.key_identifier
+        if key_identifier is not None:
+            aki = key_identifier.hex()
+    except Exception:
+        pass
+    return ski, aki
+
+
 class Certificate:
     """
     Stores PEM with parsed certificate.
@@ -158,6 +235,26 @@ class Certificate:
             pem = pem + "\n"
         self.pem = pem
         self.cert = cert
+        self.subject_key = get_name_key(cert.subject)
+        self.issuer_key = get_name_key(cert.issuer)
+        self.ski, self.aki = get_key_identifiers(cert)
+        self.fingerprint = cert.fingerprint(
+            cryptography.hazmat.primitives.hashes.SHA256()
+        ).hex()
+
+    def get_index_entry(self, start: int, end: int) -> dict[str, t.Any]:
+        """
+        Return the entry describing this certificate in a ``CertificateIndex``.
+        """
+        return {
+            "subject": self.subject_key,
+            "issuer": self.issuer_key,
+            "ski": self.ski,
+            "aki": self.aki,
+            "fingerprint": self.fingerprint,
+            "start": start,
+            "end": end,
+        }
 
 
 def is_parent(
@@ -248,27 +345,161 @@ def parse_pem_list(
     return result
 
 
-def load_pem_list(
-    module: AnsibleModule, path: bytes | str | os.PathLike, fail_on_error: bool = True
-) -> list[Certificate]:
+def find_pem_offsets(data: bytes) -> list[tuple[int, int]]:
     """
-    Load concatenated PEM certificates from file. Return list of ``Certificate`` objects.
+    Find the PEM objects in data. Return a list of ``(start, end)`` byte offsets.
     """
+    result = []
+    start = None
+    position = 0
+    for line in data.splitlines(True):
+        if line.strip():
+            if line.startswith(b"-----BEGIN "):
+                start = position
+            if start is not None and line.startswith(b"-----END "):
+                result.append((start, position + len(line)))
+                start = None
+        position += len(line)
+    return result
+
+
+def index_pem_file(
+    module: AnsibleModule, path: bytes | str | os.PathLike
+) -> list[tuple[Certificate, dict[str, t.Any]]]:
+    """
+    Load concatenated PEM certificates from file. Return a list of ``Certificate`` objects
+    together with their ``CertificateIndex`` entries.
+    """
+    result: list[tuple[Certificate, dict[str, t.Any]]] = []
     try:
         with open(path, "rb") as f:
-            return parse_pem_list(
-                module,
-                f.read().decode("utf-8"),
-                source=path,
-                fail_on_error=fail_on_error,
-            )
+            data = f.read()
+        # Files which cannot be decoded as a whole are skipped
+        data.decode("utf-8")
     except Exception as e:
-        msg = f"Cannot read certificate file {to_text(path)!r}: {e}"
-        if fail_on_error:
-            module.fail_json(msg=msg)
-        else:
-            module.warn(msg)
-            return []
+        module.warn(f"Cannot read certificate file {to_text(path)!r}: {e}")
+        return result
+    for start, end in find_pem_offsets(data):
+        certs = parse_pem_list(
+            module, data[start:end].decode("utf-8"), source=path, fail_on_error=False
+        )
+        for cert in certs:
+            result.append((cert, cert.get_index_entry(start, end)))
+    return result
+
+
+class CertificateIndex:
+    """
+    On-disk index of the certificates contained in files. Files are identified by their path,
+    modification time, and size, so that only changed files need to be parsed again.
+    """
+
+    VERSION = 1
+
+    def __init__(self, module: AnsibleModule, path: str) -> None:
+        self.module = module
+        self.path = path
+        self.files: dict[str, dict[str, t.Any]] = {}
+        self.changed = False
+        try:
+            with open(path, "rb") as f:
+                data = json.load(f)
+            if data.get("version") == self.VERSION and isinstance(
+                data.get("files"), dict
+            ):
+                self.files = data["files"]
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            module.warn(f"Ignoring invalid certificate index {path!r}: {e}")
+
+    @staticmethod
+    def _stat(path: bytes | str | os.PathLike) -> tuple[int, int] | None:
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def get(
+        self, path: bytes | str | os.PathLike
+    ) -> tuple[tuple[int, int] | None, list[dict[str, t.Any]] | None]:
+        """
+        Return the current state of the file and its entries, if the file did not change since it was indexed.
+        """
+        state = self._stat(path)
+        entry = self.files.get(to_text(path, errors="surrogate_or_strict"))
+        if state is None or entry is None:
+            return state, None
+        if [entry.get("mtime"), entry.get("size")] != list(state):
+            return state, None
+        return state, entry.get("certificates")
+
+    def set(
+        self,
+        path: bytes | str | os.PathLike,
+        state: tuple[int, int],
+        certificates: list[dict[str, t.Any]],
+    ) -> None:
+        self.files[to_text(path, errors="surrogate_or_strict")] = {
+            "mtime": state[0],
+            "size": state[1],
+            "certificates": certificates,
+        }
+        self.changed = True
+
+    def save(self) -> None:
+        if not self.changed:
+            return
+        directory = os.path.dirname(os.path.abspath(self.path))
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".certificate-index-")
+            try:
+                with os.fdopen(fd, "w") as f:
+                    json.dump({"version": self.VERSION, "files": self.files}, f)
+                os.replace(tmp_path, self.path)
+            except Exception:
+                os.unlink(tmp_path)
+                raise
+        except Exception as e:
+            self.module.warn(f"Cannot write certificate index {self.path!r}: {e}")
+
+
+class CertificateReference:
+    """
+    A certificate in a ``CertificateSet``. The certificate is only parsed when it is needed.
+    """
+
+    def __init__(
+        self,
+        path: bytes | str | os.PathLike,
+        entry: dict[str, t.Any],
+        certificate: Certificate | None = None,
+    ) -> None:
+        self.path = path
+        self.entry = entry
+        self.ski: str | None = entry["ski"]
+        self.certificate = certificate
+        self.failed = False
+
+    def load(self, module: AnsibleModule) -> Certificate | None:
+        if self.certificate is None and not self.failed:
+            start, end = self.entry["start"], self.entry["end"]
+            try:
+                with open(self.path, "rb") as f:
+                    f.seek(start)
+                    data = f.read(end - start)
+                certs = parse_pem_list(
+                    module, data.decode("utf-8"), source=self.path, fail_on_error=False
+                )
+            except Exception as e:
+                module.warn(f"Cannot read certificate file {to_text(self.path)!r}: {e}")
+                certs = []
+            if certs and certs[0].fingerprint == self.entry["fingerprint"]:
+                self.certificate = certs[0]
+            else:
+                self.failed = True
+        return self.certificate
 
 
 class CertificateSet:
@@ -276,22 +507,33 @@ class CertificateSet:
     Stores a set of certificates. Allows to search for parent (issuer of a certificate).
     """
 
-    def __init__(self, module: AnsibleModule) -> None:
+    def __init__(
+        self, module: AnsibleModule, index: CertificateIndex | None = None
+    ) -> None:
         self.module = module
-        self.certificates: set[Certificate] = set()
-        self.certificates_by_issuer: dict[cryptography.x509.Name, list[Certificate]] = (
-            {}
+        self.index = index
+        self.certificates_by_subject: dict[str, list[CertificateReference]] = {}
+        self.fingerprints: set[str] = set()
+
+    def _add(self, reference: CertificateReference) -> None:
+        self.certificates_by_subject.setdefault(reference.entry["subject"], []).append(
+            reference
         )
-        self.certificate_by_cert: dict[cryptography.x509.Certificate, Certificate] = {}
+        self.fingerprints.add(reference.entry["fingerprint"])
 
     def _load_file(self, path: bytes | str | os.PathLike) -> None:
-        certs = load_pem_list(self.module, path, fail_on_error=False)
-        for cert in certs:
-            self.certificates.add(cert)
-            if cert.cert.subject not in self.certificates_by_issuer:
-                self.certificates_by_issuer[cert.cert.subject] = []
-            self.certificates_by_issuer[cert.cert.subject].append(cert)
-            self.certificate_by_cert[cert.cert] = cert
+        state = None
+        if self.index is not None:
+            state, entries = self.index.get(path)
+            if entries is not None:
+                for entry in entries:
+                    self._add(CertificateReference(path, entry))
+                return
+        certs = index_pem_file(self.module, path)
+        if self.index is not None and state is not None:
+            self.index.set(path, state, [entry for dummy, entry in certs])
+        for cert, entry in certs:
+            self._add(CertificateReference(path, entry, cert))
 
     def load(self, path: str | os.PathLike) -> None:
         """
@@ -309,12 +551,32 @@ class CertificateSet:
         """
         Search for the parent (issuer) of a certificate. Return ``None`` if none was found.
         """
-        potential_parents = self.certificates_by_issuer.get(cert.cert.issuer, [])
-        for potential_parent in potential_parents:
-            if is_parent(self.module, cert, potential_parent):
+        potential_parents = self.certificates_by_subject.get(cert.issuer_key, [])
+        if cert.aki is not None:
+            # Try certificates whose subject key identifier matches first,
+            # and the ones with a different subject key identifier last
+            potential_parents = sorted(
+                potential_parents,
+                key=lambda reference: (
+                    0
+                    if reference.ski == cert.aki
+                    else (1 if reference.ski is None else 2)
+                ),
+            )
+        for reference in potential_parents:
+            potential_parent = reference.load(self.module)
+            if potential_parent is not None and is_parent(
+                self.module, cert, potential_parent
+            ):
                 return potential_parent
         return None
 
+    def contains(self, cert: Certificate) -> bool:
+        """
+        Check whether the certificate is part of the set.
+        """
+        return cert.fingerprint in self.fingerprints
+
 
 def format_cert(cert: Certificate) -> str:
     """
@@ -347,6 +609,7 @@ def main() -> t.NoReturn:
                 "default": [],
                 "elements": "path",
             },
+            "index_path": {"type": "path"},
         },
         supports_check_mode=True,
     )
@@ -369,21 +632,28 @@ def main() -> t.NoReturn:
                 )
             )
 
+    index = None
+    if module.params["index_path"] is not None:
+        index = CertificateIndex(module, module.params["index_path"])
+
     # Load intermediate certificates
-    intermediates = CertificateSet(module)
+    intermediates = CertificateSet(module, index)
     for path in module.params["intermediate_certificates"]:
         intermediates.load(path)
 
     # Load root certificates
-    roots = CertificateSet(module)
+    roots = CertificateSet(module, index)
     for path in module.params["root_certificates"]:
         roots.load(path)
 
+    if index is not None:
+        index.save()
+
     # Try to complete chain
     current: Certificate | None = chain[-1]
     completed = []
     occured_certificates = {cert.cert for cert in chain}
-    if current and current.cert in roots.certificate_by_cert:
+    if current and roots.contains(current):
         # Do not try to complete the chain when it is already ending with a root certificate
         current = None
     while current:
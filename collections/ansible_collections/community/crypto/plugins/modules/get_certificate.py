@@ -29,8 +29,8 @@ options:
   host:
     description:
       - The host to get the cert for (IP is fine).
+      - Exactly one of O(host) and O(targets) must be specified.
     type: str
-    required: true
   ca_cert:
     description:
       - A PEM file containing one or more root certificates; if present, the cert will be validated against these root certs.
@@ -40,8 +40,58 @@ options:
   port:
     description:
       - The port to connect to.
+      - Required if O(host) is specified.
     type: int
-    required: true
+  targets:
+    description:
+      - A list of endpoints to get the certificates from.
+      - The endpoints are probed concurrently, see O(max_concurrent_connections). The result is returned in RV(results)
+        instead of the top-level return values.
+      - Mutually exclusive with O(host), O(port), and O(server_name).
+    type: list
+    elements: dict
+    suboptions:
+      host:
+        description:
+          - The host to get the cert for (IP is fine).
+        type: str
+        required: true
+      port:
+        description:
+          - The port to connect to.
+        type: int
+        required: true
+      server_name:
+        description:
+          - Server name used for SNI when O(targets[].host) is an IP or is different from server name.
+        type: str
+      starttls:
+        description:
+          - Requests a secure connection for protocols which require clients to initiate encryption.
+          - Defaults to O(starttls).
+        type: str
+        choices:
+          - mysql
+      timeout:
+        description:
+          - The timeout in seconds for this endpoint.
+          - Defaults to O(timeout).
+        type: int
+    version_added: 3.2.0
+  max_concurrent_connections:
+    description:
+      - The maximal number of endpoints from O(targets) that are probed at the same time.
+    type: int
+    default: 16
+    version_added: 3.2.0
+  expiry_only:
+    description:
+      - If set to V(true), only RV(results[].not_before), RV(results[].not_after), and RV(results[].expired) are returned
+        for every endpoint in O(targets). This keeps the result small when only the expiry of the certificates is checked.
+      - Only used with O(targets).
+    type: bool
+    default: false
+    version_added: 3.2.0
   server_name:
     description:
       - Server name used for SNI (L(Server Name Indication,https://en.wikipedia.org/wiki/Server_Name_Indication)) when hostname
@@ -122,6 +172,8 @@ options:
 
 notes:
   - When using ca_cert on OS X it has been reported that in some conditions the validate will always succeed.
+  - When O(targets) is used and the certificate of at least one endpoint cannot be retrieved, the module fails and RV(results)
+    contains the error messages of the failed endpoints next to the information of the other endpoints.
 requirements:
   - "Python >= 3.10 when O(get_certificate_chain=true)"
 
@@ -215,6 +267,50 @@ unverified_chain:
   type: list
   elements: str
   version_added: 2.21.0
+results:
+  description:
+    - The certificate information for every endpoint in O(targets), in the same order.
+    - Unless O(expiry_only=true), every entry also contains the values returned at the top level when O(host) is used,
+      such as RV(cert), RV(subject), and RV(issuer).
+  returned: when O(targets) is used
+  type: list
+  elements: dict
+  contains:
+    host:
+      description: The host of the endpoint.
+      returned: always
+      type: str
+      sample: rgw1.example.com
+    port:
+      description: The port of the endpoint.
+      returned: always
+      type: int
+      sample: 443
+    expired:
+      description: Boolean indicating if the cert is expired.
+      returned: success
+      type: bool
+    not_after:
+      description: Date of expiry of the cert.
+      returned: success
+      type: str
+      sample: "20261029200436Z"
+    not_before:
+      description: Date the cert is valid from.
+      returned: success
+      type: str
+      sample: "20261019200436Z"
+    failed:
+      description: Whether the certificate of this endpoint could not be retrieved.
+      returned: when the certificate could not be retrieved
+      type: bool
+      sample: true
+    msg:
+      description: The error message.
+      returned: when the certificate could not be retrieved
+      type: str
+      sample: "Failed to get cert from rgw1.example.com:443, error: [Errno 111] Connection refused"
+  version_added: 3.2.0
 """
 
 EXAMPLES = r"""
@@ -261,15 +357,41 @@ EXAMPLES = r"""
   delegate_to: localhost
   run_once: true
   register: legacy_cert
+
+- name: Check the expiry of the certificates of several endpoints at once
+  community.crypto.get_certificate:
+    targets:
+      - host: rgw1.example.com
+        port: 443
+      - host: grafana.example.com
+        port: 3000
+        timeout: 5
+      - host: db.example.com
+        port: 3306
+        starttls: mysql
+    expiry_only: true
+  delegate_to: localhost
+  run_once: true
+  register: certs
+
+- name: Show the endpoints whose certificates expire within 30 days
+  ansible.builtin.debug:
+    msg: "{{ item.host }}:{{ item.port }} expires on {{ item.not_after }}"
+  loop: "{{ certs.results }}"
+  when: >-
+    (
+      (item.not_after | ansible.builtin.to_datetime('%Y%m%d%H%M%SZ')) -
+      (ansible_date_time.iso8601 | ansible.builtin.to_datetime('%Y-%m-%dT%H:%M:%SZ'))
+    ).days < 30
 """
 
-import atexit
 import base64
 import ssl
 import sys
 import typing as t
+from concurrent.futures import ThreadPoolExecutor
 from os.path import isfile
-from socket import create_connection, setdefaulttimeout, socket
+from socket import create_connection, socket
 from ssl import (
     CERT_NONE,
     CERT_REQUIRED,
@@ -321,136 +443,107 @@ def send_starttls_packet(sock: socket, server_type: t.Literal["mysql"]) -> None:
         sock.send(ssl_request_packet)
 
 
-def main() -> t.NoReturn:
-    module = AnsibleModule(
-        argument_spec={
-            "ca_cert": {"type": "path"},
-            "host": {"type": "str", "required": True},
-            "port": {"type": "int", "required": True},
-            "proxy_host": {"type": "str"},
-            "proxy_port": {"type": "int", "default": 8080},
-            "server_name": {"type": "str"},
-            "timeout": {"type": "int", "default": 10},
-            "select_crypto_backend": {
-                "type": "str",
-                "default": "auto",
-                "choices": ["auto", "cryptography"],
-            },
-            "starttls": {"type": "str", "choices": ["mysql"]},
-            "ciphers": {"type": "list", "elements": "str"},
-            "asn1_base64": {"type": "bool", "default": True},
-            "tls_ctx_options": {"type": "list", "elements": "raw"},
-            "get_certificate_chain": {"type": "bool", "default": False},
-        },
-    )
-
-    ca_cert: str | None = module.params.get("ca_cert")
-    host: str = module.params.get("host")
-    port: int = module.params.get("port")
-    proxy_host: str | None = module.params.get("proxy_host")
-    proxy_port: int | None = module.params.get("proxy_port")
-    timeout: int = module.params.get("timeout")
-    server_name: str | None = module.params.get("server_name")
-    start_tls_server_type: t.Literal["mysql"] | None = module.params.get("starttls")
-    ciphers: list[str] | None = module.params.get("ciphers")
-    asn1_base64: bool = module.params["asn1_base64"]
-    tls_ctx_options: list[str | bytes | int] | None = module.params["tls_ctx_options"]
-    get_certificate_chain: bool = module.params["get_certificate_chain"]
-
-    if get_certificate_chain and sys.version_info < (3, 10):
-        module.fail_json(
-            msg="get_certificate_chain=true can only be used with Python 3.10 (Python 3.13+ officially supports this). "
-            f"The Python version used to run the get_certificate module is {sys.version}"
-        )
-
-    assert_required_cryptography_version(
-        module, minimum_cryptography_version=MINIMAL_CRYPTOGRAPHY_VERSION
-    )
-
-    result: dict[str, t.Any] = {
-        "changed": False,
-    }
-
-    if timeout:
-        setdefaulttimeout(timeout)
-
-    if ca_cert and not isfile(ca_cert):
-        module.fail_json(msg="ca_cert file does not exist")
-
+def create_ssl_context(
+    module: AnsibleModule,
+    *,
+    ca_cert: str | None,
+    ciphers: list[str] | None,
+    tls_ctx_options: list[str | bytes | int] | None,
+) -> ssl.SSLContext:
+    if ca_cert:
+        ctx = create_default_context(cafile=ca_cert)
+        ctx.check_hostname = False
+        ctx.verify_mode = CERT_REQUIRED
+    else:
+        ctx = create_default_context()
+        ctx.check_hostname = False
+        ctx.verify_mode = CERT_NONE
+
+    if ciphers is not None:
+        ciphers_joined = ":".join(ciphers)
+        ctx.set_ciphers(ciphers_joined)
+
+    if tls_ctx_options is not None:
+        # Clear default ctx options
+        ctx.options = 0  # type: ignore
+
+        # For each item in the tls_ctx_options list
+        for tls_ctx_option in tls_ctx_options:
+            # If the item is a string_type
+            if isinstance(tls_ctx_option, (str, bytes)):
+                # Convert tls_ctx_option to a native string
+                tls_ctx_option_str = to_text(tls_ctx_option)
+                # Get the tls_ctx_option_str attribute from ssl
+                tls_ctx_option_attr = getattr(ssl, tls_ctx_option_str, None)
+                # If tls_ctx_option_attr is an integer
+                if isinstance(tls_ctx_option_attr, int):
+                    # Set tls_ctx_option_int to the attribute value
+                    tls_ctx_option_int = tls_ctx_option_attr
+                # If tls_ctx_option_attr is not an integer
+                else:
+                    module.fail_json(
+                        msg=f"Failed to determine the numeric value for {tls_ctx_option_str}"
+                    )
+            # If the item is an integer
+            elif isinstance(tls_ctx_option, int):
+                # Set tls_ctx_option_int to the item value
+                tls_ctx_option_int = tls_ctx_option
+            # If the item is not a string nor integer
+            else:
+                module.fail_json(
+                    msg=f"tls_ctx_options must be a string or integer, got {tls_ctx_option!r}"
+                )
+                tls_ctx_option_int = (  # type: ignore[unreachable]
+                    0  # make pylint happy; this code is actually unreachable
+                )
+
+            try:
+                # Add the int value of the item to ctx options
+                # (pylint does not yet notice that module.fail_json cannot return)
+                ctx.options |= tls_ctx_option_int  # pylint: disable=possibly-used-before-assignment
+            except Exception:
+                module.fail_json(
+                    msg=f"Failed to add {tls_ctx_option_str or tls_ctx_option_int} to CTX options"
+                )
+
+    return ctx
+
+
+def get_peer_certificate(
+    ctx: ssl.SSLContext,
+    *,
+    host: str,
+    port: int,
+    timeout: int | None,
+    proxy_host: str | None,
+    proxy_port: int | None,
+    server_name: str | None,
+    start_tls_server_type: t.Literal["mysql"] | None,
+    get_certificate_chain: bool,
+) -> tuple[str, list[str] | None, list[str] | None]:
+    """
+    Connect to host:port and return the certificate presented by the server in PEM
+    format, together with the verified and unverified chains if get_certificate_chain
+    is true.
+    """
     verified_chain = None
     unverified_chain = None
-
+    sock = None
+    tls_sock = None
     try:
         if proxy_host:
             connect = f"CONNECT {host}:{port} HTTP/1.0\r\n\r\n"
             sock = socket()
-            atexit.register(sock.close)
+            sock.settimeout(timeout or None)
             sock.connect((proxy_host, proxy_port))
             sock.send(connect.encode())
             sock.recv(8192)
         else:
-            sock = create_connection((host, port))
-            atexit.register(sock.close)
-
-        if ca_cert:
-            ctx = create_default_context(cafile=ca_cert)
-            ctx.check_hostname = False
-            ctx.verify_mode = CERT_REQUIRED
-        else:
-            ctx = create_default_context()
-            ctx.check_hostname = False
-            ctx.verify_mode = CERT_NONE
+            sock = create_connection((host, port), timeout=timeout or None)
 
         if start_tls_server_type is not None:
             send_starttls_packet(sock, start_tls_server_type)
 
-        if ciphers is not None:
-            ciphers_joined = ":".join(ciphers)
-            ctx.set_ciphers(ciphers_joined)
-
-        if tls_ctx_options is not None:
-            # Clear default ctx options
-            ctx.options = 0  # type: ignore
-
-            # For each item in the tls_ctx_options list
-            for tls_ctx_option in tls_ctx_options:
-                # If the item is a string_type
-                if isinstance(tls_ctx_option, (str, bytes)):
-                    # Convert tls_ctx_option to a native string
-                    tls_ctx_option_str = to_text(tls_ctx_option)
-                    # Get the tls_ctx_option_str attribute from ssl
-                    tls_ctx_option_attr = getattr(ssl, tls_ctx_option_str, None)
-                    # If tls_ctx_option_attr is an integer
-                    if isinstance(tls_ctx_option_attr, int):
-                        # Set tls_ctx_option_int to the attribute value
-                        tls_ctx_option_int = tls_ctx_option_attr
-                    # If tls_ctx_option_attr is not an integer
-                    else:
-                        module.fail_json(
-                            msg=f"Failed to determine the numeric value for {tls_ctx_option_str}"
-                        )
-                # If the item is an integer
-                elif isinstance(tls_ctx_option, int):
-                    # Set tls_ctx_option_int to the item value
-                    tls_ctx_option_int = tls_ctx_option
-                # If the item is not a string nor integer
-                else:
-                    module.fail_json(
-                        msg=f"tls_ctx_options must be a string or integer, got {tls_ctx_option!r}"
-                    )
-                    tls_ctx_option_int = (  # type: ignore[unreachable]
-                        0  # make pylint happy; this code is actually unreachable
-                    )
-
-                try:
-                    # Add the int value of the item to ctx options
-                    # (pylint does not yet notice that module.fail_json cannot return)
-                    ctx.options |= tls_ctx_option_int  # pylint: disable=possibly-used-before-assignment
-                except Exception:
-                    module.fail_json(
-                        msg=f"Failed to add {tls_ctx_option_str or tls_ctx_option_int} to CTX options"
-                    )
-
         tls_sock = ctx.wrap_socket(sock, server_hostname=server_name or host)
         cert_der = tls_sock.getpeercert(True)
         if cert_der is None:
@@ -502,16 +595,28 @@ def main() -> t.NoReturn:
 
             verified_chain = [DER_cert_to_PEM_cert(c) for c in verified_der_chain]
             unverified_chain = [DER_cert_to_PEM_cert(c) for c in unverified_der_chain]
+    finally:
+        if tls_sock is not None:
+            tls_sock.close()
+        if sock is not None:
+            sock.close()
+
+    return cert, verified_chain, unverified_chain
+
+
+def get_expiry_info(x509: cryptography.x509.Certificate) -> dict[str, t.Any]:
+    return {
+        "expired": get_not_valid_after(x509)
+        < get_now_datetime(with_timezone=CRYPTOGRAPHY_TIMEZONE),
+        "not_after": get_not_valid_after(x509).strftime("%Y%m%d%H%M%SZ"),
+        "not_before": get_not_valid_before(x509).strftime("%Y%m%d%H%M%SZ"),
+    }
 
-    except Exception as e:
-        if proxy_host:
-            module.fail_json(
-                msg=f"Failed to get cert via proxy {proxy_host}:{proxy_port} from {host}:{port}, error: {e}"
-            )
-        else:
-            module.fail_json(msg=f"Failed to get cert from {host}:{port}, error: {e}")
 
-    result["cert"] = cert
+def get_certificate_info(cert: str, *, asn1_base64: bool) -> dict[str, t.Any]:
+    result: dict[str, t.Any] = {
+        "cert": cert,
+    }
 
     x509 = cryptography.x509.load_pem_x509_certificate(to_bytes(cert))
     result["subject"] = {}
@@ -520,10 +625,6 @@ def main() -> t.NoReturn:
             attribute.value
         )
 
-    result["expired"] = get_not_valid_after(x509) < get_now_datetime(
-        with_timezone=CRYPTOGRAPHY_TIMEZONE
-    )
-
     result["extensions"] = []
     for dotted_number, entry in cryptography_get_extensions_from_cert(x509).items():
         oid = cryptography.x509.oid.ObjectIdentifier(dotted_number)
@@ -542,8 +643,7 @@ def main() -> t.NoReturn:
             attribute.value
         )
 
-    result["not_after"] = get_not_valid_after(x509).strftime("%Y%m%d%H%M%SZ")
-    result["not_before"] = get_not_valid_before(x509).strftime("%Y%m%d%H%M%SZ")
+    result.update(get_expiry_info(x509))
 
     result["serial_number"] = x509.serial_number
     result["signature_algorithm"] = cryptography_oid_to_name(
@@ -558,6 +658,191 @@ def main() -> t.NoReturn:
     else:
         result["version"] = "unknown"  # type: ignore[unreachable]
 
+    return result
+
+
+def format_error(
+    *,
+    host: str,
+    port: int,
+    proxy_host: str | None,
+    proxy_port: int | None,
+    error: Exception,
+) -> str:
+    if proxy_host:
+        return f"Failed to get cert via proxy {proxy_host}:{proxy_port} from {host}:{port}, error: {error}"
+    return f"Failed to get cert from {host}:{port}, error: {error}"
+
+
+def main() -> t.NoReturn:
+    module = AnsibleModule(
+        argument_spec={
+            "ca_cert": {"type": "path"},
+            "host": {"type": "str"},
+            "port": {"type": "int"},
+            "targets": {
+                "type": "list",
+                "elements": "dict",
+                "options": {
+                    "host": {"type": "str", "required": True},
+                    "port": {"type": "int", "required": True},
+                    "server_name": {"type": "str"},
+                    "starttls": {"type": "str", "choices": ["mysql"]},
+                    "timeout": {"type": "int"},
+                },
+            },
+            "max_concurrent_connections": {"type": "int", "default": 16},
+            "expiry_only": {"type": "bool", "default": False},
+            "proxy_host": {"type": "str"},
+            "proxy_port": {"type": "int", "default": 8080},
+            "server_name": {"type": "str"},
+            "timeout": {"type": "int", "default": 10},
+            "select_crypto_backend": {
+                "type": "str",
+                "default": "auto",
+                "choices": ["auto", "cryptography"],
+            },
+            "starttls": {"type": "str", "choices": ["mysql"]},
+            "ciphers": {"type": "list", "elements": "str"},
+            "asn1_base64": {"type": "bool", "default": True},
+            "tls_ctx_options": {"type": "list", "elements": "raw"},
+            "get_certificate_chain": {"type": "bool", "default": False},
+        },
+        required_one_of=[["host", "targets"]],
+        required_together=[["host", "port"]],
+        mutually_exclusive=[
+            ["host", "targets"],
+            ["port", "targets"],
+            ["server_name", "targets"],
+        ],
+    )
+
+    ca_cert: str | None = module.params.get("ca_cert")
+    host: str | None = module.params.get("host")
+    port: int | None = module.params.get("port")
+    targets: list[dict[str, t.Any]] | None = module.params.get("targets")
+    proxy_host: str | None = module.params.get("proxy_host")
+    proxy_port: int | None = module.params.get("proxy_port")
+    timeout: int = module.params.get("timeout")
+    server_name: str | None = module.params.get("server_name")
+    start_tls_server_type: t.Literal["mysql"] | None = module.params.get("starttls")
+    ciphers: list[str] | None = module.params.get("ciphers")
+    asn1_base64: bool = module.params["asn1_base64"]
+    tls_ctx_options: list[str | bytes | int] | None = module.params["tls_ctx_options"]
+    get_certificate_chain: bool = module.params["get_certificate_chain"]
+
+    if get_certificate_chain and sys.version_info < (3, 10):
+        module.fail_json(
+            msg="get_certificate_chain=true can only be used with Python 3.10 (Python 3.13+ officially supports this). "
+            f"The Python version used to run the get_certificate module is {sys.version}"
+        )
+
+    assert_required_cryptography_version(
+        module, minimum_cryptography_version=MINIMAL_CRYPTOGRAPHY_VERSION
+    )
+
+    if ca_cert and not isfile(ca_cert):
+        module.fail_json(msg="ca_cert file does not exist")
+
+    ctx = create_ssl_context(
+        module, ca_cert=ca_cert, ciphers=ciphers, tls_ctx_options=tls_ctx_options
+    )
+
+    if targets is not None:
+        expiry_only: bool = module.params["expiry_only"]
+
+        def probe(target: dict[str, t.Any]) -> dict[str, t.Any]:
+            target_result: dict[str, t.Any] = {
+                "host": target["host"],
+                "port": target["port"],
+            }
+            try:
+                cert, verified_chain, unverified_chain = get_peer_certificate(
+                    ctx,
+                    host=target["host"],
+                    port=target["port"],
+                    timeout=(
+                        target["timeout"] if target["timeout"] is not None else timeout
+                    ),
+                    proxy_host=proxy_host,
+                    proxy_port=proxy_port,
+                    server_name=target["server_name"],
+                    start_tls_server_type=target["starttls"] or start_tls_server_type,
+                    get_certificate_chain=get_certificate_chain and not expiry_only,
+                )
+                if expiry_only:
+                    target_result.update(
+                        get_expiry_info(
+                            cryptography.x509.load_pem_x509_certificate(to_bytes(cert))
+                        )
+                    )
+                else:
+                    target_result.update(
+                        get_certificate_info(cert, asn1_base64=asn1_base64)
+                    )
+                    if verified_chain is not None:
+                        target_result["verified_chain"] = verified_chain
+                    if unverified_chain is not None:
+                        target_result["unverified_chain"] = unverified_chain
+            except Exception as e:
+                target_result["failed"] = True
+                target_result["msg"] = format_error(
+                    host=target["host"],
+                    port=target["port"],
+                    proxy_host=proxy_host,
+                    proxy_port=proxy_port,
+                    error=e,
+                )
+            return target_result
+
+        max_workers = max(
+            1, min(module.params["max_concurrent_connections"], len(targets))
+        )
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(probe, targets))
+
+        failed = [
+            f"{target_result['host']}:{target_result['port']}"
+            for target_result in results
+            if target_result.get("failed")
+        ]
+        if failed:
+            module.fail_json(
+                msg=f"Failed to get the certificates from {', '.join(failed)}",
+                changed=False,
+                results=results,
+            )
+        module.exit_json(changed=False, results=results)
+
+    assert host is not None and port is not None
+    try:
+        cert, verified_chain, unverified_chain = get_peer_certificate(
+            ctx,
+            host=host,
+            port=port,
+            timeout=timeout,
+            proxy_host=proxy_host,
+            proxy_port=proxy_port,
+            server_name=server_name,
+            start_tls_server_type=start_tls_server_type,
+            get_certificate_chain=get_certificate_chain,
+        )
+    except Exception as e:
+        module.fail_json(
+            msg=format_error(
+                host=host,
+                port=port,
+                proxy_host=proxy_host,
+                proxy_port=proxy_port,
+                error=e,
+            )
+        )
+
+    result: dict[str, t.Any] = {
+        "changed": False,
+    }
+    result.update(get_certificate_info(cert, asn1_base64=asn1_base64))
+
     if verified_chain is not None:
         result["verified_chain"] = verified_chain
     if unverified_chain is not None:
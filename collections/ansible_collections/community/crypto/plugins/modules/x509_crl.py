@@ -48,12 +48,16 @@ options:
       - If set to V(update), makes sure that the CRL contains the revoked certificates from O(revoked_certificates), but can
         also contain other revoked certificates. If the CRL file already exists, all entries from the existing CRL will also
         be included in the new CRL. When using V(update), you might be interested in setting O(ignore_timestamps) to V(true).
+      - If set to V(append), entries from O(revoked_certificates) are only added to the CRL if no entry with the same serial
+        number exists yet. Existing entries are copied as they are and never compared to O(revoked_certificates), which
+        is considerably faster than V(update) for CRLs with many entries. Use this if revocations are only ever added and
+        never modified. The value V(append) has been added in community.crypto 3.2.0.
       - The default value is V(generate).
       - This parameter was called O(mode) before community.crypto 2.13.0. It has been renamed to avoid a collision with the
         common O(mode) parameter for setting the CRL file's access mode.
     type: str
     default: generate
-    choices: [generate, update]
+    choices: [generate, update, append]
     version_added: 2.13.0
 
   force:
@@ -425,6 +429,7 @@ crl:
 import base64
 import os
 import typing as t
+from collections import Counter
 
 from ansible.module_utils.basic import AnsibleModule
 from ansible.module_utils.common.text.converters import to_text
@@ -514,7 +519,9 @@ class CRL(OpenSSLObject):
 
         self.format: t.Literal["pem", "der"] = module.params["format"]
 
-        self.update: bool = module.params["crl_mode"] == "update"
+        self.crl_mode: t.Literal["generate", "update", "append"] = module.params[
+            "crl_mode"
+        ]
         self.ignore_timestamps: bool = module.params["ignore_timestamps"]
         self.return_content: bool = module.params["return_content"]
         self.name_encoding: t.Literal["ignore", "idna", "unicode"] = module.params[
@@ -805,20 +812,42 @@ class CRL(OpenSSLObject):
             if want_issuer != is_issuer:
                 return False
 
-        old_entries = [
-            self._compress_entry(cryptography_decode_revoked_certificate(cert))
-            for cert in self.crl
-        ]
-        new_entries = [self._compress_entry(cert) for cert in self.revoked_certificates]
-        if self.update:
-            # We do not simply use a set so that duplicate entries are treated correctly
-            for entry in new_entries:
-                try:
-                    old_entries.remove(entry)
-                except ValueError:
-                    return False
+        if self.crl_mode == "append":
+            # Only the serial numbers matter, so existing entries do not need to be decoded
+            existing_serials = {cert.serial_number for cert in self.crl}
+            if any(
+                entry["serial_number"] not in existing_serials
+                for entry in self.revoked_certificates
+            ):
+                return False
+        elif self.crl_mode == "update":
+            # Only existing entries with a wanted serial number can match a new entry,
+            # so only these need to be decoded. We use multisets instead of sets so that
+            # duplicate entries are treated correctly.
+            wanted_serials = {
+                entry["serial_number"] for entry in self.revoked_certificates
+            }
+            old_entries = Counter(
+                self._compress_entry(cryptography_decode_revoked_certificate(cert))
+                for cert in self.crl
+                if cert.serial_number in wanted_serials
+            )
+            new_entries = Counter(
+                self._compress_entry(entry) for entry in self.revoked_certificates
+            )
+            if new_entries - old_entries:
+                return False
         else:
-            if old_entries != new_entries:
+            if len(self.crl) != len(self.revoked_certificates):
+                return False
+            old_entries_list = [
+                self._compress_entry(cryptography_decode_revoked_certificate(cert))
+                for cert in self.crl
+            ]
+            new_entries_list = [
+                self._compress_entry(entry) for entry in self.revoked_certificates
+            ]
+            if old_entries_list != new_entries_list:
                 return False
 
         return not (self.format != self.actual_format and not ignore_conversion)
@@ -844,17 +873,34 @@ class CRL(OpenSSLObject):
         if self.next_update is not None:
             crl = set_next_update(crl, value=self.next_update)
 
-        if self.update and self.crl:
+        revoked_certificates = self.revoked_certificates
+        if self.crl_mode == "append" and self.crl:
+            existing_serials = set()
+            for entry in self.crl:
+                existing_serials.add(entry.serial_number)
+                crl = crl.add_revoked_certificate(entry)
+            revoked_certificates = [
+                entry
+                for entry in self.revoked_certificates
+                if entry["serial_number"] not in existing_serials
+            ]
+        elif self.crl_mode == "update" and self.crl:
+            new_serials = {
+                entry["serial_number"] for entry in self.revoked_certificates
+            }
             new_entries = {
                 self._compress_entry(entry) for entry in self.revoked_certificates
             }
             for entry in self.crl:
-                decoded_entry = self._compress_entry(
-                    cryptography_decode_revoked_certificate(entry)
-                )
-                if decoded_entry not in new_entries:
-                    crl = crl.add_revoked_certificate(entry)
-        for revoked_entry in self.revoked_certificates:
+                # Entries whose serial number is not wanted cannot be replaced by a new entry
+                if entry.serial_number in new_serials:
+                    decoded_entry = self._compress_entry(
+                        cryptography_decode_revoked_certificate(entry)
+                    )
+                    if decoded_entry in new_entries:
+                        continue
+                crl = crl.add_revoked_certificate(entry)
+        for revoked_entry in revoked_certificates:
             revoked_cert = RevokedCertificateBuilder()
             revoked_cert = revoked_cert.serial_number(revoked_entry["serial_number"])
             revoked_cert = set_revocation_date(
@@ -1008,7 +1054,7 @@ def main() -> t.NoReturn:
             "crl_mode": {
                 "type": "str",
                 "default": "generate",
-                "choices": ["generate", "update"],
+                "choices": ["generate", "update", "append"],
             },
             "force": {"type": "bool", "default": False},
             "backup": {"type": "bool", "default": False},
@@ -0,0 +1,160 @@
+# Copyright (c) Ansible Project
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import annotations
+
+import itertools
+import json
+import threading
+import typing as t
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import (
+    MagicMock,
+)
+
+import pytest
+
+from ansible_collections.community.crypto.plugins.module_utils._acme.acme import (
+    ACMEClient,
+)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args: t.Any) -> None:
+        pass
+
+    def _respond(self, status: int, data: t.Any = None, nonce: bool = True) -> None:
+        body = json.dumps(data).encode("utf-8") if data is not None else b""
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        if nonce:
+            self.send_header("Replay-Nonce", f"nonce-{next(self.server.nonces)}")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self) -> None:
+        self.server.requests.append(("GET", self.path, self.client_address))
+        base = f"http://127.0.0.1:{self.server.server_address[1]}"
+        self._respond(
+            200,
+            {
+                "newNonce": f"{base}/nonce",
+                "newAccount": f"{base}/account",
+                "newOrder": f"{base}/order",
+            },
+            nonce=False,
+        )
+
+    def do_HEAD(self) -> None:
+        self.server.requests.append(("HEAD", self.path, self.client_address))
+        self._respond(200)
+
+    def do_POST(self) -> None:
+        length = int(self.headers["Content-Length"])
+        data = json.loads(self.rfile.read(length))
+        self.server.requests.append(("POST", self.path, self.client_address))
+        self.server.used_nonces.append(data["protected"]["nonce"])
+        self._respond(200, {"status": "valid"})
+
+
+@pytest.fixture
+def server() -> Iterator[ThreadingHTTPServer]:
+    srv = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    srv.daemon_threads = True
+    srv.requests = []  # type: ignore[attr-defined]
+    srv.used_nonces = []  # type: ignore[attr-defined]
+    srv.nonces = itertools.count()  # type: ignore[attr-defined]
+    thread = threading.Thread(target=srv.serve_forever)
+    thread.daemon = True
+    thread.start()
+    yield srv
+    srv.shutdown()
+    srv.server_close()
+
+
+def _create_client(
+    server: ThreadingHTTPServer, max_concurrent_requests: int = 4
+) -> ACMEClient:
+    module = MagicMock()
+    module.params = {
+        "acme_directory": f"http://127.0.0.1:{server.server_address[1]}/directory",
+        "acme_version": 2,
+        "validate_certs": True,
+        "request_timeout": 10,
+        "max_concurrent_requests": max_concurrent_requests,
+    }
+    module.jsonify = json.dumps
+    module.from_json = json.loads
+    backend = MagicMock()
+    backend.sign.side_effect = lambda payload64, protected64, key_data: {
+        "protected": json.loads(protected64),
+        "payload": payload64,
+    }
+    return ACMEClient(module=module, backend=backend)
+
+
+@pytest.fixture(autouse=True)
+def plain_base64(monkeypatch: pytest.MonkeyPatch) -> None:
+    # Make the protected header readable for the test server
+    monkeypatch.setattr(
+        "ansible_collections.community.crypto.plugins.module_utils._acme.acme.nopad_b64",
+        lambda data: data.decode("utf-8"),
+    )
+
+
+def test_nonce_recycling_and_keep_alive(server: ThreadingHTTPServer) -> None:
+    client = _create_client(server)
+    url = client.directory["newOrder"]
+    for dummy in range(3):
+        result, info = client.send_signed_request(
+            url,
+            {"foo": "bar"},
+            key_data={"alg": "none"},
+            jws_header={"alg": "none"},
+        )
+        assert result == {"status": "valid"}
+        assert info["status"] == 200
+
+    methods = [method for method, dummy, dummy2 in server.requests]  # type: ignore[attr-defined]
+    assert methods == ["GET", "HEAD", "POST", "POST", "POST"]
+    # Every nonce is used once, and the nonces returned by the POST requests are reused
+    assert server.used_nonces == ["nonce-0", "nonce-1", "nonce-2"]  # type: ignore[attr-defined]
+    # All requests used the same connection
+    clients = {address for dummy, dummy2, address in server.requests}  # type: ignore[attr-defined]
+    assert len(clients) == 1
+    client.connections.close()
+
+
+def test_connection_failure(server: ThreadingHTTPServer) -> None:
+    client = _create_client(server)
+    port = server.server_address[1]
+    server.shutdown()
+    server.server_close()
+    client.connections.close()
+    response, info = client.connections.fetch(
+        f"http://127.0.0.1:{port}/directory", method="GET"
+    )
+    assert response is None
+    assert info["status"] == -1
+    assert info["msg"].startswith("Request failed: ")
+
+
+@pytest.mark.parametrize("max_concurrent_requests", [1, 4])
+def test_run_concurrently(
+    server: ThreadingHTTPServer, max_concurrent_requests: int
+) -> None:
+    client = _create_client(server, max_concurrent_requests=max_concurrent_requests)
+    assert client.run_concurrently(lambda x: x * 2, range(10)) == list(range(0, 20, 2))
+
+    def fail(x: int) -> int:
+        if x in (3, 5):
+            raise ValueError(f"error {x}")
+        return x
+
+    with pytest.raises(ValueError, match="error 3"):
+        client.run_concurrently(fail, range(10))
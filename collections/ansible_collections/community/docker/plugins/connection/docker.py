@@ -109,6 +109,26 @@ options:
     type: boolean
     default: false
     version_added: 3.12.0
+  persistent_shell:
+    description:
+      - Keep one shell open in the container with C(docker exec -i) and run all commands and file transfers through it,
+        instead of starting a new Docker CLI process for every command and file transfer.
+      - This avoids the startup time of the Docker CLI for every command, which adds up for the many small commands Ansible
+        runs for every task.
+      - The shell is closed when the connection is closed or reset. Commands which need to answer a privilege escalation
+        password prompt, and files larger than 1 MiB, still use their own C(docker exec) process. The size of a file to
+        fetch is determined with C(wc) in the container.
+      - The shell O(ansible.builtin.default#shell:executable) must support C(printf).
+    env:
+      - name: ANSIBLE_DOCKER_PERSISTENT_SHELL
+    ini:
+      - key: persistent_shell
+        section: docker_connection
+    vars:
+      - name: ansible_docker_persistent_shell
+    type: boolean
+    default: false
+    version_added: 5.1.0
 """
 
 import fcntl
@@ -118,6 +138,7 @@ import re
 import selectors
 import subprocess
 import typing as t
+import uuid
 from shlex import quote
 
 from ansible.errors import AnsibleConnectionFailure, AnsibleError, AnsibleFileNotFound
@@ -133,6 +154,163 @@ from ansible_collections.community.docker.plugins.module_utils._version import (
 display = Display()
 
 
+# Files up to this size are transferred through the persistent shell
+PERSISTENT_SHELL_MAX_FILE_SIZE = 1024 * 1024
+
+# Number of input bytes passed to one printf call when feeding data through the persistent shell
+_PRINTF_CHUNK_SIZE = 16 * 1024
+
+# Bytes which can be used verbatim in a single-quoted printf format; all other bytes are octal escaped
+_PRINTF_ESCAPES = [
+    (bytes([b]) if 0x20 <= b < 0x7F and b not in b"'\\%" else b"\\%03o" % b)
+    for b in range(256)
+]
+
+
+def _printf_escape(data: bytes) -> bytes:
+    return b"".join(_PRINTF_ESCAPES[b] for b in data)
+
+
+class _OutputBuffer:
+    """
+    Collects the output of a command in the persistent shell and finds the end marker.
+    Only the newly read data, plus enough of the previous data to catch a marker split
+    across reads, is searched, so large outputs are not scanned over and over.
+    """
+
+    def __init__(self, marker: bytes) -> None:
+        self.marker = marker
+        self.marker_index: int | None = None
+        self._chunks: list[bytes] = []
+        self._size = 0
+        self._tail = b""
+
+    def add(self, chunk: bytes) -> None:
+        if self.marker_index is None:
+            window = self._tail + chunk
+            index = window.find(self.marker)
+            if index >= 0:
+                self.marker_index = self._size - len(self._tail) + index
+            self._tail = window[-(len(self.marker) - 1) :]
+        self._chunks.append(chunk)
+        self._size += len(chunk)
+
+    def getvalue(self) -> bytes:
+        if len(self._chunks) > 1:
+            self._chunks = [b"".join(self._chunks)]
+        return self._chunks[0] if self._chunks else b""
+
+    def before_marker(self) -> bytes:
+        data = self.getvalue()
+        return data if self.marker_index is None else data[: self.marker_index]
+
+    def after_marker(self) -> bytes | None:
+        if self.marker_index is None:
+            return None
+        return self.getvalue()[self.marker_index + len(self.marker) :]
+
+
+class _PersistentShell:
+    """
+    A shell kept open in the container with ``docker exec -i``. Commands are written to its
+    standard input, and the end of their output is marked on stdout and stderr with a random
+    marker; the marker on stdout is followed by the command's return code.
+    """
+
+    def __init__(self, local_cmd: list[bytes]) -> None:
+        self.local_cmd = local_cmd
+        self._marker = to_bytes(f"__ANSIBLE_DOCKER_{uuid.uuid4().hex}__")
+        # pylint: disable-next=consider-using-with
+        self._process = subprocess.Popen(
+            local_cmd,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+        )
+
+    @property
+    def alive(self) -> bool:
+        return self._process.poll() is None
+
+    def _build_script(self, cmd: bytes, in_data: bytes | None) -> bytes:
+        if in_data:
+            feed = b"; ".join(
+                b"printf '%s'" % _printf_escape(in_data[i : i + _PRINTF_CHUNK_SIZE])
+                for i in range(0, len(in_data), _PRINTF_CHUNK_SIZE)
+            )
+            line = b"{ %s; } | %s" % (feed, cmd)
+        else:
+            line = b"%s </dev/null" % cmd
+        return b"%s\nprintf '\\n%%s %%d\\n' %s \"$?\"; printf '\\n%%s\\n' %s >&2\n" % (
+            line,
+            self._marker,
+            self._marker,
+        )
+
+    def run(self, cmd: bytes, in_data: bytes | None = None) -> tuple[int, bytes, bytes]:
+        """
+        Run a shell command line, feeding in_data to its standard input.
+        """
+        assert self._process.stdin is not None
+        assert self._process.stdout is not None
+        assert self._process.stderr is not None
+
+        script = memoryview(self._build_script(cmd, in_data))
+        stdout = _OutputBuffer(b"\n" + self._marker + b" ")
+        stderr = _OutputBuffer(b"\n" + self._marker + b"\n")
+        buffers = {self._process.stdout: stdout, self._process.stderr: stderr}
+        rc: int | None = None
+        stderr_done = False
+
+        stdin_fd = self._process.stdin.fileno()
+        os.set_blocking(stdin_fd, False)
+        selector = selectors.DefaultSelector()
+        try:
+            selector.register(self._process.stdin, selectors.EVENT_WRITE)
+            selector.register(self._process.stdout, selectors.EVENT_READ)
+            selector.register(self._process.stderr, selectors.EVENT_READ)
+            while rc is None or not stderr_done:
+                for key, dummy_event in selector.select():
+                    if key.fileobj is self._process.stdin:
+                        written = os.write(stdin_fd, script[:BUFSIZE])
+                        script = script[written:]
+                        if not script:
+                            selector.unregister(self._process.stdin)
+                        continue
+                    chunk = os.read(key.fd, BUFSIZE)
+                    if not chunk:
+                        raise AnsibleConnectionFailure(
+                            "the persistent shell in the container exited unexpectedly:\n"
+                            + to_text(stderr.getvalue())
+                        )
+                    buffers[key.fileobj].add(chunk)
+                    if key.fileobj is self._process.stdout and rc is None:
+                        # The marker on stdout is followed by the return code and newline
+                        if stdout.marker_index is not None and chunk.endswith(b"\n"):
+                            rc = int(stdout.after_marker()[:-1])
+                    elif key.fileobj is self._process.stderr and not stderr_done:
+                        stderr_done = stderr.after_marker() == b""
+        finally:
+            selector.close()
+            os.set_blocking(stdin_fd, True)
+        return rc, stdout.before_marker(), stderr.before_marker()
+
+    def close(self) -> None:
+        if self._process.stdin is not None and not self._process.stdin.closed:
+            try:
+                self._process.stdin.close()
+            except OSError:
+                pass
+        try:
+            self._process.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            self._process.kill()
+            self._process.wait()
+        for stream in (self._process.stdout, self._process.stderr):
+            if stream is not None:
+                stream.close()
+
+
 class Connection(ConnectionBase):
     """Local docker based connections"""
 
@@ -156,6 +334,7 @@ class Connection(ConnectionBase):
         self._version: str | None = None
         self.remote_user: str | None = None
         self.timeout: int | float | None = None
+        self._persistent_shell: _PersistentShell | None = None
 
         # Windows uses Powershell modules
         if getattr(self._shell, "_IS_WINDOWS", False):
@@ -375,6 +554,64 @@ class Connection(ConnectionBase):
             self._connected = True
         return self
 
+    def _get_persistent_shell(self) -> _PersistentShell:
+        local_cmd = [
+            to_bytes(i, errors="surrogate_or_strict")
+            for i in self._build_exec_cmd([self._play_context.executable])
+        ]
+        shell = self._persistent_shell
+        if shell is not None and (shell.local_cmd != local_cmd or not shell.alive):
+            self._close_persistent_shell()
+            shell = None
+        if shell is None:
+            display.vvv(
+                f"OPEN PERSISTENT SHELL {to_text(local_cmd)}",
+                host=self.get_option("remote_addr"),
+            )
+            try:
+                shell = _PersistentShell(local_cmd)
+            except OSError as exc:
+                raise AnsibleConnectionFailure(
+                    f"cannot start the persistent shell: {exc}"
+                ) from exc
+            self._persistent_shell = shell
+        return shell
+
+    def _close_persistent_shell(self) -> None:
+        if self._persistent_shell is not None:
+            display.vvv("CLOSE PERSISTENT SHELL", host=self.get_option("remote_addr"))
+            self._persistent_shell.close()
+            self._persistent_shell = None
+
+    def _run_in_persistent_shell(
+        self, cmd: list[str], in_data: bytes | None = None
+    ) -> tuple[int, bytes, bytes]:
+        shell = self._get_persistent_shell()
+        command_line = " ".join(quote(part) for part in cmd)
+        try:
+            return shell.run(
+                to_bytes(command_line, errors="surrogate_or_strict"), in_data
+            )
+        except AnsibleConnectionFailure:
+            self._close_persistent_shell()
+            raise
+
+    def _get_container_file_size(self, path: str) -> int | None:
+        """
+        Return the size of a file in the container if it can be transferred through the
+        persistent shell, and None if it is too large or its size cannot be determined.
+        """
+        returncode, stdout, dummy_stderr = self._run_in_persistent_shell(
+            ["wc", "-c", path]
+        )
+        try:
+            size = int(stdout.split()[0]) if returncode == 0 else None
+        except (IndexError, ValueError):
+            size = None
+        if size is None or size > PERSISTENT_SHELL_MAX_FILE_SIZE:
+            return None
+        return size
+
     def exec_command(
         self, cmd: str, in_data: bytes | None = None, sudoable: bool = False
     ) -> tuple[int, bytes, bytes]:
@@ -384,6 +621,17 @@ class Connection(ConnectionBase):
 
         super().exec_command(cmd, in_data=in_data, sudoable=sudoable)  # type: ignore[safe-super]
 
+        if self.get_option("persistent_shell") and not (
+            self.become and self.become.expect_prompt() and sudoable
+        ):
+            display.vvv(
+                f"EXEC (persistent shell) {to_text(cmd)}",
+                host=self.get_option("remote_addr"),
+            )
+            return self._run_in_persistent_shell(
+                [self._play_context.executable, "-c", cmd], in_data
+            )
+
         local_cmd = self._build_exec_cmd([self._play_context.executable, "-c", cmd])
 
         display.vvv(f"EXEC {to_text(local_cmd)}", host=self.get_option("remote_addr"))
@@ -506,6 +754,20 @@ class Connection(ConnectionBase):
                 f"file or module does not exist: {to_text(in_path)}"
             )
 
+        if self.get_option("persistent_shell"):
+            b_in_path = to_bytes(in_path, errors="surrogate_or_strict")
+            if os.path.getsize(b_in_path) <= PERSISTENT_SHELL_MAX_FILE_SIZE:
+                with open(b_in_path, "rb") as in_file:
+                    content = in_file.read()
+                returncode, stdout, stderr = self._run_in_persistent_shell(
+                    ["dd", f"of={out_path}", f"bs={BUFSIZE}"], content
+                )
+                if returncode != 0:
+                    raise AnsibleError(
+                        f"failed to transfer file {to_text(in_path)} to {to_text(out_path)}:\n{to_text(stdout)}\n{to_text(stderr)}"
+                    )
+                return
+
         out_path = quote(out_path)
         # Older docker does not have native support for copying files into
         # running containers, so we use docker exec to implement this
@@ -549,6 +811,23 @@ class Connection(ConnectionBase):
         )
 
         in_path = self._prefix_login_path(in_path)
+        if (
+            self.get_option("persistent_shell")
+            and self._get_container_file_size(in_path) is not None
+        ):
+            returncode, stdout, stderr = self._run_in_persistent_shell(
+                ["dd", f"if={in_path}", f"bs={BUFSIZE}"]
+            )
+            if returncode != 0:
+                raise AnsibleError(
+                    f"failed to fetch file {in_path} to {out_path}:\n{stdout!r}\n{stderr!r}"
+                )
+            with open(
+                to_bytes(out_path, errors="surrogate_or_strict"), "wb"
+            ) as out_file:
+                out_file.write(stdout)
+            return
+
         # out_path is the final file path, but docker takes a directory, not a
         # file path
         out_dir = os.path.dirname(out_path)
@@ -614,10 +893,12 @@ class Connection(ConnectionBase):
             )
 
     def close(self) -> None:
-        """Terminate the connection. Nothing to do for Docker"""
+        """Terminate the connection. Closes the persistent shell, if there is one"""
         super().close()  # type: ignore[safe-super]
+        self._close_persistent_shell()
         self._connected = False
 
     def reset(self) -> None:
         # Clear container user cache
         self._container_user_cache = {}
+        self._close_persistent_shell()
@@ -102,10 +102,50 @@ options:
     type: boolean
     default: false
     version_added: 3.12.0
+  pipelining:
+    description:
+      - Whether modules are streamed to the module interpreter through the exec stdin instead of being transferred
+        to a temporary file in the container first.
+      - This saves the archive upload and the additional exec calls per task.
+      - Unlike the global C(pipelining) setting, this can be enabled for the Docker connections only.
+    env:
+      - name: ANSIBLE_PIPELINING
+      - name: ANSIBLE_DOCKER_PIPELINING
+    ini:
+      - key: pipelining
+        section: defaults
+      - key: pipelining
+        section: connection
+      - key: pipelining
+        section: docker_connection
+    vars:
+      - name: ansible_pipelining
+      - name: ansible_docker_pipelining
+    type: boolean
+    default: false
+    version_added: 5.1.0
+  batch_transfers:
+    description:
+      - Whether files put into the container are queued and uploaded together in a single archive, right before the
+        next command is executed or the next file is fetched.
+      - Only files up to 1 MiB are queued, their content is read when they are put. Larger files are uploaded directly.
+      - This reduces the number of archive uploads when several files are transferred in a row, for example when
+        pipelining cannot be used.
+    env:
+      - name: ANSIBLE_DOCKER_BATCH_TRANSFERS
+    ini:
+      - key: batch_transfers
+        section: docker_connection
+    vars:
+      - name: ansible_docker_batch_transfers
+    type: boolean
+    default: false
+    version_added: 5.1.0
 """
 
 import os
 import os.path
+import stat
 import typing as t
 
 from ansible.errors import AnsibleConnectionFailure, AnsibleFileNotFound
@@ -126,6 +166,7 @@ from ansible_collections.community.docker.plugins.module_utils._copy import (
     DockerFileNotFound,
     fetch_file,
     put_file,
+    put_file_contents,
 )
 from ansible_collections.community.docker.plugins.module_utils._version import (
     LooseVersion,
@@ -145,6 +186,9 @@ if t.TYPE_CHECKING:
 
 MIN_DOCKER_API = None
 
+# Files larger than this are never queued by batch_transfers
+BATCH_TRANSFER_MAX_FILE_SIZE = 1024 * 1024
+
 
 display = Display()
 
@@ -195,6 +239,7 @@ class Connection(ConnectionBase):
 
         self.client: AnsibleDockerClient | None = None
         self.ids: dict[str | None, tuple[int, int]] = {}
+        self._pending_files: list[tuple[str, bytes, int, float]] = []
 
         # Windows uses Powershell modules
         if getattr(self._shell, "_IS_WINDOWS", False):
@@ -244,6 +289,8 @@ class Connection(ConnectionBase):
         if self.client is None:
             raise AssertionError("Client must be present")
 
+        self._flush_pending_files()
+
         command = [self._play_context.executable, "-c", cmd]
 
         do_become = self.become and self.become.expect_prompt() and sudoable
@@ -393,16 +440,8 @@ class Connection(ConnectionBase):
             remote_path = os.path.join(os.path.sep, remote_path)
         return os.path.normpath(remote_path)
 
-    def put_file(self, in_path: str, out_path: str) -> None:
-        """Transfer a file from local to docker container"""
-        super().put_file(in_path, out_path)  # type: ignore[safe-super]
-        display.vvv(f"PUT {in_path} TO {out_path}", host=self.get_option("remote_addr"))
-
-        if self.client is None:
-            raise AssertionError("Client must be present")
-
-        out_path = self._prefix_login_path(out_path)
-
+    def _get_ids(self) -> tuple[int, int]:
+        """Determine the user and group ID of the user in the container."""
         if self.actual_user not in self.ids:
             dummy, ids, dummy2 = self.exec_command("id -u && id -g")
             remote_addr = self.get_option("remote_addr")
@@ -419,7 +458,44 @@ class Connection(ConnectionBase):
                     f'Error while determining user and group ID of current user in container "{remote_addr}": {e}\nGot value: {ids!r}'
                 ) from e
 
-        user_id, group_id = self.ids[self.actual_user]
+        return self.ids[self.actual_user]
+
+    def put_file(self, in_path: str, out_path: str) -> None:
+        """Transfer a file from local to docker container"""
+        super().put_file(in_path, out_path)  # type: ignore[safe-super]
+        display.vvv(f"PUT {in_path} TO {out_path}", host=self.get_option("remote_addr"))
+
+        if self.client is None:
+            raise AssertionError("Client must be present")
+
+        out_path = self._prefix_login_path(out_path)
+
+        if self.get_option("batch_transfers"):
+            b_in_path = to_bytes(in_path, errors="surrogate_or_strict")
+            try:
+                file_stat = os.stat(b_in_path)
+            except FileNotFoundError as exc:
+                raise AnsibleFileNotFound(
+                    f"file or module does not exist: {in_path}"
+                ) from exc
+            if (
+                stat.S_ISREG(file_stat.st_mode)
+                and file_stat.st_size <= BATCH_TRANSFER_MAX_FILE_SIZE
+            ):
+                # The content has to be read now, the caller might remove the file once we return
+                with open(b_in_path, "rb") as f:
+                    content = f.read()
+                display.vvvv(
+                    f"PUT: Queued {out_path} ({len(content)} bytes)",
+                    host=self.get_option("remote_addr"),
+                )
+                self._pending_files.append(
+                    (out_path, content, file_stat.st_mode & 0o700, file_stat.st_mtime)
+                )
+                return
+            self._flush_pending_files()
+
+        user_id, group_id = self._get_ids()
         try:
             self._call_client(
                 lambda client: put_file(
@@ -439,6 +515,32 @@ class Connection(ConnectionBase):
         except DockerFileCopyError as exc:
             raise AnsibleConnectionFailure(to_text(exc)) from exc
 
+    def _flush_pending_files(self) -> None:
+        """Upload all queued files with a single archive."""
+        if not self._pending_files:
+            return
+        files, self._pending_files = self._pending_files, []
+
+        display.vvv(
+            f"PUT: Uploading {len(files)} queued file(s) with a single archive",
+            host=self.get_option("remote_addr"),
+        )
+        user_id, group_id = self._get_ids()
+        try:
+            self._call_client(
+                lambda client: put_file_contents(
+                    client,
+                    container=self.get_option("remote_addr"),
+                    files=files,
+                    user_id=user_id,
+                    group_id=group_id,
+                    user_name=self.actual_user,
+                ),
+                not_found_can_be_resource=True,
+            )
+        except DockerFileCopyError as exc:
+            raise AnsibleConnectionFailure(to_text(exc)) from exc
+
     def fetch_file(self, in_path: str, out_path: str) -> None:
         """Fetch a file from container to local."""
         super().fetch_file(in_path, out_path)  # type: ignore[safe-super]
@@ -451,6 +553,8 @@ class Connection(ConnectionBase):
 
         in_path = self._prefix_login_path(in_path)
 
+        self._flush_pending_files()
+
         try:
             self._call_client(
                 lambda client: fetch_file(
@@ -472,8 +576,11 @@ class Connection(ConnectionBase):
 
     def close(self) -> None:
         """Terminate the connection. Nothing to do for Docker"""
+        if self._connected:
+            self._flush_pending_files()
         super().close()  # type: ignore[safe-super]
         self._connected = False
 
     def reset(self) -> None:
+        self._flush_pending_files()
         self.ids.clear()
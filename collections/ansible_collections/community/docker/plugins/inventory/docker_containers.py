@@ -16,11 +16,18 @@ author:
   - Felix Fontein (@felixfontein)
 extends_documentation_fragment:
   - ansible.builtin.constructed
+  - ansible.builtin.inventory_cache
   - community.docker._docker.api_documentation
   - community.library_inventory_filtering_v1.inventory_filter
 description:
   - Reads inventories from the Docker API.
   - Uses a YAML configuration file that ends with V(docker.(yml|yaml\)).
+  - Containers are only inspected when the inspection metadata is needed, that is when O(verbose_output=true),
+    O(connection_type=ssh), O(add_legacy_groups=true), or when one of O(compose), O(groups), O(keyed_groups), and O(filters)
+    is used.
+  - When the inventory cache is enabled with O(cache=true), the inspection results are cached. A container is only inspected
+    again when it has been created, changed state, or changed its configuration since it was cached; the cache as a whole
+    expires after O(cache_timeout) seconds.
 notes:
   - The configuration file must be a YAML file whose filename ends with V(docker.yml) or V(docker.yaml). Other filenames will
     not be accepted.
@@ -101,6 +108,14 @@ options:
     type: bool
     default: false
 
+  max_concurrent_inspects:
+    description:
+      - The maximum number of containers which are inspected concurrently.
+      - Set to V(1) to inspect the containers one after another.
+    type: int
+    default: 4
+    version_added: 5.1.0
+
   filters:
     version_added: 3.5.0
 """
@@ -165,13 +180,24 @@ filters:
       inventory_hostname.startswith("a")
   # Exclude all containers that did not match any of the above filters
   - exclude: true
+
+---
+# Cache the container inspection results for an hour, only containers which
+# have been created or changed since are inspected again
+plugin: community.docker.docker_containers
+verbose_output: true
+cache: true
+cache_plugin: ansible.builtin.jsonfile
+cache_connection: /tmp/docker_inventory
+cache_timeout: 3600
 """
 
 import re
 import typing as t
+from concurrent.futures import ThreadPoolExecutor
 
 from ansible.errors import AnsibleError
-from ansible.plugins.inventory import BaseInventoryPlugin, Constructable
+from ansible.plugins.inventory import BaseInventoryPlugin, Cacheable, Constructable
 from ansible_collections.community.library_inventory_filtering_v1.plugins.plugin_utils.inventory_filter import (
     filter_host,
     parse_filters,
@@ -202,7 +228,7 @@ if t.TYPE_CHECKING:
 MIN_DOCKER_API = None
 
 
-class InventoryModule(BaseInventoryPlugin, Constructable):
+class InventoryModule(BaseInventoryPlugin, Constructable, Cacheable):
     """Host inventory parser for ansible using Docker daemon as source."""
 
     NAME = "community.docker.docker_containers"
@@ -211,7 +237,74 @@ class InventoryModule(BaseInventoryPlugin, Constructable):
         slug = re.sub(r"[^\w-]", "_", value).lower().lstrip("_")
         return f"docker_{slug}"
 
-    def _populate(self, client: AnsibleDockerClient) -> None:
+    def _needs_inspection(self) -> bool:
+        if self.get_option("verbose_output") or self.get_option("add_legacy_groups"):
+            return True
+        if self.get_option("connection_type") == "ssh":
+            return True
+        return any(
+            self.get_option(option)
+            for option in ("compose", "groups", "keyed_groups", "filters")
+        )
+
+    @staticmethod
+    def _get_container_summary(container: dict[str, t.Any]) -> dict[str, t.Any]:
+        # The Status field contains the uptime in human readable form ("Up 5 minutes"),
+        # which changes all the time without the container changing.
+        return {key: value for key, value in container.items() if key != "Status"}
+
+    def _inspect_containers(
+        self,
+        client: AnsibleDockerClient,
+        containers: list[dict[str, t.Any]],
+        cached_inspects: dict[str, t.Any],
+    ) -> dict[str, dict[str, t.Any]]:
+        """
+        Return a mapping of container IDs to their summary from the container list and
+        their inspection result. Only containers whose summary differs from the cached one
+        are inspected; these are inspected concurrently.
+        """
+        result: dict[str, dict[str, t.Any]] = {}
+        to_inspect: list[tuple[str, str]] = []
+        for container in containers:
+            container_id = container["Id"]
+            summary = self._get_container_summary(container)
+            cached = cached_inspects.get(container_id)
+            if isinstance(cached, dict) and cached.get("summary") == summary:
+                result[container_id] = cached
+                continue
+            result[container_id] = {"summary": summary}
+            names = container.get("Names") or [container_id[:13]]
+            to_inspect.append((container_id, names[0].lstrip("/")))
+
+        def inspect_container(item: tuple[str, str]) -> dict[str, t.Any]:
+            container_id, name = item
+            try:
+                return client.get_json("/containers/{0}/json", container_id)
+            except APIError as exc:
+                raise AnsibleError(
+                    f"Error inspecting container {name} - {exc}"
+                ) from exc
+
+        if to_inspect:
+            max_workers = max(1, self.get_option("max_concurrent_inspects") or 1)
+            with ThreadPoolExecutor(
+                max_workers=min(max_workers, len(to_inspect))
+            ) as executor:
+                for (container_id, dummy_name), inspect in zip(
+                    to_inspect, executor.map(inspect_container, to_inspect)
+                ):
+                    result[container_id]["inspect"] = inspect
+        return result
+
+    def _populate(
+        self,
+        client: AnsibleDockerClient,
+        cached_inspects: dict[str, t.Any] | None = None,
+    ) -> dict[str, dict[str, t.Any]]:
+        """
+        Populate the inventory. Return the inspection results which can be cached.
+        """
         strict = self.get_option("strict")
 
         ssh_port = self.get_option("private_ssh_port")
@@ -248,6 +341,12 @@ class InventoryModule(BaseInventoryPlugin, Constructable):
                 if value is not None:
                     extra_facts[var_name] = value
 
+        inspects: dict[str, dict[str, t.Any]] = {}
+        if self._needs_inspection():
+            inspects = self._inspect_containers(
+                client, containers, cached_inspects or {}
+            )
+
         filters = parse_filters(self.get_option("filters"))
         for container in containers:
             container_id = container.get("Id")
@@ -266,12 +365,7 @@ class InventoryModule(BaseInventoryPlugin, Constructable):
             }
             full_facts = {}
 
-            try:
-                inspect = client.get_json("/containers/{0}/json", container_id)
-            except APIError as exc:
-                raise AnsibleError(
-                    f"Error inspecting container {name} - {exc}"
-                ) from exc
+            inspect = inspects.get(container_id, {}).get("inspect") or {}
 
             state = inspect.get("State") or {}
             config = inspect.get("Config") or {}
@@ -394,6 +488,8 @@ class InventoryModule(BaseInventoryPlugin, Constructable):
                 else:
                     self.inventory.add_host(name, group="stopped")
 
+        return inspects
+
     def verify_file(self, path: str) -> bool:
         """Return the possibly of a file being consumable by this plugin."""
         return super().verify_file(path) and path.endswith(
@@ -412,12 +508,25 @@ class InventoryModule(BaseInventoryPlugin, Constructable):
     ) -> None:
         super().parse(inventory, loader, path, cache)
         self._read_config_data(path)
+
+        cache_key = self.get_cache_key(path)
+        use_cache = self.get_option("cache")
+        cached_inspects: dict[str, t.Any] = {}
+        if use_cache and cache:
+            try:
+                cached_inspects = self._cache[cache_key]
+            except KeyError:
+                pass
+
         client = self._create_client()
         try:
-            self._populate(client)
+            inspects = self._populate(client, cached_inspects)
         except DockerException as e:
             raise AnsibleError(f"An unexpected Docker error occurred: {e}") from e
         except RequestException as e:
             raise AnsibleError(
                 f"An unexpected requests error occurred when trying to talk to the Docker daemon: {e}"
             ) from e
+
+        if use_cache and inspects != cached_inspects:
+            self._cache[cache_key] = inspects
@@ -38,6 +38,7 @@ from ansible_collections.community.docker.plugins.module_utils._api.api.client i
 )
 from ansible_collections.community.docker.plugins.module_utils._api.errors import (
     APIError,
+    DockerException,
     MissingRequirementException,
     NotFound,
     TLSParameterError,
@@ -63,6 +64,12 @@ if t.TYPE_CHECKING:
     from collections.abc import Callable
 
 
+class ImagePullError(DockerException):
+    """
+    The Docker daemon reported an error while pulling an image.
+    """
+
+
 def _get_tls_config(
     fail_function: Callable[[str], t.NoReturn], **kwargs: t.Any
 ) -> TLSConfig:
@@ -531,6 +538,66 @@ class AnsibleDockerClientBase(Client):
         img2_filtered = {k: v for k, v in img2.items() if k not in filter_keys}
         return img1_filtered == img2_filtered
 
+    def _get_registry_auth_headers(self, repository: str) -> dict[str, t.Any]:
+        registry, dummy_repo_name = auth.resolve_repository_name(repository)
+        headers = {}
+        header = auth.get_config_header(self, registry)
+        if header:
+            headers["X-Registry-Auth"] = header
+        return headers
+
+    def get_remote_image_digest(self, name: str, tag: str) -> str:
+        """
+        Ask the Docker daemon for the digest of an image in its registry without pulling it.
+        Needs API version 1.30 or newer.
+        """
+        repository, dummy_tag = parse_repository_tag(name)
+        data = self.get_json(
+            "/distribution/{0}/json",
+            f"{repository}:{tag}",
+            headers=self._get_registry_auth_headers(repository),
+        )
+        return data["Descriptor"]["digest"]
+
+    def pull_image_raw(
+        self, name: str, tag: str = "latest", image_platform: str | None = None
+    ) -> int:
+        """
+        Pull an image without looking it up before and after. Raises ImagePullError
+        if the daemon reports an error. Returns the number of bytes downloaded.
+        """
+        repository, image_tag = parse_repository_tag(name)
+        params = {
+            "tag": tag or image_tag or "latest",
+            "fromImage": repository,
+        }
+        if image_platform is not None:
+            params["platform"] = image_platform
+
+        response = self._post(
+            self._url("/images/create"),
+            params=params,
+            headers=self._get_registry_auth_headers(repository),
+            stream=True,
+            timeout=None,
+        )
+        self._raise_for_status(response)
+        layer_sizes: dict[str, int] = {}
+        for line in self._stream_helper(response, decode=True):
+            self.log(line, pretty_print=True)
+            if line.get("error"):
+                if line.get("errorDetail"):
+                    error_detail = line.get("errorDetail")
+                    raise ImagePullError(
+                        f"Error pulling {name} - code: {error_detail.get('code')} message: {error_detail.get('message')}"
+                    )
+                raise ImagePullError(f"Error pulling {name} - {line.get('error')}")
+            if line.get("status") == "Downloading" and line.get("id"):
+                total = (line.get("progressDetail") or {}).get("total")
+                if total:
+                    layer_sizes[line["id"]] = total
+        return sum(layer_sizes.values())
+
     def pull_image(
         self, name: str, tag: str = "latest", image_platform: str | None = None
     ) -> tuple[dict[str, t.Any] | None, bool]:
@@ -540,38 +607,9 @@ class AnsibleDockerClientBase(Client):
         self.log(f"Pulling image {name}:{tag}")
         old_image = self.find_image(name, tag)
         try:
-            repository, image_tag = parse_repository_tag(name)
-            registry, dummy_repo_name = auth.resolve_repository_name(repository)
-            params = {
-                "tag": tag or image_tag or "latest",
-                "fromImage": repository,
-            }
-            if image_platform is not None:
-                params["platform"] = image_platform
-
-            headers = {}
-            header = auth.get_config_header(self, registry)
-            if header:
-                headers["X-Registry-Auth"] = header
-
-            response = self._post(
-                self._url("/images/create"),
-                params=params,
-                headers=headers,
-                stream=True,
-                timeout=None,
-            )
-            self._raise_for_status(response)
-            for line in self._stream_helper(response, decode=True):
-                self.log(line, pretty_print=True)
-                if line.get("error"):
-                    if line.get("errorDetail"):
-                        error_detail = line.get("errorDetail")
-                        self.fail(
-                            f"Error pulling {name} - code: {error_detail.get('code')} message: {error_detail.get('message')}"
-                        )
-                    else:
-                        self.fail(f"Error pulling {name} - {line.get('error')}")
+            self.pull_image_raw(name, tag=tag, image_platform=image_platform)
+        except ImagePullError as exc:
+            self.fail(str(exc))
         except Exception as exc:  # pylint: disable=broad-exception-caught
             self.fail(f"Error pulling image {name}:{tag} - {exc}")
 
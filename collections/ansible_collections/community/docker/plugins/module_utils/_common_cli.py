@@ -32,7 +32,8 @@ from ansible_collections.community.docker.plugins.module_utils._version import (
 )
 
 if t.TYPE_CHECKING:
-    from collections.abc import Mapping, Sequence
+    import subprocess
+    from collections.abc import Callable, Mapping, Sequence
 
 
 DOCKER_COMMON_ARGS = {
@@ -178,6 +179,22 @@ class AnsibleDockerClientBase:
     ) -> tuple[int, bytes, bytes]:
         pass
 
+    def call_cli_stream_stderr(
+        self,
+        *args: str,
+        stderr_callback: Callable[[bytes], None],
+        cwd: str | None = None,
+        environ_update: dict[str, str] | None = None,
+    ) -> tuple[int, bytes, bytes]:
+        """
+        Like call_cli(), but pass stderr to stderr_callback while it arrives.
+        """
+        rc, stdout, stderr = self.call_cli(
+            *args, cwd=cwd, environ_update=environ_update
+        )
+        stderr_callback(stderr)
+        return rc, stdout, stderr
+
     def call_cli_json(
         self,
         *args: str,
@@ -383,6 +400,29 @@ class AnsibleDockerClientBase:
         return image[0]
 
 
+class _StreamTap:
+    """
+    Wraps the stderr pipe of a process run by AnsibleModule.run_command() and
+    passes everything run_command() reads from it to a callback.
+    """
+
+    def __init__(self, stream: t.Any, callback: Callable[[bytes], None]) -> None:
+        self._stream = stream
+        self._callback = callback
+
+    def fileno(self) -> int:
+        return self._stream.fileno()
+
+    def read(self, size: int = -1) -> bytes | None:
+        chunk = self._stream.read(size)
+        if chunk:
+            self._callback(chunk)
+        return chunk
+
+    def close(self) -> None:
+        self._stream.close()
+
+
 class AnsibleModuleDockerClient(AnsibleDockerClientBase):
     def __init__(
         self,
@@ -453,6 +493,7 @@ class AnsibleModuleDockerClient(AnsibleDockerClientBase):
         data: bytes | None = None,
         cwd: str | None = None,
         environ_update: dict[str, str] | None = None,
+        before_communicate_callback: Callable[[subprocess.Popen], None] | None = None,
     ) -> tuple[int, bytes, bytes]:
         environment = self._environment.copy()
         if environ_update:
@@ -467,9 +508,29 @@ class AnsibleModuleDockerClient(AnsibleDockerClientBase):
             environ_update=environment,
             expand_user_and_vars=False,
             ignore_invalid_cwd=False,
+            before_communicate_callback=before_communicate_callback,
         )
         return rc, stdout, stderr
 
+    def call_cli_stream_stderr(
+        self,
+        *args: str,
+        stderr_callback: Callable[[bytes], None],
+        cwd: str | None = None,
+        environ_update: dict[str, str] | None = None,
+    ) -> tuple[int, bytes, bytes]:
+        def tap_stderr(process: subprocess.Popen) -> None:
+            process.stderr = _StreamTap(  # type: ignore[assignment]
+                process.stderr, stderr_callback
+            )
+
+        return self.call_cli(
+            *args,
+            cwd=cwd,
+            environ_update=environ_update,
+            before_communicate_callback=tap_stderr,
+        )
+
     def fail(self, msg: str, **kwargs: t.Any) -> t.NoReturn:
         self.fail_results.update(kwargs)
         self.module.fail_json(msg=msg, **sanitize_result(self.fail_results))
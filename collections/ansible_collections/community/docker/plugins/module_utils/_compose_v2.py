@@ -378,15 +378,6 @@ def _warn_unparsable_line(
         )
 
 
-def _find_last_event_for(
-    events: list[Event], resource_id: str
-) -> tuple[int, Event] | None:
-    for index, event in enumerate(reversed(events)):
-        if event.resource_id == resource_id:
-            return len(events) - 1 - index, event
-    return None
-
-
 def _concat_event_msg(event: Event, append_msg: str) -> Event:
     return Event(
         event.resource_type,
@@ -402,236 +393,333 @@ _JSON_LEVEL_TO_STATUS_MAP = {
 }
 
 
-def parse_json_events(
-    stderr: bytes, warn_function: Callable[[str], None] | None = None
-) -> list[Event]:
-    events = []
-    stderr_lines = stderr.splitlines()
-    if stderr_lines and stderr_lines[-1] == b"":
-        del stderr_lines[-1]
-    for line in stderr_lines:
-        line = line.strip()
-        if not line.startswith(b"{") or not line.endswith(b"}"):
-            if line.startswith(b"Warning: "):
-                # This is a bug in Compose that will get fixed by https://github.com/docker/compose/pull/11996
-                event = Event(
-                    ResourceType.UNKNOWN,
-                    None,
-                    "Warning",
-                    to_text(line[len(b"Warning: ") :]),
-                )
-                events.append(event)
-                continue
-            if warn_function:
-                warn_function(
-                    f"Cannot parse event from non-JSON line: {line!r}. Please check with the latest community.docker version,"
-                    " and if the problem still happens there, please report this at "
-                    "https://github.com/ansible-collections/community.docker/issues/new?assignees=&labels=&projects=&template=bug_report.md"
-                )
-            continue
-        try:
-            line_data = json.loads(line)
-        except Exception as exc:  # pylint: disable=broad-exception-caught
-            if warn_function:
-                warn_function(
-                    f"Cannot parse event from line: {line!r}: {exc}. Please check with the latest community.docker version,"
-                    " and if the problem still happens there, please report this at "
-                    "https://github.com/ansible-collections/community.docker/issues/new?assignees=&labels=&projects=&template=bug_report.md"
-                )
-            continue
-        if line_data.get("tail"):
-            resource_type = ResourceType.UNKNOWN
-            msg = line_data.get("text")
-            status = "Error"
-            if isinstance(msg, str) and msg.lower().startswith("warning:"):
-                # For some reason, Writer.TailMsgf() is always used for errors *except* in one place,
-                # where its message is prepended with 'WARNING: ' (in pkg/compose/pull.go).
-                status = "Warning"
-                msg = msg[len("warning:") :].lstrip()
-            event = Event(
-                resource_type,
+def _parse_json_line(
+    line: bytes, warn_function: Callable[[str], None] | None = None
+) -> Event | None:
+    line = line.strip()
+    if not line.startswith(b"{") or not line.endswith(b"}"):
+        if line.startswith(b"Warning: "):
+            # This is a bug in Compose that will get fixed by https://github.com/docker/compose/pull/11996
+            return Event(
+                ResourceType.UNKNOWN,
                 None,
-                status,
-                msg,
+                "Warning",
+                to_text(line[len(b"Warning: ") :]),
             )
-        elif line_data.get("error"):
-            resource_type = ResourceType.UNKNOWN
-            event = Event(
-                resource_type,
-                line_data.get("id"),
-                "Error",
-                line_data.get("message"),
+        if warn_function:
+            warn_function(
+                f"Cannot parse event from non-JSON line: {line!r}. Please check with the latest community.docker version,"
+                " and if the problem still happens there, please report this at "
+                "https://github.com/ansible-collections/community.docker/issues/new?assignees=&labels=&projects=&template=bug_report.md"
             )
-        else:
-            resource_type = ResourceType.UNKNOWN
-            resource_id = line_data.get("id")
-            status = line_data.get("status")
-            text = line_data.get("text")
-            if resource_id == " " and text and text.startswith("build service "):
-                # Example:
-                # {"dry-run":true,"id":" ","text":"build service app"}
-                resource_id = "S" + text[len("build s") :]
-                text = "Building"
-            if (
-                isinstance(resource_id, str)
-                and resource_id.endswith("==>")
-                and text
-                and text.startswith("==> writing image ")
-            ):
-                # Example:
-                # {"dry-run":true,"id":"==>","text":"==> writing image dryRun-7d1043473d55bfa90e8530d35801d4e381bc69f0"}
-                # {"dry-run":true,"id":"ansible-docker-test-dc713f1f-container ==>","text":"==> writing image dryRun-5d9204268db1a73d57bbd24a25afbeacebe2bc02"}
-                # (The longer form happens since Docker Compose 2.39.0)
-                continue
-            if (
-                isinstance(resource_id, str)
-                and resource_id.endswith("==> ==>")
-                and text
-                and text.startswith("naming to ")
-            ):
-                # Example:
-                # {"dry-run":true,"id":"==> ==>","text":"naming to display-app"}
-                # {"dry-run":true,"id":"ansible-docker-test-dc713f1f-container ==> ==>","text":"naming to ansible-docker-test-dc713f1f-image"}
-                # (The longer form happens since Docker Compose 2.39.0)
-                continue
-            if (
-                status in ("Working", "Done")
-                and isinstance(line_data.get("parent_id"), str)
-                and line_data["parent_id"].startswith("Image ")
-            ):
-                # Compose 5.0.0+:
-                # {"id":"63a26ae4e8a8","parent_id":"Image ghcr.io/ansible-collections/simple-1:tag","status":"Working"}
-                # {"id":"63a26ae4e8a8","parent_id":"Image ghcr.io/ansible-collections/simple-1:tag","status":"Done","percent":100}
-                resource_type = ResourceType.IMAGE_LAYER
-                resource_id = line_data["parent_id"][len("Image ") :]
-            elif isinstance(resource_id, str) and " " in resource_id:
-                resource_type_str, resource_id = resource_id.split(" ", 1)
-                try:
-                    resource_type = ResourceType.from_docker_compose_event(
-                        resource_type_str
-                    )
-                except KeyError:
-                    if warn_function:
-                        warn_function(
-                            f"Unknown resource type {resource_type_str!r} in line {line!r}. Please check with the latest community.docker version,"
-                            " and if the problem still happens there, please report this at "
-                            "https://github.com/ansible-collections/community.docker/issues/new?assignees=&labels=&projects=&template=bug_report.md"
-                        )
-                    resource_type = ResourceType.UNKNOWN
-            elif text in DOCKER_STATUS_PULL:
-                resource_type = ResourceType.IMAGE
-                status, text = text, status
-            elif (
-                text in DOCKER_PULL_PROGRESS_DONE
-                or line_data.get("text") in DOCKER_PULL_PROGRESS_WORKING_OLD
-            ):
-                resource_type = ResourceType.IMAGE_LAYER
-                status, text = text, status
-            elif (
-                status is None
-                and isinstance(text, str)
-                and text.startswith("Skipped - ")
-            ):
-                status, text = text.split(" - ", 1)
-            elif (
-                line_data.get("level") in _JSON_LEVEL_TO_STATUS_MAP
-                and "msg" in line_data
-            ):
-                status = _JSON_LEVEL_TO_STATUS_MAP[line_data["level"]]
-                text = line_data["msg"]
-            if (
-                status not in DOCKER_STATUS_AND_WARNING
-                and text in DOCKER_STATUS_AND_WARNING
-            ):
-                status, text = text, status
-            event = Event(
-                resource_type,
-                resource_id,
-                status,
-                text,
+        return None
+    try:
+        line_data = json.loads(line)
+    except Exception as exc:  # pylint: disable=broad-exception-caught
+        if warn_function:
+            warn_function(
+                f"Cannot parse event from line: {line!r}: {exc}. Please check with the latest community.docker version,"
+                " and if the problem still happens there, please report this at "
+                "https://github.com/ansible-collections/community.docker/issues/new?assignees=&labels=&projects=&template=bug_report.md"
             )
+        return None
+    if line_data.get("tail"):
+        resource_type = ResourceType.UNKNOWN
+        msg = line_data.get("text")
+        status = "Error"
+        if isinstance(msg, str) and msg.lower().startswith("warning:"):
+            # For some reason, Writer.TailMsgf() is always used for errors *except* in one place,
+            # where its message is prepended with 'WARNING: ' (in pkg/compose/pull.go).
+            status = "Warning"
+            msg = msg[len("warning:") :].lstrip()
+        event = Event(
+            resource_type,
+            None,
+            status,
+            msg,
+        )
+    elif line_data.get("error"):
+        resource_type = ResourceType.UNKNOWN
+        event = Event(
+            resource_type,
+            line_data.get("id"),
+            "Error",
+            line_data.get("message"),
+        )
+    else:
+        resource_type = ResourceType.UNKNOWN
+        resource_id = line_data.get("id")
+        status = line_data.get("status")
+        text = line_data.get("text")
+        if resource_id == " " and text and text.startswith("build service "):
+            # Example:
+            # {"dry-run":true,"id":" ","text":"build service app"}
+            resource_id = "S" + text[len("build s") :]
+            text = "Building"
+        if (
+            isinstance(resource_id, str)
+            and resource_id.endswith("==>")
+            and text
+            and text.startswith("==> writing image ")
+        ):
+            # Example:
+            # {"dry-run":true,"id":"==>","text":"==> writing image dryRun-7d1043473d55bfa90e8530d35801d4e381bc69f0"}
+            # {"dry-run":true,"id":"ansible-docker-test-dc713f1f-container ==>","text":"==> writing image dryRun-5d9204268db1a73d57bbd24a25afbeacebe2bc02"}
+            # (The longer form happens since Docker Compose 2.39.0)
+            return None
+        if (
+            isinstance(resource_id, str)
+            and resource_id.endswith("==> ==>")
+            and text
+            and text.startswith("naming to ")
+        ):
+            # Example:
+            # {"dry-run":true,"id":"==> ==>","text":"naming to display-app"}
+            # {"dry-run":true,"id":"ansible-docker-test-dc713f1f-container ==> ==>","text":"naming to ansible-docker-test-dc713f1f-image"}
+            # (The longer form happens since Docker Compose 2.39.0)
+            return None
+        if (
+            status in ("Working", "Done")
+            and isinstance(line_data.get("parent_id"), str)
+            and line_data["parent_id"].startswith("Image ")
+        ):
+            # Compose 5.0.0+:
+            # {"id":"63a26ae4e8a8","parent_id":"Image ghcr.io/ansible-collections/simple-1:tag","status":"Working"}
+            # {"id":"63a26ae4e8a8","parent_id":"Image ghcr.io/ansible-collections/simple-1:tag","status":"Done","percent":100}
+            resource_type = ResourceType.IMAGE_LAYER
+            resource_id = line_data["parent_id"][len("Image ") :]
+        elif isinstance(resource_id, str) and " " in resource_id:
+            resource_type_str, resource_id = resource_id.split(" ", 1)
+            try:
+                resource_type = ResourceType.from_docker_compose_event(
+                    resource_type_str
+                )
+            except KeyError:
+                if warn_function:
+                    warn_function(
+                        f"Unknown resource type {resource_type_str!r} in line {line!r}. Please check with the latest community.docker version,"
+                        " and if the problem still happens there, please report this at "
+                        "https://github.com/ansible-collections/community.docker/issues/new?assignees=&labels=&projects=&template=bug_report.md"
+                    )
+                resource_type = ResourceType.UNKNOWN
+        elif text in DOCKER_STATUS_PULL:
+            resource_type = ResourceType.IMAGE
+            status, text = text, status
+        elif (
+            text in DOCKER_PULL_PROGRESS_DONE
+            or line_data.get("text") in DOCKER_PULL_PROGRESS_WORKING_OLD
+        ):
+            resource_type = ResourceType.IMAGE_LAYER
+            status, text = text, status
+        elif status is None and isinstance(text, str) and text.startswith("Skipped - "):
+            status, text = text.split(" - ", 1)
+        elif line_data.get("level") in _JSON_LEVEL_TO_STATUS_MAP and "msg" in line_data:
+            status = _JSON_LEVEL_TO_STATUS_MAP[line_data["level"]]
+            text = line_data["msg"]
+        if (
+            status not in DOCKER_STATUS_AND_WARNING
+            and text in DOCKER_STATUS_AND_WARNING
+        ):
+            status, text = text, status
+        event = Event(
+            resource_type,
+            resource_id,
+            status,
+            text,
+        )
+    return event
+
+
+class _BaseEventParser:
+    """
+    Incremental parser for the progress output Docker Compose writes to stderr.
+
+    The output can be passed to feed() in chunks of arbitrary size while it arrives.
+    Only the last incomplete line is buffered. close() returns the events.
+    """
+
+    def __init__(self, warn_function: Callable[[str], None] | None = None) -> None:
+        self.warn_function = warn_function
+        self.events: list[Event] = []
+        self._buffer = b""
+        self._blank_lines = 0
+        self._line_index = 0
+
+    def feed(self, data: bytes) -> None:
+        lines = (self._buffer + data).splitlines(True)
+        self._buffer = b""
+        # Keep an incomplete last line, and a trailing \r that might be followed by \n
+        if lines and (
+            lines[-1].endswith(b"\r") or lines[-1].splitlines()[0] == lines[-1]
+        ):
+            self._buffer = lines.pop()
+        for line in lines:
+            self._handle_line(line.splitlines()[0])
+
+    def close(self, nonzero_rc: bool = False) -> list[Event]:
+        for line in self._buffer.splitlines():
+            self._handle_line(line)
+        self._buffer = b""
+        # A trailing empty line is ignored
+        self._flush_blank_lines(self._blank_lines - 1)
+        self._finish(nonzero_rc)
+        return self.events
+
+    def _handle_line(self, line: bytes) -> None:
+        if not line:
+            # Only process empty lines once we know whether they are trailing
+            self._blank_lines += 1
+            return
+        self._flush_blank_lines(self._blank_lines)
+        self._process_line(line)
 
-        events.append(event)
-    return events
+    def _flush_blank_lines(self, count: int) -> None:
+        for dummy in range(count):
+            self._process_line(b"")
+        self._blank_lines = 0
 
+    def _process_line(self, line: bytes) -> None:
+        self._parse_line(line, self._line_index)
+        self._line_index += 1
 
-def parse_events(
-    stderr: bytes,
-    dry_run: bool = False,
-    warn_function: Callable[[str], None] | None = None,
-    nonzero_rc: bool = False,
-) -> list[Event]:
-    events = []
-    error_event = None
-    stderr_lines = stderr.splitlines()
-    if stderr_lines and stderr_lines[-1] == b"":
-        del stderr_lines[-1]
-    for index, line_b in enumerate(stderr_lines):
+    def _parse_line(self, line: bytes, index: int) -> None:
+        raise NotImplementedError()
+
+    def _finish(self, nonzero_rc: bool) -> None:
+        pass
+
+
+class EventParser(_BaseEventParser):
+    """
+    Incremental parser for the plain progress output of Docker Compose.
+    """
+
+    def __init__(
+        self,
+        dry_run: bool = False,
+        warn_function: Callable[[str], None] | None = None,
+    ) -> None:
+        super().__init__(warn_function=warn_function)
+        self.dry_run = dry_run
+        self._error_event: Event | None = None
+        self._last_event_index: dict[str | None, int] = {}
+        # An unparsable line is an error message if it is the last line and
+        # either the only line, or the return code is non-zero
+        self._unparsable: tuple[str, bool, int] | None = None
+
+    def _append(self, event: Event) -> None:
+        self._last_event_index[event.resource_id] = len(self.events)
+        self.events.append(event)
+
+    def _append_error(self, line: str) -> None:
+        self._error_event = Event(
+            ResourceType.UNKNOWN,
+            "",
+            "Error",
+            line,
+        )
+        self._append(self._error_event)
+
+    def _warn_unparsable(self, line: str, warn_missing_dry_run_prefix: bool) -> None:
+        _warn_missing_dry_run_prefix(
+            line, warn_missing_dry_run_prefix, self.warn_function
+        )
+        _warn_unparsable_line(line, self.warn_function)
+
+    def _parse_line(self, line_b: bytes, index: int) -> None:
+        if self._unparsable is not None:
+            # The unparsable line was not the last one
+            self._warn_unparsable(*self._unparsable[:2])
+            self._unparsable = None
         line = to_text(line_b.strip())
         if not line:
-            continue
+            return
         warn_missing_dry_run_prefix = False
-        if dry_run:
+        if self.dry_run:
             if line.startswith(_DRY_RUN_MARKER):
                 line = line[len(_DRY_RUN_MARKER) :].lstrip()
             else:
                 warn_missing_dry_run_prefix = True
-        event, parsed = _extract_event(line, warn_function=warn_function)
+        event, parsed = _extract_event(line, warn_function=self.warn_function)
         if event is not None:
-            events.append(event)
+            self._append(event)
             if event.status in DOCKER_STATUS_ERROR:
-                error_event = event
+                self._error_event = event
             else:
-                error_event = None
+                self._error_event = None
             _warn_missing_dry_run_prefix(
-                line, warn_missing_dry_run_prefix, warn_function
+                line, warn_missing_dry_run_prefix, self.warn_function
             )
-            continue
+            return
         if parsed:
-            continue
+            return
         match = _RE_BUILD_PROGRESS_EVENT.match(line)
         if match:
             # Ignore this
-            continue
+            return
         match = _RE_CONTINUE_EVENT.match(line)
         if match:
             # Continuing an existing event
-            index_event = _find_last_event_for(events, match.group("resource_id"))
-            if index_event is not None:
-                index, event = index_event
-                events[index] = _concat_event_msg(event, match.group("msg"))
-        event, parsed = _extract_logfmt_event(line, warn_function=warn_function)
+            event_index = self._last_event_index.get(match.group("resource_id"))
+            if event_index is not None:
+                self.events[event_index] = _concat_event_msg(
+                    self.events[event_index], match.group("msg")
+                )
+        event, parsed = _extract_logfmt_event(line, warn_function=self.warn_function)
         if event is not None:
-            events.append(event)
+            self._append(event)
         elif parsed:
-            continue
-        if error_event is not None:
+            return
+        if self._error_event is not None:
             # Unparsable line that apparently belongs to the previous error event
-            events[-1] = _concat_event_msg(error_event, line)
-            continue
+            self.events[-1] = _concat_event_msg(self._error_event, line)
+            return
         if line.startswith("Error "):
             # Error message that is independent of an error event
-            error_event = Event(
-                ResourceType.UNKNOWN,
-                "",
-                "Error",
-                line,
-            )
-            events.append(error_event)
-            continue
-        if len(stderr_lines) == 1 or (nonzero_rc and index == len(stderr_lines) - 1):
+            self._append_error(line)
+            return
+        self._unparsable = (line, warn_missing_dry_run_prefix, index)
+
+    def _finish(self, nonzero_rc: bool) -> None:
+        if self._unparsable is None:
+            return
+        line, warn_missing_dry_run_prefix, index = self._unparsable
+        self._unparsable = None
+        if index == 0 or nonzero_rc:
             # **Very likely** an error message that is independent of an error event
-            error_event = Event(
-                ResourceType.UNKNOWN,
-                "",
-                "Error",
-                line,
-            )
-            events.append(error_event)
-            continue
-        _warn_missing_dry_run_prefix(line, warn_missing_dry_run_prefix, warn_function)
-        _warn_unparsable_line(line, warn_function)
-    return events
+            self._append_error(line)
+            return
+        self._warn_unparsable(line, warn_missing_dry_run_prefix)
+
+
+class JSONEventParser(_BaseEventParser):
+    """
+    Incremental parser for the JSON progress output of Docker Compose 2.29.0+.
+    """
+
+    def _parse_line(self, line: bytes, index: int) -> None:
+        event = _parse_json_line(line, warn_function=self.warn_function)
+        if event is not None:
+            self.events.append(event)
+
+
+def parse_json_events(
+    stderr: bytes, warn_function: Callable[[str], None] | None = None
+) -> list[Event]:
+    parser = JSONEventParser(warn_function=warn_function)
+    parser.feed(stderr)
+    return parser.close()
+
+
+def parse_events(
+    stderr: bytes,
+    dry_run: bool = False,
+    warn_function: Callable[[str], None] | None = None,
+    nonzero_rc: bool = False,
+) -> list[Event]:
+    parser = EventParser(dry_run=dry_run, warn_function=warn_function)
+    parser.feed(stderr)
+    return parser.close(nonzero_rc=nonzero_rc)
 
 
 def has_changes(
@@ -956,17 +1044,29 @@ class BaseComposeManager(DockerBaseClass):
             images = list(images.values())
         return images
 
+    def create_event_parser(self, dry_run: bool = False) -> _BaseEventParser:
+        if self.use_json_events:
+            return JSONEventParser(warn_function=self.client.warn)
+        return EventParser(dry_run=dry_run, warn_function=self.client.warn)
+
     def parse_events(
         self, stderr: bytes, dry_run: bool = False, nonzero_rc: bool = False
     ) -> list[Event]:
-        if self.use_json_events:
-            return parse_json_events(stderr, warn_function=self.client.warn)
-        return parse_events(
-            stderr,
-            dry_run=dry_run,
-            warn_function=self.client.warn,
-            nonzero_rc=nonzero_rc,
+        parser = self.create_event_parser(dry_run=dry_run)
+        parser.feed(stderr)
+        return parser.close(nonzero_rc=nonzero_rc)
+
+    def call_cli_with_events(
+        self, args: list[str], dry_run: bool = False
+    ) -> tuple[int, bytes, bytes, list[Event]]:
+        """
+        Run Docker Compose and parse its progress output while it is running.
+        """
+        parser = self.create_event_parser(dry_run=dry_run)
+        rc, stdout, stderr = self.client.call_cli_stream_stderr(
+            *args, stderr_callback=parser.feed, cwd=self.project_src
         )
+        return rc, stdout, stderr, parser.close(nonzero_rc=rc != 0)
 
     def emit_warnings(self, events: Sequence[Event]) -> None:
         emit_warnings(events, warn_function=self.client.warn)
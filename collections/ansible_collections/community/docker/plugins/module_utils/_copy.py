@@ -26,7 +26,7 @@ from ansible_collections.community.docker.plugins.module_utils._api.errors impor
 )
 
 if t.TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Sequence
 
     from _typeshed import WriteableBuffer
 
@@ -106,7 +106,17 @@ def _symlink_tar_generator(
     )
 
 
-def _regular_file_tar_generator(
+def _tar_end_generator(total_size: int) -> t.Generator[bytes]:
+    # End with two zeroed blocks
+    yield tarfile.NUL * (2 * tarfile.BLOCKSIZE)
+    total_size += 2 * tarfile.BLOCKSIZE
+
+    remainder = total_size % tarfile.RECORDSIZE
+    if remainder > 0:
+        yield tarfile.NUL * (tarfile.RECORDSIZE - remainder)
+
+
+def _regular_file_tar_member(
     b_in_path: bytes,
     file_stat: os.stat_result,
     out_file: str | bytes,
@@ -131,12 +141,9 @@ def _regular_file_tar_generator(
     if user_name:
         tarinfo.uname = user_name
 
-    tarinfo_buf = tarinfo.tobuf()
-    total_size = len(tarinfo_buf)
-    yield tarinfo_buf
+    yield tarinfo.tobuf()
 
     size = tarinfo.size
-    total_size += size
     with open(b_in_path, "rb") as f:
         while size > 0:
             to_read = min(size, 65536)
@@ -154,24 +161,95 @@ def _regular_file_tar_generator(
     if remainder:
         # We need to write a multiple of 512 bytes. Fill up with zeros.
         yield tarfile.NUL * (tarfile.BLOCKSIZE - remainder)
-        total_size += tarfile.BLOCKSIZE - remainder
 
-    # End with two zeroed blocks
-    yield tarfile.NUL * (2 * tarfile.BLOCKSIZE)
-    total_size += 2 * tarfile.BLOCKSIZE
 
-    remainder = total_size % tarfile.RECORDSIZE
-    if remainder > 0:
-        yield tarfile.NUL * (tarfile.RECORDSIZE - remainder)
+def _directory_tar_member(
+    file_stat: os.stat_result,
+    out_file: str | bytes,
+    user_id: int,
+    group_id: int,
+    mode: int | None = None,
+    user_name: str | None = None,
+) -> t.Generator[bytes]:
+    if not stat.S_ISDIR(file_stat.st_mode):
+        raise DockerUnexpectedError("stat information is not for a directory")
+    tarinfo = tarfile.TarInfo()
+    tarinfo.name = (
+        os.path.splitdrive(to_text(out_file))[1].replace(os.sep, "/").lstrip("/")
+    )
+    tarinfo.mode = stat.S_IMODE(file_stat.st_mode) if mode is None else mode
+    tarinfo.uid = user_id
+    tarinfo.gid = group_id
+    tarinfo.size = 0
+    tarinfo.mtime = file_stat.st_mtime
+    tarinfo.type = tarfile.DIRTYPE
+    tarinfo.linkname = ""
+    if user_name:
+        tarinfo.uname = user_name
 
+    yield tarinfo.tobuf()
 
-def _regular_content_tar_generator(
+
+def _regular_file_tar_generator(
+    b_in_path: bytes,
+    file_stat: os.stat_result,
+    out_file: str | bytes,
+    user_id: int,
+    group_id: int,
+    mode: int | None = None,
+    user_name: str | None = None,
+) -> t.Generator[bytes]:
+    total_size = 0
+    for chunk in _regular_file_tar_member(
+        b_in_path,
+        file_stat,
+        out_file,
+        user_id,
+        group_id,
+        mode=mode,
+        user_name=user_name,
+    ):
+        total_size += len(chunk)
+        yield chunk
+    yield from _tar_end_generator(total_size)
+
+
+def _multiple_files_tar_generator(
+    files: Sequence[tuple[str, bytes, os.stat_result, int | None]],
+    user_id: int,
+    group_id: int,
+    user_name: str | None = None,
+) -> t.Generator[bytes]:
+    total_size = 0
+    for out_file, b_in_path, file_stat, mode in files:
+        if stat.S_ISDIR(file_stat.st_mode):
+            member = _directory_tar_member(
+                file_stat, out_file, user_id, group_id, mode=mode, user_name=user_name
+            )
+        else:
+            member = _regular_file_tar_member(
+                b_in_path,
+                file_stat,
+                out_file,
+                user_id,
+                group_id,
+                mode=mode,
+                user_name=user_name,
+            )
+        for chunk in member:
+            total_size += len(chunk)
+            yield chunk
+    yield from _tar_end_generator(total_size)
+
+
+def _regular_content_tar_member(
     content: bytes,
     out_file: str | bytes,
     user_id: int,
     group_id: int,
     mode: int,
     user_name: str | None = None,
+    mtime: int | float | None = None,
 ) -> t.Generator[bytes]:
     tarinfo = tarfile.TarInfo()
     tarinfo.name = (
@@ -181,32 +259,58 @@ def _regular_content_tar_generator(
     tarinfo.uid = user_id
     tarinfo.gid = group_id
     tarinfo.size = len(content)
-    tarinfo.mtime = int(datetime.datetime.now().timestamp())
+    tarinfo.mtime = int(datetime.datetime.now().timestamp()) if mtime is None else mtime
     tarinfo.type = tarfile.REGTYPE
     tarinfo.linkname = ""
     if user_name:
         tarinfo.uname = user_name
 
-    tarinfo_buf = tarinfo.tobuf()
-    total_size = len(tarinfo_buf)
-    yield tarinfo_buf
-
-    total_size += len(content)
+    yield tarinfo.tobuf()
     yield content
 
     remainder = tarinfo.size % tarfile.BLOCKSIZE
     if remainder:
         # We need to write a multiple of 512 bytes. Fill up with zeros.
         yield tarfile.NUL * (tarfile.BLOCKSIZE - remainder)
-        total_size += tarfile.BLOCKSIZE - remainder
 
-    # End with two zeroed blocks
-    yield tarfile.NUL * (2 * tarfile.BLOCKSIZE)
-    total_size += 2 * tarfile.BLOCKSIZE
 
-    remainder = total_size % tarfile.RECORDSIZE
-    if remainder > 0:
-        yield tarfile.NUL * (tarfile.RECORDSIZE - remainder)
+def _regular_content_tar_generator(
+    content: bytes,
+    out_file: str | bytes,
+    user_id: int,
+    group_id: int,
+    mode: int,
+    user_name: str | None = None,
+) -> t.Generator[bytes]:
+    total_size = 0
+    for chunk in _regular_content_tar_member(
+        content, out_file, user_id, group_id, mode, user_name=user_name
+    ):
+        total_size += len(chunk)
+        yield chunk
+    yield from _tar_end_generator(total_size)
+
+
+def _multiple_content_tar_generator(
+    files: Sequence[tuple[str, bytes, int, int | float | None]],
+    user_id: int,
+    group_id: int,
+    user_name: str | None = None,
+) -> t.Generator[bytes]:
+    total_size = 0
+    for out_file, content, mode, mtime in files:
+        for chunk in _regular_content_tar_member(
+            content,
+            out_file,
+            user_id,
+            group_id,
+            mode,
+            user_name=user_name,
+            mtime=mtime,
+        ):
+            total_size += len(chunk)
+            yield chunk
+    yield from _tar_end_generator(total_size)
 
 
 def put_file(
@@ -290,6 +394,86 @@ def put_file_content(
         )
 
 
+def put_file_contents(
+    client: APIClient,
+    container: str,
+    files: Sequence[tuple[str, bytes, int, int | float | None]],
+    user_id: int,
+    group_id: int,
+    user_name: str | None = None,
+) -> None:
+    """Transfer several files from local to Docker container with a single archive upload.
+
+    ``files`` is a sequence of ``(out_path, content, mode, mtime)`` tuples. ``mtime`` can be
+    ``None`` to use the current time. The archive is extracted in the deepest directory
+    common to all ``out_path``s.
+    """
+    if not files:
+        return
+
+    out_dir = os.path.commonpath([os.path.dirname(out_path) for out_path, *_ in files])
+    stream = _multiple_content_tar_generator(
+        [
+            (os.path.relpath(out_path, out_dir), content, mode, mtime)
+            for out_path, content, mode, mtime in files
+        ],
+        user_id,
+        group_id,
+        user_name=user_name,
+    )
+
+    ok = _put_archive(client, container, out_dir, stream)
+    if not ok:
+        out_paths = ", ".join(f'"{out_path}"' for out_path, *_ in files)
+        raise DockerUnexpectedError(
+            f'Unknown error while creating files {out_paths} in container "{container}".'
+        )
+
+
+def put_files(
+    client: APIClient,
+    container: str,
+    out_dir: str,
+    files: Sequence[tuple[str, str, int | None]],
+    user_id: int,
+    group_id: int,
+    user_name: str | None = None,
+) -> None:
+    """Transfer several local files and directories to a Docker container with a single archive upload.
+
+    ``files`` is a sequence of ``(name, in_path, mode)`` tuples, where ``name`` is the path relative
+    to ``out_dir`` in the container. Symbolic links are followed. If ``mode`` is ``None``, the mode
+    of the local file is used for directories, and its owner permissions for regular files.
+    """
+    if not files:
+        return
+
+    entries = []
+    for name, in_path, mode in files:
+        b_in_path = to_bytes(in_path, errors="surrogate_or_strict")
+        try:
+            file_stat = os.stat(b_in_path)
+        except FileNotFoundError as exc:
+            raise DockerFileNotFound(
+                f"file or module does not exist: {to_text(in_path)}"
+            ) from exc
+        if not stat.S_ISREG(file_stat.st_mode) and not stat.S_ISDIR(file_stat.st_mode):
+            raise DockerFileCopyError(
+                f"File referenced by {in_path} is neither a regular file nor a directory (stat mode {oct(file_stat.st_mode)})."
+            )
+        entries.append((name, b_in_path, file_stat, mode))
+
+    stream = _multiple_files_tar_generator(
+        entries, user_id, group_id, user_name=user_name
+    )
+
+    ok = _put_archive(client, container, out_dir, stream)
+    if not ok:
+        raise DockerUnexpectedError(
+            f'Unknown error while creating {len(files)} files in "{out_dir}" in container "{container}".'
+        )
+
+
 def stat_file(
     client: APIClient,
     container: str,
@@ -588,3 +772,102 @@ def determine_user_group(
         raise DockerUnexpectedError(
             f"Expected two-line output with numeric IDs to obtain user and group ID for container {container}, but got {user_id!r} and {group_id!r} instead"
         ) from exc
+
+
+_STAT_TREE_FORMAT = "%F|%s|%Y|%a|%u|%g|%n"
+_CHECKSUM_BATCH_SIZE = 500
+
+
+def stat_tree(
+    client: APIClient,
+    container: str,
+    path: str,
+    log: Callable[[str], None] | None = None,
+) -> dict[str, dict[str, t.Any]]:
+    """List a file or a directory tree in a Docker container with a single command.
+
+    Return a dictionary mapping every path below (and including) ``path`` to a dictionary
+    with fields ``type`` (``file``, ``directory``, ``link``, or ``other``), ``size``, ``mtime``,
+    ``mode``, ``uid``, and ``gid`` (all integers). Symbolic links are not followed. The dictionary
+    is empty if ``path`` does not exist.
+
+    This needs ``/bin/sh``, ``find``, and ``stat`` in the container.
+    """
+    dummy_rc, stdout, dummy_stderr = _execute_command(
+        client,
+        container,
+        [
+            "/bin/sh",
+            "-c",
+            f'if [ -e "$1" ] || [ -L "$1" ]; then find "$1" -exec stat -c \'{_STAT_TREE_FORMAT}\' {{}} +; fi',
+            "sh",
+            path,
+        ],
+        check_rc=True,
+        log=log,
+    )
+
+    result = {}
+    for line in to_text(stdout, errors="surrogate_or_strict").splitlines():
+        parts = line.split("|", 6)
+        if len(parts) != 7:
+            raise DockerUnexpectedError(
+                f"Unexpected output while listing {path} in container {container}: {line!r}"
+            )
+        file_type, size, mtime, mode, uid, gid, name = parts
+        if file_type.startswith("regular"):
+            file_type = "file"
+        elif file_type == "directory":
+            file_type = "directory"
+        elif file_type == "symbolic link":
+            file_type = "link"
+        else:
+            file_type = "other"
+        try:
+            result[name] = {
+                "type": file_type,
+                "size": int(size),
+                "mtime": int(mtime),
+                "mode": int(mode, 8),
+                "uid": int(uid),
+                "gid": int(gid),
+            }
+        except ValueError as exc:
+            raise DockerUnexpectedError(
+                f"Unexpected output while listing {path} in container {container}: {line!r}"
+            ) from exc
+    return result
+
+
+def checksum_files(
+    client: APIClient,
+    container: str,
+    paths: Sequence[str],
+    log: Callable[[str], None] | None = None,
+) -> dict[str, str]:
+    """Compute the SHA-256 digests of files in a Docker container, with one command per batch of files.
+
+    Return a dictionary mapping the paths to the hex digests. This needs ``/bin/sh`` and
+    ``sha256sum`` in the container.
+    """
+    result: dict[str, str] = {}
+    # Keep the command line well below ARG_MAX for large trees
+    for start in range(0, len(paths), _CHECKSUM_BATCH_SIZE):
+        dummy_rc, stdout, dummy_stderr = _execute_command(
+            client,
+            container,
+            ["/bin/sh", "-c", 'sha256sum "$@"', "sh"]
+            + list(paths[start : start + _CHECKSUM_BATCH_SIZE]),
+            check_rc=True,
+            log=log,
+        )
+
+        for line in to_text(stdout, errors="surrogate_or_strict").splitlines():
+            # Format is "<digest>  <path>" (or "<digest> *<path>" for binary mode)
+            digest, sep, name = line.partition(" ")
+            if not sep or len(digest) != 64:
+                raise DockerUnexpectedError(
+                    f"Unexpected sha256sum output in container {container}: {line!r}"
+                )
+            result[name[1:]] = digest
+    return result
@@ -7,9 +7,55 @@
 
 from __future__ import annotations
 
+import bz2
+import contextlib
+import gzip
 import json
+import lzma
 import os
 import tarfile
+import traceback
+import typing as t
+
+if t.TYPE_CHECKING:
+    from collections.abc import Generator, Iterator
+
+ZSTD_IMPORT_ERROR: None | str  # pylint: disable=invalid-name
+try:
+    from compression import zstd as _zstd  # type: ignore  # Python 3.14+
+
+    _zstandard = None  # pylint: disable=invalid-name
+except ImportError:
+    _zstd = None  # pylint: disable=invalid-name
+    try:
+        import zstandard as _zstandard  # type: ignore
+    except ImportError:
+        _zstandard = None  # pylint: disable=invalid-name
+        HAS_ZSTD = False
+        ZSTD_IMPORT_ERROR = traceback.format_exc()  # pylint: disable=invalid-name
+    else:
+        HAS_ZSTD = True
+        ZSTD_IMPORT_ERROR = None  # pylint: disable=invalid-name
+else:
+    HAS_ZSTD = True
+    ZSTD_IMPORT_ERROR = None  # pylint: disable=invalid-name
+
+
+_COMPRESSION_MAGIC = {
+    "gzip": b"\x1f\x8b",
+    "bzip2": b"BZh",
+    "xz": b"\xfd7zXZ\x00",
+    "zstd": b"\x28\xb5\x2f\xfd",
+}
+
+_COMPRESSION_EXTENSIONS = {
+    ".gz": "gzip",
+    ".tgz": "gzip",
+    ".zst": "zstd",
+    ".zstd": "zstd",
+}
+
+ARCHIVE_CHUNK_SIZE = 1024 * 1024
 
 
 class ImageArchiveManifestSummary:
@@ -44,6 +90,163 @@ def api_image_id(archive_image_id: str) -> str:
     return f"sha256:{archive_image_id}"
 
 
+def compression_from_path(archive_path: str) -> str:
+    """
+    Guess the compression of an archive to write from its file name extension.
+
+    :param archive_path: Tar file name
+    :returns: One of "none", "gzip", and "zstd"
+    """
+
+    return _COMPRESSION_EXTENSIONS.get(
+        os.path.splitext(archive_path)[1].lower(), "none"
+    )
+
+
+def detect_archive_compression(archive_path: str) -> str:
+    """
+    Detect the compression of an existing archive from its magic bytes.
+
+    :param archive_path: Tar file to read
+    :returns: One of "none", "gzip", "bzip2", "xz", and "zstd"
+    """
+
+    with open(archive_path, "rb") as f:
+        header = f.read(6)
+    for compression, magic in _COMPRESSION_MAGIC.items():
+        if header.startswith(magic):
+            return compression
+    return "none"
+
+
+def _check_zstd() -> None:
+    if not HAS_ZSTD:
+        raise ImageArchiveInvalidException(
+            "zstd compression requires Python 3.14 or the zstandard Python library"
+        )
+
+
+@contextlib.contextmanager
+def open_archive_reader(archive_path: str) -> Iterator[t.IO[bytes]]:
+    """
+    Open an archive for streaming, decompressing it on the fly if it is compressed.
+
+    :param archive_path: Tar file to read
+    """
+
+    compression = detect_archive_compression(archive_path)
+    if compression == "gzip":
+        with gzip.open(archive_path, "rb") as f:
+            yield f
+    elif compression == "bzip2":
+        with bz2.open(archive_path, "rb") as f:
+            yield f
+    elif compression == "xz":
+        with lzma.open(archive_path, "rb") as f:
+            yield f
+    elif compression == "zstd":
+        _check_zstd()
+        with open(archive_path, "rb") as raw:
+            if _zstd is not None:
+                with _zstd.ZstdFile(raw, "rb") as f:
+                    yield f
+            else:
+                assert _zstandard is not None
+                with _zstandard.ZstdDecompressor().stream_reader(raw) as f:
+                    yield f
+    else:
+        with open(archive_path, "rb") as f:
+            yield f
+
+
+@contextlib.contextmanager
+def open_archive_writer(
+    archive_path: str, compression: str, level: int | None = None
+) -> Iterator[t.IO[bytes]]:
+    """
+    Open an archive for writing, compressing the data on the fly.
+
+    :param archive_path: Tar file to write
+    :param compression: One of "none", "gzip", and "zstd"
+    :param level: Compression level, or None for the default level
+    """
+
+    if compression == "zstd":
+        _check_zstd()
+    with open(archive_path, "wb") as raw:
+        if compression == "gzip":
+            with gzip.GzipFile(
+                fileobj=raw, mode="wb", compresslevel=9 if level is None else level
+            ) as f:
+                yield f
+        elif compression == "zstd":
+            if _zstd is not None:
+                with _zstd.ZstdFile(raw, "wb", level=level) as f:
+                    yield f
+            else:
+                assert _zstandard is not None
+                compressor = _zstandard.ZstdCompressor(
+                    level=3 if level is None else level
+                )
+                with compressor.stream_writer(raw, closefd=False) as f:
+                    yield f
+        else:
+            yield raw
+
+
+@contextlib.contextmanager
+def open_archive_for_load(
+    archive_path: str,
+) -> Iterator[t.IO[bytes] | Generator[bytes]]:
+    """
+    Open an archive so that it can be sent to the Docker daemon's /images/load endpoint.
+
+    The Docker daemon decompresses gzip, bzip2, and xz compressed archives itself, so these
+    are sent as-is. zstd compressed archives are decompressed on the fly.
+
+    :param archive_path: Tar file to read
+    """
+
+    if detect_archive_compression(archive_path) != "zstd":
+        with open(archive_path, "rb") as f:
+            yield f
+        return
+
+    with open_archive_reader(archive_path) as reader:
+
+        def stream() -> Generator[bytes]:
+            while True:
+                chunk = reader.read(ARCHIVE_CHUNK_SIZE)
+                if not chunk:
+                    break
+                yield chunk
+
+        yield stream()
+
+
+@contextlib.contextmanager
+def _open_tar(archive_path: str) -> Iterator[tarfile.TarFile]:
+    if detect_archive_compression(archive_path) != "zstd":
+        with tarfile.open(archive_path, "r") as tf:
+            yield tf
+        return
+
+    # Python's tarfile does not know zstd, so stream through the decompressed archive
+    with open_archive_reader(archive_path) as f, tarfile.open(
+        fileobj=f, mode="r|"
+    ) as tf:
+        yield tf
+
+
+def _extract_manifest(tf: tarfile.TarFile) -> t.IO[bytes] | None:
+    # Iterating works for both random access and streaming mode, and stops as soon as
+    # manifest.json has been found
+    for member in tf:
+        if member.name == "manifest.json":
+            return tf.extractfile(member)
+    raise KeyError("filename 'manifest.json' not found")
+
+
 def load_archived_image_manifest(
     archive_path: str,
 ) -> list[ImageArchiveManifestSummary] | None:
@@ -67,10 +270,10 @@ def load_archived_image_manifest(
         if not os.path.isfile(archive_path):
             return None
 
-        with tarfile.open(archive_path, "r") as tf:
+        with _open_tar(archive_path) as tf:
             try:
                 try:
-                    reader = tf.extractfile("manifest.json")
+                    reader = _extract_manifest(tf)
                     if reader is None:
                         raise ImageArchiveInvalidException(
                             "Failed to read manifest.json"
@@ -156,18 +156,13 @@ class Option:
         self.not_a_container_option = not_a_container_option
         self.not_an_ansible_option = not_an_ansible_option
         self.copy_comparison_from = copy_comparison_from
-        self.compare = (
-            (
-                lambda param_value, container_value: compare(
-                    self, param_value, container_value
-                )
-            )
-            if compare
-            else (
-                lambda param_value, container_value: compare_generic(
-                    param_value, container_value, self.comparison, self.comparison_type
-                )
-            )
+        self._compare = compare
+
+    def compare(self, param_value: t.Any, container_value: t.Any) -> bool:
+        if self._compare:
+            return self._compare(self, param_value, container_value)
+        return compare_generic(
+            param_value, container_value, self.comparison, self.comparison_type
         )
 
 
@@ -338,6 +333,57 @@ class Engine(t.Generic[Client]):
         pass
 
 
+class ContainerError(Exception):
+    """
+    Raised instead of failing the module when managing one container out of several fails.
+    """
+
+    def __init__(self, msg: str, **kwargs: t.Any) -> None:
+        super().__init__(msg)
+        self.msg = msg
+        self.kwargs = kwargs
+
+
+class ContainerOptionsSpec:
+    """
+    The argument spec, the constraints, and the minimal versions of the container options
+    supported by an engine driver.
+    """
+
+    def __init__(
+        self,
+        argument_spec: dict[str, t.Any],
+        mutually_exclusive: Sequence[Sequence[str]] | None = None,
+        required_together: Sequence[Sequence[str]] | None = None,
+        required_one_of: Sequence[Sequence[str]] | None = None,
+        required_if: (
+            Sequence[
+                tuple[str, t.Any, Sequence[str]]
+                | tuple[str, t.Any, Sequence[str], bool]
+            ]
+            | None
+        ) = None,
+        required_by: dict[str, Sequence[str]] | None = None,
+    ) -> None:
+        self.active_options: list[OptionGroup] = []
+        self.argument_spec = dict(argument_spec or {})
+        self.mutually_exclusive = list(mutually_exclusive or [])
+        self.required_together = list(required_together or [])
+        self.required_one_of = list(required_one_of or [])
+        self.required_if = list(required_if or [])
+        self.required_by = dict(required_by or {})
+        self.option_minimal_versions: dict[str, dict[str, t.Any]] = {}
+
+    def add_options(self, options: OptionGroup) -> None:
+        self.mutually_exclusive.extend(options.ansible_mutually_exclusive)
+        self.required_together.extend(options.ansible_required_together)
+        self.required_one_of.extend(options.ansible_required_one_of)
+        self.required_if.extend(options.ansible_required_if)
+        self.required_by.update(options.ansible_required_by)
+        self.argument_spec.update(options.argument_spec)
+        self.active_options.append(options)
+
+
 class EngineDriver(t.Generic[Client]):
     name: str
 
@@ -359,6 +405,47 @@ class EngineDriver(t.Generic[Client]):
     ) -> tuple[AnsibleModule, list[OptionGroup], Client]:
         pass
 
+    @abc.abstractmethod
+    def collect_options(
+        self,
+        argument_spec: dict[str, t.Any],
+        mutually_exclusive: Sequence[Sequence[str]] | None = None,
+        required_together: Sequence[Sequence[str]] | None = None,
+        required_one_of: Sequence[Sequence[str]] | None = None,
+        required_if: (
+            Sequence[
+                tuple[str, t.Any, Sequence[str]]
+                | tuple[str, t.Any, Sequence[str], bool]
+            ]
+            | None
+        ) = None,
+        required_by: dict[str, Sequence[str]] | None = None,
+    ) -> ContainerOptionsSpec:
+        pass
+
+    @abc.abstractmethod
+    def setup_bulk(
+        self,
+        argument_spec: dict[str, t.Any],
+        mutually_exclusive: Sequence[Sequence[str]] | None = None,
+        required_together: Sequence[Sequence[str]] | None = None,
+        required_one_of: Sequence[Sequence[str]] | None = None,
+        required_if: (
+            Sequence[
+                tuple[str, t.Any, Sequence[str]]
+                | tuple[str, t.Any, Sequence[str], bool]
+            ]
+            | None
+        ) = None,
+        required_by: dict[str, Sequence[str]] | None = None,
+    ) -> tuple[AnsibleModule, Client]:
+        """
+        Set up a module managing several containers. The container options are not part
+        of the module's argument spec; use collect_options() to validate them. When called
+        from a worker thread, the client's fail() raises ContainerError instead of failing
+        the module.
+        """
+
     @abc.abstractmethod
     def get_host_info(self, client: Client) -> dict[str, t.Any]:
         pass
@@ -0,0 +1,288 @@
+# Copyright (c) Ansible Project
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+# Note that this module util is **PRIVATE** to the collection. It can have breaking changes at any time.
+# Do not use this from other collections or standalone plugins/modules!
+
+from __future__ import annotations
+
+import copy
+import threading
+import traceback
+import typing as t
+from concurrent.futures import ThreadPoolExecutor
+
+from ansible.module_utils.common.arg_spec import ArgumentSpecValidator
+
+from ansible_collections.community.docker.plugins.module_utils._module_container.base import (
+    ContainerError,
+)
+from ansible_collections.community.docker.plugins.module_utils._module_container.module import (
+    CONTAINER_ARGUMENT_SPEC,
+    CONTAINER_REQUIRED_IF,
+    ContainerManager,
+)
+from ansible_collections.community.docker.plugins.module_utils._util import (
+    sanitize_result,
+)
+from ansible_collections.community.docker.plugins.module_utils._version import (
+    LooseVersion,
+)
+
+if t.TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from ansible.module_utils.basic import AnsibleModule
+
+    from .base import ContainerOptionsSpec, EngineDriver, OptionGroup
+
+
+class _ContainerModule:
+    """
+    The module as seen by the ContainerManager of a single container: it has the
+    container's parameters, and failing raises ContainerError.
+    """
+
+    def __init__(
+        self,
+        module: AnsibleModule,
+        params: dict[str, t.Any],
+        argument_spec: dict[str, t.Any],
+    ) -> None:
+        self._module = module
+        self.params = params
+        self.argument_spec = argument_spec
+        self.check_mode = module.check_mode
+        self._diff = module._diff
+
+    def fail_json(self, msg: str, **kwargs: t.Any) -> t.NoReturn:
+        raise ContainerError(msg, **kwargs)
+
+    def __getattr__(self, name: str) -> t.Any:
+        return getattr(self._module, name)
+
+
+class _ClientOptionsView:
+    # The 'detect_usage' callbacks of the option minimal versions look at client.module.params.
+    def __init__(self, module: _ContainerModule) -> None:
+        self.module = module
+
+
+class _SharedEngineDriver:
+    """
+    Wraps an engine driver so that the host information and the image inspections
+    are retrieved once for all containers, and every image is pulled at most once.
+    """
+
+    def __init__(self, engine_driver: EngineDriver) -> None:
+        self._engine_driver = engine_driver
+        self._lock = threading.Lock()
+        self._key_locks: dict[tuple[t.Any, ...], threading.Lock] = {}
+        self._cache: dict[tuple[t.Any, ...], t.Any] = {}
+
+    def __getattr__(self, name: str) -> t.Any:
+        return getattr(self._engine_driver, name)
+
+    def _get_key_lock(self, key: tuple[t.Any, ...]) -> threading.Lock:
+        with self._lock:
+            return self._key_locks.setdefault(key, threading.Lock())
+
+    def _cached(self, key: tuple[t.Any, ...], compute: Callable[[], t.Any]) -> t.Any:
+        with self._get_key_lock(key):
+            if key not in self._cache:
+                self._cache[key] = compute()
+            return self._cache[key]
+
+    def get_host_info(self, client: t.Any) -> dict[str, t.Any]:
+        return self._cached(
+            ("host_info",), lambda: self._engine_driver.get_host_info(client)
+        )
+
+    def inspect_image_by_id(
+        self, client: t.Any, image_id: str
+    ) -> dict[str, t.Any] | None:
+        return self._cached(
+            ("image_id", image_id),
+            lambda: self._engine_driver.inspect_image_by_id(client, image_id),
+        )
+
+    def inspect_image_by_name(
+        self, client: t.Any, repository: str, tag: str
+    ) -> dict[str, t.Any] | None:
+        return self._cached(
+            ("image_name", repository, tag),
+            lambda: self._engine_driver.inspect_image_by_name(client, repository, tag),
+        )
+
+    def pull_image(
+        self,
+        client: t.Any,
+        repository: str,
+        tag: str,
+        image_platform: str | None = None,
+    ) -> tuple[dict[str, t.Any] | None, bool]:
+        key = ("pull", repository, tag, image_platform)
+        with self._get_key_lock(key):
+            if key in self._cache:
+                # Another container already pulled this image during this run
+                return self._cache[key], True
+            image, already_to_latest = self._engine_driver.pull_image(
+                client, repository, tag, image_platform=image_platform
+            )
+            self._cache[key] = image
+        with self._get_key_lock(("image_name", repository, tag)):
+            self._cache[("image_name", repository, tag)] = image
+        return image, already_to_latest
+
+
+class BulkContainerManager:
+    def __init__(
+        self,
+        module: AnsibleModule,
+        engine_driver: EngineDriver,
+        client: t.Any,
+        spec: ContainerOptionsSpec,
+    ) -> None:
+        self.module = module
+        self.engine_driver = _SharedEngineDriver(engine_driver)
+        self.client = client
+        self.spec = spec
+        self.parallelism: int = max(1, module.params["parallelism"])
+        self.results: dict[str, t.Any] = {"changed": False, "containers": []}
+
+    def _validate(self, index: int, definition: t.Any) -> _ContainerModule:
+        if not isinstance(definition, dict):
+            self.module.fail_json(msg=f"containers[{index}] must be a dictionary")
+        params = dict(self.module.params["defaults"] or {})
+        params.update(definition)
+        validator = ArgumentSpecValidator(
+            self.spec.argument_spec,
+            mutually_exclusive=self.spec.mutually_exclusive,
+            required_together=self.spec.required_together,
+            required_one_of=self.spec.required_one_of,
+            required_if=self.spec.required_if,
+            required_by=self.spec.required_by,
+        )
+        result = validator.validate(params)
+        name = params.get("name") or f"containers[{index}]"
+        if result.error_messages:
+            self.module.fail_json(
+                msg=f"Invalid definition of container {name}: {'; '.join(result.error_messages)}"
+            )
+        container_params = dict(self.module.params)
+        container_params.update(result.validated_parameters)
+        container_module = _ContainerModule(
+            self.module, container_params, self.spec.argument_spec
+        )
+        self._check_minimal_versions(name, container_module)
+        return container_module
+
+    def _check_minimal_versions(
+        self, name: str, container_module: _ContainerModule
+    ) -> None:
+        api_version = self.engine_driver.get_api_version(self.client)
+        for option, data in self.spec.option_minimal_versions.items():
+            if api_version >= LooseVersion(data["docker_api_version"]):
+                continue
+            if "detect_usage" in data:
+                used = data["detect_usage"](_ClientOptionsView(container_module))
+            else:
+                value = container_module.params.get(option)
+                used = value is not None
+                if used and "default" in self.spec.argument_spec[option]:
+                    used = value != self.spec.argument_spec[option]["default"]
+            if used:
+                usg = data.get("usage_msg", f"set {option} option")
+                self.module.fail_json(
+                    msg=f"Docker API version is {api_version}. Minimum version required is "
+                    f"{data['docker_api_version']} to {usg} (container {name})."
+                )
+
+    def _copy_active_options(self) -> list[OptionGroup]:
+        # ContainerManager stores the comparison modes in the options, so every
+        # container gets its own copies of them
+        active_options = []
+        for options in self.spec.active_options:
+            copies = {id(option): copy.copy(option) for option in options.all_options}
+            group = copy.copy(options)
+            group.options = [copies[id(option)] for option in options.options]
+            group.all_options = [copies[id(option)] for option in options.all_options]
+            active_options.append(group)
+        return active_options
+
+    def _run_container(self, container_module: _ContainerModule) -> dict[str, t.Any]:
+        name = container_module.params["name"]
+        cm: ContainerManager | None = None
+        try:
+            cm = ContainerManager(
+                t.cast("AnsibleModule", container_module),
+                t.cast("EngineDriver", self.engine_driver),
+                self.client,
+                self._copy_active_options(),
+            )
+            cm.run()
+            result = dict(cm.results)
+        except ContainerError as exc:
+            result = dict(cm.results) if cm else {"changed": False}
+            result.update(exc.kwargs)
+            result["failed"] = True
+            result["msg"] = exc.msg
+        except Exception as exc:  # pylint: disable=broad-exception-caught
+            result = dict(cm.results) if cm else {"changed": False}
+            result["failed"] = True
+            result["msg"] = f"Error while managing container {name}: {exc}"
+            result["exception"] = traceback.format_exc()
+        result["name"] = name
+        return sanitize_result(result)
+
+    def run(self) -> None:
+        container_modules = [
+            self._validate(index, definition)
+            for index, definition in enumerate(self.module.params["containers"])
+        ]
+        names = [
+            container_module.params["name"] for container_module in container_modules
+        ]
+        duplicates = sorted({name for name in names if names.count(name) > 1})
+        if duplicates:
+            self.module.fail_json(
+                msg=f"Containers must not be specified more than once: {', '.join(duplicates)}"
+            )
+
+        with ThreadPoolExecutor(max_workers=self.parallelism) as executor:
+            results = list(executor.map(self._run_container, container_modules))
+
+        self.results["containers"] = results
+        self.results["changed"] = any(result.get("changed") for result in results)
+
+
+def run_bulk_module(engine_driver: EngineDriver) -> None:
+    spec = engine_driver.collect_options(
+        CONTAINER_ARGUMENT_SPEC,
+        required_if=CONTAINER_REQUIRED_IF,
+    )
+    module, client = engine_driver.setup_bulk(
+        argument_spec={
+            "containers": {"type": "list", "elements": "dict", "required": True},
+            "defaults": {"type": "dict", "default": {}},
+            "parallelism": {"type": "int", "default": 4},
+        },
+    )
+
+    def execute() -> t.NoReturn:
+        bm = BulkContainerManager(module, engine_driver, client, spec)
+        bm.run()
+        failed = [
+            result["name"]
+            for result in bm.results["containers"]
+            if result.get("failed")
+        ]
+        if failed:
+            module.fail_json(
+                msg=f"Failed to manage the containers {', '.join(failed)}",
+                **bm.results,
+            )
+        module.exit_json(**bm.results)
+
+    engine_driver.run(execute, client)
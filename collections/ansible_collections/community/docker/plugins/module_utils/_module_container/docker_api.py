@@ -9,6 +9,7 @@
 from __future__ import annotations
 
 import json
+import threading
 import traceback
 import typing as t
 
@@ -101,6 +102,8 @@ from ansible_collections.community.docker.plugins.module_utils._module_container
     OPTION_VOLUMES_FROM,
     OPTION_WORKING_DIR,
     OPTIONS,
+    ContainerError,
+    ContainerOptionsSpec,
     Engine,
     EngineDriver,
     _is_volume_permissions,
@@ -130,10 +133,17 @@ if t.TYPE_CHECKING:
 _SENTRY: Sentry = object()
 
 
+class _BulkDockerClient(AnsibleDockerClient):
+    def fail(self, msg: str, **kwargs: t.Any) -> t.NoReturn:
+        if threading.current_thread() is not threading.main_thread():
+            raise ContainerError(msg, **kwargs)
+        super().fail(msg, **kwargs)
+
+
 class DockerAPIEngineDriver(EngineDriver[AnsibleDockerClient]):
     name = "docker_api"
 
-    def setup(
+    def collect_options(
         self,
         argument_spec: dict[str, t.Any],
         mutually_exclusive: Sequence[Sequence[str]] | None = None,
@@ -147,51 +157,97 @@ class DockerAPIEngineDriver(EngineDriver[AnsibleDockerClient]):
             | None
         ) = None,
         required_by: dict[str, Sequence[str]] | None = None,
-    ) -> tuple[AnsibleModule, list[OptionGroup], AnsibleDockerClient]:
-        argument_spec = dict(argument_spec or {})
-        mutually_exclusive = list(mutually_exclusive or [])
-        required_together = list(required_together or [])
-        required_one_of = list(required_one_of or [])
-        required_if = list(required_if or [])
-        required_by = dict(required_by or {})
-
-        active_options = []
-        option_minimal_versions = {}
+    ) -> ContainerOptionsSpec:
+        spec = ContainerOptionsSpec(
+            argument_spec,
+            mutually_exclusive=mutually_exclusive,
+            required_together=required_together,
+            required_one_of=required_one_of,
+            required_if=required_if,
+            required_by=required_by,
+        )
         for options in OPTIONS:
             if not options.supports_engine(self.name):
                 continue
 
-            mutually_exclusive.extend(options.ansible_mutually_exclusive)
-            required_together.extend(options.ansible_required_together)
-            required_one_of.extend(options.ansible_required_one_of)
-            required_if.extend(options.ansible_required_if)
-            required_by.update(options.ansible_required_by)
-            argument_spec.update(options.argument_spec)
+            spec.add_options(options)
 
             engine = options.get_engine(self.name)
             if engine.min_api_version is not None:
                 for option in options.options:
                     if not option.not_an_ansible_option:
-                        option_minimal_versions[option.name] = {
+                        spec.option_minimal_versions[option.name] = {
                             "docker_api_version": engine.min_api_version
                         }
             if engine.extra_option_minimal_versions:
-                option_minimal_versions.update(engine.extra_option_minimal_versions)
+                spec.option_minimal_versions.update(
+                    engine.extra_option_minimal_versions
+                )
+        return spec
 
-            active_options.append(options)
+    def setup(
+        self,
+        argument_spec: dict[str, t.Any],
+        mutually_exclusive: Sequence[Sequence[str]] | None = None,
+        required_together: Sequence[Sequence[str]] | None = None,
+        required_one_of: Sequence[Sequence[str]] | None = None,
+        required_if: (
+            Sequence[
+                tuple[str, t.Any, Sequence[str]]
+                | tuple[str, t.Any, Sequence[str], bool]
+            ]
+            | None
+        ) = None,
+        required_by: dict[str, Sequence[str]] | None = None,
+    ) -> tuple[AnsibleModule, list[OptionGroup], AnsibleDockerClient]:
+        spec = self.collect_options(
+            argument_spec,
+            mutually_exclusive=mutually_exclusive,
+            required_together=required_together,
+            required_one_of=required_one_of,
+            required_if=required_if,
+            required_by=required_by,
+        )
 
         client = AnsibleDockerClient(
+            argument_spec=spec.argument_spec,
+            mutually_exclusive=spec.mutually_exclusive,
+            required_together=spec.required_together,
+            required_one_of=spec.required_one_of,
+            required_if=spec.required_if,
+            required_by=spec.required_by,
+            option_minimal_versions=spec.option_minimal_versions,
+            supports_check_mode=True,
+        )
+
+        return client.module, spec.active_options, client
+
+    def setup_bulk(
+        self,
+        argument_spec: dict[str, t.Any],
+        mutually_exclusive: Sequence[Sequence[str]] | None = None,
+        required_together: Sequence[Sequence[str]] | None = None,
+        required_one_of: Sequence[Sequence[str]] | None = None,
+        required_if: (
+            Sequence[
+                tuple[str, t.Any, Sequence[str]]
+                | tuple[str, t.Any, Sequence[str], bool]
+            ]
+            | None
+        ) = None,
+        required_by: dict[str, Sequence[str]] | None = None,
+    ) -> tuple[AnsibleModule, AnsibleDockerClient]:
+        client = _BulkDockerClient(
             argument_spec=argument_spec,
             mutually_exclusive=mutually_exclusive,
             required_together=required_together,
             required_one_of=required_one_of,
             required_if=required_if,
             required_by=required_by,
-            option_minimal_versions=option_minimal_versions,
             supports_check_mode=True,
         )
 
-        return client.module, active_options, client
+        return client.module, client
 
     def get_host_info(self, client: AnsibleDockerClient) -> dict[str, t.Any]:
         return client.info()
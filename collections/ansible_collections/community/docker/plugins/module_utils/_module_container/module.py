@@ -1279,68 +1279,73 @@ class ContainerManager(DockerBaseClass, t.Generic[Client]):
                 self.fail(f"Error stopping container {container_id}: {exc}")
 
 
+CONTAINER_ARGUMENT_SPEC: dict[str, t.Any] = {
+    "cleanup": {"type": "bool", "default": False},
+    "comparisons": {"type": "dict"},
+    "container_default_behavior": {
+        "type": "str",
+        "default": "no_defaults",
+        "choices": ["compatibility", "no_defaults"],
+    },
+    "command_handling": {
+        "type": "str",
+        "choices": ["compatibility", "correct"],
+        "default": "correct",
+    },
+    "default_host_ip": {"type": "str"},
+    "force_kill": {"type": "bool", "default": False, "aliases": ["forcekill"]},
+    "image": {"type": "str"},
+    "image_comparison": {
+        "type": "str",
+        "choices": ["desired-image", "current-image"],
+        "default": "desired-image",
+    },
+    "image_label_mismatch": {
+        "type": "str",
+        "choices": ["ignore", "fail"],
+        "default": "ignore",
+    },
+    "image_name_mismatch": {
+        "type": "str",
+        "choices": ["ignore", "recreate"],
+        "default": "recreate",
+    },
+    "keep_volumes": {"type": "bool", "default": True},
+    "kill_signal": {"type": "str"},
+    "name": {"type": "str", "required": True},
+    "networks_cli_compatible": {"type": "bool", "default": True},
+    "output_logs": {"type": "bool", "default": False},
+    "paused": {"type": "bool"},
+    "pull": {
+        "type": "raw",
+        "choices": ["never", "missing", "always", True, False],
+        "default": "missing",
+    },
+    "pull_check_mode_behavior": {
+        "type": "str",
+        "choices": ["image_not_present", "always"],
+        "default": "image_not_present",
+    },
+    "recreate": {"type": "bool", "default": False},
+    "removal_wait_timeout": {"type": "float"},
+    "restart": {"type": "bool", "default": False},
+    "state": {
+        "type": "str",
+        "default": "started",
+        "choices": ["absent", "present", "healthy", "started", "stopped"],
+    },
+    "healthy_wait_timeout": {"type": "float", "default": 300},
+}
+
+CONTAINER_REQUIRED_IF: list[tuple[str, t.Any, list[str]]] = [
+    ("state", "present", ["image"]),
+]
+
+
 def run_module(engine_driver: EngineDriver) -> None:
     module, active_options, client = engine_driver.setup(
-        argument_spec={
-            "cleanup": {"type": "bool", "default": False},
-            "comparisons": {"type": "dict"},
-            "container_default_behavior": {
-                "type": "str",
-                "default": "no_defaults",
-                "choices": ["compatibility", "no_defaults"],
-            },
-            "command_handling": {
-                "type": "str",
-                "choices": ["compatibility", "correct"],
-                "default": "correct",
-            },
-            "default_host_ip": {"type": "str"},
-            "force_kill": {"type": "bool", "default": False, "aliases": ["forcekill"]},
-            "image": {"type": "str"},
-            "image_comparison": {
-                "type": "str",
-                "choices": ["desired-image", "current-image"],
-                "default": "desired-image",
-            },
-            "image_label_mismatch": {
-                "type": "str",
-                "choices": ["ignore", "fail"],
-                "default": "ignore",
-            },
-            "image_name_mismatch": {
-                "type": "str",
-                "choices": ["ignore", "recreate"],
-                "default": "recreate",
-            },
-            "keep_volumes": {"type": "bool", "default": True},
-            "kill_signal": {"type": "str"},
-            "name": {"type": "str", "required": True},
-            "networks_cli_compatible": {"type": "bool", "default": True},
-            "output_logs": {"type": "bool", "default": False},
-            "paused": {"type": "bool"},
-            "pull": {
-                "type": "raw",
-                "choices": ["never", "missing", "always", True, False],
-                "default": "missing",
-            },
-            "pull_check_mode_behavior": {
-                "type": "str",
-                "choices": ["image_not_present", "always"],
-                "default": "image_not_present",
-            },
-            "recreate": {"type": "bool", "default": False},
-            "removal_wait_timeout": {"type": "float"},
-            "restart": {"type": "bool", "default": False},
-            "state": {
-                "type": "str",
-                "default": "started",
-                "choices": ["absent", "present", "healthy", "started", "stopped"],
-            },
-            "healthy_wait_timeout": {"type": "float", "default": 300},
-        },
-        required_if=[
-            ("state", "present", ["image"]),
-        ],
+        argument_spec=CONTAINER_ARGUMENT_SPEC,
+        required_if=CONTAINER_REQUIRED_IF,
     )
 
     def execute() -> t.NoReturn:
@@ -558,8 +558,9 @@ class ServicesManager(BaseComposeManager):
     def cmd_up(self) -> dict[str, t.Any]:
         result: dict[str, t.Any] = {}
         args = self.get_up_cmd(self.check_mode)
-        rc, stdout, stderr = self.client.call_cli(*args, cwd=self.project_src)
-        events = self.parse_events(stderr, dry_run=self.check_mode, nonzero_rc=rc != 0)
+        rc, stdout, stderr, events = self.call_cli_with_events(
+            args, dry_run=self.check_mode
+        )
         self.emit_warnings(events)
         self.update_result(
             result,
@@ -596,9 +597,8 @@ class ServicesManager(BaseComposeManager):
         result: dict[str, t.Any] = {}
         # Make sure all containers are created
         args_1 = self.get_up_cmd(self.check_mode, no_start=True)
-        rc_1, stdout_1, stderr_1 = self.client.call_cli(*args_1, cwd=self.project_src)
-        events_1 = self.parse_events(
-            stderr_1, dry_run=self.check_mode, nonzero_rc=rc_1 != 0
+        rc_1, stdout_1, stderr_1, events_1 = self.call_cli_with_events(
+            args_1, dry_run=self.check_mode
         )
         self.emit_warnings(events_1)
         self.update_result(
@@ -613,11 +613,8 @@ class ServicesManager(BaseComposeManager):
         if not is_failed_1 and not self._are_containers_stopped():
             # Make sure all containers are stopped
             args_2 = self.get_stop_cmd(self.check_mode)
-            rc_2, stdout_2, stderr_2 = self.client.call_cli(
-                *args_2, cwd=self.project_src
-            )
-            events_2 = self.parse_events(
-                stderr_2, dry_run=self.check_mode, nonzero_rc=rc_2 != 0
+            rc_2, stdout_2, stderr_2, events_2 = self.call_cli_with_events(
+                args_2, dry_run=self.check_mode
             )
             self.emit_warnings(events_2)
             self.update_result(result, events_2, stdout_2, stderr_2)
@@ -652,8 +649,9 @@ class ServicesManager(BaseComposeManager):
     def cmd_restart(self) -> dict[str, t.Any]:
         result: dict[str, t.Any] = {}
         args = self.get_restart_cmd(self.check_mode)
-        rc, stdout, stderr = self.client.call_cli(*args, cwd=self.project_src)
-        events = self.parse_events(stderr, dry_run=self.check_mode, nonzero_rc=rc != 0)
+        rc, stdout, stderr, events = self.call_cli_with_events(
+            args, dry_run=self.check_mode
+        )
         self.emit_warnings(events)
         self.update_result(result, events, stdout, stderr)
         self.update_failed(result, events, args, stdout, stderr, rc)
@@ -679,8 +677,9 @@ class ServicesManager(BaseComposeManager):
     def cmd_down(self) -> dict[str, t.Any]:
         result: dict[str, t.Any] = {}
         args = self.get_down_cmd(self.check_mode)
-        rc, stdout, stderr = self.client.call_cli(*args, cwd=self.project_src)
-        events = self.parse_events(stderr, dry_run=self.check_mode, nonzero_rc=rc != 0)
+        rc, stdout, stderr, events = self.call_cli_with_events(
+            args, dry_run=self.check_mode
+        )
         self.emit_warnings(events)
         self.update_result(result, events, stdout, stderr)
         self.update_failed(result, events, args, stdout, stderr, rc)
@@ -164,8 +164,9 @@ class PullManager(BaseComposeManager):
     def run(self) -> dict[str, t.Any]:
         result: dict[str, t.Any] = {}
         args = self.get_pull_cmd(self.check_mode)
-        rc, stdout, stderr = self.client.call_cli(*args, cwd=self.project_src)
-        events = self.parse_events(stderr, dry_run=self.check_mode, nonzero_rc=rc != 0)
+        rc, stdout, stderr, events = self.call_cli_with_events(
+            args, dry_run=self.check_mode
+        )
         self.emit_warnings(events)
         self.update_result(
             result,
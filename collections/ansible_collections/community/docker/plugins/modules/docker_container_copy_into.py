@@ -14,7 +14,7 @@ short_description: Copy a file into a Docker container
 version_added: 3.4.0
 
 description:
-  - Copy a file into a Docker container.
+  - Copy a file or a directory tree into a Docker container.
   - Similar to C(docker cp).
   - To copy files in a non-running container, you must provide the O(owner_id) and O(group_id) options. This is also necessary
     if the container does not contain a C(/bin/sh) shell with an C(id) tool.
@@ -25,6 +25,7 @@ attributes:
     support: full
     details:
       - Additional data will need to be transferred to compute diffs.
+      - No diff is computed when copying a directory tree.
       - The module uses R(the MAX_FILE_SIZE_FOR_DIFF ansible-core configuration,MAX_FILE_SIZE_FOR_DIFF) to determine for how
         large files diffs should be computed.
   idempotent:
@@ -40,7 +41,11 @@ options:
     required: true
   path:
     description:
-      - Path to a file on the managed node.
+      - Path to a file or a directory on the managed node.
+      - If this is a directory, its content is synchronized into the directory O(container_path), which is created if it
+        does not exist. Only the files which differ are uploaded, in a single archive. Files that only exist in the container
+        are kept. Symbolic links in the source tree are always followed, O(follow), O(local_follow), and O(compare) are ignored,
+        and files are always compared as if O(compare=checksum).
       - Mutually exclusive with O(content). One of O(content) and O(path) is required.
     type: path
   content:
@@ -122,6 +127,22 @@ options:
         on the filesystem object in the container, and if everything seems to match will download the file from the container
         to compare it to the file to upload.
     type: bool
+  compare:
+    description:
+      - Determines how the content of a regular file that exists in the container is compared to the file to upload, when
+        the idempotency checks are performed (see O(force)).
+    type: str
+    choices:
+      content:
+        - Download the file from the container and compare it byte by byte.
+      checksum:
+        - Compare owner, group, mode, size, and the modification time for O(path). Files uploaded by this module keep the
+          modification time of the source file. If the modification time differs, the SHA-256 digest of the file is computed in the
+          container and compared to the one of the file to upload. The file is not downloaded.
+        - This requires the container to be running and to contain C(/bin/sh), C(find), C(stat), and C(sha256sum).
+        - In diff mode, the file still has to be downloaded to compute the diff.
+    default: content
+    version_added: 5.1.0
 
 extends_documentation_fragment:
   - community.docker._docker.api_documentation
@@ -152,6 +173,21 @@ EXAMPLES = r"""
     group_id: 0 # root
     mode: "0755" # readable and executable by all users, writable by root
     mode_parse: modern # ensure that strings passed for 'mode' are passed as octal numbers
+
+- name: Copy a large file, without downloading it to check whether it changed
+  community.docker.docker_container_copy_into:
+    container: mydata
+    path: /home/user/bin/tool
+    container_path: /usr/local/bin/tool
+    compare: checksum
+
+- name: Synchronize a configuration directory into the container
+  community.docker.docker_container_copy_into:
+    container: ceph-mon
+    path: /etc/ceph/
+    container_path: /etc/ceph
+    owner_id: 167
+    group_id: 167
 """
 
 RETURN = r"""
@@ -161,11 +197,22 @@ container_path:
     - Can only be different from O(container_path) when O(follow=true).
   type: str
   returned: success
+changed_files:
+  description:
+    - The files which have been (or would have been in check mode) uploaded when O(path) is a directory.
+  type: list
+  elements: str
+  returned: success and O(path) is a directory
+  sample:
+    - /etc/ceph/ceph.conf
+  version_added: 5.1.0
 """
 
 import base64
+import hashlib
 import io
 import os
+import posixpath
 import stat
 import traceback
 import typing as t
@@ -186,11 +233,14 @@ from ansible_collections.community.docker.plugins.module_utils._copy import (
     DockerFileCopyError,
     DockerFileNotFound,
     DockerUnexpectedError,
+    checksum_files,
     determine_user_group,
     fetch_file_ex,
     put_file,
     put_file_content,
+    put_files,
     stat_file,
+    stat_tree,
 )
 from ansible_collections.community.docker.plugins.module_utils._scramble import (
     generate_insecure_key,
@@ -199,6 +249,7 @@ from ansible_collections.community.docker.plugins.module_utils._scramble import
 
 if t.TYPE_CHECKING:
     import tarfile
+    from collections.abc import Callable
 
 
 def are_fileobjs_equal(f1: t.IO[bytes], f2: t.IO[bytes]) -> bool:
@@ -488,6 +539,43 @@ def copy_dst_to_src(diff: dict[str, t.Any] | None) -> None:
             diff.pop(to)
 
 
+def is_checksum_idempotent(
+    client: AnsibleDockerClient,
+    container: str,
+    container_path: str,
+    owner_id: int,
+    group_id: int,
+    mode: int,
+    size: int,
+    mtime: float | None,
+    get_checksum: Callable[[], str],
+) -> bool:
+    """Compare a regular file in the container without transferring it.
+
+    Owner, group, mode, and size are compared first. If ``mtime`` is provided and
+    matches the modification time of the file in the container, the file is assumed
+    to be up-to-date (uploaded files keep their modification time). Otherwise the
+    SHA-256 digest of the file is computed inside the container and compared to
+    ``get_checksum()``.
+    """
+    entry = stat_tree(client, container, container_path).get(container_path)
+    if entry is None or entry["type"] != "file":
+        return False
+    if any(
+        [
+            entry["mode"] != mode,
+            entry["uid"] != owner_id,
+            entry["gid"] != group_id,
+            entry["size"] != size,
+        ]
+    ):
+        return False
+    if mtime is not None and entry["mtime"] == int(mtime):
+        return True
+    checksums = checksum_files(client, container, [container_path])
+    return checksums.get(container_path) == get_checksum()
+
+
 def is_file_idempotent(
     client: AnsibleDockerClient,
     container: str,
@@ -501,6 +589,7 @@ def is_file_idempotent(
     force: bool | None = False,
     diff: dict[str, t.Any] | None = None,
     max_file_size_for_diff: int = 1,
+    compare: str = "content",
 ) -> tuple[str, int, bool]:
     # Retrieve information of local file
     try:
@@ -668,6 +757,33 @@ def is_file_idempotent(
         )
         return container_path, mode, False
 
+    # Compare the digest computed in the container instead of fetching the file
+    if compare == "checksum" and stat.S_ISREG(file_stat.st_mode):
+        retrieve_diff(
+            client,
+            container,
+            container_path,
+            follow_links,
+            diff,
+            max_file_size_for_diff,
+            regular_stat,
+            link_target,
+        )
+        is_equal = is_checksum_idempotent(
+            client,
+            container,
+            container_path,
+            owner_id,
+            group_id,
+            mode,
+            file_stat.st_size,
+            file_stat.st_mtime,
+            lambda: client.module.sha256(managed_path),
+        )
+        if is_equal:
+            copy_dst_to_src(diff)
+        return container_path, mode, is_equal
+
     # Fetch file from container
     def process_none(in_path: str) -> tuple[str, int, bool]:
         return container_path, mode, False
@@ -747,6 +863,7 @@ def copy_file_into_container(
     force: bool | None = False,
     do_diff: bool = False,
     max_file_size_for_diff: int = 1,
+    compare: str = "content",
 ) -> t.NoReturn:
     diff: dict[str, t.Any] | None
     diff = {} if do_diff else None
@@ -764,6 +881,7 @@ def copy_file_into_container(
         force=force,
         diff=diff,
         max_file_size_for_diff=max_file_size_for_diff,
+        compare=compare,
     )
     changed = not idempotent
 
@@ -788,6 +906,128 @@ def copy_file_into_container(
     client.module.exit_json(**result)
 
 
+def collect_local_tree(managed_path: str) -> list[tuple[str, str, os.stat_result]]:
+    """Walk a local directory tree, following symbolic links.
+
+    Return a list of ``(relative_path, path, stat)`` tuples for the directory itself, all
+    directories, and all regular files below it. Parent directories come before their content.
+    """
+    result = [(".", managed_path, os.stat(managed_path))]
+    for root, dirs, files in os.walk(managed_path, followlinks=True):
+        dirs.sort()
+        for name in dirs + sorted(files):
+            path = os.path.join(root, name)
+            try:
+                file_stat = os.stat(path)
+            except OSError as exc:
+                raise DockerFileCopyError(
+                    f"Cannot stat local file {path}: {exc}"
+                ) from exc
+            if not stat.S_ISDIR(file_stat.st_mode) and not stat.S_ISREG(
+                file_stat.st_mode
+            ):
+                raise DockerFileCopyError(
+                    f"Local path {path} is not a directory or a regular file"
+                )
+            result.append((os.path.relpath(path, managed_path), path, file_stat))
+    return result
+
+
+def copy_tree_into_container(
+    client: AnsibleDockerClient,
+    container: str,
+    managed_path: str,
+    container_path: str,
+    owner_id: int,
+    group_id: int,
+    mode: int | None,
+    force: bool | None = False,
+) -> t.NoReturn:
+    local_tree = collect_local_tree(managed_path)
+    container_tree = stat_tree(client, container, container_path)
+
+    root = container_tree.get(container_path)
+    if root is not None and root["type"] != "directory":
+        raise DockerFileCopyError(
+            f"Container path {container_path} exists and is not a directory"
+        )
+
+    changed_paths: set[str] = set()
+    checksum_candidates: dict[str, str] = {}
+    for rel_path, path, file_stat in local_tree:
+        dest = posixpath.normpath(posixpath.join(container_path, rel_path))
+        entry = container_tree.get(dest)
+        if stat.S_ISDIR(file_stat.st_mode):
+            # Existing directories are left alone
+            if entry is None:
+                changed_paths.add(dest)
+            elif entry["type"] != "directory":
+                raise DockerFileCopyError(
+                    f"Container path {dest} exists and is not a directory"
+                )
+            continue
+        file_mode = stat.S_IMODE(file_stat.st_mode) if mode is None else mode
+        if entry is None or force:
+            changed_paths.add(dest)
+        elif force is False:
+            continue
+        elif any(
+            [
+                entry["type"] != "file",
+                entry["size"] != file_stat.st_size,
+                entry["mode"] != file_mode,
+                entry["uid"] != owner_id,
+                entry["gid"] != group_id,
+            ]
+        ):
+            changed_paths.add(dest)
+        elif entry["mtime"] != int(file_stat.st_mtime):
+            checksum_candidates[dest] = path
+
+    if checksum_candidates:
+        checksums = checksum_files(client, container, sorted(checksum_candidates))
+        for dest, path in checksum_candidates.items():
+            if checksums.get(dest) != client.module.sha256(path):
+                changed_paths.add(dest)
+
+    # Extract into the parent directory if the destination directory has to be created
+    if root is None:
+        out_dir, prefix = posixpath.split(container_path)
+    else:
+        out_dir, prefix = container_path, ""
+
+    files: list[tuple[str, str, int | None]] = []
+    changed_files = []
+    for rel_path, path, file_stat in local_tree:
+        dest = posixpath.normpath(posixpath.join(container_path, rel_path))
+        if dest not in changed_paths:
+            continue
+        is_dir = stat.S_ISDIR(file_stat.st_mode)
+        file_mode = stat.S_IMODE(file_stat.st_mode) if mode is None or is_dir else mode
+        files.append(
+            (posixpath.normpath(posixpath.join(prefix, rel_path)), path, file_mode)
+        )
+        if not is_dir:
+            changed_files.append(dest)
+
+    changed = bool(files)
+    if changed and not client.module.check_mode:
+        put_files(
+            client,
+            container,
+            out_dir=out_dir,
+            files=files,
+            user_id=owner_id,
+            group_id=group_id,
+        )
+
+    client.module.exit_json(
+        container_path=container_path,
+        changed=changed,
+        changed_files=changed_files,
+    )
+
+
 def is_content_idempotent(
     client: AnsibleDockerClient,
     container: str,
@@ -800,6 +1040,7 @@ def is_content_idempotent(
     force: bool | None = False,
     diff: dict[str, t.Any] | None = None,
     max_file_size_for_diff: int = 1,
+    compare: str = "content",
 ) -> tuple[str, int, bool]:
     if diff is not None:
         if len(content) > max_file_size_for_diff > 0:
@@ -920,6 +1161,33 @@ def is_content_idempotent(
         )
         return container_path, mode, False
 
+    # Compare the digest computed in the container instead of fetching the file
+    if compare == "checksum":
+        retrieve_diff(
+            client,
+            container,
+            container_path,
+            follow_links,
+            diff,
+            max_file_size_for_diff,
+            regular_stat,
+            link_target,
+        )
+        is_equal = is_checksum_idempotent(
+            client,
+            container,
+            container_path,
+            owner_id,
+            group_id,
+            mode,
+            len(content),
+            None,
+            lambda: hashlib.sha256(content).hexdigest(),
+        )
+        if is_equal:
+            copy_dst_to_src(diff)
+        return container_path, mode, is_equal
+
     # Fetch file from container
     def process_none(in_path: str) -> tuple[str, int, bool]:
         if diff is not None:
@@ -992,6 +1260,7 @@ def copy_content_into_container(
     force: bool | None = False,
     do_diff: bool = False,
     max_file_size_for_diff: int = 1,
+    compare: str = "content",
 ) -> t.NoReturn:
     diff: dict[str, t.Any] | None = {} if do_diff else None
 
@@ -1007,6 +1276,7 @@ def copy_content_into_container(
         force=force,
         diff=diff,
         max_file_size_for_diff=max_file_size_for_diff,
+        compare=compare,
     )
     changed = not idempotent
 
@@ -1066,6 +1336,11 @@ def main() -> None:
             "default": "legacy",
         },
         "force": {"type": "bool"},
+        "compare": {
+            "type": "str",
+            "choices": ["content", "checksum"],
+            "default": "content",
+        },
         "content": {"type": "str", "no_log": True},
         "content_is_b64": {"type": "bool", "default": False},
         # Undocumented parameters for use by the action plugin
@@ -1092,6 +1367,7 @@ def main() -> None:
     group_id: int | None = client.module.params["group_id"]
     mode: t.Any = client.module.params["mode"]
     force: bool | None = client.module.params["force"]
+    compare: str = client.module.params["compare"]
     content_str: str | None = client.module.params["content"]
     max_file_size_for_diff: int = client.module.params["_max_file_size_for_diff"] or 1
 
@@ -1143,6 +1419,18 @@ def main() -> None:
                 force=force,
                 do_diff=client.module._diff,
                 max_file_size_for_diff=max_file_size_for_diff,
+                compare=compare,
+            )
+        elif managed_path is not None and os.path.isdir(managed_path):
+            copy_tree_into_container(
+                client,
+                container,
+                managed_path,
+                container_path,
+                owner_id=owner_id,
+                group_id=group_id,
+                mode=mode,
+                force=force,
             )
         elif managed_path is not None:
             copy_file_into_container(
@@ -1158,6 +1446,7 @@ def main() -> None:
                 force=force,
                 do_diff=client.module._diff,
                 max_file_size_for_diff=max_file_size_for_diff,
+                compare=compare,
             )
         else:
             # Can happen if a user explicitly passes `content: null` or `path: null`...
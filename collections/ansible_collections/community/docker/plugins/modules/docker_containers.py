@@ -0,0 +1,173 @@
+#!/usr/bin/python
+#
+# Copyright (c) Ansible Project
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import annotations
+
+DOCUMENTATION = r"""
+module: docker_containers
+
+short_description: manage several Docker containers at once
+
+version_added: 5.1.0
+
+description:
+  - Manage the life cycle of several Docker containers in one module run.
+  - Every container is managed the same way the M(community.docker.docker_container) module manages a single container,
+    but the host information and the images are inspected only once for all containers, every image is pulled at most
+    once, and the containers are handled in parallel.
+  - Supports check mode. Run with C(--check) and C(--diff) to view config difference and list of actions to be taken.
+notes:
+  - The same notes as for M(community.docker.docker_container) apply. In particular, always specify B(all) options relevant
+    to a container, since it is recreated only from the options provided.
+  - Containers with different C(comparisons) are handled one group after another; only containers with the
+    same comparisons are handled in parallel.
+extends_documentation_fragment:
+  - community.docker._docker.api_documentation
+  - community.docker._attributes
+  - community.docker._attributes.actiongroup_docker
+
+attributes:
+  check_mode:
+    support: partial
+    details:
+      - When trying to pull an image, the module assumes this is never changed in check mode except when the image is not
+        present on the Docker daemon.
+  diff_mode:
+    support: full
+    details:
+      - The difference is returned for every container in RV(containers[].diff).
+  idempotent:
+    support: partial
+    details:
+      - If C(recreate=true) or C(restart=true) is used the module is not idempotent.
+
+options:
+  containers:
+    description:
+      - The containers to manage.
+      - Every element accepts the options of the M(community.docker.docker_container) module, except the options to connect
+        to the Docker daemon. The C(name) option is required.
+      - Every container must be specified only once.
+    type: list
+    elements: dict
+    required: true
+  defaults:
+    description:
+      - Options of the M(community.docker.docker_container) module used for all containers, unless the container specifies
+        them in O(containers).
+    type: dict
+    default: {}
+  parallelism:
+    description:
+      - The maximum number of containers which are created, updated, started, or stopped at the same time.
+    type: int
+    default: 4
+
+author:
+  - Felix Fontein (@felixfontein)
+
+requirements:
+  - "Docker API >= 1.25"
+"""
+
+EXAMPLES = r"""
+---
+- name: Run three sidecars with the same image and restart policy
+  community.docker.docker_containers:
+    defaults:
+      image: registry.example.com/sidecar:1.4
+      restart_policy: unless-stopped
+      networks:
+        - name: backend
+    containers:
+      - name: sidecar-metrics
+        env:
+          MODE: metrics
+      - name: sidecar-logs
+        env:
+          MODE: logs
+      - name: sidecar-old
+        state: absent
+
+- name: Stop all workers
+  community.docker.docker_containers:
+    containers:
+      - name: worker-1
+      - name: worker-2
+      - name: worker-3
+    defaults:
+      state: stopped
+"""
+
+RETURN = r"""
+containers:
+  description:
+    - The result for every container, in the order of O(containers).
+  returned: always
+  type: list
+  elements: dict
+  contains:
+    name:
+      description:
+        - The name of the container.
+      type: str
+      returned: always
+      sample: sidecar-metrics
+    changed:
+      description:
+        - Whether the container was changed.
+      type: bool
+      returned: always
+      sample: true
+    container:
+      description:
+        - Facts representing the current state of the container. Matches the docker inspection output.
+        - See the RV(community.docker.docker_container#module:container) return value of M(community.docker.docker_container).
+      type: dict
+      returned: success, unless the container is absent
+    status:
+      description:
+        - In case a container is started without detaching, this contains the exit code of the process in the container.
+      type: int
+      returned: when the container is started with C(state=started) and C(detach=false)
+    actions:
+      description:
+        - The actions taken for the container.
+      type: list
+      elements: dict
+      returned: in check mode, or when O(debug=true)
+    diff:
+      description:
+        - The differences of the container.
+      type: dict
+      returned: in diff mode, or when O(debug=true)
+    failed:
+      description:
+        - Whether managing the container failed.
+      type: bool
+      returned: when managing the container failed
+    msg:
+      description:
+        - The error message.
+      type: str
+      returned: when managing the container failed
+"""
+
+from ansible_collections.community.docker.plugins.module_utils._module_container.bulk import (
+    run_bulk_module,
+)
+from ansible_collections.community.docker.plugins.module_utils._module_container.docker_api import (
+    DockerAPIEngineDriver,
+)
+
+
+def main() -> None:
+    engine_driver = DockerAPIEngineDriver()
+    run_bulk_module(engine_driver)
+
+
+if __name__ == "__main__":
+    main()
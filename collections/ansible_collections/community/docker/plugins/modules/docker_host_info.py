@@ -102,6 +102,49 @@ options:
       - The output is a sum of images, volumes, containers and build cache.
     type: bool
     default: false
+  fields:
+    description:
+      - The keys to return for every listed object.
+      - If not specified for an object type, the keys described in O(verbose_output) are returned.
+      - Keys which are not present for an object are returned with value V(null).
+    type: dict
+    suboptions:
+      containers:
+        description:
+          - The keys to return for every container, for example V(Id), V(Names), and V(State).
+        type: list
+        elements: str
+      images:
+        description:
+          - The keys to return for every image, for example V(Id), V(RepoTags), and V(Size).
+        type: list
+        elements: str
+      networks:
+        description:
+          - The keys to return for every network, for example V(Id) and V(Name).
+        type: list
+        elements: str
+      volumes:
+        description:
+          - The keys to return for every volume, for example V(Name) and V(Mountpoint).
+        type: list
+        elements: str
+    version_added: 5.1.0
+  max_items:
+    description:
+      - The maximum number of objects returned for each of O(containers), O(images), O(networks), and O(volumes).
+      - For containers, the limit is applied by the Docker daemon.
+    type: int
+    version_added: 5.1.0
+  summary_only:
+    description:
+      - Instead of returning the lists of objects, only return the number of objects and their total size in RV(summary).
+      - If O(disk_usage=true), RV(disk_usage) only contains the number and the total size of the images, containers, volumes,
+        and build cache objects in addition to C(LayersSize).
+      - O(fields), O(max_items), and O(verbose_output) are ignored for the objects summarized.
+    type: bool
+    default: false
+    version_added: 5.1.0
   verbose_output:
     description:
       - When set to V(true) and O(networks), O(volumes), O(images), O(containers), or O(disk_usage) is set to V(true) then
@@ -157,6 +200,27 @@ EXAMPLES = r"""
         - key2=value2
   register: result
 
+- name: Get info on docker host and list the ID and the tags of the first 100 dangling images
+  community.docker.docker_host_info:
+    images: true
+    images_filters:
+      dangling: true
+    fields:
+      images:
+        - Id
+        - RepoTags
+    max_items: 100
+  register: result
+
+- name: Count the containers and images, and sum up the disk usage
+  community.docker.docker_host_info:
+    containers: true
+    containers_all: true
+    images: true
+    disk_usage: true
+    summary_only: true
+  register: result
+
 - name: Show host information
   ansible.builtin.debug:
     var: result.host_info
@@ -208,6 +272,23 @@ disk_usage:
       description for O(verbose_output).
   returned: When O(disk_usage=true)
   type: dict
+summary:
+  description:
+    - The number of listed objects for every object type, and their total size.
+    - The size is only returned for images, and is the sum of the sizes of the images.
+    - For containers, the number of containers per state is returned in C(states).
+  returned: When O(summary_only=true)
+  type: dict
+  sample:
+    containers:
+      count: 3
+      states:
+        running: 2
+        exited: 1
+    images:
+      count: 12
+      size: 1234567890
+  version_added: 5.1.0
 """
 
 import traceback
@@ -237,6 +318,11 @@ class DockerHostManager(DockerBaseClass):
         self.client = client
         self.results = results
         self.verbose_output = self.client.module.params["verbose_output"]
+        self.fields = self.client.module.params["fields"] or {}
+        self.max_items = self.client.module.params["max_items"]
+        self.summary_only = self.client.module.params["summary_only"]
+        if self.max_items is not None and self.max_items < 0:
+            self.client.fail("max_items must not be negative")
 
         listed_objects = ["volumes", "networks", "containers", "images"]
 
@@ -255,9 +341,17 @@ class DockerHostManager(DockerBaseClass):
                 filters = clean_dict_booleans_for_docker_api(
                     client.module.params.get(filter_name), allow_sequences=True
                 )
-                self.results[returned_name] = self.get_docker_items_list(
-                    docker_object, filters
-                )
+                if self.summary_only:
+                    self.results.setdefault("summary", {})[docker_object] = (
+                        get_docker_items_summary(
+                            docker_object,
+                            self.list_docker_items(docker_object, filters),
+                        )
+                    )
+                else:
+                    self.results[returned_name] = self.get_docker_items_list(
+                        docker_object, filters
+                    )
 
     def get_docker_host_info(self) -> dict[str, t.Any]:
         try:
@@ -267,40 +361,25 @@ class DockerHostManager(DockerBaseClass):
 
     def get_docker_disk_usage_facts(self) -> dict[str, t.Any]:
         try:
+            if self.summary_only:
+                return get_docker_disk_usage_summary(self.client.df())
             if self.verbose_output:
                 return self.client.df()
             return {"LayersSize": self.client.df()["LayersSize"]}
         except APIError as exc:
             self.client.fail(f"Error inspecting docker host: {exc}")
 
-    def get_docker_items_list(
+    def list_docker_items(
         self,
         docker_object: str,
         filters: dict[str, t.Any] | None = None,
-        verbose: bool = False,
+        limit: int | None = None,
     ) -> list[dict[str, t.Any]]:
         items = []
-
-        header_containers = [
-            "Id",
-            "Image",
-            "Command",
-            "Created",
-            "Status",
-            "Ports",
-            "Names",
-        ]
-        header_volumes = ["Driver", "Name"]
-        header_images = ["Id", "RepoTags", "Created", "Size"]
-        header_networks = ["Id", "Driver", "Name", "Scope"]
-
-        filter_arg = {}
-        if filters:
-            filter_arg["filters"] = filters
         try:
             if docker_object == "containers":
                 params = {
-                    "limit": -1,
+                    "limit": -1 if limit is None else limit,
                     "all": 1 if self.client.module.params["containers_all"] else 0,
                     "size": 0,
                     "trunc_cmd": 0,
@@ -327,6 +406,37 @@ class DockerHostManager(DockerBaseClass):
             self.client.fail(
                 f"Error inspecting docker host for object '{docker_object}': {exc}"
             )
+        if limit is not None:
+            # Only the container list can be limited by the daemon
+            del items[limit:]
+        return items
+
+    def get_docker_items_list(
+        self,
+        docker_object: str,
+        filters: dict[str, t.Any] | None = None,
+        verbose: bool = False,
+    ) -> list[dict[str, t.Any]]:
+        items = self.list_docker_items(docker_object, filters, limit=self.max_items)
+
+        header_containers = [
+            "Id",
+            "Image",
+            "Command",
+            "Created",
+            "Status",
+            "Ports",
+            "Names",
+        ]
+        header_volumes = ["Driver", "Name"]
+        header_images = ["Id", "RepoTags", "Created", "Size"]
+        header_networks = ["Id", "Driver", "Name", "Scope"]
+
+        if self.fields.get(docker_object) is not None:
+            return [
+                {key: item.get(key) for key in self.fields[docker_object]}
+                for item in items
+            ]
 
         if self.verbose_output:
             return items
@@ -352,6 +462,47 @@ class DockerHostManager(DockerBaseClass):
         return items_list
 
 
+def get_docker_items_summary(
+    docker_object: str, items: list[dict[str, t.Any]]
+) -> dict[str, t.Any]:
+    summary: dict[str, t.Any] = {"count": len(items)}
+    if docker_object == "images":
+        summary["size"] = sum(item.get("Size") or 0 for item in items)
+    elif docker_object == "containers":
+        states: dict[str, int] = {}
+        for item in items:
+            state = item.get("State") or "unknown"
+            states[state] = states.get(state, 0) + 1
+        summary["states"] = states
+    return summary
+
+
+def _summarize_sizes(sizes: list[int | None]) -> dict[str, int]:
+    # Sizes that could not be determined are reported as -1
+    return {"count": len(sizes), "size": sum(max(size or 0, 0) for size in sizes)}
+
+
+def get_docker_disk_usage_summary(df: dict[str, t.Any]) -> dict[str, t.Any]:
+    return {
+        "LayersSize": df["LayersSize"],
+        "images": _summarize_sizes(
+            [image.get("Size") for image in df.get("Images") or []]
+        ),
+        "containers": _summarize_sizes(
+            [container.get("SizeRw") for container in df.get("Containers") or []]
+        ),
+        "volumes": _summarize_sizes(
+            [
+                (volume.get("UsageData") or {}).get("Size")
+                for volume in df.get("Volumes") or []
+            ]
+        ),
+        "build_cache": _summarize_sizes(
+            [cache.get("Size") for cache in df.get("BuildCache") or []]
+        ),
+    }
+
+
 def main() -> None:
     argument_spec = {
         "containers": {"type": "bool", "default": False},
@@ -365,6 +516,17 @@ def main() -> None:
         "volumes_filters": {"type": "dict"},
         "disk_usage": {"type": "bool", "default": False},
         "verbose_output": {"type": "bool", "default": False},
+        "fields": {
+            "type": "dict",
+            "options": {
+                "containers": {"type": "list", "elements": "str"},
+                "images": {"type": "list", "elements": "str"},
+                "networks": {"type": "list", "elements": "str"},
+                "volumes": {"type": "list", "elements": "str"},
+            },
+        },
+        "max_items": {"type": "int"},
+        "summary_only": {"type": "bool", "default": False},
     }
 
     client = AnsibleDockerClient(
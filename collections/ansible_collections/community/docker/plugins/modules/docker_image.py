@@ -170,11 +170,33 @@ options:
   archive_path:
     description:
       - Use with O(state=present) to archive an image to a C(.tar) file.
+      - The archive is compressed on the fly according to O(archive_compression).
     type: path
+  archive_compression:
+    description:
+      - Compression of the archive written to O(archive_path).
+      - If not specified, it is determined from the extension of O(archive_path). V(gzip) is used for C(.gz) and C(.tgz),
+        V(zstd) for C(.zst) and C(.zstd), and V(none) otherwise.
+      - V(zstd) requires Python 3.14 or newer, or the L(zstandard,https://pypi.org/project/zstandard/) Python library.
+      - An existing archive that contains the same image but uses a different compression is overwritten.
+    type: str
+    choices:
+      - none
+      - gzip
+      - zstd
+    version_added: 5.1.0
+  archive_compression_level:
+    description:
+      - Compression level used for O(archive_compression=gzip) (V(0) to V(9)) and O(archive_compression=zstd) (V(1) to V(22)).
+      - If not specified, V(9) is used for gzip and the library default for zstd.
+    type: int
+    version_added: 5.1.0
   load_path:
     description:
       - Use with O(state=present) to load an image from a C(.tar) file.
       - Set O(source=load) if you want to load the image.
+      - The archive can be compressed with gzip, bzip2, xz, or zstd. It is decompressed on the fly, without temporary files.
+        zstd requires Python 3.14 or newer, or the L(zstandard,https://pypi.org/project/zstandard/) Python library.
     type: path
   force_source:
     description:
@@ -319,6 +341,13 @@ EXAMPLES = r"""
     archive_path: my_sinatra.tar
     source: local
 
+- name: Archive image with zstd compression
+  community.docker.docker_image:
+    name: quay.io/ceph/ceph
+    tag: v18
+    archive_path: /srv/images/ceph-v18.tar.zst
+    source: local
+
 - name: Load image from archive and push to a private registry
   community.docker.docker_image:
     name: localhost:5000/myimages/sinatra
@@ -370,6 +399,7 @@ import os
 import traceback
 import typing as t
 
+from ansible.module_utils.basic import missing_required_lib
 from ansible.module_utils.common.text.converters import to_text
 from ansible.module_utils.common.text.formatters import human_to_bytes
 
@@ -398,9 +428,15 @@ from ansible_collections.community.docker.plugins.module_utils._common_api impor
     RequestException,
 )
 from ansible_collections.community.docker.plugins.module_utils._image_archive import (
+    HAS_ZSTD,
+    ZSTD_IMPORT_ERROR,
     ImageArchiveInvalidException,
     api_image_id,
     archived_image_manifest,
+    compression_from_path,
+    detect_archive_compression,
+    open_archive_for_load,
+    open_archive_writer,
 )
 from ansible_collections.community.docker.plugins.module_utils._util import (
     DockerBaseClass,
@@ -458,6 +494,12 @@ class ImageManager(DockerBaseClass):
         build: dict[str, t.Any] = parameters["build"] or {}
         pull: dict[str, t.Any] = parameters["pull"] or {}
         self.archive_path: str | None = parameters["archive_path"]
+        self.archive_compression: str | None = parameters["archive_compression"]
+        if self.archive_path and self.archive_compression is None:
+            self.archive_compression = compression_from_path(self.archive_path)
+        self.archive_compression_level: int | None = parameters[
+            "archive_compression_level"
+        ]
         self.cache_from: list[str] | None = build.get("cache_from")
         self.container_limits: dict[str, t.Any] | None = build.get("container_limits")
         if self.container_limits and "memory" in self.container_limits:
@@ -512,6 +554,10 @@ class ImageManager(DockerBaseClass):
                 self.tag = repo_tag
 
         # Sanity check: fail early when we know that something will fail later
+        if self.archive_path and self.archive_compression == "zstd" and not HAS_ZSTD:
+            self.client.fail(
+                missing_required_lib("zstandard"), exception=ZSTD_IMPORT_ERROR
+            )
         if self.repository and is_image_name_id(self.repository):
             self.fail(f"`repository` must not be an image ID; got: {self.repository}")
         if not self.repository and self.push and is_image_name_id(self.name):
@@ -650,6 +696,7 @@ class ImageManager(DockerBaseClass):
         archive_path: str,
         current_image_name: str,
         current_image_id: str,
+        compression: str | None = None,
     ) -> str | None:
         """
         If the archive is missing or requires replacement, return an action message.
@@ -662,6 +709,8 @@ class ImageManager(DockerBaseClass):
         :type current_image_name: str
         :param current_image_id: Hash, including hash type prefix such as "sha256:"
         :type current_image_id: str
+        :param compression: Expected compression of the archive, or None to accept any compression
+        :type compression: str | None
 
         :returns: Either None, or an Ansible action message.
         :rtype: str
@@ -682,7 +731,14 @@ class ImageManager(DockerBaseClass):
             current_image_id == api_image_id(archived.image_id)
             and [current_image_name] == archived.repo_tags
         ):
-            return None
+            if compression is None:
+                return None
+            archived_compression = detect_archive_compression(archive_path)
+            if archived_compression == compression:
+                return None
+            return build_msg(
+                f"overwriting archive with compression {archived_compression}"
+            )
         name = ", ".join(archived.repo_tags)
 
         return build_msg(
@@ -718,7 +774,11 @@ class ImageManager(DockerBaseClass):
         image_id = image["Id"]
 
         action = self.archived_image_action(
-            self.client.module.debug, self.archive_path, image_name, image_id
+            self.client.module.debug,
+            self.archive_path,
+            image_name,
+            image_id,
+            compression=self.archive_compression,
         )
 
         if action:
@@ -740,7 +800,11 @@ class ImageManager(DockerBaseClass):
                 self.fail(f"Error getting image {image_name} - {exc}")
 
             try:
-                with open(self.archive_path, "wb") as fd:
+                with open_archive_writer(
+                    self.archive_path,
+                    self.archive_compression or "none",
+                    level=self.archive_compression_level,
+                ) as fd:
                     for chunk in saved_image:
                         fd.write(chunk)
             except Exception as exc:  # pylint: disable=broad-exception-caught
@@ -1023,7 +1087,7 @@ class ImageManager(DockerBaseClass):
         has_output = False
         try:
             self.log(f"Opening image {self.load_path}")
-            with open(self.load_path, "rb") as image_tar:
+            with open_archive_for_load(self.load_path) as image_tar:
                 self.log(f"Loading image from {self.load_path}")
                 res = self.client._post(
                     self.client._url("/images/load"), data=image_tar, stream=True
@@ -1141,6 +1205,8 @@ def main() -> None:
             },
         },
         "archive_path": {"type": "path"},
+        "archive_compression": {"type": "str", "choices": ["none", "gzip", "zstd"]},
+        "archive_compression_level": {"type": "int"},
         "force_source": {"type": "bool", "default": False},
         "force_absent": {"type": "bool", "default": False},
         "force_tag": {"type": "bool", "default": False},
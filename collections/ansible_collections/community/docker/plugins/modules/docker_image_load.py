@@ -14,7 +14,9 @@ short_description: Load docker image(s) from archives
 version_added: 1.3.0
 
 description:
-  - Load one or multiple Docker images from a C(.tar) archive, and return information on the loaded image(s).
+  - Load one or multiple Docker images from one or multiple C(.tar) archives, and return information on the loaded image(s).
+  - The archives can be compressed with gzip, bzip2, xz, or zstd. They are decompressed on the fly, without temporary files.
+    zstd requires Python 3.14 or newer, or the L(zstandard,https://pypi.org/project/zstandard/) Python library.
 extends_documentation_fragment:
   - community.docker._docker.api_documentation
   - community.docker._attributes
@@ -26,14 +28,32 @@ attributes:
   diff_mode:
     support: none
   idempotent:
-    support: none
+    support: partial
+    details:
+      - The module is only idempotent when O(paths) is used.
 
 options:
   path:
     description:
       - The path to the C(.tar) archive to load Docker image(s) from.
+      - Exactly one of O(path) and O(paths) must be provided.
     type: path
-    required: true
+  paths:
+    description:
+      - The paths to several C(.tar) archives to load Docker image(s) from.
+      - The C(manifest.json) of every archive is read first. Archives whose images are all present with all their tags
+        are skipped.
+      - The remaining archives are loaded concurrently, see O(parallel_loads).
+      - Exactly one of O(path) and O(paths) must be provided.
+    type: list
+    elements: path
+    version_added: 5.1.0
+  parallel_loads:
+    description:
+      - How many archives of O(paths) are loaded at the same time.
+    type: int
+    default: 2
+    version_added: 5.1.0
 
 requirements:
   - "Docker API >= 1.25"
@@ -58,6 +78,14 @@ EXAMPLES = r"""
 - name: Print the loaded image names
   ansible.builtin.debug:
     msg: "Loaded the following images: {{ result.image_names | join(', ') }}"
+
+- name: Load the images of several compressed archives, skipping the ones already loaded
+  community.docker.docker_image_load:
+    paths:
+      - /srv/images/ceph-v18.tar.zst
+      - /srv/images/grafana.tar.gz
+      - /srv/images/prometheus.tar
+    parallel_loads: 3
 """
 
 RETURN = r"""
@@ -75,11 +103,29 @@ images:
   type: list
   elements: dict
   sample: []
+archives:
+  description: The result for every archive of O(paths).
+  returned: success and O(paths) is provided
+  type: list
+  elements: dict
+  contains:
+    path:
+      description: The path of the archive.
+      type: str
+    loaded:
+      description: Whether the archive has been loaded, or skipped since all its images were already present.
+      type: bool
+    image_names:
+      description: Image names and IDs loaded from the archive.
+      type: list
+      elements: str
+  version_added: 5.1.0
 """
 
 import errno
 import traceback
 import typing as t
+from concurrent.futures import ThreadPoolExecutor
 
 from ansible_collections.community.docker.plugins.module_utils._api.errors import (
     DockerException,
@@ -88,6 +134,12 @@ from ansible_collections.community.docker.plugins.module_utils._common_api impor
     AnsibleDockerClient,
     RequestException,
 )
+from ansible_collections.community.docker.plugins.module_utils._image_archive import (
+    ImageArchiveInvalidException,
+    api_image_id,
+    load_archived_image_manifest,
+    open_archive_for_load,
+)
 from ansible_collections.community.docker.plugins.module_utils._util import (
     DockerBaseClass,
     is_image_name_id,
@@ -103,9 +155,14 @@ class ImageManager(DockerBaseClass):
         parameters = self.client.module.params
         self.check_mode = self.client.check_mode
 
-        self.path = parameters["path"]
+        self.path: str | None = parameters["path"]
+        self.paths: list[str] | None = parameters["paths"]
+        self.parallel_loads: int = max(1, parameters["parallel_loads"])
 
-        self.load_images()
+        if self.paths is not None:
+            self.load_multiple_archives()
+        else:
+            self.load_images()
 
     @staticmethod
     def _extract_output_line(line: dict[str, t.Any], output: list[str]) -> None:
@@ -118,22 +175,55 @@ class ImageManager(DockerBaseClass):
             text_line = line.get("stream") or line.get("status") or ""
             output.extend(text_line.splitlines())
 
+    def _load_archive(self, path: str, load_output: list[str]) -> None:
+        """
+        Send an archive to the Docker daemon, and append its output to load_output
+        """
+        self.log(f"Opening image {path}")
+        with open_archive_for_load(path) as image_tar:
+            self.log(f"Loading images from {path}")
+            res = self.client._post(
+                self.client._url("/images/load"), data=image_tar, stream=True
+            )
+            for line in self.client._stream_helper(res, decode=True):
+                self.log(line, pretty_print=True)
+                self._extract_output_line(line, load_output)
+
+    @staticmethod
+    def _loaded_image_names(load_output: list[str]) -> list[str]:
+        loaded_images = []
+        for line in load_output:
+            if line.startswith("Loaded image:"):
+                loaded_images.append(line[len("Loaded image:") :].strip())
+            if line.startswith("Loaded image ID:"):
+                loaded_images.append(line[len("Loaded image ID:") :].strip())
+        return loaded_images
+
+    def _inspect_images(
+        self, loaded_images: list[str]
+    ) -> list[dict[str, t.Any] | None]:
+        images = []
+        for image_name in loaded_images:
+            if is_image_name_id(image_name):
+                images.append(self.client.find_image_by_id(image_name))
+            elif ":" in image_name:
+                image_name, tag = image_name.rsplit(":", 1)
+                images.append(self.client.find_image(image_name, tag))
+            else:
+                self.client.module.warn(
+                    f'Image name "{image_name}" is neither ID nor has a tag'
+                )
+        return images
+
     def load_images(self) -> None:
         """
         Load images from a .tar archive
         """
         # Load image(s) from file
+        assert self.path is not None
         load_output: list[str] = []
         try:
-            self.log(f"Opening image {self.path}")
-            with open(self.path, "rb") as image_tar:
-                self.log(f"Loading images from {self.path}")
-                res = self.client._post(
-                    self.client._url("/images/load"), data=image_tar, stream=True
-                )
-                for line in self.client._stream_helper(res, decode=True):
-                    self.log(line, pretty_print=True)
-                    self._extract_output_line(line, load_output)
+            self._load_archive(self.path, load_output)
         except EnvironmentError as exc:
             if exc.errno == errno.ENOENT:
                 self.client.fail(f"Error opening archive {self.path} - {exc}")
@@ -148,12 +238,7 @@ class ImageManager(DockerBaseClass):
             )
 
         # Collect loaded images
-        loaded_images = []
-        for line in load_output:
-            if line.startswith("Loaded image:"):
-                loaded_images.append(line[len("Loaded image:") :].strip())
-            if line.startswith("Loaded image ID:"):
-                loaded_images.append(line[len("Loaded image ID:") :].strip())
+        loaded_images = self._loaded_image_names(load_output)
 
         if not loaded_images:
             self.client.fail(
@@ -161,29 +246,105 @@ class ImageManager(DockerBaseClass):
                 stdout="\n".join(load_output),
             )
 
-        images = []
-        for image_name in loaded_images:
-            if is_image_name_id(image_name):
-                images.append(self.client.find_image_by_id(image_name))
-            elif ":" in image_name:
-                image_name, tag = image_name.rsplit(":", 1)
-                images.append(self.client.find_image(image_name, tag))
-            else:
-                self.client.module.warn(
-                    f'Image name "{image_name}" is neither ID nor has a tag'
-                )
-
         self.results["image_names"] = loaded_images
-        self.results["images"] = images
+        self.results["images"] = self._inspect_images(loaded_images)
         self.results["changed"] = True
         self.results["stdout"] = "\n".join(load_output)
 
+    def _is_archive_present(self, path: str) -> bool:
+        """
+        Check whether all images of an archive are present with all their tags
+        """
+        try:
+            manifest = load_archived_image_manifest(path)
+        except ImageArchiveInvalidException as exc:
+            self.log(f"Cannot read manifest of {path}, loading it: {exc}")
+            return False
+        if not manifest:
+            return False
+        for entry in manifest:
+            image = self.client.find_image_by_id(
+                api_image_id(entry.image_id), accept_missing_image=True
+            )
+            if image is None:
+                return False
+            if not set(entry.repo_tags or []).issubset(image.get("RepoTags") or []):
+                return False
+        return True
+
+    def _load_one_of_multiple(self, path: str) -> tuple[list[str], str | None]:
+        # Runs in a worker thread, so it must not call fail()
+        load_output: list[str] = []
+        try:
+            self._load_archive(path, load_output)
+        except Exception as exc:  # pylint: disable=broad-exception-caught
+            return load_output, f"Error loading archive {path} - {exc}"
+        return load_output, None
+
+    def load_multiple_archives(self) -> None:
+        """
+        Load images from several .tar archives concurrently, skipping the ones already present
+        """
+        assert self.paths is not None
+        archives: list[dict[str, t.Any]] = []
+        to_load = []
+        for path in self.paths:
+            archive = {"path": path, "loaded": False, "image_names": []}
+            archives.append(archive)
+            if self._is_archive_present(path):
+                self.log(f"All images of {path} are present, skipping")
+                continue
+            to_load.append(archive)
+
+        outputs: list[tuple[list[str], str | None]] = []
+        if to_load:
+            with ThreadPoolExecutor(
+                max_workers=min(self.parallel_loads, len(to_load))
+            ) as executor:
+                outputs = list(
+                    executor.map(
+                        self._load_one_of_multiple,
+                        [archive["path"] for archive in to_load],
+                    )
+                )
+
+        all_output: list[str] = []
+        errors = []
+        for archive, (load_output, error) in zip(to_load, outputs):
+            all_output.extend(load_output)
+            if error is not None:
+                errors.append(error)
+                continue
+            archive["image_names"] = self._loaded_image_names(load_output)
+            if not archive["image_names"]:
+                errors.append(
+                    f"Detected no loaded images in {archive['path']}. Archive potentially corrupt?"
+                )
+                continue
+            archive["loaded"] = True
+
+        if errors:
+            self.client.fail("\n".join(errors), stdout="\n".join(all_output))
+
+        loaded_images = [
+            image_name for archive in archives for image_name in archive["image_names"]
+        ]
+        self.results["image_names"] = loaded_images
+        self.results["images"] = self._inspect_images(loaded_images)
+        self.results["archives"] = archives
+        self.results["changed"] = bool(to_load)
+        self.results["stdout"] = "\n".join(all_output)
+
 
 def main() -> None:
     client = AnsibleDockerClient(
         argument_spec={
-            "path": {"type": "path", "required": True},
+            "path": {"type": "path"},
+            "paths": {"type": "list", "elements": "path"},
+            "parallel_loads": {"type": "int", "default": 2},
         },
+        mutually_exclusive=[("path", "paths")],
+        required_one_of=[("path", "paths")],
         supports_check_mode=False,
     )
 
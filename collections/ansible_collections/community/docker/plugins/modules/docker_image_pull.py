@@ -24,7 +24,8 @@ attributes:
   check_mode:
     support: partial
     details:
-      - When trying to pull an image with O(pull=always), the module assumes this is always changed in check mode.
+      - When trying to pull an image with O(pull=always), the module assumes this is always changed in check mode. When O(images)
+        is used, the module assumes this is changed only if the image's digest in the registry differs from the local image.
       - When check mode is combined with diff mode, the pulled image's ID is always shown as V(unknown) in the diff.
   diff_mode:
     support: full
@@ -36,8 +37,41 @@ options:
     description:
       - Image name. Name format must be one of V(name), V(repository/name), or V(registry_server:port/name).
       - The name can optionally include the tag by appending V(:tag_name), or it can contain a digest by appending V(@hash:digest).
+      - Exactly one of O(name) and O(images) must be specified.
     type: str
-    required: true
+  images:
+    description:
+      - Pull several images at once.
+      - Before pulling, the digests of the images in their registries are looked up (the Docker daemon sends a C(HEAD) request
+        to the registry, using the credentials of the daemon's host). Images whose digest matches the local image are not pulled
+        again, even with O(pull=always).
+      - The remaining images are pulled concurrently, see O(max_concurrent_pulls).
+      - Exactly one of O(name) and O(images) must be specified.
+    type: list
+    elements: dict
+    suboptions:
+      name:
+        description:
+          - Image name, see O(name).
+        type: str
+        required: true
+      tag:
+        description:
+          - The tag of the image, see O(tag).
+          - If not specified, O(tag) is used.
+        type: str
+      platform:
+        description:
+          - Ask for this specific platform when pulling, see O(platform).
+          - If not specified, O(platform) is used.
+        type: str
+    version_added: 5.1.0
+  max_concurrent_pulls:
+    description:
+      - The maximum number of images pulled at the same time when O(images) is used.
+    type: int
+    default: 4
+    version_added: 5.1.0
   tag:
     description:
       - Used to select an image when pulling. Defaults to V(latest).
@@ -79,18 +113,96 @@ EXAMPLES = r"""
     name: pacur/centos-7
     # Select platform for pulling. If not specified, will pull whatever docker prefers.
     platform: amd64
+
+- name: Pull the monitoring images, skipping the ones which are up-to-date
+  community.docker.docker_image_pull:
+    images:
+      - name: quay.io/prometheus/prometheus
+        tag: v2.53.0
+      - name: quay.io/prometheus/node-exporter
+        tag: v1.8.1
+      - name: docker.io/grafana/grafana
+        tag: 11.1.0
+    max_concurrent_pulls: 3
+  register: result
+
+- name: Show how long the pulls took
+  ansible.builtin.debug:
+    msg: "{{ item.name }}:{{ item.tag }}: {{ item.bytes_downloaded }} bytes in {{ item.duration }} seconds"
+  loop: "{{ result.images }}"
+  when: item.pulled
 """
 
 RETURN = r"""
 image:
   description: Image inspection results for the affected image.
-  returned: success
+  returned: success and O(name) is specified
   type: dict
   sample: {}
+images:
+  description:
+    - The result for every image, in the order of O(images).
+  returned: success and O(images) is specified
+  type: list
+  elements: dict
+  contains:
+    name:
+      description:
+        - The name of the image.
+      type: str
+      sample: quay.io/prometheus/prometheus
+    tag:
+      description:
+        - The tag or digest of the image.
+      type: str
+      sample: v2.53.0
+    id:
+      description:
+        - The ID of the image, if it exists.
+      type: str
+      sample: sha256:b62b2ec4a0d4f32b9deb1a5cc19b2bb5bd2d4c5c1c3aa1c1ba0a2bc4ee1fe61a
+    digest:
+      description:
+        - The digest of the image in the registry, if it could be determined.
+      type: str
+      sample: sha256:075b1ba2c4ebb04bc3a6ab86ec9ec6b5c4e7e3e1b5d5b6c8f2c5e6fd9d4c8c7a
+    pulled:
+      description:
+        - Whether the image was pulled (or would have been pulled in check mode).
+      type: bool
+      sample: true
+    changed:
+      description:
+        - Whether the image changed.
+      type: bool
+      sample: true
+    bytes_downloaded:
+      description:
+        - The number of bytes of the layers which were downloaded.
+      type: int
+      sample: 103574112
+    duration:
+      description:
+        - The number of seconds the pull took.
+      type: float
+      sample: 12.37
+    failed:
+      description:
+        - Whether pulling the image failed.
+      type: bool
+      returned: when pulling the image failed
+    msg:
+      description:
+        - The error message.
+      type: str
+      returned: when pulling the image failed
+  version_added: 5.1.0
 """
 
+import time
 import traceback
 import typing as t
+from concurrent.futures import ThreadPoolExecutor
 
 from ansible_collections.community.docker.plugins.module_utils._api.errors import (
     DockerException,
@@ -100,6 +212,7 @@ from ansible_collections.community.docker.plugins.module_utils._api.utils.utils
 )
 from ansible_collections.community.docker.plugins.module_utils._common_api import (
     AnsibleDockerClient,
+    ImagePullError,
     RequestException,
 )
 from ansible_collections.community.docker.plugins.module_utils._platform import (
@@ -112,6 +225,9 @@ from ansible_collections.community.docker.plugins.module_utils._util import (
     is_image_name_id,
     is_valid_tag,
 )
+from ansible_collections.community.docker.plugins.module_utils._version import (
+    LooseVersion,
+)
 
 
 def image_info(image: dict[str, t.Any] | None) -> dict[str, t.Any]:
@@ -123,6 +239,37 @@ def image_info(image: dict[str, t.Any] | None) -> dict[str, t.Any]:
     return result
 
 
+def platform_matches(
+    host_info: dict[str, t.Any], image: dict[str, t.Any], platform: str
+) -> bool:
+    wanted_platform = normalize_platform_string(
+        platform,
+        daemon_os=host_info.get("OSType"),
+        daemon_arch=host_info.get("Architecture"),
+    )
+    image_platform = compose_platform_string(
+        os=image.get("Os"),
+        arch=image.get("Architecture"),
+        variant=image.get("Variant"),
+        daemon_os=host_info.get("OSType"),
+        daemon_arch=host_info.get("Architecture"),
+    )
+    return compare_platform_strings(wanted_platform, image_platform)
+
+
+def split_name_tag(client: AnsibleDockerClient, name: str, tag: str) -> tuple[str, str]:
+    if is_image_name_id(name):
+        client.fail("Cannot pull an image by ID")
+    if not is_valid_tag(tag, allow_empty=True):
+        client.fail(f'"{tag}" is not a valid docker tag!')
+
+    # If name contains a tag, it takes precedence over tag parameter.
+    repo, repo_tag = parse_repository_tag(name)
+    if repo_tag:
+        return repo, repo_tag
+    return name, tag
+
+
 class ImagePuller(DockerBaseClass):
     def __init__(self, client: AnsibleDockerClient) -> None:
         super().__init__()
@@ -136,16 +283,7 @@ class ImagePuller(DockerBaseClass):
         self.platform: str | None = parameters["platform"]
         self.pull_mode: t.Literal["always", "not_present"] = parameters["pull"]
 
-        if is_image_name_id(self.name):
-            self.client.fail("Cannot pull an image by ID")
-        if not is_valid_tag(self.tag, allow_empty=True):
-            self.client.fail(f'"{self.tag}" is not a valid docker tag!')
-
-        # If name contains a tag, it takes precedence over tag parameter.
-        repo, repo_tag = parse_repository_tag(self.name)
-        if repo_tag:
-            self.name = repo
-            self.tag = repo_tag
+        self.name, self.tag = split_name_tag(self.client, self.name, self.tag)
 
     def pull(self) -> dict[str, t.Any]:
         image = self.client.find_image(name=self.name, tag=self.tag)
@@ -161,20 +299,7 @@ class ImagePuller(DockerBaseClass):
         if image and self.pull_mode == "not_present":
             if self.platform is None:
                 return results
-            host_info = self.client.info()
-            wanted_platform = normalize_platform_string(
-                self.platform,
-                daemon_os=host_info.get("OSType"),
-                daemon_arch=host_info.get("Architecture"),
-            )
-            image_platform = compose_platform_string(
-                os=image.get("Os"),
-                arch=image.get("Architecture"),
-                variant=image.get("Variant"),
-                daemon_os=host_info.get("OSType"),
-                daemon_arch=host_info.get("Architecture"),
-            )
-            if compare_platform_strings(wanted_platform, image_platform):
+            if platform_matches(self.client.info(), image, self.platform):
                 return results
 
         actions.append(f"Pulled image {self.name}:{self.tag}")
@@ -192,9 +317,169 @@ class ImagePuller(DockerBaseClass):
         return results
 
 
+class MultiImagePuller(DockerBaseClass):
+    def __init__(self, client: AnsibleDockerClient) -> None:
+        super().__init__()
+
+        self.client = client
+        self.check_mode = self.client.check_mode
+
+        parameters = self.client.module.params
+        self.pull_mode: t.Literal["always", "not_present"] = parameters["pull"]
+        self.max_concurrent_pulls: int = max(1, parameters["max_concurrent_pulls"])
+        self.images: list[dict[str, t.Any]] = []
+        for image in parameters["images"]:
+            name, tag = split_name_tag(
+                self.client, image["name"], image["tag"] or parameters["tag"]
+            )
+            self.images.append(
+                {
+                    "name": name,
+                    "tag": tag,
+                    "platform": image["platform"] or parameters["platform"],
+                }
+            )
+        # Looking up remote digests needs https://docs.docker.com/reference/api/engine/version/v1.30/#tag/Distribution
+        self.can_resolve_digests = self.client.docker_api_version >= LooseVersion(
+            "1.30"
+        )
+        self._host_info: dict[str, t.Any] | None = None
+
+    def _get_host_info(self) -> dict[str, t.Any]:
+        if self._host_info is None:
+            self._host_info = self.client.info()
+        return self._host_info
+
+    def _get_remote_digest(self, image: dict[str, t.Any]) -> str | None:
+        if image["tag"].startswith("sha256:"):
+            return image["tag"]
+        try:
+            return self.client.get_remote_image_digest(image["name"], image["tag"])
+        except Exception as exc:  # pylint: disable=broad-exception-caught
+            # Simply pull the image if the registry cannot be asked
+            self.log(
+                f"Cannot determine digest of {image['name']}:{image['tag']}: {exc}"
+            )
+            return None
+
+    def _needs_pull(
+        self, image: dict[str, t.Any], local_image: dict[str, t.Any] | None
+    ) -> bool:
+        if local_image is None:
+            return True
+        if image["platform"] is not None and not platform_matches(
+            self._get_host_info(), local_image, image["platform"]
+        ):
+            return True
+        if self.pull_mode == "not_present":
+            return False
+        if image["digest"] is None:
+            return True
+        # The local image is the one with this tag, so if it has the remote digest
+        # (no matter for which repository) it is identical to the remote image
+        return not any(
+            repo_digest.endswith(f"@{image['digest']}")
+            for repo_digest in local_image.get("RepoDigests") or []
+        )
+
+    def _pull(self, image: dict[str, t.Any]) -> None:
+        start = time.monotonic()
+        try:
+            image["bytes_downloaded"] = self.client.pull_image_raw(
+                image["name"], tag=image["tag"], image_platform=image["platform"]
+            )
+        except ImagePullError as exc:
+            image["error"] = str(exc)
+        except Exception as exc:  # pylint: disable=broad-exception-caught
+            image["error"] = (
+                f"Error pulling image {image['name']}:{image['tag']} - {exc}"
+            )
+        image["duration"] = round(time.monotonic() - start, 2)
+
+    def pull(self) -> dict[str, t.Any]:
+        local_images = [
+            self.client.find_image(name=image["name"], tag=image["tag"])
+            for image in self.images
+        ]
+        for image in self.images:
+            image["digest"] = None
+        if self.pull_mode == "always" and self.can_resolve_digests:
+            with ThreadPoolExecutor(max_workers=self.max_concurrent_pulls) as executor:
+                for image, digest in zip(
+                    self.images, executor.map(self._get_remote_digest, self.images)
+                ):
+                    image["digest"] = digest
+
+        to_pull = [
+            image
+            for image, local_image in zip(self.images, local_images)
+            if self._needs_pull(image, local_image)
+        ]
+        if to_pull and not self.check_mode:
+            with ThreadPoolExecutor(
+                max_workers=min(self.max_concurrent_pulls, len(to_pull))
+            ) as executor:
+                for dummy in executor.map(self._pull, to_pull):
+                    pass
+
+        results: dict[str, t.Any] = {"changed": False, "images": []}
+        diff: dict[str, dict[str, t.Any]] = {"before": {}, "after": {}}
+        for image, local_image in zip(self.images, local_images):
+            pulled = any(image is other for other in to_pull)
+            new_image = local_image
+            changed = False
+            if pulled and self.check_mode:
+                changed = True
+                new_image = {"Id": "unknown"}
+            elif pulled and "error" not in image:
+                new_image = self.client.find_image(name=image["name"], tag=image["tag"])
+                changed = not self.client._compare_images(local_image, new_image)
+            name = f"{image['name']}:{image['tag']}"
+            diff["before"][name] = image_info(local_image)
+            diff["after"][name] = image_info(new_image)
+            result = {
+                "name": image["name"],
+                "tag": image["tag"],
+                "id": new_image["Id"] if new_image else None,
+                "digest": image["digest"],
+                "pulled": pulled,
+                "changed": changed,
+            }
+            if pulled and not self.check_mode:
+                result["bytes_downloaded"] = image.get("bytes_downloaded", 0)
+                result["duration"] = image["duration"]
+            if "error" in image:
+                result["failed"] = True
+                result["msg"] = image["error"]
+            results["images"].append(result)
+            results["changed"] = results["changed"] or changed
+        results["diff"] = diff
+
+        failed = [
+            f"{result['name']}:{result['tag']}"
+            for result in results["images"]
+            if result.get("failed")
+        ]
+        if failed:
+            self.client.fail(
+                f"Failed to pull the images {', '.join(failed)}", **results
+            )
+        return results
+
+
 def main() -> None:
     argument_spec = {
-        "name": {"type": "str", "required": True},
+        "name": {"type": "str"},
+        "images": {
+            "type": "list",
+            "elements": "dict",
+            "options": {
+                "name": {"type": "str", "required": True},
+                "tag": {"type": "str"},
+                "platform": {"type": "str"},
+            },
+        },
+        "max_concurrent_pulls": {"type": "int", "default": 4},
         "tag": {"type": "str", "default": "latest"},
         "platform": {"type": "str"},
         "pull": {
@@ -211,11 +496,16 @@ def main() -> None:
     client = AnsibleDockerClient(
         argument_spec=argument_spec,
         supports_check_mode=True,
+        mutually_exclusive=[("name", "images")],
+        required_one_of=[("name", "images")],
         option_minimal_versions=option_minimal_versions,
     )
 
     try:
-        results = ImagePuller(client).pull()
+        if client.module.params["images"] is not None:
+            results = MultiImagePuller(client).pull()
+        else:
+            results = ImagePuller(client).pull()
         client.module.exit_json(**results)
     except DockerException as e:
         client.fail(
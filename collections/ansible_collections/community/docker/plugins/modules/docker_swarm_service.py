@@ -321,12 +321,18 @@ options:
           - File mode of the tmpfs in octal.
           - Can only be used when O(mounts[].type=tmpfs).
         type: int
+  max_concurrent_updates:
+    description:
+      - The maximum number of services which are created, updated, or removed at the same time when O(services) is used.
+    type: int
+    default: 4
+    version_added: 5.1.0
   name:
     description:
       - Service name.
       - Corresponds to the C(--name) option of C(docker service create).
+      - Exactly one of O(name) and O(services) must be specified.
     type: str
-    required: true
   networks:
     description:
       - List of the service networks names or dictionaries.
@@ -545,6 +551,18 @@ options:
         description:
           - File access mode inside the container. Must be an octal number (like V(0644) or V(0444)).
         type: int
+  services:
+    description:
+      - Manage several services at once.
+      - Every element accepts the options of this module, except O(services), O(max_concurrent_updates), and the options
+        to connect to the Docker daemon. The C(name) option is required.
+      - Options that are not specified in an element default to the values of the options of this module.
+      - All services, networks, secrets, and configs are looked up once for all services. The services which need to be
+        changed are changed concurrently, see O(max_concurrent_updates).
+      - Exactly one of O(name) and O(services) must be specified.
+    type: list
+    elements: dict
+    version_added: 5.1.0
   state:
     description:
       - V(absent) - A service matching the specified name will be removed and have its tasks stopped.
@@ -692,6 +710,16 @@ rebuilt:
     - True if the service has been recreated (removed and created).
   type: bool
   sample: true
+services:
+  returned: when O(services) is specified
+  description:
+    - The result for every service, in the order of O(services).
+    - Every element contains the keys RV(swarm_service), RV(changes), and RV(rebuilt) for the service, and the keys C(name),
+      C(msg), and C(changed).
+    - If managing the service failed, the element contains the keys C(failed) and C(msg).
+  type: list
+  elements: dict
+  version_added: 5.1.0
 """
 
 EXAMPLES = r"""
@@ -847,14 +875,34 @@ EXAMPLES = r"""
   community.docker.docker_swarm_service:
     name: myservice
     state: absent
+
+- name: Manage several services sharing the same options
+  community.docker.docker_swarm_service:
+    image: registry.example.com/worker:2.1
+    networks:
+      - backend
+    restart_config:
+      condition: on-failure
+    services:
+      - name: worker-mail
+        env:
+          QUEUE: mail
+      - name: worker-reports
+        env:
+          QUEUE: reports
+        replicas: 3
+      - name: worker-legacy
+        state: absent
 """
 
 import shlex
 import time
 import traceback
 import typing as t
+from concurrent.futures import ThreadPoolExecutor
 
 from ansible.module_utils.basic import human_to_bytes
+from ansible.module_utils.common.arg_spec import ArgumentSpecValidator
 from ansible.module_utils.common.text.converters import to_text
 
 from ansible_collections.community.docker.plugins.module_utils._common import (
@@ -2226,6 +2274,13 @@ class DockerService(DockerBaseClass):
         return service
 
 
+class _ServiceOptionsView:
+    # The 'detect_usage' callbacks of the option minimal versions look at client.module.params.
+    def __init__(self, params: dict[str, t.Any]) -> None:
+        self.module = self
+        self.params = params
+
+
 class DockerServiceManager:
     def __init__(self, client: AnsibleDockerClient):
         self.client = client
@@ -2237,6 +2292,9 @@ class DockerServiceManager:
             raw_data = self.client.inspect_service(name)
         except NotFound:
             return None
+        return self.get_service_from_data(raw_data)
+
+    def get_service_from_data(self, raw_data: dict[str, t.Any]) -> DockerService:
         ds = DockerService(
             self.client.docker_api_version, self.client.docker_py_version
         )
@@ -2501,15 +2559,17 @@ class DockerServiceManager:
     def get_networks_names_ids(self) -> dict[str, str]:
         return {network["Name"]: network["Id"] for network in self.client.networks()}
 
-    def get_missing_secret_ids(self) -> dict[str, str]:
+    def get_missing_secret_ids(
+        self, secrets: list[dict[str, t.Any]] | None = None
+    ) -> dict[str, str]:
         """
         Resolve missing secret ids by looking them up by name
         """
-        secret_names = [
-            secret["secret_name"]
-            for secret in self.client.module.params.get("secrets") or []
-            if secret["secret_id"] is None
-        ]
+        if secrets is None:
+            secrets = self.client.module.params.get("secrets") or []
+        secret_names = sorted(
+            {secret["secret_name"] for secret in secrets if secret["secret_id"] is None}
+        )
         if not secret_names:
             return {}
         secrets = self.client.secrets(filters={"name": secret_names})
@@ -2523,15 +2583,17 @@ class DockerServiceManager:
                 self.client.fail(f'Could not find a secret named "{secret_name}"')
         return secrets
 
-    def get_missing_config_ids(self) -> dict[str, str]:
+    def get_missing_config_ids(
+        self, configs: list[dict[str, t.Any]] | None = None
+    ) -> dict[str, str]:
         """
         Resolve missing config ids by looking them up by name
         """
-        config_names = [
-            config["config_name"]
-            for config in self.client.module.params.get("configs") or []
-            if config["config_id"] is None
-        ]
+        if configs is None:
+            configs = self.client.module.params.get("configs") or []
+        config_names = sorted(
+            {config["config_name"] for config in configs if config["config_id"] is None}
+        )
         if not config_names:
             return {}
         configs = self.client.configs(filters={"name": config_names})
@@ -2545,6 +2607,72 @@ class DockerServiceManager:
                 self.client.fail(f'Could not find a config named "{config_name}"')
         return configs
 
+    def plan_service(
+        self,
+        params: dict[str, t.Any],
+        current_service: DockerService | None,
+        new_service: DockerService,
+    ) -> tuple[str | None, str, bool, bool, DifferenceTracker, dict[str, t.Any]]:
+        """
+        Determine what has to be done to bring a service into the state described by
+        the parameters. The action is None, "remove", "rebuild", "update", or "create".
+        """
+        action = None
+        changed = False
+        msg = "noop"
+        rebuilt = False
+        differences = DifferenceTracker()
+        facts = {}
+
+        if current_service:
+            if params["state"] == "absent":
+                action = "remove"
+                msg = "Service removed"
+                changed = True
+            else:
+                changed, differences, need_rebuild, force_update = new_service.compare(
+                    current_service
+                )
+                if changed:
+                    if need_rebuild:
+                        action = "rebuild"
+                        msg = "Service rebuilt"
+                        rebuilt = True
+                    else:
+                        action = "update"
+                        msg = "Service updated"
+                elif force_update:
+                    action = "update"
+                    msg = "Service forcefully updated"
+                    changed = True
+                else:
+                    msg = "Service unchanged"
+                facts = new_service.get_facts()
+        elif params["state"] == "absent":
+            msg = "Service absent"
+        else:
+            action = "create"
+            msg = "Service created"
+            changed = True
+            facts = new_service.get_facts()
+
+        return action, msg, changed, rebuilt, differences, facts
+
+    def apply_service_action(
+        self,
+        name: str,
+        action: str,
+        current_service: DockerService | None,
+        new_service: DockerService,
+    ) -> None:
+        if action in ("remove", "rebuild"):
+            self.remove_service(name)
+        if action in ("rebuild", "create"):
+            self.create_service(name, new_service)
+        if action == "update":
+            assert current_service is not None
+            self.update_service(name, current_service, new_service)
+
     def run(self) -> tuple[str, bool, bool, list[str], dict[str, t.Any]]:
         self.diff_tracker = DifferenceTracker()
         module = self.client.module
@@ -2579,58 +2707,15 @@ class DockerServiceManager:
         except Exception as e:  # pylint: disable=broad-exception-caught
             return self.client.fail(f"Error parsing module parameters: {e}")
 
-        changed = False
-        msg = "noop"
-        rebuilt = False
-        differences = DifferenceTracker()
-        facts = {}
-
-        if current_service:
-            if module.params["state"] == "absent":
-                if not module.check_mode:
-                    self.remove_service(module.params["name"])
-                msg = "Service removed"
-                changed = True
-            else:
-                changed, differences, need_rebuild, force_update = new_service.compare(
-                    current_service
-                )
-                if changed:
-                    self.diff_tracker.merge(differences)
-                    if need_rebuild:
-                        if not module.check_mode:
-                            self.remove_service(module.params["name"])
-                            self.create_service(module.params["name"], new_service)
-                        msg = "Service rebuilt"
-                        rebuilt = True
-                    else:
-                        if not module.check_mode:
-                            self.update_service(
-                                module.params["name"], current_service, new_service
-                            )
-                        msg = "Service updated"
-                        rebuilt = False
-                else:
-                    if force_update:
-                        if not module.check_mode:
-                            self.update_service(
-                                module.params["name"], current_service, new_service
-                            )
-                        msg = "Service forcefully updated"
-                        rebuilt = False
-                        changed = True
-                    else:
-                        msg = "Service unchanged"
-                facts = new_service.get_facts()
-        else:
-            if module.params["state"] == "absent":
-                msg = "Service absent"
-            else:
-                if not module.check_mode:
-                    self.create_service(module.params["name"], new_service)
-                msg = "Service created"
-                changed = True
-                facts = new_service.get_facts()
+        action, msg, changed, rebuilt, differences, facts = self.plan_service(
+            module.params, current_service, new_service
+        )
+        if changed:
+            self.diff_tracker.merge(differences)
+        if action is not None and not module.check_mode:
+            self.apply_service_action(
+                module.params["name"], action, current_service, new_service
+            )
 
         return msg, changed, rebuilt, differences.get_legacy_docker_diffs(), facts
 
@@ -2647,6 +2732,225 @@ class DockerServiceManager:
                 else:
                     raise
 
+    def get_services_by_name(self, names: list[str]) -> dict[str, DockerService]:
+        """
+        Inspect all services with one of the given names with a single request
+        """
+        services = {}
+        for raw_data in self.client.services(filters={"name": names}):
+            name = raw_data["Spec"]["Name"]
+            if name in names:
+                services[name] = self.get_service_from_data(raw_data)
+        return services
+
+    def _check_service_minimal_versions(
+        self, name: str, params: dict[str, t.Any]
+    ) -> None:
+        argument_spec = self.client.module.argument_spec
+        for option, data in self.client.option_minimal_versions.items():
+            if data["supported"]:
+                continue
+            if "detect_usage" in data:
+                used = data["detect_usage"](_ServiceOptionsView(params))
+            else:
+                used = params.get(option) is not None
+                if used and "default" in argument_spec[option]:
+                    used = params[option] != argument_spec[option]["default"]
+            if used:
+                usg = data.get("usage_msg", f"set {option} option")
+                versions = []
+                if "docker_py_version" in data:
+                    versions.append(
+                        f"Docker SDK for Python {data['docker_py_version']}"
+                    )
+                if "docker_api_version" in data:
+                    versions.append(f"Docker API {data['docker_api_version']}")
+                self.client.fail(
+                    f"Docker SDK for Python version is {self.client.docker_py_version}, Docker API version is"
+                    f" {self.client.docker_api_version_str}. Minimum version required is {' and '.join(versions)}"
+                    f" to {usg} (service {name})."
+                )
+
+    def get_services_params(
+        self, service_argument_spec: dict[str, t.Any]
+    ) -> list[dict[str, t.Any]]:
+        """
+        Validate the elements of the services option. The module's options are
+        used for everything an element does not specify.
+        """
+        module = self.client.module
+        defaults = {
+            key: value
+            for key, value in module.params.items()
+            if key in service_argument_spec and key != "name"
+        }
+        validator = ArgumentSpecValidator(
+            service_argument_spec, required_if=[("state", "present", ["image"])]
+        )
+        services_params = []
+        for index, definition in enumerate(module.params["services"]):
+            if not isinstance(definition, dict):
+                self.client.fail(f"services[{index}] must be a dictionary")
+            params = dict(defaults)
+            params.update(definition)
+            name = params.get("name") or f"services[{index}]"
+            validation = validator.validate(params)
+            if validation.error_messages:
+                self.client.fail(
+                    f"Invalid definition of service {name}: {'; '.join(validation.error_messages)}"
+                )
+            self._check_service_minimal_versions(name, validation.validated_parameters)
+            services_params.append(validation.validated_parameters)
+        names = [params["name"] for params in services_params]
+        duplicates = sorted({name for name in names if names.count(name) > 1})
+        if duplicates:
+            self.client.fail(
+                f"Services must not be specified more than once: {', '.join(duplicates)}"
+            )
+        return services_params
+
+    def _apply_service_action_safe(
+        self,
+        name: str,
+        action: str,
+        current_service: DockerService | None,
+        new_service: DockerService,
+    ) -> str | None:
+        retries = self.retries
+        while True:
+            try:
+                self.apply_service_action(name, action, current_service, new_service)
+                return None
+            except APIError as e:
+                # Sometimes Version.Index will have changed between the inspect and
+                # the update. If this is encountered we'll inspect again and retry.
+                if (
+                    action == "update"
+                    and retries > 0
+                    and "update out of sequence" in str(e.explanation)
+                ):
+                    retries -= 1
+                    time.sleep(1)
+                    current_service = self.get_service(name) or current_service
+                    continue
+                return f"Error while managing service {name}: {e}"
+            except (DockerException, RequestException) as e:
+                return f"Error while managing service {name}: {e}"
+
+    def run_bulk(self, service_argument_spec: dict[str, t.Any]) -> dict[str, t.Any]:
+        module = self.client.module
+        services_params = self.get_services_params(service_argument_spec)
+        names = [params["name"] for params in services_params]
+
+        image_digests: dict[tuple[str, bool], str] = {}
+        for params in services_params:
+            image_key = (params["image"], params["resolve_image"])
+            if image_key in image_digests:
+                continue
+            try:
+                image_digests[image_key] = self.get_image_digest(
+                    name=params["image"], resolve=params["resolve_image"]
+                )
+            except DockerException as e:
+                self.client.fail(
+                    f"Error looking for an image named {params['image']}: {e}"
+                )
+
+        try:
+            current_services = self.get_services_by_name(names)
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            self.client.fail(
+                f"Error looking for services named {', '.join(names)}: {e}"
+            )
+        try:
+            secret_ids = self.get_missing_secret_ids(
+                [
+                    secret
+                    for params in services_params
+                    for secret in params["secrets"] or []
+                ]
+            )
+            config_ids = self.get_missing_config_ids(
+                [
+                    config
+                    for params in services_params
+                    for config in params["configs"] or []
+                ]
+            )
+            network_ids = self.get_networks_names_ids()
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            self.client.fail(f"Error parsing module parameters: {e}")
+
+        plans = []
+        for params in services_params:
+            current_service = current_services.get(params["name"])
+            try:
+                new_service = DockerService.from_ansible_params(
+                    params,
+                    current_service,
+                    image_digests[(params["image"], params["resolve_image"])],
+                    secret_ids,
+                    config_ids,
+                    network_ids,
+                    self.client,
+                )
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                self.client.fail(
+                    f"Error parsing parameters of service {params['name']}: {e}"
+                )
+            plans.append(
+                (
+                    current_service,
+                    new_service,
+                    self.plan_service(params, current_service, new_service),
+                )
+            )
+
+        errors: list[str | None] = [None] * len(plans)
+        to_apply = [index for index, plan in enumerate(plans) if plan[2][0] is not None]
+        if to_apply and not module.check_mode:
+            with ThreadPoolExecutor(
+                max_workers=min(
+                    max(1, module.params["max_concurrent_updates"]), len(to_apply)
+                )
+            ) as executor:
+                futures = {
+                    index: executor.submit(
+                        self._apply_service_action_safe,
+                        names[index],
+                        plans[index][2][0],
+                        plans[index][0],
+                        plans[index][1],
+                    )
+                    for index in to_apply
+                }
+                for index, future in futures.items():
+                    errors[index] = future.result()
+
+        results: dict[str, t.Any] = {"changed": False, "services": []}
+        diff_before = {}
+        diff_after = {}
+        for name, plan, error in zip(names, plans, errors):
+            dummy, msg, changed, rebuilt, differences, facts = plan[2]
+            result = {
+                "name": name,
+                "msg": msg,
+                "changed": changed,
+                "rebuilt": rebuilt,
+                "changes": differences.get_legacy_docker_diffs(),
+                "swarm_service": facts,
+            }
+            if error is not None:
+                result["failed"] = True
+                result["msg"] = error
+            if changed:
+                results["changed"] = True
+                diff_before[name], diff_after[name] = differences.get_before_after()
+            results["services"].append(result)
+        if module._diff:
+            results["diff"] = {"before": diff_before, "after": diff_after}
+        return results
+
 
 def _detect_publish_mode_usage(client: AnsibleDockerClient) -> bool:
     return any(
@@ -2679,7 +2983,7 @@ def _detect_update_config_failure_action_rollback(client: AnsibleDockerClient) -
 
 
 def main() -> None:
-    argument_spec = {
+    service_argument_spec = {
         "name": {"type": "str", "required": True},
         "image": {"type": "str"},
         "state": {
@@ -2865,6 +3169,14 @@ def main() -> None:
         "cap_add": {"type": "list", "elements": "str"},
         "cap_drop": {"type": "list", "elements": "str"},
     }
+    argument_spec = dict(service_argument_spec)
+    argument_spec.update(
+        {
+            "name": {"type": "str"},
+            "services": {"type": "list", "elements": "dict"},
+            "max_concurrent_updates": {"type": "int", "default": 4},
+        }
+    )
 
     option_minimal_versions = {
         "dns": {"docker_py_version": "2.6.0"},
@@ -2977,10 +3289,12 @@ def main() -> None:
             "usage_msg": "set mode",
         },
     }
-    required_if = [("state", "present", ["image"])]
+    required_if = [("state", "present", ["image", "services"], True)]
 
     client = AnsibleDockerClient(
         argument_spec=argument_spec,
+        mutually_exclusive=[("name", "services")],
+        required_one_of=[("name", "services")],
         required_if=required_if,
         supports_check_mode=True,
         min_docker_version="2.0.2",
@@ -2989,6 +3303,17 @@ def main() -> None:
 
     try:
         dsm = DockerServiceManager(client)
+        if client.module.params["services"] is not None:
+            results = dsm.run_bulk(service_argument_spec)
+            failed = [
+                result["name"] for result in results["services"] if result.get("failed")
+            ]
+            if failed:
+                client.fail(
+                    f"Failed to manage the services {', '.join(failed)}", **results
+                )
+            client.module.exit_json(**results)
+
         msg, changed, rebuilt, changes, facts = dsm.run_safe()
 
         results = {
@@ -4,15 +4,25 @@
 
 from __future__ import annotations
 
+import os
 import typing as t
 import unittest
 from io import StringIO
 from unittest import mock
 
-from ansible.errors import AnsibleError
+import pytest
+from ansible.errors import AnsibleConnectionFailure, AnsibleError
 from ansible.playbook.play_context import PlayContext
 from ansible.plugins.loader import connection_loader
 
+from ansible_collections.community.docker.plugins.connection.docker import (
+    PERSISTENT_SHELL_MAX_FILE_SIZE,
+    Connection,
+    _OutputBuffer,
+    _PersistentShell,
+    _printf_escape,
+)
+
 
 class TestDockerConnectionClass(unittest.TestCase):
     def setUp(self) -> None:
@@ -83,3 +93,80 @@ class TestDockerConnectionClass(unittest.TestCase):
             "^Docker version check (.*?) failed:",
             self.dc._get_actual_user,
         )
+
+
+def test_printf_escape() -> None:
+    assert _printf_escape(b"abc") == b"abc"
+    assert (
+        _printf_escape(b"a'b%c\\d\n\x00\xff") == b"a\\047b\\045c\\134d\\012\\000\\377"
+    )
+
+
+@pytest.mark.skipif(not os.path.exists("/bin/sh"), reason="needs /bin/sh")
+def test_persistent_shell() -> None:
+    # /bin/sh stands in for 'docker exec -i <container> /bin/sh'
+    shell = _PersistentShell([b"/bin/sh"])
+    try:
+        assert shell.run(b"/bin/sh -c 'echo out; echo err >&2; exit 3'") == (
+            3,
+            b"out\n",
+            b"err\n",
+        )
+        assert shell.run(b"printf no-newline") == (0, b"no-newline", b"")
+
+        data = bytes(range(256)) * 200
+        assert shell.run(b"cat", data) == (0, data, b"")
+        assert shell.run(b"cat", b"") == (0, b"", b"")
+        assert shell.alive
+    finally:
+        shell.close()
+    assert not shell.alive
+
+
+@pytest.mark.skipif(not os.path.exists("/bin/sh"), reason="needs /bin/sh")
+def test_persistent_shell_exited() -> None:
+    shell = _PersistentShell([b"/bin/sh"])
+    try:
+        with pytest.raises(AnsibleConnectionFailure, match="exited unexpectedly"):
+            shell.run(b"echo bye >&2; exit 1")
+    finally:
+        shell.close()
+
+
+def test_output_buffer() -> None:
+    buffer = _OutputBuffer(b"\n__MARKER__ ")
+    # The marker is split across reads
+    for chunk in [b"foo", b"\n__MA", b"R", b"KER", b"__ 0", b"\n"]:
+        buffer.add(chunk)
+    assert buffer.marker_index == 3
+    assert buffer.before_marker() == b"foo"
+    assert buffer.after_marker() == b"0\n"
+
+    buffer = _OutputBuffer(b"\n__MARKER__ ")
+    buffer.add(b"foo\n__MARKER")
+    assert buffer.marker_index is None
+    assert buffer.after_marker() is None
+    assert buffer.before_marker() == b"foo\n__MARKER"
+
+
+@pytest.mark.parametrize(
+    "result, expected",
+    [
+        ((0, b"123 /etc/ceph/ceph.conf\n", b""), 123),
+        (
+            (0, b"%d /var/log/ceph.log\n" % (PERSISTENT_SHELL_MAX_FILE_SIZE + 1), b""),
+            None,
+        ),
+        ((1, b"", b"wc: /missing: No such file or directory\n"), None),
+        ((127, b"", b"sh: wc: not found\n"), None),
+    ],
+)
+def test_get_container_file_size(
+    result: tuple[int, bytes, bytes], expected: int | None
+) -> None:
+    dc = mock.MagicMock()
+    dc._run_in_persistent_shell.return_value = result
+    assert Connection._get_container_file_size(dc, "/etc/ceph/ceph.conf") == expected
+    dc._run_in_persistent_shell.assert_called_once_with(
+        ["wc", "-c", "/etc/ceph/ceph.conf"]
+    )
@@ -331,3 +331,85 @@ def test_populate_filter(inventory: InventoryModule, mocker: t.Any) -> None:
 
     assert host_1_vars["ansible_host"] == "loving_tharp"
     assert len(inventory.inventory.hosts) == 1
+
+
+class CountingFakeClient(FakeClient):
+    def __init__(self, *hosts: dict[str, t.Any]) -> None:
+        super().__init__(*hosts)
+        self.inspected: list[str] = []
+
+    def get_json(self, url: str, *param: str, **kwargs: t.Any) -> t.Any:
+        if url == "/containers/{0}/json":
+            self.inspected.append(param[0])
+        return super().get_json(url, *param, **kwargs)
+
+
+def test_populate_without_inspection(templar: Templar, mocker: t.Any) -> None:
+    inventory = InventoryModule()
+    inventory.inventory = InventoryData()
+    inventory.templar = templar
+    client = CountingFakeClient(LOVING_THARP)
+
+    inventory.get_option = mocker.MagicMock(  # type: ignore[method-assign]
+        side_effect=create_get_option(
+            {
+                "verbose_output": False,
+                "connection_type": "docker-api",
+                "add_legacy_groups": False,
+                "compose": {},
+                "groups": {},
+                "keyed_groups": {},
+                "filters": None,
+            }
+        )
+    )
+    inspects = inventory._populate(client)  # type: ignore
+
+    assert client.inspected == []
+    assert inspects == {}
+
+    host_1 = inventory.inventory.get_host("loving_tharp")
+    assert host_1 is not None
+    host_1_vars = host_1.get_vars()
+
+    assert host_1_vars["ansible_host"] == "loving_tharp"
+    assert host_1_vars["ansible_connection"] == "community.docker.docker_api"
+
+
+def test_populate_cached_inspection(templar: Templar, mocker: t.Any) -> None:
+    inventory = InventoryModule()
+    inventory.inventory = InventoryData()
+    inventory.templar = templar
+    client = CountingFakeClient(
+        LOVING_THARP, LOVING_THARP_SERVICE | {"Id": "abc", "Name": "/other"}
+    )
+
+    inventory.get_option = mocker.MagicMock(  # type: ignore[method-assign]
+        side_effect=create_get_option(
+            {
+                "verbose_output": True,
+                "connection_type": "docker-api",
+                "add_legacy_groups": False,
+                "compose": {},
+                "groups": {},
+                "keyed_groups": {},
+                "filters": None,
+                "max_concurrent_inspects": 2,
+            }
+        )
+    )
+    inspects = inventory._populate(client)  # type: ignore
+    assert sorted(client.inspected) == sorted([LOVING_THARP["Id"], "abc"])
+    assert inspects[LOVING_THARP["Id"]]["inspect"] == LOVING_THARP
+
+    # Nothing changed: no container is inspected again
+    client.inspected = []
+    assert inventory._populate(client, inspects) == inspects  # type: ignore
+    assert client.inspected == []
+
+    # A changed container is inspected again
+    client.get_results["/containers/json"][1]["State"] = "exited"
+    new_inspects = inventory._populate(client, inspects)  # type: ignore
+    assert client.inspected == ["abc"]
+    assert new_inspects[LOVING_THARP["Id"]] == inspects[LOVING_THARP["Id"]]
+    assert new_inspects["abc"]["summary"]["State"] == "exited"
@@ -4,10 +4,25 @@
 
 from __future__ import annotations
 
+import contextlib
+import json
+import os
+import typing as t
+from unittest import mock
+
 import pytest
+from ansible.module_utils import basic
+from ansible.module_utils.basic import AnsibleModule
+from ansible.module_utils.common.text.converters import to_bytes
 
+from ansible_collections.community.docker.plugins.module_utils._common_cli import (
+    AnsibleModuleDockerClient,
+)
 from ansible_collections.community.docker.plugins.module_utils._compose_v2 import (
+    BaseComposeManager,
     Event,
+    EventParser,
+    JSONEventParser,
     parse_events,
     parse_json_events,
 )
@@ -589,3 +604,151 @@ def test_parse_json_events(
 
     assert collected_events == events
     assert collected_warnings == warnings
+
+
+def _feed_in_chunks(
+    parser: EventParser | JSONEventParser, data: bytes, chunk_size: int
+) -> None:
+    for offset in range(0, len(data), chunk_size):
+        parser.feed(data[offset : offset + chunk_size])
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7])
+@pytest.mark.parametrize(
+    "test_id, compose_version, dry_run, nonzero_rc, stderr, events, warnings",
+    _ALL_TEST_CASES,
+    ids=[tc[0] for tc in _ALL_TEST_CASES],
+)
+def test_event_parser_chunks(
+    test_id: str,
+    compose_version: str,
+    dry_run: bool,
+    nonzero_rc: bool,
+    stderr: str,
+    events: list[Event],
+    warnings: list[str],
+    chunk_size: int,
+) -> None:
+    collected_warnings: list[str] = []
+    parser = EventParser(dry_run=dry_run, warn_function=collected_warnings.append)
+    _feed_in_chunks(parser, stderr.encode("utf-8"), chunk_size)
+
+    assert parser.close(nonzero_rc=nonzero_rc) == events
+    assert collected_warnings == warnings
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7])
+@pytest.mark.parametrize(
+    "test_id, compose_version, stderr, events, warnings",
+    JSON_TEST_CASES,
+    ids=[tc[0] for tc in JSON_TEST_CASES],
+)
+def test_json_event_parser_chunks(
+    test_id: str,
+    compose_version: str,
+    stderr: str,
+    events: list[Event],
+    warnings: list[str],
+    chunk_size: int,
+) -> None:
+    collected_warnings: list[str] = []
+    parser = JSONEventParser(warn_function=collected_warnings.append)
+    _feed_in_chunks(parser, stderr.encode("utf-8"), chunk_size)
+
+    assert parser.close() == events
+    assert collected_warnings == warnings
+
+
+def test_event_parser_incremental() -> None:
+    collected_warnings: list[str] = []
+    parser = EventParser(warn_function=collected_warnings.append)
+    parser.feed(b" Container foo  Creating\r")
+    assert parser.events == []
+    parser.feed(b"\n Container foo  Created\n Contai")
+    assert parser.events == [
+        Event("container", "foo", "Creating", None),
+        Event("container", "foo", "Created", None),
+    ]
+    # The unparsable line is only an error if it is the last one
+    parser.feed(b"ner foo  Starting\nsomething went wrong\n")
+    assert len(parser.events) == 3
+    assert collected_warnings == []
+    assert parser.close(nonzero_rc=True)[-1] == Event(
+        "unknown", "", "Error", "something went wrong"
+    )
+    assert collected_warnings == []
+
+    parser = EventParser(warn_function=collected_warnings.append)
+    parser.feed(b"something odd\n Container foo  Created\n\n")
+    assert parser.close(nonzero_rc=True) == [
+        Event("container", "foo", "Created", None),
+    ]
+    assert len(collected_warnings) == 1
+    assert "something odd" in collected_warnings[0]
+
+
+@pytest.mark.skipif(not os.path.exists("/bin/sh"), reason="needs /bin/sh")
+@contextlib.contextmanager
+def _module_args(args: dict[str, t.Any]) -> t.Iterator[None]:
+    try:
+        from ansible.module_utils.testing import patch_module_args
+    except ImportError:
+        # Before data tagging support was merged, this was the way to go:
+        serialized_args = to_bytes(json.dumps({"ANSIBLE_MODULE_ARGS": args}))
+        with mock.patch.object(basic, "_ANSIBLE_ARGS", serialized_args):
+            yield
+    else:
+        with patch_module_args(args):
+            yield
+
+
+def test_call_cli_with_events(tmp_path: t.Any) -> None:
+    # /bin/sh stands in for 'docker compose'
+    with _module_args({}):
+        module = AnsibleModule(argument_spec={})
+    client = mock.MagicMock()
+    client.module = module
+    client._environment = {"FOO": "bar"}
+    client._compose_cmd.side_effect = lambda args: ["/bin/sh", "-c", *args]
+    client.call_cli.side_effect = (
+        lambda *args, **kwargs: AnsibleModuleDockerClient.call_cli(
+            client, *args, **kwargs
+        )
+    )
+    client.call_cli_stream_stderr.side_effect = (
+        lambda *args, **kwargs: AnsibleModuleDockerClient.call_cli_stream_stderr(
+            client, *args, **kwargs
+        )
+    )
+
+    parser = EventParser()
+    seen: list[list[Event]] = []
+    feed = parser.feed
+
+    def record_feed(chunk: bytes) -> None:
+        feed(chunk)
+        seen.append(list(parser.events))
+
+    parser.feed = record_feed  # type: ignore[method-assign]
+    manager = mock.MagicMock()
+    manager.project_src = str(tmp_path)
+    manager.client = client
+    manager.create_event_parser.return_value = parser
+
+    rc, stdout, stderr, events = BaseComposeManager.call_cli_with_events(
+        manager,
+        [
+            "printf ' Container foo  Creating\\n' >&2; sleep 0.2;"
+            " printf ' Container foo  Created\\n' >&2; echo $FOO; pwd; exit 1"
+        ],
+    )
+
+    assert rc == 1
+    assert stdout == f"bar\n{tmp_path}\n".encode("utf-8")
+    assert stderr == b" Container foo  Creating\n Container foo  Created\n"
+    assert events == [
+        Event("container", "foo", "Creating", None),
+        Event("container", "foo", "Created", None),
+    ]
+    # The first event was parsed while Compose was still running
+    assert seen[0] == [Event("container", "foo", "Creating", None)]
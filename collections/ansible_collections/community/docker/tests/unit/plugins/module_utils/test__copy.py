@@ -4,12 +4,19 @@
 
 from __future__ import annotations
 
+import io
+import tarfile
 import typing as t
+from unittest import mock
 
 import pytest
 
 from ansible_collections.community.docker.plugins.module_utils._copy import (
     _stream_generator_to_fileobj,
+    checksum_files,
+    put_file_contents,
+    put_files,
+    stat_tree,
 )
 
 if t.TYPE_CHECKING:
@@ -85,3 +92,136 @@ def test__stream_generator_to_fileobj(
 
     assert buffer == expected[: len(buffer)]
     assert min(totally_read, len(expected)) == len(buffer)
+
+
+def test_put_file_contents() -> None:
+    client = mock.MagicMock()
+    client._put.return_value.status_code = 200
+
+    put_file_contents(
+        client,
+        "container",
+        [
+            ("/tmp/ansible-tmp/AnsiballZ_ping.py", b"print('ping')\n", 0o700, 1000),
+            ("/tmp/ansible-tmp/args", b"", 0o600, None),
+            ("/tmp/ansible-tmp/sub/data", b"x" * 1000, 0o644, 2000),
+        ],
+        user_id=1000,
+        group_id=1001,
+        user_name="ansible",
+    )
+
+    client._put.assert_called_once()
+    assert client._put.call_args.kwargs["params"] == {"path": "/tmp/ansible-tmp"}
+    data = b"".join(client._put.call_args.kwargs["data"])
+    assert len(data) % tarfile.RECORDSIZE == 0
+
+    with tarfile.open(fileobj=io.BytesIO(data), mode="r") as tar:
+        members = tar.getmembers()
+        assert [m.name for m in members] == ["AnsiballZ_ping.py", "args", "sub/data"]
+        assert [m.mode for m in members] == [0o700, 0o600, 0o644]
+        assert all(m.uid == 1000 and m.gid == 1001 for m in members)
+        assert all(m.uname == "ansible" for m in members)
+        assert members[0].mtime == 1000
+        assert members[2].mtime == 2000
+        assert tar.extractfile(members[0]).read() == b"print('ping')\n"
+        assert tar.extractfile(members[1]).read() == b""
+        assert tar.extractfile(members[2]).read() == b"x" * 1000
+
+
+def test_put_file_contents_empty() -> None:
+    client = mock.MagicMock()
+    put_file_contents(client, "container", [], user_id=0, group_id=0)
+    client._put.assert_not_called()
+
+
+def test_put_files(tmp_path: t.Any) -> None:
+    (tmp_path / "conf").mkdir()
+    (tmp_path / "conf" / "a.conf").write_bytes(b"a" * 700)
+    client = mock.MagicMock()
+    client._put.return_value.status_code = 200
+
+    put_files(
+        client,
+        "container",
+        "/etc",
+        [
+            ("ceph", str(tmp_path / "conf"), 0o750),
+            ("ceph/a.conf", str(tmp_path / "conf" / "a.conf"), 0o640),
+        ],
+        user_id=167,
+        group_id=167,
+    )
+
+    assert client._put.call_args.kwargs["params"] == {"path": "/etc"}
+    data = b"".join(client._put.call_args.kwargs["data"])
+    with tarfile.open(fileobj=io.BytesIO(data), mode="r") as tar:
+        members = tar.getmembers()
+        assert [(m.name, m.isdir(), m.mode) for m in members] == [
+            ("ceph", True, 0o750),
+            ("ceph/a.conf", False, 0o640),
+        ]
+        assert tar.extractfile(members[1]).read() == b"a" * 700
+
+
+def test_stat_tree() -> None:
+    stdout = (
+        b"directory|4096|1700000000|755|0|0|/etc/ceph\n"
+        b"regular file|120|1700000001|644|167|167|/etc/ceph/ceph.conf\n"
+        b"regular empty file|0|1700000002|600|0|0|/etc/ceph/a|b\n"
+        b"symbolic link|7|1700000003|777|0|0|/etc/ceph/link\n"
+    )
+    with mock.patch(
+        "ansible_collections.community.docker.plugins.module_utils._copy._execute_command",
+        return_value=(0, stdout, b""),
+    ) as execute:
+        result = stat_tree(mock.MagicMock(), "container", "/etc/ceph")
+
+    assert execute.call_args.args[2][-1] == "/etc/ceph"
+    assert result == {
+        "/etc/ceph": {
+            "type": "directory",
+            "size": 4096,
+            "mtime": 1700000000,
+            "mode": 0o755,
+            "uid": 0,
+            "gid": 0,
+        },
+        "/etc/ceph/ceph.conf": {
+            "type": "file",
+            "size": 120,
+            "mtime": 1700000001,
+            "mode": 0o644,
+            "uid": 167,
+            "gid": 167,
+        },
+        "/etc/ceph/a|b": {
+            "type": "file",
+            "size": 0,
+            "mtime": 1700000002,
+            "mode": 0o600,
+            "uid": 0,
+            "gid": 0,
+        },
+        "/etc/ceph/link": {
+            "type": "link",
+            "size": 7,
+            "mtime": 1700000003,
+            "mode": 0o777,
+            "uid": 0,
+            "gid": 0,
+        },
+    }
+
+
+def test_checksum_files() -> None:
+    digest = "a" * 64
+    with mock.patch(
+        "ansible_collections.community.docker.plugins.module_utils._copy._execute_command",
+        return_value=(0, f"{digest}  /etc/ceph/ceph.conf\n".encode(), b""),
+    ) as execute:
+        result = checksum_files(mock.MagicMock(), "container", ["/etc/ceph/ceph.conf"])
+
+    assert execute.call_args.args[2][-1] == "/etc/ceph/ceph.conf"
+    assert result == {"/etc/ceph/ceph.conf": digest}
+    assert checksum_files(mock.MagicMock(), "container", []) == {}
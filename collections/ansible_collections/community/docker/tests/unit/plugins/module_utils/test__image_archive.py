@@ -4,15 +4,22 @@
 
 from __future__ import annotations
 
+import gzip
 import tarfile
 import typing as t
 
 import pytest
 
 from ansible_collections.community.docker.plugins.module_utils._image_archive import (
+    HAS_ZSTD,
     ImageArchiveInvalidException,
     api_image_id,
     archived_image_manifest,
+    compression_from_path,
+    detect_archive_compression,
+    open_archive_for_load,
+    open_archive_reader,
+    open_archive_writer,
 )
 
 from ..test_support.docker_image_archive_stubbing import (
@@ -95,3 +102,72 @@ def test_archived_image_manifest_raises_when_manifest_missing_id(
     except ImageArchiveInvalidException as e:
         assert isinstance(e.__cause__, KeyError)
         assert "Config" in str(e.__cause__)
+
+
+def _compress(tar_file_name: str, compression: str) -> str:
+    with open(tar_file_name, "rb") as f:
+        data = f.read()
+    compressed_name = f"{tar_file_name}.{compression}"
+    with open_archive_writer(compressed_name, compression) as f:
+        f.write(data)
+    return compressed_name
+
+
+@pytest.mark.parametrize(
+    "path, expected",
+    [
+        ("/tmp/foo.tar", "none"),
+        ("/tmp/foo.tar.gz", "gzip"),
+        ("/tmp/foo.TGZ", "gzip"),
+        ("/tmp/foo.tar.zst", "zstd"),
+        ("/tmp/foo.tar.zstd", "zstd"),
+        ("/tmp/foo", "none"),
+    ],
+)
+def test_compression_from_path(path: str, expected: str) -> None:
+    assert compression_from_path(path) == expected
+
+
+@pytest.mark.parametrize("compression", ["gzip", "zstd"])
+def test_archived_image_manifest_compressed(
+    tar_file_name: str, compression: str
+) -> None:
+    if compression == "zstd" and not HAS_ZSTD:
+        pytest.skip("zstd is not available")
+
+    write_imitation_archive(tar_file_name, "abcde12345", ["foo:latest"])
+    compressed_name = _compress(tar_file_name, compression)
+
+    assert detect_archive_compression(tar_file_name) == "none"
+    assert detect_archive_compression(compressed_name) == compression
+
+    actual = archived_image_manifest(compressed_name)
+    assert actual is not None
+    assert actual.image_id == "abcde12345"
+    assert actual.repo_tags == ["foo:latest"]
+
+    with open(tar_file_name, "rb") as f:
+        expected = f.read()
+    with open_archive_reader(compressed_name) as f:
+        assert f.read() == expected
+
+
+def test_open_archive_for_load_keeps_gzip(tar_file_name: str) -> None:
+    write_imitation_archive(tar_file_name, "abcde12345", ["foo:latest"])
+    compressed_name = _compress(tar_file_name, "gzip")
+
+    # The Docker daemon decompresses gzip itself, so the file is sent as-is
+    with open_archive_for_load(compressed_name) as f:
+        data = f.read()  # type: ignore[union-attr]
+    with open(compressed_name, "rb") as f:
+        assert data == f.read()
+    assert gzip.decompress(data).startswith(b"manifest.json")
+
+
+def test_open_archive_writer_zstd_missing(tar_file_name: str) -> None:
+    if HAS_ZSTD:
+        pytest.skip("zstd is available")
+    with pytest.raises(
+        ImageArchiveInvalidException, match="zstandard"
+    ), open_archive_writer(tar_file_name, "zstd"):
+        pass
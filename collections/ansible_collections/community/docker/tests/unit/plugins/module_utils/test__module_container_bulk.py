@@ -0,0 +1,228 @@
+# Copyright (c) Ansible Project
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import annotations
+
+import threading
+import typing as t
+from unittest import mock
+
+import pytest
+
+from ansible_collections.community.docker.plugins.module_utils._module_container.base import (
+    ContainerError,
+)
+from ansible_collections.community.docker.plugins.module_utils._module_container.bulk import (
+    BulkContainerManager,
+    _SharedEngineDriver,
+)
+from ansible_collections.community.docker.plugins.module_utils._module_container.docker_api import (
+    DockerAPIEngineDriver,
+)
+from ansible_collections.community.docker.plugins.module_utils._module_container.module import (
+    CONTAINER_ARGUMENT_SPEC,
+    CONTAINER_REQUIRED_IF,
+)
+from ansible_collections.community.docker.plugins.module_utils._version import (
+    LooseVersion,
+)
+
+
+class FailJson(Exception):
+    pass
+
+
+def _create_module(params: dict[str, t.Any]) -> mock.MagicMock:
+    module = mock.MagicMock()
+    module.check_mode = False
+    module._diff = False
+    module.params = {
+        "debug": False,
+        "defaults": {},
+        "parallelism": 4,
+    }
+    module.params.update(params)
+
+    def fail_json(msg: str, **kwargs: t.Any) -> t.NoReturn:
+        raise FailJson(msg)
+
+    module.fail_json.side_effect = fail_json
+    return module
+
+
+def _create_manager(
+    params: dict[str, t.Any],
+) -> tuple[BulkContainerManager, mock.MagicMock]:
+    engine_driver = DockerAPIEngineDriver()
+    spec = engine_driver.collect_options(
+        CONTAINER_ARGUMENT_SPEC, required_if=CONTAINER_REQUIRED_IF
+    )
+    client = mock.MagicMock()
+    client.docker_api_version = LooseVersion("1.48")
+    module = _create_module(params)
+    return BulkContainerManager(module, engine_driver, client, spec), module
+
+
+def test_shared_engine_driver_caches() -> None:
+    engine_driver = mock.MagicMock()
+    engine_driver.get_host_info.return_value = {"Name": "host"}
+    engine_driver.inspect_image_by_name.return_value = None
+    engine_driver.pull_image.return_value = ({"Id": "sha256:123"}, False)
+    shared = _SharedEngineDriver(engine_driver)
+    client = object()
+
+    for dummy in range(3):
+        assert shared.get_host_info(client) == {"Name": "host"}
+    assert engine_driver.get_host_info.call_count == 1
+
+    assert shared.inspect_image_by_name(client, "foo", "latest") is None
+    assert shared.inspect_image_by_name(client, "foo", "latest") is None
+    assert engine_driver.inspect_image_by_name.call_count == 1
+
+    # Only the first pull talks to the daemon, the second one is already up-to-date
+    assert shared.pull_image(client, "foo", "latest") == ({"Id": "sha256:123"}, False)
+    assert shared.pull_image(client, "foo", "latest") == ({"Id": "sha256:123"}, True)
+    assert engine_driver.pull_image.call_count == 1
+
+    # The pulled image is returned by later inspections
+    assert shared.inspect_image_by_name(client, "foo", "latest") == {"Id": "sha256:123"}
+    assert engine_driver.inspect_image_by_name.call_count == 1
+
+    # Other methods are passed through
+    assert shared.name is engine_driver.name
+
+
+def test_shared_engine_driver_concurrent_pull() -> None:
+    engine_driver = mock.MagicMock()
+    engine_driver.pull_image.return_value = ({"Id": "sha256:123"}, False)
+    shared = _SharedEngineDriver(engine_driver)
+    results: list[t.Any] = []
+
+    def pull() -> None:
+        results.append(shared.pull_image(None, "foo", "1.0"))
+
+    threads = [threading.Thread(target=pull) for dummy in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert engine_driver.pull_image.call_count == 1
+    assert sorted(already for dummy, already in results) == [False] + [True] * 7
+
+
+def test_bulk_validation() -> None:
+    manager, dummy = _create_manager(
+        {"containers": [{"name": "a", "state": "present"}]}
+    )
+    with pytest.raises(FailJson) as exc:
+        manager.run()
+    assert "Invalid definition of container a" in str(exc.value)
+    assert "image" in str(exc.value)
+
+    manager, dummy = _create_manager(
+        {"containers": [{"name": "a", "foo": 1}], "defaults": {"image": "foo"}}
+    )
+    with pytest.raises(FailJson) as exc:
+        manager.run()
+    assert "foo" in str(exc.value)
+
+    manager, dummy = _create_manager(
+        {"containers": [{"name": "a"}, {"name": "a"}], "defaults": {"image": "foo"}}
+    )
+    with pytest.raises(FailJson) as exc:
+        manager.run()
+    assert "more than once: a" in str(exc.value)
+
+
+def test_bulk_run() -> None:
+    manager, dummy = _create_manager(
+        {
+            "containers": [
+                {"name": "a"},
+                {"name": "b", "comparisons": {"*": "ignore"}},
+                {"name": "c", "state": "absent"},
+                {"name": "d"},
+            ],
+            "defaults": {"image": "foo:1.0", "state": "started"},
+        }
+    )
+    seen: list[tuple[str, str, str | None]] = []
+    lock = threading.Lock()
+
+    class FakeContainerManager:
+        def __init__(self, module: t.Any, engine_driver: t.Any, *args: t.Any) -> None:
+            self.module = module
+            self.results: dict[str, t.Any] = {"changed": False}
+            with lock:
+                seen.append(
+                    (
+                        module.params["name"],
+                        module.params["state"],
+                        module.params["image"],
+                    )
+                )
+            assert isinstance(engine_driver, _SharedEngineDriver)
+
+        def run(self) -> None:
+            name = self.module.params["name"]
+            if name == "c":
+                self.results["changed"] = True
+            if name == "d":
+                self.module.fail_json(msg="boom", container={"Id": "d"})
+
+    with mock.patch(
+        "ansible_collections.community.docker.plugins.module_utils._module_container.bulk.ContainerManager",
+        FakeContainerManager,
+    ):
+        manager.run()
+
+    assert sorted(seen) == [
+        ("a", "started", "foo:1.0"),
+        ("b", "started", "foo:1.0"),
+        ("c", "absent", "foo:1.0"),
+        ("d", "started", "foo:1.0"),
+    ]
+    assert manager.results["changed"] is True
+    assert [result["name"] for result in manager.results["containers"]] == [
+        "a",
+        "b",
+        "c",
+        "d",
+    ]
+    assert manager.results["containers"][3] == {
+        "name": "d",
+        "changed": False,
+        "failed": True,
+        "msg": "boom",
+        "container": {"Id": "d"},
+    }
+    assert "failed" not in manager.results["containers"][0]
+
+
+def test_bulk_comparisons_per_container() -> None:
+    manager, dummy = _create_manager({"containers": []})
+    first = manager._copy_active_options()
+    second = manager._copy_active_options()
+    first_options = {
+        option.name: option for options in first for option in options.all_options
+    }
+    second_options = {
+        option.name: option for options in second for option in options.all_options
+    }
+    first_options["env"].comparison = "ignore"
+    assert second_options["env"].comparison == "allow_more_present"
+    assert first_options["env"].compare({"a": "b"}, {}) is True
+    assert second_options["env"].compare({"a": "b"}, {}) is False
+    for options in manager.spec.active_options:
+        for option in options.all_options:
+            assert option is not first_options[option.name]
+            if option.name == "env":
+                assert option.comparison == "allow_more_present"
+
+
+def test_container_error() -> None:
+    exc = ContainerError("msg", status=1)
+    assert exc.msg == "msg"
+    assert exc.kwargs == {"status": 1}
@@ -4,11 +4,16 @@
 
 from __future__ import annotations
 
+import hashlib
+import os
 import typing as t
+from unittest import mock
 
 import pytest
 
 from ansible_collections.community.docker.plugins.modules.docker_container_copy_into import (
+    copy_tree_into_container,
+    is_checksum_idempotent,
     parse_modern,
     parse_octal_string_only,
 )
@@ -82,3 +87,147 @@ def test_parse_bad_value(value: str) -> None:
         parse_modern(value)
     with pytest.raises(ValueError):
         parse_octal_string_only(value)
+
+
+def _container_entry(
+    path: str, file_type: str = "file", size: int = 0, mtime: int = 0
+) -> dict[str, t.Any]:
+    st = os.stat(path)
+    return {
+        "type": file_type,
+        "size": size if file_type == "file" else 4096,
+        "mtime": mtime,
+        "mode": st.st_mode & 0o7777,
+        "uid": 167,
+        "gid": 167,
+    }
+
+
+def test_copy_tree_into_container(tmp_path: t.Any) -> None:
+    src = tmp_path / "ceph"
+    (src / "osd").mkdir(parents=True)
+    (src / "same_mtime").write_bytes(b"1")
+    (src / "same_digest").write_bytes(b"22")
+    (src / "other_digest").write_bytes(b"33")
+    (src / "other_size").write_bytes(b"4444")
+    (src / "osd" / "new").write_bytes(b"5")
+
+    def local(name: str) -> str:
+        return str(src / name)
+
+    container_tree = {
+        "/etc/ceph": _container_entry(str(src), "directory"),
+        "/etc/ceph/osd": _container_entry(local("osd"), "directory"),
+        "/etc/ceph/same_mtime": _container_entry(
+            local("same_mtime"),
+            size=1,
+            mtime=int(os.stat(local("same_mtime")).st_mtime),
+        ),
+        "/etc/ceph/same_digest": _container_entry(local("same_digest"), size=2),
+        "/etc/ceph/other_digest": _container_entry(local("other_digest"), size=2),
+        "/etc/ceph/other_size": _container_entry(local("other_size"), size=3),
+    }
+    checksums = {
+        "/etc/ceph/same_digest": hashlib.sha256(b"22").hexdigest(),
+        "/etc/ceph/other_digest": hashlib.sha256(b"xx").hexdigest(),
+    }
+
+    client = mock.MagicMock()
+    client.module.check_mode = False
+
+    def sha256(path: str) -> str:
+        with open(path, "rb") as f:
+            return hashlib.sha256(f.read()).hexdigest()
+
+    client.module.sha256.side_effect = sha256
+
+    module = "ansible_collections.community.docker.plugins.modules.docker_container_copy_into"
+    with mock.patch(f"{module}.stat_tree", return_value=container_tree), mock.patch(
+        f"{module}.checksum_files", return_value=checksums
+    ) as checksum_files, mock.patch(f"{module}.put_files") as put_files:
+        copy_tree_into_container(
+            client, "ceph-mon", str(src), "/etc/ceph", 167, 167, None, force=None
+        )
+
+    assert sorted(checksum_files.call_args.args[2]) == [
+        "/etc/ceph/other_digest",
+        "/etc/ceph/same_digest",
+    ]
+    put_files.assert_called_once()
+    assert put_files.call_args.kwargs["out_dir"] == "/etc/ceph"
+    assert [f[0] for f in put_files.call_args.kwargs["files"]] == [
+        "other_digest",
+        "other_size",
+        "osd/new",
+    ]
+    client.module.exit_json.assert_called_once_with(
+        container_path="/etc/ceph",
+        changed=True,
+        changed_files=[
+            "/etc/ceph/other_digest",
+            "/etc/ceph/other_size",
+            "/etc/ceph/osd/new",
+        ],
+    )
+
+
+def test_copy_tree_into_missing_container_directory(tmp_path: t.Any) -> None:
+    src = tmp_path / "ceph"
+    src.mkdir()
+    (src / "ceph.conf").write_bytes(b"[global]\n")
+
+    client = mock.MagicMock()
+    client.module.check_mode = False
+
+    module = "ansible_collections.community.docker.plugins.modules.docker_container_copy_into"
+    with mock.patch(f"{module}.stat_tree", return_value={}), mock.patch(
+        f"{module}.checksum_files"
+    ) as checksum_files, mock.patch(f"{module}.put_files") as put_files:
+        copy_tree_into_container(
+            client, "ceph-mon", str(src), "/etc/ceph", 167, 167, 0o600
+        )
+
+    checksum_files.assert_not_called()
+    assert put_files.call_args.kwargs["out_dir"] == "/etc"
+    assert [(f[0], f[2]) for f in put_files.call_args.kwargs["files"]] == [
+        ("ceph", os.stat(src).st_mode & 0o7777),
+        ("ceph/ceph.conf", 0o600),
+    ]
+
+
+@pytest.mark.parametrize(
+    "size, expected",
+    [
+        (4, True),
+        (5, False),
+    ],
+)
+def test_is_checksum_idempotent_same_mtime(
+    tmp_path: t.Any, size: int, expected: bool
+) -> None:
+    path = tmp_path / "ceph.conf"
+    path.write_bytes(b"1234")
+    mtime = os.stat(path).st_mtime
+    entry = _container_entry(str(path), size=size, mtime=int(mtime))
+
+    module = "ansible_collections.community.docker.plugins.modules.docker_container_copy_into"
+    with mock.patch(
+        f"{module}.stat_tree", return_value={"/etc/ceph/ceph.conf": entry}
+    ), mock.patch(f"{module}.checksum_files") as checksum_files:
+        assert (
+            is_checksum_idempotent(
+                mock.MagicMock(),
+                "ceph-mon",
+                "/etc/ceph/ceph.conf",
+                167,
+                167,
+                entry["mode"],
+                4,
+                mtime,
+                lambda: hashlib.sha256(b"1234").hexdigest(),
+            )
+            is expected
+        )
+
+    # A matching modification time is only trusted if the size matches as well
+    checksum_files.assert_not_called()
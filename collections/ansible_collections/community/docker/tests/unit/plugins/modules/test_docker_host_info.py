@@ -0,0 +1,97 @@
+# Copyright (c) Ansible Project
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import annotations
+
+import typing as t
+from unittest import mock
+
+from ansible_collections.community.docker.plugins.modules import (
+    docker_host_info,
+)
+
+
+def _create_client(**params: t.Any) -> mock.MagicMock:
+    client = mock.MagicMock()
+    client.module.params = {
+        "containers": False,
+        "containers_all": False,
+        "containers_filters": None,
+        "images": False,
+        "images_filters": None,
+        "networks": False,
+        "networks_filters": None,
+        "volumes": False,
+        "volumes_filters": None,
+        "disk_usage": False,
+        "verbose_output": False,
+        "fields": None,
+        "max_items": None,
+        "summary_only": False,
+    }
+    client.module.params.update(params)
+    client.info.return_value = {"ID": "host"}
+    return client
+
+
+IMAGES = [
+    {"Id": "sha256:1", "RepoTags": ["a:1"], "Created": 1, "Size": 100, "Labels": {}},
+    {"Id": "sha256:2", "RepoTags": ["b:1"], "Created": 2, "Size": 50, "Labels": {}},
+    {"Id": "sha256:3", "RepoTags": [], "Created": 3, "Size": 10, "Labels": {}},
+]
+
+
+def test_fields_and_max_items() -> None:
+    client = _create_client(
+        images=True, fields={"images": ["Id", "Missing"]}, max_items=2
+    )
+    client.get_json.return_value = list(IMAGES)
+    results: dict[str, t.Any] = {}
+    docker_host_info.DockerHostManager(client, results)
+    assert results["images"] == [
+        {"Id": "sha256:1", "Missing": None},
+        {"Id": "sha256:2", "Missing": None},
+    ]
+
+
+def test_max_items_containers() -> None:
+    client = _create_client(containers=True, max_items=5)
+    client.get_json.return_value = []
+    docker_host_info.DockerHostManager(client, {})
+    assert client.get_json.call_args.kwargs["params"]["limit"] == 5
+
+
+def test_summary_only() -> None:
+    client = _create_client(
+        images=True, containers=True, summary_only=True, max_items=1
+    )
+    client.get_json.side_effect = [
+        [{"Id": "1", "State": "running"}, {"Id": "2", "State": "running"}],
+        list(IMAGES),
+    ]
+    results: dict[str, t.Any] = {}
+    docker_host_info.DockerHostManager(client, results)
+    assert "images" not in results
+    assert "containers" not in results
+    assert results["summary"] == {
+        "containers": {"count": 2, "states": {"running": 2}},
+        "images": {"count": 3, "size": 160},
+    }
+
+
+def test_get_docker_disk_usage_summary() -> None:
+    df = {
+        "LayersSize": 1000,
+        "Images": [{"Size": 100}, {"Size": 200}],
+        "Containers": [{"SizeRw": 5}, {}],
+        "Volumes": [{"UsageData": {"Size": 7}}, {"UsageData": {"Size": -1}}],
+        "BuildCache": None,
+    }
+    assert docker_host_info.get_docker_disk_usage_summary(df) == {
+        "LayersSize": 1000,
+        "images": {"count": 2, "size": 300},
+        "containers": {"count": 2, "size": 5},
+        "volumes": {"count": 2, "size": 7},
+        "build_cache": {"count": 0, "size": 0},
+    }
@@ -119,3 +119,32 @@ def test_archived_image_action_when_obsolete_by_name(tar_file_name: str) -> None
     print(f"actual   : {actual}")
     print(f"expected : {expected}")
     assert actual == expected
+
+
+def test_archived_image_action_when_compression_differs(tar_file_name: str) -> None:
+    fake_name = "f:latest"
+    fake_id = "f6"
+
+    write_imitation_archive(tar_file_name, fake_id, [fake_name])
+
+    assert (
+        ImageManager.archived_image_action(
+            assert_no_logging,
+            tar_file_name,
+            fake_name,
+            api_image_id(fake_id),
+            compression="none",
+        )
+        is None
+    )
+
+    expected = f"Archived image {fake_name} to {tar_file_name}, overwriting archive with compression none"
+    actual = ImageManager.archived_image_action(
+        assert_no_logging,
+        tar_file_name,
+        fake_name,
+        api_image_id(fake_id),
+        compression="gzip",
+    )
+
+    assert actual == expected
@@ -0,0 +1,143 @@
+# Copyright (c) Ansible Project
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import annotations
+
+import typing as t
+from unittest import mock
+
+import pytest
+
+from ansible_collections.community.docker.plugins.module_utils._common_api import (
+    ImagePullError,
+)
+from ansible_collections.community.docker.plugins.module_utils._version import (
+    LooseVersion,
+)
+from ansible_collections.community.docker.plugins.modules import (
+    docker_image_pull,
+)
+
+
+class FailJson(Exception):
+    def __init__(self, msg: str, **kwargs: t.Any) -> None:
+        super().__init__(msg)
+        self.kwargs = kwargs
+
+
+def _create_client(images: list[dict[str, t.Any]], **params: t.Any) -> mock.MagicMock:
+    client = mock.MagicMock()
+    client.check_mode = False
+    client.docker_api_version = LooseVersion("1.41")
+    client.module.params = {
+        "name": None,
+        "images": [{"tag": None, "platform": None, **image} for image in images],
+        "tag": "latest",
+        "platform": None,
+        "pull": "always",
+        "max_concurrent_pulls": 4,
+    }
+    client.module.params.update(params)
+
+    def fail(msg: str, **kwargs: t.Any) -> t.NoReturn:
+        raise FailJson(msg, **kwargs)
+
+    client.fail.side_effect = fail
+    client._compare_images.side_effect = lambda a, b: (a or {}).get("Id") == (
+        b or {}
+    ).get("Id")
+    return client
+
+
+LOCAL_IMAGES = {
+    "a:1": {"Id": "sha256:a", "RepoDigests": ["a@sha256:remote-a"]},
+    "b:latest": {"Id": "sha256:b", "RepoDigests": ["b@sha256:old-b"]},
+}
+
+
+def test_multi_image_pull() -> None:
+    client = _create_client([{"name": "a", "tag": "1"}, {"name": "b"}, {"name": "c:2"}])
+    pulled: set[str] = set()
+
+    def find_image(name: str, tag: str) -> dict[str, t.Any] | None:
+        key = f"{name}:{tag}"
+        if key in pulled:
+            return {"Id": f"sha256:new-{name}"}
+        return LOCAL_IMAGES.get(key)
+
+    def pull_image_raw(name: str, tag: str, image_platform: str | None = None) -> int:
+        pulled.add(f"{name}:{tag}")
+        return 1000
+
+    client.find_image.side_effect = find_image
+    client.get_remote_image_digest.side_effect = lambda name, tag: (
+        f"sha256:remote-{name}"
+    )
+    client.pull_image_raw.side_effect = pull_image_raw
+
+    results = docker_image_pull.MultiImagePuller(client).pull()
+
+    assert pulled == {"b:latest", "c:2"}
+    assert results["changed"] is True
+    assert [
+        (image["name"], image["tag"], image["pulled"], image["changed"], image["id"])
+        for image in results["images"]
+    ] == [
+        ("a", "1", False, False, "sha256:a"),
+        ("b", "latest", True, True, "sha256:new-b"),
+        ("c", "2", True, True, "sha256:new-c"),
+    ]
+    assert results["images"][1]["bytes_downloaded"] == 1000
+    assert "bytes_downloaded" not in results["images"][0]
+    assert results["diff"]["before"]["c:2"] == {"exists": False}
+    assert results["diff"]["after"]["c:2"] == {"id": "sha256:new-c"}
+
+
+def test_multi_image_pull_not_present() -> None:
+    client = _create_client(
+        [{"name": "a", "tag": "1"}, {"name": "c"}], pull="not_present"
+    )
+    client.check_mode = True
+    client.find_image.side_effect = lambda name, tag: LOCAL_IMAGES.get(f"{name}:{tag}")
+
+    results = docker_image_pull.MultiImagePuller(client).pull()
+
+    client.get_remote_image_digest.assert_not_called()
+    client.pull_image_raw.assert_not_called()
+    assert [image["pulled"] for image in results["images"]] == [False, True]
+    assert results["changed"] is True
+
+
+def test_multi_image_pull_digest_fallback() -> None:
+    client = _create_client([{"name": "a", "tag": "1"}])
+    client.find_image.return_value = LOCAL_IMAGES["a:1"]
+    client.get_remote_image_digest.side_effect = Exception("registry unreachable")
+    client.pull_image_raw.return_value = 0
+
+    results = docker_image_pull.MultiImagePuller(client).pull()
+
+    client.pull_image_raw.assert_called_once_with("a", tag="1", image_platform=None)
+    assert results["images"][0]["digest"] is None
+    assert results["images"][0]["pulled"] is True
+    assert results["changed"] is False
+
+
+def test_multi_image_pull_failure() -> None:
+    client = _create_client([{"name": "a", "tag": "1"}, {"name": "b"}])
+    client.find_image.return_value = None
+    client.get_remote_image_digest.return_value = "sha256:abc"
+    client.pull_image_raw.side_effect = [
+        ImagePullError("Error pulling a - denied"),
+        10,
+    ]
+    client.module.params["max_concurrent_pulls"] = 1
+
+    with pytest.raises(FailJson) as exc:
+        docker_image_pull.MultiImagePuller(client).pull()
+
+    assert str(exc.value) == "Failed to pull the images a:1"
+    images = exc.value.kwargs["images"]
+    assert images[0]["failed"] is True
+    assert images[0]["msg"] == "Error pulling a - denied"
+    assert "failed" not in images[1]
@@ -375,3 +375,169 @@ def test_get_docker_networks() -> None:
         docker_swarm_service.get_docker_networks(
             [{"name": "test", "nonexisting_option": "foo"}], {"test": "1"}
         )
+
+
+class FailJson(Exception):
+    pass
+
+
+_SERVICE_ARGUMENT_SPEC = {
+    "name": {"type": "str", "required": True},
+    "image": {"type": "str"},
+    "state": {"type": "str", "default": "present", "choices": ["present", "absent"]},
+    "replicas": {"type": "int", "default": -1},
+    "resolve_image": {"type": "bool", "default": False},
+    "secrets": {"type": "list", "elements": "dict"},
+    "configs": {"type": "list", "elements": "dict"},
+}
+
+
+def _create_bulk_client(mocker: t.Any, services: list[t.Any]) -> t.Any:
+    client = mocker.MagicMock()
+    client.module.check_mode = False
+    client.module._diff = False
+    client.module.argument_spec = dict(_SERVICE_ARGUMENT_SPEC)
+    client.module.params = {
+        "name": None,
+        "image": "foo:1.0",
+        "state": "present",
+        "replicas": -1,
+        "resolve_image": False,
+        "secrets": None,
+        "configs": None,
+        "services": services,
+        "max_concurrent_updates": 2,
+    }
+    client.option_minimal_versions = {
+        "replicas": {"supported": True},
+        "placement_config_replicas_max_per_node": {
+            "supported": False,
+            "docker_api_version": "1.40",
+            "detect_usage": lambda c: c.module.params.get("replicas") == 42,
+            "usage_msg": "set placement.replicas_max_per_node",
+        },
+    }
+
+    def fail(msg: str, **kwargs: t.Any) -> t.NoReturn:
+        raise FailJson(msg)
+
+    client.fail.side_effect = fail
+    client.networks.return_value = []
+    return client
+
+
+def test_get_services_params(mocker: t.Any) -> None:
+    client = _create_bulk_client(
+        mocker, [{"name": "a"}, {"name": "b", "image": "bar", "replicas": 2}]
+    )
+    manager = docker_swarm_service.DockerServiceManager(client)
+    services_params = manager.get_services_params(_SERVICE_ARGUMENT_SPEC)
+    assert [
+        (params["name"], params["image"], params["replicas"], params["state"])
+        for params in services_params
+    ] == [("a", "foo:1.0", -1, "present"), ("b", "bar", 2, "present")]
+
+    client = _create_bulk_client(mocker, [{"name": "a"}, {"name": "a"}])
+    manager = docker_swarm_service.DockerServiceManager(client)
+    with pytest.raises(FailJson, match="more than once: a"):
+        manager.get_services_params(_SERVICE_ARGUMENT_SPEC)
+
+    client = _create_bulk_client(mocker, [{"name": "a", "foo": 1}])
+    manager = docker_swarm_service.DockerServiceManager(client)
+    with pytest.raises(FailJson, match="Invalid definition of service a"):
+        manager.get_services_params(_SERVICE_ARGUMENT_SPEC)
+
+    client = _create_bulk_client(mocker, [{"name": "a", "replicas": 42}])
+    manager = docker_swarm_service.DockerServiceManager(client)
+    with pytest.raises(
+        FailJson, match=r"set placement.replicas_max_per_node \(service a\)"
+    ):
+        manager.get_services_params(_SERVICE_ARGUMENT_SPEC)
+
+
+def test_run_bulk(mocker: t.Any) -> None:
+    client = _create_bulk_client(
+        mocker,
+        [
+            {"name": "unchanged"},
+            {"name": "updated"},
+            {"name": "created"},
+            {"name": "removed", "state": "absent"},
+            {"name": "failed"},
+        ],
+    )
+    client.update_service.side_effect = [
+        APIError(
+            message="",
+            response=None,
+            explanation="rpc error: code = Unknown desc = update out of sequence",
+        ),
+        None,
+        APIError(message="", response=None, explanation="some error"),
+    ]
+    mocker.patch("time.sleep")
+    manager = docker_swarm_service.DockerServiceManager(client)
+
+    current_services = {
+        name: mocker.MagicMock(service_id=name, service_version=1)
+        for name in ("unchanged", "updated", "removed", "failed")
+    }
+    mocker.patch.object(manager, "get_services_by_name", return_value=current_services)
+    mocker.patch.object(
+        manager,
+        "get_service",
+        return_value=mocker.MagicMock(service_id="updated", service_version=2),
+    )
+
+    def from_ansible_params(params: dict[str, t.Any], *args: t.Any) -> t.Any:
+        new_service = mocker.MagicMock()
+        differences = docker_swarm_service.DifferenceTracker()
+        if params["name"] in ("updated", "failed"):
+            differences.add("replicas", parameter=2, active=1)
+        new_service.compare.return_value = (
+            not differences.empty,
+            differences,
+            False,
+            False,
+        )
+        new_service.get_facts.return_value = {"name": params["name"]}
+        new_service.build_docker_service.return_value = {}
+        return new_service
+
+    mocker.patch.object(
+        docker_swarm_service.DockerService,
+        "from_ansible_params",
+        side_effect=from_ansible_params,
+    )
+    # Make sure the updates happen in a predictable order
+    client.module.params["max_concurrent_updates"] = 1
+
+    results = manager.run_bulk(_SERVICE_ARGUMENT_SPEC)
+
+    assert results["changed"] is True
+    assert [
+        (result["name"], result["msg"], result["changed"])
+        for result in results["services"][:4]
+    ] == [
+        ("unchanged", "Service unchanged", False),
+        ("updated", "Service updated", True),
+        ("created", "Service created", True),
+        ("removed", "Service removed", True),
+    ]
+    assert all("failed" not in result for result in results["services"][:4])
+    failed = results["services"][4]
+    assert failed["name"] == "failed"
+    assert failed["failed"] is True
+    assert failed["msg"].startswith("Error while managing service failed: ")
+    assert "some error" in failed["msg"]
+    assert results["services"][1]["changes"] == ["replicas"]
+    # The update of 'updated' was retried with the new service version
+    assert [call.args[:2] for call in client.update_service.call_args_list] == [
+        ("updated", 1),
+        ("updated", 2),
+        ("failed", 1),
+    ]
+    client.create_service.assert_called_once()
+    client.remove_service.assert_called_once_with("removed")
+    client.services.assert_not_called()
+    client.inspect_service.assert_not_called()
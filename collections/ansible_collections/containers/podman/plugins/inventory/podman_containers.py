@@ -14,6 +14,10 @@ DOCUMENTATION = r"""
     description:
       - Discover running (and optionally stopped) Podman containers on the local host and add them as inventory hosts.
       - Each discovered host is assigned an Ansible connection plugin so tasks execute inside the container without SSH.
+      - With C(cache) enabled, the container listing is cached together with a change token made of the container IDs
+        and states. The full listing is only done again when the token changes.
+    extends_documentation_fragment:
+      - inventory_cache
     options:
       plugin:
         description: Token that ensures this is a source file for the 'containers.podman.podman_containers' inventory plugin.
@@ -26,6 +30,16 @@ DOCUMENTATION = r"""
         default: podman
         env:
           - name: ANSIBLE_PODMAN_EXECUTABLE
+      connections:
+        description:
+          - Names of Podman system connections (see C(podman system connection list)) to discover containers on.
+          - The connections are queried concurrently. Empty means the local Podman.
+          - The hosts discovered on a connection are named C(<container name>@<connection>) and the connection is
+            passed to the connection plugin with C(ansible_podman_extra_args).
+        type: list
+        elements: str
+        default: []
+        version_added: '1.20.0'
       include_stopped:
         description: Whether to include stopped/exited containers.
         type: bool
@@ -87,8 +101,10 @@ connection_plugin: containers.podman.podman
 
 import json
 import fnmatch
+import shlex
 import shutil
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 
 from ansible.errors import AnsibleParserError
 from ansible.plugins.inventory import BaseInventoryPlugin, Cacheable, Constructable
@@ -106,11 +122,44 @@ class InventoryModule(BaseInventoryPlugin, Cacheable, Constructable):
             return False
         return verify_inventory_file(self, path)
 
+    @staticmethod
+    def _change_token(output):
+        return "\n".join(sorted(line for line in output.decode("utf-8").splitlines() if line.strip()))
+
+    def _list_containers(self, podman_path, connection, include_stopped, use_cache, cached):
+        """List the containers of one Podman, reuse the cached listing if the containers did not change.
+
+        The change token is the output of a cheap C(podman ps) with only the IDs and states of the
+        containers, it is stored with the listing and compared to the output of the same command.
+        """
+        args = [podman_path, "ps", "--format", "json"]
+        if include_stopped:
+            args.insert(2, "-a")
+        if connection:
+            args[1:1] = ["--connection", connection]
+
+        output = ""
+        token = None
+        try:
+            if use_cache:
+                token_args = args[:-2] + ["--no-trunc", "--format", "{{.ID}} {{.State}}"]
+                output = subprocess.check_output(token_args, stderr=subprocess.STDOUT)
+                token = self._change_token(output)
+                if cached and token == cached.get("token"):
+                    self.display.vvvv(f"Using cached containers of {connection or 'local podman'}")
+                    return cached
+            output = subprocess.check_output(args, stderr=subprocess.STDOUT)
+            containers = json.loads(output.decode("utf-8"))
+        except Exception as exc:
+            raise AnsibleParserError(f"Failed to list podman containers: {exc} from output {output}")
+        return {"token": token, "containers": containers}
+
     def parse(self, inventory, loader, path, cache=True):
         super(InventoryModule, self).parse(inventory, loader, path)
         config = self._read_config_data(path)
 
         executable = config.get("executable", "podman")
+        connections = list(config.get("connections", []) or [])
         include_stopped = bool(config.get("include_stopped", False))
         name_patterns = list(config.get("name_patterns", []) or [])
         label_selectors = dict(config.get("label_selectors", {}) or {})
@@ -126,17 +175,30 @@ class InventoryModule(BaseInventoryPlugin, Cacheable, Constructable):
 
         podman_path = shutil.which(executable) or executable
 
-        args = [podman_path, "ps", "--format", "json"]
-        if include_stopped:
-            args.insert(2, "-a")
+        # The options (and the cache plugin) are loaded by _read_config_data
+        use_cache = "cache" in self._options and self.get_option("cache")
+        cache_key = self.get_cache_key(path)
+        cached = {}
+        if use_cache and cache:
+            try:
+                cached = self._cache[cache_key]
+            except KeyError:
+                pass
 
-        output = ""
-        containers = []
-        try:
-            output = subprocess.check_output(args, stderr=subprocess.STDOUT)
-            containers = json.loads(output.decode("utf-8"))
-        except Exception as exc:
-            raise AnsibleParserError(f"Failed to list podman containers: {exc} from output {output}")
+        sources = connections or [""]
+        with ThreadPoolExecutor(max_workers=min(8, len(sources))) as executor:
+            listings = list(
+                executor.map(
+                    lambda connection: self._list_containers(
+                        podman_path, connection, include_stopped, use_cache, cached.get(connection)
+                    ),
+                    sources,
+                )
+            )
+        if use_cache:
+            new_cache = dict(zip(sources, listings))
+            if new_cache != cached:
+                self._cache[cache_key] = new_cache
 
         def matches_filters(name, cid, image, status, labels):
             include_rules = dict(filters.get("include", {}) or {})
@@ -165,7 +227,10 @@ class InventoryModule(BaseInventoryPlugin, Cacheable, Constructable):
                     return False
             return True
 
-        for c in containers:
+        # Image and label groups, filled in one pass over the containers and added at the end
+        group_hosts = {}
+
+        for connection, c in ((src, c) for src, listing in zip(sources, listings) for c in listing["containers"]):
             name = (
                 (c.get("Names") or [c.get("Names", "")])[0]
                 if isinstance(c.get("Names"), list)
@@ -199,11 +264,17 @@ class InventoryModule(BaseInventoryPlugin, Cacheable, Constructable):
             if not host:
                 self.display.vvvv(f"Filtered out {name or cid} by no name or cid")
                 continue
+            if connection:
+                host = f"{host}@{connection}"
 
             self.inventory.add_host(host)
             # Set connection plugin and remote_addr (container id or name works)
             self.inventory.set_variable(host, "ansible_connection", connection_plugin)
             self.inventory.set_variable(host, "ansible_host", name or cid)
+            if connection:
+                extra_args = f"--connection {shlex.quote(connection)}"
+                self.inventory.set_variable(host, "ansible_podman_extra_args", extra_args)
+                self.inventory.set_variable(host, "podman_connection", connection)
 
             # Common vars
             self.inventory.set_variable(host, "podman_container_id", cid)
@@ -220,15 +291,12 @@ class InventoryModule(BaseInventoryPlugin, Cacheable, Constructable):
             # Grouping
             if group_by_image and image:
                 safe_image = image.replace(":", "_").replace("/", "_").replace("-", "_")
-                self.inventory.add_group(f"image_{safe_image}")
-                self.inventory.add_host(host, group=f"image_{safe_image}")
+                group_hosts.setdefault(f"image_{safe_image}", []).append(host)
 
             for key in group_by_label:
                 if key in labels:
                     val = str(labels.get(key)).replace("/", "_").replace(":", "_").replace("-", "_")
-                    group = f"label_{key}_{val}"
-                    self.inventory.add_group(group)
-                    self.inventory.add_host(host, group=group)
+                    group_hosts.setdefault(f"label_{key}_{val}", []).append(host)
 
             # Composed and keyed groups
             hostvars = {
@@ -302,3 +370,8 @@ class InventoryModule(BaseInventoryPlugin, Cacheable, Constructable):
                 if strict:
                     raise
                 self.display.vvvv(f"Grouping error for host {host}: {exc}")
+
+        for group, hosts in group_hosts.items():
+            self.inventory.add_group(group)
+            for host in hosts:
+                self.inventory.add_host(host, group=group)
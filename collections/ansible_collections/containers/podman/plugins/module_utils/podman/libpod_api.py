@@ -0,0 +1,137 @@
+# Copyright (c) 2020 Red Hat
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import json
+import os
+import socket
+from http.client import HTTPConnection, HTTPException
+from urllib.parse import quote, urlencode
+
+# Every libpod API since Podman 2.0 serves the container and image inspect endpoints used here
+LIBPOD_API_VERSION = "v2.0.0"
+
+# Clients are kept for the lifetime of the module process, so several containers
+# managed in one run (for example with podman_containers) share one connection
+_CLIENTS = {}
+
+
+class LibpodAPIError(Exception):
+    """The libpod API could not be reached or returned an unexpected response."""
+
+
+class UnixHTTPConnection(HTTPConnection):
+    """HTTP connection over a unix domain socket."""
+
+    def __init__(self, socket_path, timeout=60):
+        super().__init__("localhost", timeout=timeout)
+        self.socket_path = socket_path
+
+    def connect(self):
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(self.timeout)
+        sock.connect(self.socket_path)
+        self.sock = sock
+
+
+def default_socket_path():
+    """Return the path of the Podman service socket of the current user."""
+    if os.geteuid() == 0:
+        return "/run/podman/podman.sock"
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR") or "/run/user/%d" % os.getuid()
+    return os.path.join(runtime_dir, "podman", "podman.sock")
+
+
+class LibpodClient:
+    """Minimal client of the libpod REST API.
+
+    Keeps one HTTP connection open for all the requests and caches the version.
+    """
+
+    def __init__(self, socket_path, timeout=60):
+        self.socket_path = socket_path
+        self.timeout = timeout
+        self._connection = None
+        self._version = None
+
+    def _request(self, method, path, params=None):
+        url = "/%s/libpod%s" % (LIBPOD_API_VERSION, path)
+        if params:
+            url += "?" + urlencode(params)
+        # A kept-alive connection can be closed by the service at any time, retry once
+        for attempt in range(2):
+            if self._connection is None:
+                self._connection = UnixHTTPConnection(self.socket_path, timeout=self.timeout)
+            try:
+                self._connection.request(method, url)
+                response = self._connection.getresponse()
+                body = response.read()
+                break
+            except (HTTPException, OSError) as e:
+                self.close()
+                if attempt:
+                    raise LibpodAPIError("Request %s %s failed: %s" % (method, url, e))
+        if response.status == 404:
+            return None
+        data = body.decode("utf-8", errors="replace")
+        if data and (response.getheader("Content-Type") or "").startswith("application/json"):
+            try:
+                data = json.loads(data)
+            except ValueError as e:
+                raise LibpodAPIError("Could not parse JSON from %s %s: %s" % (method, url, e))
+        if response.status >= 400:
+            message = data.get("message") if isinstance(data, dict) else body
+            raise LibpodAPIError("Request %s %s failed with status %d: %s" % (method, url, response.status, message))
+        return data
+
+    def close(self):
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+    def ping(self):
+        """Return True if the Podman service answers."""
+        try:
+            self._request("GET", "/_ping")
+        except LibpodAPIError:
+            return False
+        return True
+
+    def version(self):
+        """Return the version of the Podman service, as 'podman --version' would."""
+        if self._version is None:
+            data = self._request("GET", "/version")
+            self._version = data.get("Version") if isinstance(data, dict) else None
+            if not self._version:
+                raise LibpodAPIError("Could not determine the Podman version")
+        return self._version
+
+    def inspect_container(self, name):
+        """Return the inspection of a container, as 'podman container inspect', or {} if it does not exist."""
+        return self._request("GET", "/containers/%s/json" % quote(name, safe="")) or {}
+
+    def inspect_image(self, name):
+        """Return the inspection of an image, as 'podman image inspect', or {} if it does not exist."""
+        return self._request("GET", "/images/%s/json" % quote(name, safe="/:@")) or {}
+
+
+def get_libpod_client(module, socket_path=None):
+    """Return a client of the Podman service, or None if the service is not available.
+
+    The callers fall back to the podman CLI when None is returned.
+    """
+    socket_path = socket_path or default_socket_path()
+    if socket_path in _CLIENTS:
+        return _CLIENTS[socket_path]
+    client = None
+    if os.path.exists(socket_path):
+        client = LibpodClient(socket_path)
+        if not client.ping():
+            client = None
+    if client is None:
+        module.debug("Podman service is not available on %s, using the podman CLI" % socket_path)
+    _CLIENTS[socket_path] = client
+    return client
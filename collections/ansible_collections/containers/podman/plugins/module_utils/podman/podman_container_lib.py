@@ -25,6 +25,12 @@ from ansible_collections.containers.podman.plugins.module_utils.podman.common im
 from ansible_collections.containers.podman.plugins.module_utils.podman.common import (
     createcommand,
 )
+from ansible_collections.containers.podman.plugins.module_utils.podman.libpod_api import (
+    LibpodAPIError,
+)
+from ansible_collections.containers.podman.plugins.module_utils.podman.libpod_api import (
+    get_libpod_client,
+)
 from ansible_collections.containers.podman.plugins.module_utils.podman.quadlet import (
     create_quadlet_state,
 )
@@ -35,9 +41,16 @@ from ansible_collections.containers.podman.plugins.module_utils.podman.quadlet i
 
 __metaclass__ = type
 
+# The output of 'podman --version' per executable, for the lifetime of the module process
+_PODMAN_VERSIONS = {}
+# The image inspections per (executable, image), for the lifetime of the module process
+_IMAGE_INFOS = {}
+
 ARGUMENTS_SPEC_CONTAINER = dict(
     name=dict(required=True, type="str"),
     executable=dict(default="podman", type="str"),
+    backend=dict(type="str", default="cli", choices=["cli", "api"]),
+    api_socket=dict(type="path"),
     state=dict(
         type="str",
         default="started",
@@ -908,6 +921,9 @@ class PodmanModuleParams:
 
 
 class PodmanDefaults:
+    # The defaults only depend on the podman version, they are computed once per version
+    _cache = {}
+
     def __init__(self, image_info, podman_version):
         self.version = podman_version
         self.image_info = image_info
@@ -918,16 +934,23 @@ class PodmanDefaults:
         }
 
     def default_dict(self):
+        if self.version in PodmanDefaults._cache:
+            self.defaults = dict(PodmanDefaults._cache[self.version])
+            return self.defaults
         # make here any changes to self.defaults related to podman version
         # https://github.com/containers/libpod/pull/5669
         if LooseVersion(self.version) >= LooseVersion("1.8.0") and LooseVersion(self.version) < LooseVersion("1.9.0"):
             self.defaults["cpu_shares"] = 1024
         if LooseVersion(self.version) >= LooseVersion("3.0.0"):
             self.defaults["log_level"] = "warning"
+        PodmanDefaults._cache[self.version] = dict(self.defaults)
         return self.defaults
 
 
 class PodmanContainerDiff:
+    # Names of the diffparam_* methods, collected once per class
+    _diff_functions = None
+
     def __init__(self, module, module_params, info, image_info, podman_version):
         self.module = module
         self.module_params = module_params
@@ -1531,8 +1554,20 @@ class PodmanContainerDiff:
     def diffparam_workdir(self):
         return self._diff_generic("workdir", "--workdir")
 
+    @classmethod
+    def get_diff_functions(cls):
+        if cls.__dict__.get("_diff_functions") is None:
+            cls._diff_functions = [
+                func for func in dir(cls) if func.startswith("diffparam") and callable(getattr(cls, func))
+            ]
+        return cls._diff_functions
+
     def is_different(self):
-        diff_func_list = [func for func in dir(self) if callable(getattr(self, func)) and func.startswith("diffparam")]
+        # Check the parameters set by the user first, they are the most likely to differ
+        diff_func_list = sorted(
+            self.get_diff_functions(),
+            key=lambda func: self.module_params.get(func[len("diffparam_"):]) is None,
+        )
         fail_fast = not bool(self.module._diff)
         different = False
         for func_name in diff_func_list:
@@ -1618,6 +1653,9 @@ class PodmanContainer:
         self.module_params = module_params
         self.name = name
         self.stdout, self.stderr = "", ""
+        self.api = None
+        if module_params.get("backend") == "api":
+            self.api = get_libpod_client(module, module_params.get("api_socket"))
         self.info = self.get_info()
         self.version = self._get_podman_version()
         self.diff = {}
@@ -1655,18 +1693,42 @@ class PodmanContainer:
         """Return True if container exists and is not running now."""
         return self.exists and not self.info["State"]["Running"]
 
+    def _api_call(self, method, *args):
+        """Call the libpod API, return None to fall back to the CLI."""
+        if self.api is None:
+            return None
+        try:
+            return getattr(self.api, method)(*args)
+        except LibpodAPIError as e:
+            self.module.debug("PODMAN-CONTAINER-DEBUG: libpod API failed, using the CLI: %s" % e)
+            return None
+
     def get_info(self):
         """Inspect container and gather info about it."""
+        info = self._api_call("inspect_container", self.name)
+        if info is not None:
+            return info
         # pylint: disable=unused-variable
         rc, out, err = self.module.run_command([self.module_params["executable"], b"container", b"inspect", self.name])
         return json.loads(out)[0] if rc == 0 else {}
 
     def get_image_info(self):
         """Inspect container image and gather info about it."""
-        # pylint: disable=unused-variable
         is_rootfs = self.module_params["rootfs"]
         if is_rootfs:
             return {"Id": self.module_params["image"]}
+        cache_key = (self.module_params["executable"], self.module_params["image"])
+        if cache_key in _IMAGE_INFOS:
+            return _IMAGE_INFOS[cache_key]
+        info = self._api_call("inspect_image", self.module_params["image"].replace("docker://", ""))
+        if info is None:
+            info = self._get_image_info_cli()
+        if info:
+            _IMAGE_INFOS[cache_key] = info
+        return info
+
+    def _get_image_info_cli(self):
+        # pylint: disable=unused-variable
         rc, out, err = self.module.run_command(
             [
                 self.module_params["executable"],
@@ -1679,11 +1741,17 @@ class PodmanContainer:
         return json.loads(out)[0] if rc == 0 else {}
 
     def _get_podman_version(self):
-        # pylint: disable=unused-variable
-        rc, out, err = self.module.run_command([self.module_params["executable"], b"--version"])
-        if rc != 0 or not out or "version" not in out:
-            self.module.fail_json(msg="%s run failed!" % self.module_params["executable"])
-        return out.split("version")[1].strip()
+        version = self._api_call("version")
+        if version is not None:
+            return version
+        executable = self.module_params["executable"]
+        if executable not in _PODMAN_VERSIONS:
+            # pylint: disable=unused-variable
+            rc, out, err = self.module.run_command([executable, b"--version"])
+            if rc != 0 or not out or "version" not in out:
+                self.module.fail_json(msg="%s run failed!" % executable)
+            _PODMAN_VERSIONS[executable] = out.split("version")[1].strip()
+        return _PODMAN_VERSIONS[executable]
 
     def _perform_action(self, action):
         """Perform action with container.
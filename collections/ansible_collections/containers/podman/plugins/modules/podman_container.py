@@ -32,6 +32,26 @@ options:
         machine running C(podman)
     default: 'podman'
     type: str
+  backend:
+    description:
+      - How the container, its image and the Podman version are inspected.
+      - I(cli) - Run the C(podman) executable for every inspection.
+      - I(api) - Use the libpod REST API of the Podman service on I(api_socket),
+        with one request per inspection and the Podman version retrieved once per
+        module run. If the service is not available, the C(podman) executable is used.
+      - The containers are always created, started, stopped and removed with the
+        C(podman) executable.
+    type: str
+    default: cli
+    choices:
+      - cli
+      - api
+  api_socket:
+    description:
+      - Path to the unix socket of the Podman service, used with I(backend=api).
+      - Defaults to C(/run/podman/podman.sock) for root and to
+        C($XDG_RUNTIME_DIR/podman/podman.sock) for other users.
+    type: path
   state:
     description:
       - I(absent) - A container matching the specified name will be stopped and
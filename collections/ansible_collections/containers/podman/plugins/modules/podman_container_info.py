@@ -32,6 +32,15 @@ options:
         machine running C(podman)
     default: 'podman'
     type: str
+  fields:
+    description:
+      - Only return these fields of the container inspections, to keep the
+        result small.
+      - Nested fields are selected with dots, for example C(State.Status).
+      - Missing fields are returned as C(null).
+      - If not specified, the whole inspections are returned.
+    type: list
+    elements: str
 """
 
 EXAMPLES = r"""
@@ -47,6 +56,15 @@ EXAMPLES = r"""
     name:
       - redis
       - web1
+
+- name: Gather the status and the image of some containers
+  containers.podman.podman_container_info:
+    name: "{{ ceph_container_names }}"
+    fields:
+      - Name
+      - ImageName
+      - State.Status
+      - State.StartedAt
 """
 
 RETURN = r"""
@@ -364,10 +382,75 @@ def get_containers_facts(module, executable, name):
     if rc != 0 and "no such " in err:
         if len(name) < 2:
             return [], out, err
-        return cycle_over(module, executable, name)
+        # Inspect only the existing containers, in a single call
+        existing = filter_existing(name, list_containers(module, executable))
+        if not existing:
+            return [], "", err
+        rc, out, dummy = module.run_command([executable, "container", "inspect"] + existing)
+        if rc == 0:
+            return (json.loads(out) if out else None) or [], out, err
+        # A container was removed in the meantime
+        return cycle_over(module, executable, existing)
     module.fail_json(msg="Unable to gather info for %s: %s" % (",".join(name), err))
 
 
+def list_containers(module, executable):
+    """List the names and the IDs of all the containers.
+
+    Arguments:
+        module {AnsibleModule} -- instance of AnsibleModule
+        executable {string} -- binary to execute when listing containers
+
+    Returns:
+        list of containers, as listed by 'podman ps'
+    """
+    rc, out, err = module.run_command([executable, "ps", "-a", "--format", "json"])
+    if rc != 0:
+        module.fail_json(msg="Unable to get list of containers: %s" % err)
+    return json.loads(out) if out else []
+
+
+def filter_existing(name, containers):
+    """Return the names which match an existing container, by name or by ID (prefix).
+
+    Arguments:
+        name {list} -- list of containers names to inspect
+        containers {list} -- list of containers, as listed by 'podman ps'
+
+    Returns:
+        list of existing containers names, in the order of 'name'
+    """
+    names = set()
+    ids = []
+    for container in containers:
+        names.update(container.get("Names") or [])
+        ids.append(container.get("Id") or "")
+    return [n for n in name if n in names or (n and any(i.startswith(n) for i in ids))]
+
+
+def select_fields(container, fields):
+    """Keep only some fields, nested fields are separated with dots.
+
+    Arguments:
+        container {dict} -- container inspection
+        fields {list} -- fields to keep
+
+    Returns:
+        dict with the selected fields
+    """
+    result = {}
+    for field in fields:
+        value = container
+        for part in field.split("."):
+            value = value.get(part) if isinstance(value, dict) else None
+        target = result
+        parts = field.split(".")
+        for part in parts[:-1]:
+            target = target.setdefault(part, {})
+        target[parts[-1]] = value
+    return result
+
+
 def cycle_over(module, executable, name):
     """Inspect each container in a cycle in case some of them don't exist.
 
@@ -399,6 +482,7 @@ def main():
         argument_spec={
             "executable": {"type": "str", "default": "podman"},
             "name": {"type": "list", "elements": "str"},
+            "fields": {"type": "list", "elements": "str"},
         },
         supports_check_mode=True,
     )
@@ -407,6 +491,8 @@ def main():
     executable = module.get_bin_path(module.params["executable"], required=True)
     # pylint: disable=unused-variable
     inspect_results, out, err = get_containers_facts(module, executable, name)
+    if module.params["fields"]:
+        inspect_results = [select_fields(container, module.params["fields"]) for container in inspect_results]
 
     results = {"changed": False, "containers": inspect_results, "stderr": err}
 
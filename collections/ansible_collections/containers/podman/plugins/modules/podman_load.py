@@ -16,14 +16,35 @@ description:
     on the local machine into container storage.
     podman load is used for loading from the archive generated by podman save,
     that includes the image parent layers.
+  - The C(manifest.json) (docker-archive) or C(index.json) (oci-archive) of the
+    archive is read without extracting the layers, and the archive is loaded only
+    if one of its images or tags is missing in container storage.
 options:
   input:
     description:
     - Path to image file to load.
+    - Exactly one of I(input) and I(inputs) must be specified.
     type: str
-    required: true
     aliases:
       - path
+  inputs:
+    description:
+    - Paths to several image files to load.
+    - The archives are loaded concurrently, see I(max_concurrent_loads).
+    - Exactly one of I(input) and I(inputs) must be specified.
+    type: list
+    elements: str
+  max_concurrent_loads:
+    description:
+      - The maximum number of archives loaded at the same time when I(inputs) is used.
+    type: int
+    default: 2
+  force:
+    description:
+      - Load the archives even if all their images are already present.
+      - Archives whose images can not be determined are always loaded.
+    type: bool
+    default: false
   executable:
     description:
       - Path to C(podman) executable if it is not in the C($PATH) on the
@@ -35,6 +56,24 @@ requirements:
 """
 
 RETURN = """
+images:
+    description: The result for every archive, in the order of I(input) or I(inputs).
+    returned: always
+    type: list
+    elements: dict
+    sample: [
+        {
+            "input": "/tmp/ceph.tar",
+            "changed": true,
+            "image_ids": [
+                "bcacbdf7a119c0fa934661ca8af839e625ce6540d9ceb6827cdd389f823d49e0"
+            ],
+            "repo_tags": [
+                "quay.io/ceph/ceph:v18"
+            ],
+            "duration": 12.51
+        }
+    ]
 image:
     description: info from loaded image
     returned: always
@@ -138,58 +177,212 @@ EXAMPLES = """
 # What modules does for example
 - containers.podman.podman_load:
     input: /path/to/tar/file
+
+- name: Load several archives, skipping the ones already loaded
+  containers.podman.podman_load:
+    inputs:
+      - /path/to/ceph.tar
+      - /path/to/grafana.tar
+      - /path/to/prometheus.tar
+    max_concurrent_loads: 3
 """
 
 import json  # noqa: E402
+import os  # noqa: E402
+import tarfile  # noqa: E402
+import time  # noqa: E402
+from concurrent.futures import ThreadPoolExecutor  # noqa: E402
+
 from ansible.module_utils.basic import AnsibleModule  # noqa: E402
 
+OCI_REF_NAME_ANNOTATION = "org.opencontainers.image.ref.name"
+
+
+def _read_json_member(archive, name):
+    try:
+        member = archive.getmember(name)
+    except KeyError:
+        return None
+    stream = archive.extractfile(member)
+    if stream is None:
+        return None
+    with stream:
+        return json.loads(stream.read())
+
+
+def _strip_digest(digest):
+    return digest.split(":", 1)[1] if ":" in digest else digest
+
+
+def read_archive_images(path):
+    """Return the (image ID, tags) pairs of a docker-archive or an oci-archive.
+
+    Only the archive headers and the small JSON files are read, the layers are skipped.
+    Returns None if the images of the archive can not be determined.
+    """
+    try:
+        with tarfile.open(path, "r:*") as archive:
+            manifest = _read_json_member(archive, "manifest.json")
+            if manifest:
+                # docker-archive: the config file name (or blob digest) is the image ID
+                return [
+                    (
+                        os.path.basename(image["Config"]).split(".", 1)[0],
+                        sorted(image.get("RepoTags") or []),
+                    )
+                    for image in manifest
+                ]
+            index = _read_json_member(archive, "index.json")
+            if not index:
+                return None
+            images = []
+            for descriptor in index.get("manifests") or []:
+                image_manifest = _read_json_member(
+                    archive, "blobs/%s" % descriptor["digest"].replace(":", "/", 1)
+                )
+                if not image_manifest or "config" not in image_manifest:
+                    return None
+                ref_name = (descriptor.get("annotations") or {}).get(OCI_REF_NAME_ANNOTATION)
+                images.append((_strip_digest(image_manifest["config"]["digest"]), [ref_name] if ref_name else []))
+            return images or None
+    except (tarfile.TarError, EnvironmentError, ValueError, KeyError, TypeError):
+        return None
+
+
+def has_tag(tag, local_tags):
+    # podman qualifies short names with a registry (localhost/, docker.io/library/, ...)
+    return any(local_tag == tag or local_tag.endswith("/" + tag) for local_tag in local_tags)
 
-def load(module, executable):
-    changed = False
-    command = [executable, "load", "--input"]
-    command.append(module.params["input"])
-    changed = True
-    if module.check_mode:
-        return changed, "", "", ""
-    rc, out, err = module.run_command(command)
+
+def get_local_images(module, executable):
+    """Return the IDs and the tags of all the images in container storage."""
+    rc, out, err = module.run_command([executable, "image", "ls", "--all", "--no-trunc", "--format", "json"])
     if rc != 0:
-        module.fail_json(msg="Image loading failed: %s" % (err))
-    image_name_line = [i for i in out.splitlines() if "Loaded image" in i][0]
+        module.fail_json(msg="Listing images failed: %s" % err)
+    ids = set()
+    tags = set()
+    for image in json.loads(out or "[]"):
+        ids.add(_strip_digest(image["Id"]))
+        tags.update(image.get("Names") or [])
+    return ids, tags
+
+
+def is_loaded(images, local_ids, local_tags):
+    if not images:
+        return False
+    for image_id, repo_tags in images:
+        if image_id not in local_ids:
+            return False
+        for tag in repo_tags:
+            if not has_tag(tag, local_tags):
+                return False
+    return True
+
+
+def parse_loaded_image(out):
+    """Return the name of the first image in the output of podman load."""
+    image_name_lines = [i for i in out.splitlines() if "Loaded image" in i]
+    if not image_name_lines:
+        return None
+    image_name_line = image_name_lines[0]
     # For Podman < 4.x
     if "Loaded image(s):" in image_name_line:
-        image_name = image_name_line.split("Loaded image(s): ")[1].split(",")[0].strip()
+        return image_name_line.split("Loaded image(s): ")[1].split(",")[0].strip()
     # For Podman > 4.x
-    elif "Loaded image:" in image_name_line:
-        image_name = image_name_line.split("Loaded image: ")[1].strip()
-    else:
-        module.fail_json(msg="Not found images in %s" % image_name_line)
-    rc, out2, err2 = module.run_command([executable, "image", "inspect", image_name])
+    if "Loaded image:" in image_name_line:
+        return image_name_line.split("Loaded image: ")[1].strip()
+    return None
+
+
+def load_archive(module, executable, path):
+    start = time.monotonic()
+    rc, out, err = module.run_command([executable, "load", "--input", path])
+    return rc, out, err, round(time.monotonic() - start, 2)
+
+
+def inspect_images(module, executable, names):
+    rc, out, err = module.run_command([executable, "image", "inspect"] + names)
     if rc != 0:
-        module.fail_json(msg="Image %s inspection failed: %s" % (image_name, err2))
+        module.fail_json(msg="Image %s inspection failed: %s" % (", ".join(names), err))
     try:
-        info = json.loads(out2)[0]
+        return json.loads(out)
     except Exception as e:
-        module.fail_json(msg="Could not parse JSON from image %s: %s" % (image_name, e))
-    return changed, out, err, info
+        module.fail_json(msg="Could not parse JSON from image %s: %s" % (", ".join(names), e))
+
+
+def load(module, executable, inputs):
+    force = module.params["force"]
+    results = []
+    local_ids, local_tags = get_local_images(module, executable)
+    for path in inputs:
+        images = read_archive_images(path)
+        result = {
+            "input": path,
+            "changed": force or not is_loaded(images, local_ids, local_tags),
+            "image_ids": [image_id for image_id, dummy in images or []],
+            "repo_tags": [tag for dummy, repo_tags in images or [] for tag in repo_tags],
+        }
+        results.append(result)
+
+    to_load = [result for result in results if result["changed"]]
+    changed = bool(to_load)
+    if module.check_mode or not to_load:
+        return changed, "", "", results
+
+    max_workers = max(1, min(module.params["max_concurrent_loads"], len(to_load)))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        outputs = list(executor.map(lambda result: load_archive(module, executable, result["input"]), to_load))
+
+    errors = []
+    for result, (rc, out, err, duration) in zip(to_load, outputs):
+        result["duration"] = duration
+        if rc != 0:
+            errors.append("%s: %s" % (result["input"], err))
+        elif not result["image_ids"]:
+            # The images could not be read from the archive, use the loaded image name
+            image_name = parse_loaded_image(out)
+            if image_name is None:
+                errors.append("%s: Not found images in %s" % (result["input"], out))
+            else:
+                result["image_ids"] = [image_name]
+    if errors:
+        module.fail_json(msg="Image loading failed: %s" % "; ".join(errors), images=results)
+    return (
+        changed,
+        "".join(out for dummy, out, dummy2, dummy3 in outputs),
+        "".join(err for dummy, dummy2, err, dummy3 in outputs),
+        results,
+    )
 
 
 def main():
     module = AnsibleModule(
         argument_spec=dict(
-            input=dict(type="str", required=True, aliases=["path"]),
+            input=dict(type="str", aliases=["path"]),
+            inputs=dict(type="list", elements="str"),
+            max_concurrent_loads=dict(type="int", default=2),
+            force=dict(type="bool", default=False),
             executable=dict(type="str", default="podman"),
         ),
+        mutually_exclusive=[("input", "inputs")],
+        required_one_of=[("input", "inputs")],
         supports_check_mode=True,
     )
 
     executable = module.get_bin_path(module.params["executable"], required=True)
-    changed, out, err, image_info = load(module, executable)
+    inputs = module.params["inputs"] or [module.params["input"]]
+    changed, out, err, results = load(module, executable, inputs)
+
+    image_info = ""
+    if results[0]["image_ids"] and not (module.check_mode and results[0]["changed"]):
+        image_info = inspect_images(module, executable, results[0]["image_ids"][:1])[0]
 
     results = {
         "changed": changed,
         "stdout": out,
         "stderr": err,
         "image": image_info,
+        "images": results,
     }
 
     module.exit_json(**results)
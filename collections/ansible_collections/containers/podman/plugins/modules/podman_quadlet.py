@@ -45,6 +45,33 @@ options:
       - For remote URLs, the module always installs fresh and reports C(changed=true) since content cannot be verified.
       - Directory installs support only top-level files; nested subdirectories will cause an error.
     type: str
+  quadlets:
+    description:
+      - Several quadlets to install when I(state=present), instead of I(src) and I(files).
+      - All quadlets are compared with the installed files first. Only the changed ones are (re)installed,
+        and systemd is reloaded once at the end instead of once per quadlet.
+      - Mutually exclusive with I(src).
+    type: list
+    elements: dict
+    suboptions:
+      src:
+        description:
+          - Path to a quadlet file, a directory containing a quadlet application, or a URL, see I(src).
+        type: str
+        required: true
+      files:
+        description:
+          - Additional non-quadlet files or URLs to install along with I(src), see I(files).
+        type: list
+        elements: str
+  restart:
+    description:
+      - After installing, restart the systemd services of the containers, pods and kube quadlets which were
+        installed or updated, or start them if they are not running.
+      - The services are restarted with a single C(systemctl restart) call, so systemd restarts them in parallel.
+      - Requires I(reload_systemd=true).
+    type: bool
+    default: false
   files:
     description:
       - Additional non-quadlet files or URLs to install along with the primary I(src) (quadlet application use-case).
@@ -112,6 +139,11 @@ quadlets:
   description: List of affected quadlets with name, path, and scope
   returned: always
   type: list
+restarted_units:
+  description: The systemd services restarted with I(restart=true)
+  returned: when I(restart=true)
+  type: list
+  elements: str
 stdout:
   description: podman stdout
   returned: when debug=true
@@ -200,6 +232,17 @@ EXAMPLES = r"""
     state: present
     src: https://example.com/myapp.container
 
+- name: Install a stack of quadlets with a single systemd reload and restart the changed services
+  containers.podman.podman_quadlet:
+    state: present
+    quadlets:
+      - src: /tmp/stack/db.container
+      - src: /tmp/stack/web.container
+        files:
+          - /tmp/stack/web.env
+      - src: /tmp/stack/backend.network
+    restart: true
+
 - name: Install multi-quadlet application from .quadlets file (Podman 6.0+)
   containers.podman.podman_quadlet:
     state: present
@@ -479,6 +522,16 @@ def _get_installed_files_for_spec(spec, quadlet_dir):
     return set()
 
 
+def _get_service_name(quadlet_name):
+    """Return the systemd service generated for a container, pod or kube quadlet, or None."""
+    base, suffix = os.path.splitext(quadlet_name)
+    if suffix in (".container", ".kube"):
+        return "%s.service" % base
+    if suffix == ".pod":
+        return "%s-pod.service" % base
+    return None
+
+
 def _needs_change(spec, quadlet_dir):
     """Determine if installation/update is needed.
 
@@ -525,24 +578,26 @@ class PodmanQuadletManager:
             cmd.extend(self.module.params["cmd_args"])
         return cmd
 
-    def _build_install_cmd(self):
+    def _build_install_cmd(self, src, files, reload_systemd):
         """Build quadlet install command."""
         cmd = self._build_base_cmd()
         cmd.extend(["quadlet", "install"])
-        if self.module.params["reload_systemd"]:
+        if reload_systemd:
             cmd.append("--reload-systemd")
         else:
             cmd.append("--reload-systemd=false")
-        cmd.append(self.module.params["src"])
-        if self.module.params.get("files"):
-            cmd.extend(self.module.params["files"])
+        cmd.append(src)
+        if files:
+            cmd.extend(files)
         return cmd
 
-    def _build_rm_cmd(self, names=None):
+    def _build_rm_cmd(self, names=None, reload_systemd=None):
         """Build quadlet rm command."""
+        if reload_systemd is None:
+            reload_systemd = self.module.params["reload_systemd"]
         cmd = self._build_base_cmd()
         cmd.extend(["quadlet", "rm"])
-        if self.module.params["reload_systemd"]:
+        if reload_systemd:
             cmd.append("--reload-systemd")
         else:
             cmd.append("--reload-systemd=false")
@@ -596,15 +651,13 @@ class PodmanQuadletManager:
             )
         return {name for name in (q.get("Name") for q in quadlets) if name}
 
-    def _install(self):
-        src = self.module.params["src"]
-        extra_files = self.module.params.get("files") or []
-
+    def _install(self, src, extra_files, reload_systemd, debug=False):
+        """Install or update one quadlet source, return its spec if it changed, None otherwise."""
         # Build the desired spec using Podman's manifest-based approach
         spec = _build_desired_spec(self.module, src, extra_files)
 
         # Add debug info if requested
-        if self.module.params["debug"]:
+        if debug:
             self.results["_debug_spec"] = {
                 "mode": spec["mode"],
                 "marker_name": spec["marker_name"],
@@ -620,14 +673,14 @@ class PodmanQuadletManager:
 
         if not needs_change:
             # Already up to date
-            return
+            return None
 
         # For remote sources, we cannot verify content matches the URL.
         # To ensure Ansible's contract (what's configured = what's on host),
         # we always install fresh. Try install first, if "already exists",
         # remove and reinstall.
         if spec["mode"] == MODE_REMOTE:
-            cmd = self._build_install_cmd()
+            cmd = self._build_install_cmd(src, extra_files, reload_systemd)
             rc, out, err = self._run(cmd)
             if rc != 0:
                 err_lower = err.lower()
@@ -635,7 +688,7 @@ class PodmanQuadletManager:
                     # Need to remove existing and reinstall to ensure fresh content
                     # Extract the quadlet name from the error or URL
                     quadlet_name = os.path.basename(src)
-                    rm_cmd = self._build_rm_cmd([quadlet_name])
+                    rm_cmd = self._build_rm_cmd([quadlet_name], reload_systemd)
                     rm_rc, rm_out, rm_err = self._run(rm_cmd)
                     # Ignore rm errors (might not exist with exact name)
                     if rm_rc != 0:
@@ -646,7 +699,7 @@ class PodmanQuadletManager:
                     self.results["actions"].append("removed existing quadlet for reinstall from remote")
 
                     # Retry install
-                    cmd = self._build_install_cmd()
+                    cmd = self._build_install_cmd(src, extra_files, reload_systemd)
                     rc, out, err = self._run(cmd)
                     if rc != 0:
                         self.module.fail_json(
@@ -667,9 +720,9 @@ class PodmanQuadletManager:
             self.results["changed"] = True
             self.results["actions"].append("installed quadlets from %s" % src)
             self.results["quadlets"].append({"source": src, "path": self.quadlet_dir})
-            if self.module.params["debug"]:
+            if debug:
                 self.results.update({"stdout": out, "stderr": err})
-            return
+            return spec
 
         # For local sources with changes needed, remove existing then install
         removal_target = spec["removal_target"]
@@ -687,7 +740,7 @@ class PodmanQuadletManager:
                 target_exists = os.path.exists(quadlet_path)
 
             if target_exists:
-                rm_cmd = self._build_rm_cmd([removal_target])
+                rm_cmd = self._build_rm_cmd([removal_target], reload_systemd)
                 rc, out, err = self._run(rm_cmd)
                 if rc != 0:
                     err_lower = err.lower()
@@ -701,7 +754,7 @@ class PodmanQuadletManager:
                 self.results["actions"].append("removed existing quadlet %s for update" % removal_target)
 
         # Install
-        cmd = self._build_install_cmd()
+        cmd = self._build_install_cmd(src, extra_files, reload_systemd)
         rc, out, err = self._run(cmd)
         if rc != 0:
             self.module.fail_json(
@@ -714,8 +767,53 @@ class PodmanQuadletManager:
         self.results["changed"] = True
         self.results["actions"].append("installed quadlets from %s" % src)
         self.results["quadlets"].append({"source": src, "path": self.quadlet_dir})
-        if self.module.params["debug"]:
+        if debug:
             self.results.update({"stdout": out, "stderr": err})
+        return spec
+
+    def _systemctl(self, args):
+        """Run systemctl for the scope of the quadlets (system for root, user otherwise)."""
+        cmd = [self.module.get_bin_path("systemctl", required=True)]
+        if os.geteuid() != 0:
+            cmd.append("--user")
+        cmd.extend(args)
+        rc, out, err = self._run(cmd)
+        if rc != 0:
+            self.module.fail_json(
+                msg="Failed to run %s: %s" % (" ".join(cmd), err),
+                stdout=out,
+                stderr=err,
+                **self.results,
+            )
+
+    def _restart_units(self, specs):
+        """Restart the services of the changed quadlets with a single systemctl call."""
+        units = []
+        for spec in specs:
+            names = spec["desired_files"] or {os.path.basename(spec["source"]): None}
+            for name in names:
+                unit = _get_service_name(name)
+                if unit and unit not in units:
+                    units.append(unit)
+        self.results["restarted_units"] = units
+        if units:
+            self._systemctl(["restart"] + units)
+            self.results["actions"].append("restarted %s" % ", ".join(units))
+
+    def _install_all(self):
+        """Install several quadlets, reload systemd once and restart the changed services."""
+        reload_systemd = self.module.params["reload_systemd"]
+        changed_specs = []
+        for quadlet in self.module.params["quadlets"]:
+            spec = self._install(quadlet["src"], quadlet.get("files") or [], reload_systemd=False)
+            if spec is not None:
+                spec["source"] = quadlet["src"]
+                changed_specs.append(spec)
+        if changed_specs and reload_systemd:
+            self._systemctl(["daemon-reload"])
+            self.results["actions"].append("reloaded systemd")
+        if self.module.params["restart"]:
+            self._restart_units(changed_specs)
 
     def _absent(self):
         names = self.module.params.get("name") or []
@@ -772,8 +870,19 @@ class PodmanQuadletManager:
 
     def execute(self):
         state = self.module.params["state"]
-        if state == "present":
-            self._install()
+        if state == "present" and self.module.params["quadlets"]:
+            self._install_all()
+        elif state == "present":
+            spec = self._install(
+                self.module.params["src"],
+                self.module.params.get("files") or [],
+                self.module.params["reload_systemd"],
+                debug=self.module.params["debug"],
+            )
+            if self.module.params["restart"]:
+                if spec is not None:
+                    spec["source"] = self.module.params["src"]
+                self._restart_units([spec] if spec is not None else [])
         elif state == "absent":
             self._absent()
         self.module.exit_json(**self.results)
@@ -786,6 +895,16 @@ def main():
             name=dict(type="list", elements="str", required=False),
             src=dict(type="str", required=False),
             files=dict(type="list", elements="str", required=False),
+            quadlets=dict(
+                type="list",
+                elements="dict",
+                required=False,
+                options=dict(
+                    src=dict(type="str", required=True),
+                    files=dict(type="list", elements="str", required=False),
+                ),
+            ),
+            restart=dict(type="bool", default=False),
             quadlet_dir=dict(type="path", required=False),
             reload_systemd=dict(type="bool", default=True),
             force=dict(type="bool", default=True),
@@ -795,10 +914,12 @@ def main():
             debug=dict(type="bool", default=False),
         ),
         required_if=[
-            ("state", "present", ["src"]),
+            ("state", "present", ["src", "quadlets"], True),
         ],
         mutually_exclusive=[
             ["all", "name"],
+            ["src", "quadlets"],
+            ["files", "quadlets"],
         ],
         supports_check_mode=True,
     )
@@ -807,6 +928,8 @@ def main():
     if module.params["state"] == "absent":
         if not module.params["name"] and not module.params["all"]:
             module.fail_json(msg="For state='absent', either 'name' or 'all' must be specified.")
+    if module.params["restart"] and not module.params["reload_systemd"]:
+        module.fail_json(msg="'restart' requires 'reload_systemd' to be true.")
 
     PodmanQuadletManager(module).execute()
 
@@ -456,3 +456,82 @@ def test_include_rules_status_only(mock_which):
         with patch.object(mod, "_read_config_data", return_value=cfg):
             mod.parse(inv, loader=None, path="dummy.yml", cache=False)
     assert list(inv.hostvars.keys()) == ["run"]
+
+
+@patch("ansible_collections.containers.podman.plugins.inventory.podman_containers.shutil.which", return_value="podman")
+def test_cache_reused_when_token_unchanged(mock_which):
+    from ansible_collections.containers.podman.plugins.inventory.podman_containers import (
+        InventoryModule,
+    )
+
+    containers = [
+        {"Names": ["app"], "Id": "id1", "Image": "img", "State": "running", "Labels": {"role": "api"}},
+    ]
+    calls = []
+
+    def fake_co(args, stderr=None):
+        calls.append(args)
+        if args[-1] == "json":
+            return build_ps_json(containers)
+        # In ps templates .State renders the human readable status, not the State of the JSON listing
+        status = {"running": "Up 3 minutes", "exited": "Exited (0) 2 seconds ago"}
+        return "".join("%s %s\n" % (c["Id"], status[c["State"]]) for c in containers).encode("utf-8")
+
+    cache = {}
+    for dummy in range(2):
+        inv = FakeInventory()
+        mod = InventoryModule()
+        mod._options = {"cache": True}
+        mod._cache = cache
+        with patch(
+            "ansible_collections.containers.podman.plugins.inventory.podman_containers.subprocess.check_output",
+            side_effect=fake_co,
+        ):
+            with patch.object(mod, "_read_config_data", return_value={"group_by_label": ["role"]}):
+                mod.parse(inv, loader=None, path="dummy.yml", cache=True)
+        assert inv.groups["label_role_api"]["hosts"] == ["app"]
+
+    # The second parse only asked for the change token
+    assert [args[-1] for args in calls] == ["{{.ID}} {{.State}}", "json", "{{.ID}} {{.State}}"]
+    assert list(cache.values()) == [{"": {"token": "id1 Up 3 minutes", "containers": containers}}]
+
+    # A changed token triggers a full listing
+    containers[0]["State"] = "exited"
+    inv = FakeInventory()
+    mod = InventoryModule()
+    mod._options = {"cache": True}
+    mod._cache = cache
+    with patch(
+        "ansible_collections.containers.podman.plugins.inventory.podman_containers.subprocess.check_output",
+        side_effect=fake_co,
+    ):
+        with patch.object(mod, "_read_config_data", return_value={}):
+            mod.parse(inv, loader=None, path="dummy.yml", cache=True)
+    assert calls[-1][-1] == "json"
+    assert list(cache.values())[0][""]["token"] == "id1 Exited (0) 2 seconds ago"
+
+
+@patch("ansible_collections.containers.podman.plugins.inventory.podman_containers.shutil.which", return_value="podman")
+def test_multiple_connections(mock_which):
+    from ansible_collections.containers.podman.plugins.inventory.podman_containers import (
+        InventoryModule,
+    )
+
+    def fake_co(args, stderr=None):
+        assert args[1] == "--connection"
+        return build_ps_json([{"Names": ["app"], "Id": "id-" + args[2], "Image": "img", "Labels": {}}])
+
+    inv = FakeInventory()
+    mod = InventoryModule()
+    with patch(
+        "ansible_collections.containers.podman.plugins.inventory.podman_containers.subprocess.check_output",
+        side_effect=fake_co,
+    ):
+        with patch.object(mod, "_read_config_data", return_value={"connections": ["node1", "node2"]}):
+            mod.parse(inv, loader=None, path="dummy.yml", cache=False)
+
+    assert sorted(inv.hostvars) == ["app@node1", "app@node2"]
+    assert inv.hostvars["app@node2"]["ansible_host"] == "app"
+    assert inv.hostvars["app@node2"]["ansible_podman_extra_args"] == "--connection node2"
+    assert inv.hostvars["app@node2"]["podman_container_id"] == "id-node2"
+    assert sorted(inv.groups["image_img"]["hosts"]) == ["app@node1", "app@node2"]
@@ -2,10 +2,15 @@ from __future__ import absolute_import, division, print_function
 
 __metaclass__ = type
 
+from unittest.mock import Mock
+
 import pytest
 
+from ansible_collections.containers.podman.plugins.module_utils.podman import podman_container_lib
 from ansible_collections.containers.podman.plugins.module_utils.podman.podman_container_lib import (
+    PodmanContainer,
     PodmanContainerDiff,
+    PodmanDefaults,
     PodmanModuleParams,
 )
 
@@ -165,3 +170,47 @@ def test_container_add_params(test_input, expected):
 def test_container_diff(test_input, expected):
     diff = PodmanContainerDiff(*test_input)
     assert diff.diffparam_conmon_pidfile() == expected
+
+
+def test_defaults_cached_per_version():
+    PodmanDefaults._cache.pop("3.4.4", None)
+    first = PodmanDefaults({}, "3.4.4").default_dict()
+    first["tty"] = True
+    assert PodmanDefaults({}, "3.4.4").default_dict() == {"detach": True, "log_level": "warning", "tty": False}
+    assert PodmanDefaults({}, "1.8.2").default_dict()["cpu_shares"] == 1024
+    assert "cpu_shares" not in PodmanDefaults({}, "3.4.4").default_dict()
+
+
+def test_diff_checks_set_params_first():
+    module = Mock()
+    module._diff = False
+    diff = PodmanContainerDiff(module, {"tty": True}, {"config": {}}, {}, "4.1.1")
+    calls = []
+
+    def fake(name, result):
+        def func():
+            calls.append(name)
+            return result
+
+        return func
+
+    for func in PodmanContainerDiff.get_diff_functions():
+        setattr(diff, func, fake(func, func == "diffparam_tty"))
+    assert diff.is_different() is True
+    assert calls == ["diffparam_tty"]
+    assert "diffparam_image" in PodmanContainerDiff.get_diff_functions()
+
+
+def test_image_info_cached(monkeypatch):
+    monkeypatch.setattr(podman_container_lib, "_IMAGE_INFOS", {})
+    module = Mock()
+    module.run_command.return_value = (0, '[{"Id": "abc"}]', "")
+    params = {"executable": "podman", "rootfs": False, "image": "docker://alpine:3"}
+    container = PodmanContainer.__new__(PodmanContainer)
+    container.module = module
+    container.module_params = params
+    container.api = None
+    assert container.get_image_info() == {"Id": "abc"}
+    assert container.get_image_info() == {"Id": "abc"}
+    assert module.run_command.call_count == 1
+    assert module.run_command.call_args[0][0][-1] == "alpine:3"
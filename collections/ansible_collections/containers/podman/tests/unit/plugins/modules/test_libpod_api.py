@@ -0,0 +1,124 @@
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import json
+import socketserver
+import threading
+from http.server import BaseHTTPRequestHandler
+from unittest.mock import Mock
+
+import pytest
+
+from ansible_collections.containers.podman.plugins.module_utils.podman import libpod_api, podman_container_lib
+from ansible_collections.containers.podman.plugins.module_utils.podman.libpod_api import (
+    LibpodAPIError,
+    LibpodClient,
+    get_libpod_client,
+)
+from ansible_collections.containers.podman.plugins.module_utils.podman.podman_container_lib import (
+    PodmanContainer,
+)
+
+RESPONSES = {
+    "/v2.0.0/libpod/_ping": (200, "text/plain", "OK"),
+    "/v2.0.0/libpod/version": (200, "application/json", {"Version": "4.9.3"}),
+    "/v2.0.0/libpod/containers/web/json": (200, "application/json", {"Name": "web", "State": {"Running": True}}),
+    "/v2.0.0/libpod/containers/missing/json": (404, "application/json", {"message": "no such container"}),
+    "/v2.0.0/libpod/images/quay.io/ceph/ceph:v18/json": (200, "application/json", {"Id": "abc"}),
+    "/v2.0.0/libpod/containers/broken/json": (500, "application/json", {"message": "internal error"}),
+}
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def address_string(self):
+        return "unix"
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        self.server.requests.append(self.path)
+        status, content_type, data = RESPONSES.get(self.path, (404, "text/plain", "not found"))
+        body = (data if isinstance(data, str) else json.dumps(data)).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class Server(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+@pytest.fixture
+def server(tmp_path):
+    srv = Server(str(tmp_path / "podman.sock"), Handler)
+    srv.requests = []
+    thread = threading.Thread(target=srv.serve_forever)
+    thread.daemon = True
+    thread.start()
+    yield srv
+    srv.shutdown()
+    srv.server_close()
+
+
+def test_client(server):
+    client = LibpodClient(server.server_address)
+    assert client.ping() is True
+    assert client.version() == "4.9.3"
+    assert client.version() == "4.9.3"
+    assert client.inspect_container("web")["Name"] == "web"
+    assert client.inspect_container("missing") == {}
+    assert client.inspect_image("quay.io/ceph/ceph:v18") == {"Id": "abc"}
+    with pytest.raises(LibpodAPIError, match="internal error"):
+        client.inspect_container("broken")
+    assert server.requests.count("/v2.0.0/libpod/version") == 1
+    client.close()
+
+
+def test_get_libpod_client(server, tmp_path, monkeypatch):
+    monkeypatch.setattr(libpod_api, "_CLIENTS", {})
+    module = Mock()
+    client = get_libpod_client(module, server.server_address)
+    assert isinstance(client, LibpodClient)
+    assert get_libpod_client(module, server.server_address) is client
+    assert get_libpod_client(module, str(tmp_path / "other.sock")) is None
+
+
+def test_podman_container_api_backend(server, monkeypatch):
+    monkeypatch.setattr(libpod_api, "_CLIENTS", {})
+    monkeypatch.setattr(podman_container_lib, "_IMAGE_INFOS", {})
+    module = Mock()
+    params = {
+        "executable": "podman",
+        "backend": "api",
+        "api_socket": server.server_address,
+        "rootfs": False,
+        "image": "docker://quay.io/ceph/ceph:v18",
+    }
+    container = PodmanContainer(module, "web", params)
+    assert container.running
+    assert container.version == "4.9.3"
+    assert container.get_image_info() == {"Id": "abc"}
+    module.run_command.assert_not_called()
+
+
+def test_podman_container_api_fallback(server, monkeypatch):
+    monkeypatch.setattr(libpod_api, "_CLIENTS", {})
+    module = Mock()
+    module.run_command.side_effect = [
+        (0, json.dumps([{"Name": "broken", "State": {"Running": False}}]), ""),
+    ]
+    params = {
+        "executable": "podman",
+        "backend": "api",
+        "api_socket": server.server_address,
+    }
+    container = PodmanContainer(module, "broken", params)
+    assert container.stopped
+    assert container.version == "4.9.3"
+    assert module.run_command.call_count == 1
@@ -0,0 +1,77 @@
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import json
+from unittest.mock import Mock
+
+import pytest
+
+from ansible_collections.containers.podman.plugins.modules.podman_container_info import (
+    filter_existing,
+    get_containers_facts,
+    select_fields,
+)
+
+CONTAINERS = [
+    {"Id": "d38a8fcd61ab7e07", "Names": ["web1"]},
+    {"Id": "0a1b2c3d4e5f6071", "Names": ["redis"]},
+]
+
+
+@pytest.mark.parametrize(
+    "name, expected",
+    [
+        (["web1", "redis"], ["web1", "redis"]),
+        (["missing", "redis"], ["redis"]),
+        (["d38a8f", "0a1b2c3d4e5f6071", "ffff"], ["d38a8f", "0a1b2c3d4e5f6071"]),
+        (["", "missing"], []),
+    ],
+)
+def test_filter_existing(name, expected):
+    assert filter_existing(name, CONTAINERS) == expected
+
+
+def test_select_fields():
+    container = {"Id": "abc", "State": {"Status": "running", "Pid": 1}, "Config": {}}
+    assert select_fields(container, ["Id", "State.Status", "Config.Labels", "Missing.Field"]) == {
+        "Id": "abc",
+        "State": {"Status": "running"},
+        "Config": {"Labels": None},
+        "Missing": {"Field": None},
+    }
+
+
+def test_get_containers_facts_missing_names():
+    module = Mock()
+    commands = []
+
+    def run_command(command):
+        commands.append(command)
+        if command[1] == "ps":
+            return 0, json.dumps(CONTAINERS), ""
+        if command[3:] == ["web1", "redis"]:
+            return 0, json.dumps([{"Name": "web1"}, {"Name": "redis"}]), ""
+        return 125, "[]", "Error: no such container missing"
+
+    module.run_command.side_effect = run_command
+    inspection, out, err = get_containers_facts(module, "podman", ["web1", "missing", "redis"])
+
+    assert inspection == [{"Name": "web1"}, {"Name": "redis"}]
+    assert "no such container" in err
+    assert commands == [
+        ["podman", "container", "inspect", "web1", "missing", "redis"],
+        ["podman", "ps", "-a", "--format", "json"],
+        ["podman", "container", "inspect", "web1", "redis"],
+    ]
+
+
+def test_get_containers_facts_all_missing():
+    module = Mock()
+    module.run_command.side_effect = [
+        (125, "[]", "Error: no such container a"),
+        (0, "[]", ""),
+    ]
+    inspection, out, err = get_containers_facts(module, "podman", ["a", "b"])
+    assert inspection == []
+    assert module.run_command.call_count == 2
@@ -0,0 +1,155 @@
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import io
+import json
+import tarfile
+from unittest.mock import Mock
+
+import pytest
+
+from ansible_collections.containers.podman.plugins.modules.podman_load import (
+    is_loaded,
+    load,
+    parse_loaded_image,
+    read_archive_images,
+)
+
+IMAGE_ID = "bcacbdf7a119c0fa934661ca8af839e625ce6540d9ceb6827cdd389f823d49e0"
+
+
+def _write_archive(path, files):
+    with tarfile.open(str(path), "w") as archive:
+        for name, content in files.items():
+            data = content if isinstance(content, bytes) else json.dumps(content).encode("utf-8")
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            archive.addfile(info, io.BytesIO(data))
+    return str(path)
+
+
+class FailJson(Exception):
+    pass
+
+
+def _create_module(**params):
+    module = Mock()
+    module.check_mode = False
+    module.params = {"force": False, "max_concurrent_loads": 2}
+    module.params.update(params)
+    module.fail_json.side_effect = FailJson
+    return module
+
+
+def test_read_docker_archive(tmp_path):
+    path = _write_archive(
+        tmp_path / "image.tar",
+        {
+            "manifest.json": [
+                {
+                    "Config": "%s.json" % IMAGE_ID,
+                    "RepoTags": ["quay.io/ceph/ceph:v18"],
+                    "Layers": ["layer.tar"],
+                }
+            ],
+            "layer.tar": b"\0" * 1024,
+        },
+    )
+    assert read_archive_images(path) == [(IMAGE_ID, ["quay.io/ceph/ceph:v18"])]
+
+
+def test_read_oci_archive(tmp_path):
+    path = _write_archive(
+        tmp_path / "image.tar",
+        {
+            "index.json": {
+                "manifests": [
+                    {
+                        "digest": "sha256:1234",
+                        "annotations": {"org.opencontainers.image.ref.name": "ceph:v18"},
+                    }
+                ]
+            },
+            "blobs/sha256/1234": {"config": {"digest": "sha256:%s" % IMAGE_ID}},
+        },
+    )
+    assert read_archive_images(path) == [(IMAGE_ID, ["ceph:v18"])]
+
+
+def test_read_unknown_archive(tmp_path):
+    assert read_archive_images(_write_archive(tmp_path / "image.tar", {"foo": b"bar"})) is None
+    (tmp_path / "broken.tar").write_bytes(b"not a tar file")
+    assert read_archive_images(str(tmp_path / "broken.tar")) is None
+
+
+@pytest.mark.parametrize(
+    "images, expected",
+    [
+        (None, False),
+        ([(IMAGE_ID, ["ceph:v18"])], True),
+        ([(IMAGE_ID, ["quay.io/ceph/ceph:v18"])], True),
+        ([(IMAGE_ID, ["ceph:v19"])], False),
+        ([("other", [])], False),
+    ],
+)
+def test_is_loaded(images, expected):
+    assert is_loaded(images, {IMAGE_ID}, {"quay.io/ceph/ceph:v18", "localhost/ceph:v18"}) is expected
+
+
+@pytest.mark.parametrize(
+    "out, expected",
+    [
+        ("Loaded image(s): localhost/foo:latest,localhost/bar:latest\n", "localhost/foo:latest"),
+        ("Getting image source signatures\nLoaded image: localhost/foo:latest\n", "localhost/foo:latest"),
+        ("nothing\n", None),
+    ],
+)
+def test_parse_loaded_image(out, expected):
+    assert parse_loaded_image(out) == expected
+
+
+def test_load_skips_present_images(tmp_path):
+    present = _write_archive(
+        tmp_path / "present.tar",
+        {"manifest.json": [{"Config": "%s.json" % IMAGE_ID, "RepoTags": ["ceph:v18"]}]},
+    )
+    missing = _write_archive(
+        tmp_path / "missing.tar",
+        {"manifest.json": [{"Config": "1234.json", "RepoTags": ["grafana:11"]}]},
+    )
+    module = _create_module()
+    commands = []
+
+    def run_command(command):
+        commands.append(command)
+        if command[1:3] == ["image", "ls"]:
+            return 0, json.dumps([{"Id": IMAGE_ID, "Names": ["localhost/ceph:v18"]}]), ""
+        return 0, "Loaded image: localhost/grafana:11\n", ""
+
+    module.run_command.side_effect = run_command
+
+    changed, out, err, results = load(module, "podman", [present, missing])
+
+    assert changed is True
+    assert [command for command in commands if command[1] == "load"] == [["podman", "load", "--input", missing]]
+    assert [result["changed"] for result in results] == [False, True]
+    assert results[0]["image_ids"] == [IMAGE_ID]
+    assert "duration" not in results[0]
+    assert "duration" in results[1]
+
+    module.params["force"] = True
+    commands[:] = []
+    changed, out, err, results = load(module, "podman", [present])
+    assert changed is True
+    assert len([command for command in commands if command[1] == "load"]) == 1
+
+
+def test_load_failure(tmp_path):
+    path = _write_archive(tmp_path / "unknown.tar", {"foo": b"bar"})
+    module = _create_module()
+    module.run_command.side_effect = [(0, "[]", ""), (125, "", "invalid archive")]
+
+    with pytest.raises(FailJson):
+        load(module, "podman", [path])
+    assert "invalid archive" in module.fail_json.call_args[1]["msg"]
@@ -0,0 +1,93 @@
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+from unittest.mock import Mock
+
+import pytest
+
+from ansible_collections.containers.podman.plugins.modules.podman_quadlet import (
+    PodmanQuadletManager,
+    _get_service_name,
+)
+
+
+@pytest.mark.parametrize(
+    "name, expected",
+    [
+        ("web.container", "web.service"),
+        ("app.kube", "app.service"),
+        ("stack.pod", "stack-pod.service"),
+        ("backend.network", None),
+        ("web.env", None),
+    ],
+)
+def test_get_service_name(name, expected):
+    assert _get_service_name(name) == expected
+
+
+def _create_module(quadlet_dir, **params):
+    module = Mock()
+    module.check_mode = False
+    module.params = {
+        "state": "present",
+        "src": None,
+        "files": None,
+        "quadlets": None,
+        "quadlet_dir": str(quadlet_dir),
+        "reload_systemd": True,
+        "restart": False,
+        "force": True,
+        "all": False,
+        "executable": "podman",
+        "cmd_args": None,
+        "debug": False,
+    }
+    module.params.update(params)
+    module.get_bin_path.side_effect = lambda name, required=False: "/usr/bin/%s" % name
+    module.run_command.return_value = (0, "", "")
+    return module
+
+
+def test_install_all(tmp_path):
+    quadlet_dir = tmp_path / "systemd"
+    quadlet_dir.mkdir()
+    (quadlet_dir / "db.container").write_text("[Container]\nImage=db\n")
+    (quadlet_dir / "web.container").write_text("[Container]\nImage=web:1\n")
+    src = tmp_path / "src"
+    src.mkdir()
+    (src / "db.container").write_text("[Container]\nImage=db\n")
+    (src / "web.container").write_text("[Container]\nImage=web:2\n")
+    (src / "backend.network").write_text("[Network]\n")
+
+    module = _create_module(
+        quadlet_dir,
+        quadlets=[{"src": str(src / name), "files": None} for name in ("db.container", "web.container", "backend.network")],
+        restart=True,
+    )
+    manager = PodmanQuadletManager(module)
+    manager._install_all()
+
+    commands = [call[0][0] for call in module.run_command.call_args_list]
+    installs = [cmd for cmd in commands if cmd[1:3] == ["quadlet", "install"]]
+    assert [cmd[-1] for cmd in installs] == [str(src / "web.container"), str(src / "backend.network")]
+    assert all("--reload-systemd=false" in cmd for cmd in commands if cmd[0] == "/usr/bin/podman")
+    systemctl = [cmd for cmd in commands if cmd[0] == "/usr/bin/systemctl"]
+    assert [cmd[-1] for cmd in systemctl] == ["daemon-reload", "web.service"]
+    assert manager.results["restarted_units"] == ["web.service"]
+    assert manager.results["changed"] is True
+
+
+def test_install_all_unchanged(tmp_path):
+    quadlet_dir = tmp_path / "systemd"
+    quadlet_dir.mkdir()
+    (quadlet_dir / "db.container").write_text("[Container]\nImage=db\n")
+    src = tmp_path / "db.container"
+    src.write_text("[Container]\nImage=db\n")
+
+    module = _create_module(quadlet_dir, quadlets=[{"src": str(src), "files": None}])
+    manager = PodmanQuadletManager(module)
+    manager._install_all()
+
+    module.run_command.assert_not_called()
+    assert manager.results["changed"] is False